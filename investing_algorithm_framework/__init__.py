@@ -30,6 +30,7 @@ from .domain import ApiException, combine_backtests, Study, \
     PortfolioConfiguration, RESOURCE_DIRECTORY, AWS_LAMBDA_LOGGING_CONFIG, \
     Trade, APP_MODE, AppMode, DATETIME_FORMAT, load_backtests_from_directory, \
     BacktestDateRange, convert_polars_to_pandas, BacktestRun, Universe, \
+    TradeLedger, \
     DEFAULT_LOGGING_CONFIG, DataType, DataProvider, StopLossRule, \
     ScalingRule, TradingCost, BacktestEngine, \
     CooldownRule, CooldownTrigger, CooldownBlocks, CooldownTracker, \
@@ -37,6 +38,10 @@ from .domain import ApiException, combine_backtests, Study, \
     APPLICATION_DIRECTORY, DataSource, OrderExecutor, PortfolioProvider, \
     SnapshotInterval, AWS_S3_STATE_BUCKET_NAME, BacktestEvaluationFocus, \
     save_backtests_to_directory, BacktestMetrics, DATA_DIRECTORY, \
+    OHLCV_STORAGE_FORMAT, RESAMPLE_OHLCV_DATA, \
+    IN_MEMORY_BACKTEST_DATABASE, FLUSH_BACKTEST_DATABASE, \
+    REPOSITORY_STATISTICS, SNAPSHOT_FLUSH_SIZE, \
+    NUMERIC_STORAGE, NumericStorage, \
     retag_backtests, migrate_backtests, \
     Blotter, DefaultBlotter, SimulationBlotter, Transaction, \
     SlippageModel, NoSlippage, PercentageSlippage, FixedSlippage, \
@@ -46,7 +51,7 @@ from .domain import ApiException, combine_backtests, Study, \
     FXRateProvider, StaticFXRateProvider, \
     ScheduledDeposit, SyncResult, PortfolioOutOfSyncError, \
     DateRule, TimeRule, Schedule, ScheduledFunction, \
-    Signal, SignalSide, SignalSeries, \
+    Signal, SignalSide, SignalSeries, SignalMatrix, \
     signals_from_column, signal_series_from_column, signals_from_panel, \
     ConflictPolicy, ConflictResolution  # noqa: F401
 from .domain import Pipeline, Factor, CustomFactor, Filter, \
@@ -175,6 +180,7 @@ __all__ = [
     "Signal",
     "SignalSide",
     "SignalSeries",
+    "SignalMatrix",
     "signals_from_column",
     "signals_from_panel",
     "signal_series_from_column",
@@ -217,6 +223,7 @@ __all__ = [
     "OrderExecutor",
     "PortfolioProvider",
     "SnapshotInterval",
+    "NumericStorage",
     "add_html_report",
     "AWSS3StorageStateHandler",
     "AWS_S3_STATE_BUCKET_NAME",
@@ -315,6 +322,7 @@ __all__ = [
     "get_positive_trades",
     "get_number_of_trades",
     "BacktestRun",
+    "TradeLedger",
     "load_backtests_from_directory",
     "save_backtests_to_directory",
     "retag_backtests",
@@ -368,6 +376,13 @@ __all__ = [
     "DownloadResult",
     "create_data_storage_path",
     "DATA_DIRECTORY",
+    "OHLCV_STORAGE_FORMAT",
+    "RESAMPLE_OHLCV_DATA",
+    "IN_MEMORY_BACKTEST_DATABASE",
+    "FLUSH_BACKTEST_DATABASE",
+    "REPOSITORY_STATISTICS",
+    "SNAPSHOT_FLUSH_SIZE",
+    "NUMERIC_STORAGE",
     "Blotter",
     "DefaultBlotter",
     "SimulationBlotter",
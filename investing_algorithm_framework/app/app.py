@@ -23,7 +23,7 @@ from investing_algorithm_framework.domain import DATABASE_NAME, \
     PortfolioProvider, OrderExecutor, ImproperlyConfigured, TimeFrame, \
     DataProvider, INDEX_DATETIME, tqdm, BacktestMonteCarloTest, \
     LAST_SNAPSHOT_DATETIME, BACKTESTING_FLAG, DATA_DIRECTORY, Schedule, \
-    Universe
+    Universe, FLUSH_BACKTEST_DATABASE
 from investing_algorithm_framework.domain.backtesting.study import Study
 from investing_algorithm_framework.domain.backtesting.backtest_engine import \
     BacktestEngine
@@ -622,6 +622,63 @@ class App:
                     show_progress=show_progress,
                 )
 
+    def prefetch_data(
+        self,
+        backtest_date_range: BacktestDateRange,
+        strategies: List[TradingStrategy] = None,
+        max_workers: int = 4,
+        show_progress: bool = True,
+    ):
+        """
+        Function to download and cache the backtest data of all data
+        sources of the given strategies in parallel, so that the
+        backtests of a new universe do not download their data one
+        data source at a time. See
+        DataProviderService.prefetch_data.
+
+        Args:
+            backtest_date_range (BacktestDateRange): The date range of
+                the backtests the data is prefetched for.
+            strategies (List[TradingStrategy], optional): The strategies
+                whose data sources are prefetched. Defaults to the
+                strategies of the app.
+            max_workers (int): The number of data sources that are
+                prefetched at the same time.
+            show_progress (bool): Whether to show a progress bar.
+
+        Returns:
+            List[DataPrefetchResult]: The result of every unique data
+                source.
+        """
+        if strategies is None:
+            strategies = self._strategies
+
+        data_sources = []
+
+        for strategy in strategies:
+            data_sources.extend(strategy.data_sources or [])
+
+        # The data is cached in the data directory of the resource directory
+        if not os.path.exists(self.resource_directory_path):
+            os.makedirs(self.resource_directory_path)
+
+        data_provider_service = self.container.data_provider_service()
+        data_provider_service.reset()
+
+        for data_provider_tuple in self._data_providers:
+            data_provider_service.add_data_provider(
+                data_provider_tuple[0], priority=data_provider_tuple[1]
+            )
+
+        # Add the default data providers
+        data_provider_service.add_data_provider(CCXTOHLCVDataProvider())
+        return data_provider_service.prefetch_data(
+            data_sources,
+            backtest_date_range,
+            max_workers=max_workers,
+            show_progress=show_progress,
+        )
+
     def initialize_backtest_services(self):
         """
         Function to initialize the backtest services for the app. This method
@@ -1341,6 +1398,8 @@ class App:
         iterative_summary_update: bool = False,
         anchor_algorithm_id: Optional[str] = None,
         algorithm=None,
+        share_ohlcv_data: bool = False,
+        single_pass_windows: bool = False,
     ) -> List[Backtest]:
         """
         Run a backtest for one or more strategies using a Study as
@@ -1399,6 +1458,13 @@ class App:
             fill_missing_data: Auto-fill missing OHLCV rows.
             iterative_summary_update: Update summary after each window.
             anchor_algorithm_id: Reference algorithm for relative metrics.
+            share_ohlcv_data: Share OHLCV data between parallel workers
+                through memory-mapped files instead of copying it into
+                every worker. Only used by the vectorized engine.
+            single_pass_windows: Load the data and generate the signals
+                of each strategy once over all windows of the study and
+                simulate every window on a slice of them. Only used by
+                the vectorized engine without parallel workers.
 
         Returns:
             List[Backtest]: One Backtest per strategy, ordered to match
@@ -1663,6 +1729,8 @@ class App:
                 dynamic_position_sizing=dynamic_position_sizing,
                 fill_missing_data=fill_missing_data,
                 iterative_summary_update=iterative_summary_update,
+                share_ohlcv_data=share_ohlcv_data,
+                single_pass_windows=single_pass_windows,
             )
             # Note: unlike the event-driven branch below,
             # backtest_service.run_vector_backtests() is already
@@ -1783,6 +1851,8 @@ class App:
         dynamic_position_sizing: bool = False,
         fill_missing_data: bool = True,
         iterative_summary_update: bool = False,
+        share_ohlcv_data: bool = False,
+        single_pass_windows: bool = False,
     ) -> List[Backtest]:
         """
         Sweep multiple independent strategies (or algorithms) over a
@@ -1823,6 +1893,13 @@ class App:
             dynamic_position_sizing: Enable volatility-scaled position sizing.
             fill_missing_data: Auto-fill missing OHLCV rows.
             iterative_summary_update: Update summary after each window.
+            share_ohlcv_data: Share OHLCV data between parallel workers
+                through memory-mapped files instead of copying it into
+                every worker. Only used by the vectorized engine.
+            single_pass_windows: Load the data and generate the signals
+                of each strategy once over all windows of the study and
+                simulate every window on a slice of them. Only used by
+                the vectorized engine without parallel workers.
 
         Returns:
             List[Backtest]: One Backtest per strategy/algorithm (per
@@ -1846,6 +1923,8 @@ class App:
             dynamic_position_sizing=dynamic_position_sizing,
             fill_missing_data=fill_missing_data,
             iterative_summary_update=iterative_summary_update,
+            share_ohlcv_data=share_ohlcv_data,
+            single_pass_windows=single_pass_windows,
         )
 
     def run_monte_carlo_test(
@@ -2786,11 +2865,18 @@ class App:
     def cleanup_backtest_resources(self):
         """
         Clean up the backtest database and remove SQLAlchemy models/tables.
+        The backtest database is kept if the FLUSH_BACKTEST_DATABASE
+        config value is True, so that the flushed state of the last
+        backtest can be inspected. It is removed at the start of the
+        next backtest.
         """
         logger.info("Cleaning up backtest resources")
         config = self.config
         environment = config[ENVIRONMENT]
 
+        if config.get(FLUSH_BACKTEST_DATABASE, False):
+            return
+
         if Environment.BACKTEST.equals(environment):
             db_uri = config.get(SQLALCHEMY_DATABASE_URI)
             clear_db(db_uri)
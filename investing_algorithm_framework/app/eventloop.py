@@ -9,8 +9,9 @@ import polars as pl
 from investing_algorithm_framework.domain import Environment, ENVIRONMENT, \
     OrderStatus, DataSource, DataType, tqdm, \
     TradeStatus, SNAPSHOT_INTERVAL, SnapshotInterval, OperationalException, \
-    LAST_SNAPSHOT_DATETIME, INDEX_DATETIME
-from investing_algorithm_framework.services import TradeOrderEvaluator
+    LAST_SNAPSHOT_DATETIME, INDEX_DATETIME, SNAPSHOT_FLUSH_SIZE
+from investing_algorithm_framework.services import TradeOrderEvaluator, \
+    PortfolioSnapshotWriter
 from .algorithm import Algorithm
 from .strategy import TradingStrategy
 
@@ -70,7 +71,9 @@ class EventLoopService:
         self._algorithm = None
         self.strategies = []
         self._strategies_lookup = {}
-        self._snapshots = []
+        self._snapshot_writer = PortfolioSnapshotWriter(
+            portfolio_snapshot_service
+        )
         self._tasks_lookup = {}
         self._order_service = order_service
         self._trade_service = trade_service
@@ -285,64 +288,71 @@ class EventLoopService:
     def _snapshot(
         self,
         current_datetime,
-        open_orders,
-        created_orders
+        open_orders=None,
+        created_orders=None
     ):
         """
         Takes a snapshot of the current state of the portfolios and trades.
         This method is called based on the defined snapshot interval in the
         configuration service. It creates a snapshot of the portfolio and
-        appends it to the snapshots list.
+        adds it to the snapshot writer, which writes the snapshots to
+        the database in batches.
 
-        The function accepts the current datetime, open orders,
-        open trades, and created orders as parameters. The reason why
-        the orders and trades are passed is for efficiency, as we
-        do not want to fetch them again from the database if they are
-        already available in memory.
+        The open and created orders can be passed if they are already
+        available in memory. Otherwise, they are only fetched when a
+        snapshot is due, so iterations without a snapshot (e.g. with
+        daily snapshots of minute bars) do not query them.
 
         Args:
             current_datetime: The current datetime in UTC.
-            open_orders: List of open orders.
-            created_orders: List of created orders.
+            open_orders: Optional; list of open orders.
+            created_orders: Optional; list of created orders.
         """
         snapshot_interval = self._configuration_service\
             .config[SNAPSHOT_INTERVAL]
         portfolio = self._portfolio_service.get_all()[0]
         cash_flow = self._drain_cash_flow_for_snapshot(portfolio)
-        if SnapshotInterval.STRATEGY_ITERATION.equals(snapshot_interval):
-            snapshot = self._portfolio_snapshot_service.create_snapshot(
-                created_at=current_datetime,
-                portfolio=portfolio,
-                open_orders=open_orders,
-                created_orders=created_orders,
-                cash_flow=cash_flow,
-                save=False,
-            )
-            self._snapshots.append(snapshot)
-            self._configuration_service.add_value(
-                LAST_SNAPSHOT_DATETIME, current_datetime
-            )
-        elif SnapshotInterval.DAILY.equals(snapshot_interval):
+
+        if SnapshotInterval.DAILY.equals(snapshot_interval):
             last_snapshot_datetime = self._configuration_service.config[
                 LAST_SNAPSHOT_DATETIME
             ]
 
             # Check if the time difference is greater than 24 hours
-            if last_snapshot_datetime is None or \
+            if last_snapshot_datetime is not None and \
                     (current_datetime - last_snapshot_datetime)\
-                    .total_seconds() >= 86400:
-                snapshot = self._portfolio_snapshot_service.create_snapshot(
-                    created_at=current_datetime,
-                    portfolio=portfolio,
-                    open_orders=open_orders,
-                    created_orders=created_orders,
-                    cash_flow=cash_flow,
-                    save=False,
-                )
-                self._snapshots.append(snapshot)
-                self._configuration_service.add_value(
-                    LAST_SNAPSHOT_DATETIME, current_datetime
-                )
+                    .total_seconds() < 86400:
+                return
+        elif not SnapshotInterval.STRATEGY_ITERATION\
+                .equals(snapshot_interval):
+            return
+
+        if created_orders is None:
+            created_orders = self._order_service.get_all(
+                {
+                    "status": OrderStatus.CREATED,
+                }
+            )
+
+        if open_orders is None:
+            open_orders = self._order_service.get_all(
+                {
+                    "status": OrderStatus.OPEN,
+                }
+            )
+
+        snapshot = self._portfolio_snapshot_service.create_snapshot(
+            created_at=current_datetime,
+            portfolio=portfolio,
+            open_orders=open_orders,
+            created_orders=created_orders,
+            cash_flow=cash_flow,
+            save=False,
+        )
+        self._snapshot_writer.add(snapshot)
+        self._configuration_service.add_value(
+            LAST_SNAPSHOT_DATETIME, current_datetime
+        )
 
     def _drain_cash_flow_for_snapshot(self, portfolio) -> float:
         """Return external cash flow absorbed since the last snapshot.
@@ -395,6 +405,10 @@ class EventLoopService:
             )
 
         self._trade_order_evaluator = trade_order_evaluator
+        config = self._configuration_service.get_config()
+        self._snapshot_writer.flush_size = config.get(
+            SNAPSHOT_FLUSH_SIZE, 1000
+        )
 
         dispatcher = getattr(
             self._trade_service, "trade_hook_dispatcher", None
@@ -434,16 +448,16 @@ class EventLoopService:
 
     def cleanup(self):
         """
-        Cleans up the event loop service by saving all snapshots
-        taken during the event loop run. The snapshots are saved at the
-        end of the event to prevent too many database writes during the
-        event loop execution. Saving snapshots in bulk at the end improves
-        performance and reduces the number of database transactions.
+        Cleans up the event loop service by writing the snapshots
+        that are still buffered by the snapshot writer. During the event
+        loop run, the snapshots are written in batches of the
+        SNAPSHOT_FLUSH_SIZE config value (1000 by default) to prevent
+        a database write per snapshot.
 
         Returns:
             None
         """
-        self._portfolio_snapshot_service.save_all(self._snapshots)
+        self._snapshot_writer.flush()
         # Reset per-run live-envelope validation so a subsequent
         # run re-validates. Per-strategy pipeline universe caches
         # live on the strategy instances themselves now
@@ -922,21 +936,7 @@ class EventLoopService:
                         self.context._current_strategy_id = None
 
         # Step 7: Snapshot the portfolios if needed and update history
-        created_orders = self._order_service.get_all(
-            {
-                "status": OrderStatus.CREATED,
-            }
-        )
-        open_orders = self._order_service.get_all(
-            {
-                "status": OrderStatus.OPEN,
-            }
-        )
-        self._snapshot(
-            current_datetime=current_datetime,
-            open_orders=open_orders,
-            created_orders=created_orders
-        )
+        self._snapshot(current_datetime=current_datetime)
         self._update_history(
             current_datetime=current_datetime,
             strategies=strategies,
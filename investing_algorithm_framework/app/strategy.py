@@ -1,6 +1,7 @@
+import itertools
 import logging
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import pandas as pd
 
@@ -8,8 +9,8 @@ from investing_algorithm_framework.domain import (
     INDEX_DATETIME, ConflictPolicy, CooldownRule, CooldownTracker,
     DataSource, DataType, OperationalException, Order,
     Position, PositionSize, ScalingRule, Schedule, ScheduledFunction,
-    Signal, SignalSeries, StopLossRule, StrategyProfile, TakeProfitRule,
-    TradingCost, Trade,
+    Signal, SignalMatrix, SignalSeries, StopLossRule, StrategyProfile,
+    TakeProfitRule, TradingCost, Trade,
 )
 from ..services.executors import Executor, LimitOrderExecutor
 from ..services.strategy_phases import (
@@ -594,6 +595,109 @@ class TradingStrategy:
         """
         return iter(())
 
+    @classmethod
+    def generate_signal_matrices(
+        cls, data: Dict[str, Any], variants: List["TradingStrategy"]
+    ) -> Optional[Iterable[SignalMatrix]]:
+        """
+        Emit stacked :class:`SignalMatrix` objects for a parameter
+        sweep.
+
+        Sweep counterpart of :py:meth:`generate_signal_series`. When
+        the vector engine runs several variants of the same strategy
+        class over the same data sources (see
+        :py:meth:`from_parameter_grid`), it calls this classmethod
+        *once* with the shared data and every variant instance, so
+        indicators can be computed for all parameter combinations in
+        one vectorised pass. Row ``k`` of every yielded matrix holds
+        the flags of ``variants[k]``.
+
+        Example::
+
+            @classmethod
+            def generate_signal_matrices(cls, data, variants):
+                df = data["BTC/EUR_1d"]
+                close = df["Close"]
+                fast = np.stack([
+                    close.ewm(span=v.fast_period).mean() for v in variants
+                ])
+                slow = np.stack([
+                    close.ewm(span=v.slow_period).mean() for v in variants
+                ])
+                yield SignalMatrix(
+                    symbol="BTC", side=SignalSide.OPEN_LONG,
+                    values=fast > slow, index=df.index,
+                )
+                yield SignalMatrix(
+                    symbol="BTC", side=SignalSide.CLOSE_LONG,
+                    values=fast < slow, index=df.index,
+                )
+
+        Args:
+            data (Dict[str, Any]): Market data keyed by data-source
+                identifier, loaded once for all variants.
+            variants (List[TradingStrategy]): The strategy instances
+                of the sweep, in row order.
+
+        Returns:
+            Optional[Iterable[SignalMatrix]]: The stacked signals, or
+            ``None`` (the default) to let the engine call
+            :py:meth:`generate_signal_series` on every variant.
+        """
+        return None
+
+    @classmethod
+    def from_parameter_grid(
+        cls,
+        parameter_grid: Union[Dict[str, List[Any]], List[Dict[str, Any]]],
+        **kwargs,
+    ) -> List["TradingStrategy"]:
+        """
+        Instantiate one strategy per parameter combination.
+
+        Example::
+
+            strategies = MyStrategy.from_parameter_grid({
+                "fast_period": [10, 20, 50],
+                "slow_period": [100, 200],
+            })
+            app.run_backtests(strategies=strategies, study=study)
+
+        Args:
+            parameter_grid: Either a dict mapping a constructor
+                argument to its candidate values (expanded to the
+                cartesian product, in key order) or an explicit list
+                of keyword-argument dicts.
+            **kwargs: Constructor arguments shared by every variant.
+
+        Returns:
+            List[TradingStrategy]: One instance per combination. When
+            the constructor does not call :py:meth:`set_parameters`
+            itself, the combination is stored as the variant's
+            parameters.
+        """
+        if isinstance(parameter_grid, dict):
+            keys = list(parameter_grid.keys())
+            parameter_sets = [
+                dict(zip(keys, values)) for values in itertools.product(
+                    *(parameter_grid[key] for key in keys)
+                )
+            ]
+        else:
+            parameter_sets = [dict(params) for params in parameter_grid]
+
+        variants = []
+
+        for params in parameter_sets:
+            variant = cls(**kwargs, **params)
+
+            if not variant.get_parameters():
+                variant.set_parameters(params)
+
+            variants.append(variant)
+
+        return variants
+
     def run_strategy(self, context: Context, data: Dict[str, Any]):
         """
         Run one tick of the strategy by walking the configured
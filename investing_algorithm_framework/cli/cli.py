@@ -456,6 +456,53 @@ def index_cmd(directory, output, absolute_paths, no_progress, rebuild):
 cli.add_command(index_cmd)
 
 
+@click.command(name="prefetch")
+@click.argument(
+    "app_path",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.option(
+    "--start-date", required=True,
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M"]),
+    help="Start date (UTC) of the backtests to prefetch data for.",
+)
+@click.option(
+    "--end-date", required=True,
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M"]),
+    help="End date (UTC) of the backtests to prefetch data for.",
+)
+@click.option(
+    "--workers", type=int, default=4, show_default=True,
+    help="Number of data sources that are prefetched at the same time.",
+)
+@click.option(
+    "--no-progress", is_flag=True, default=False,
+    help="Suppress the progress bar.",
+)
+def prefetch_cmd(app_path, start_date, end_date, workers, no_progress):
+    """Download and cache the backtest data of every data source of the
+    strategies of the app in APP_PATH.
+
+    Data sources are deduplicated by (symbol, market, time frame) and
+    prefetched in parallel, requests to the same market share its rate
+    limit. Prints the rows and throughput of every data source.
+    """
+    from datetime import timezone
+    from .prefetch_command import prefetch, format_results
+
+    results = prefetch(
+        app_path,
+        start_date=start_date.replace(tzinfo=timezone.utc),
+        end_date=end_date.replace(tzinfo=timezone.utc),
+        max_workers=workers,
+        show_progress=not no_progress,
+    )
+    click.echo(format_results(results))
+
+
+cli.add_command(prefetch_cmd)
+
+
 @click.command(name="list")
 @click.argument(
     "index_path",
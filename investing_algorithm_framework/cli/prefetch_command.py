@@ -0,0 +1,95 @@
+"""``iaf prefetch`` CLI — download and cache the backtest data of all
+data sources of the strategies of an app in parallel.
+
+Loads the app from a Python file (the ``app`` created with
+``create_app`` in ``app.py`` of a project made with ``iaf init``) and
+runs :meth:`App.prefetch_data` for the given date range.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+from typing import List
+
+from investing_algorithm_framework.domain import OperationalException
+
+
+def load_app(app_path: str):
+    """Load the first App instance defined in the Python file *app_path*.
+
+    The directory of the file is added to ``sys.path`` so that the file
+    can import the modules of its project (e.g. ``strategies``).
+    """
+    from investing_algorithm_framework.app import App
+
+    app_path = os.path.abspath(app_path)
+    directory = os.path.dirname(app_path)
+
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+    spec = importlib.util.spec_from_file_location(
+        "iaf_prefetch_app", app_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    for value in vars(module).values():
+        if isinstance(value, App):
+            return value
+
+    raise OperationalException(f"No app found in {app_path}")
+
+
+def prefetch(
+    app_path: str,
+    start_date,
+    end_date,
+    max_workers: int = 4,
+    show_progress: bool = True,
+) -> List:
+    """Prefetch the backtest data of the app in *app_path* for the
+    backtest date range [*start_date*, *end_date*].
+
+    Returns:
+        List[DataPrefetchResult]: The result of every unique data source.
+    """
+    from investing_algorithm_framework.domain import BacktestDateRange
+
+    app = load_app(app_path)
+    return app.prefetch_data(
+        BacktestDateRange(start_date=start_date, end_date=end_date),
+        max_workers=max_workers,
+        show_progress=show_progress,
+    )
+
+
+def format_results(results) -> str:
+    """Format prefetch results as a table with the rows and throughput
+    of every data source and the totals."""
+    lines = [
+        f"{'data source':<40}{'rows':>12}{'seconds':>10}{'rows/s':>12}"
+    ]
+    number_of_rows = 0
+
+    for result in results:
+        identifier = result.data_source.get_identifier()
+
+        if result.succeeded:
+            lines.append(
+                f"{identifier:<40}{result.number_of_rows:>12}"
+                f"{result.duration:>10.1f}{result.rows_per_second:>12.0f}"
+            )
+        else:
+            lines.append(f"{identifier:<40}  failed: {result.error}")
+
+        number_of_rows += result.number_of_rows
+
+    failed = len([result for result in results if not result.succeeded])
+    lines.append(
+        f"{len(results)} data source(s), {number_of_rows} rows, "
+        f"{failed} failed"
+    )
+    return "\n".join(lines)
@@ -11,7 +11,10 @@ from .constants import ITEMIZE, ITEMIZED, PER_PAGE, PAGE, ENVIRONMENT, \
     APP_MODE, DATABASE_DIRECTORY_NAME, BACKTESTING_INITIAL_AMOUNT, \
     APPLICATION_DIRECTORY, SNAPSHOT_INTERVAL, AWS_S3_STATE_BUCKET_NAME, \
     LAST_SNAPSHOT_DATETIME, DATA_DIRECTORY, INDEX_DATETIME, \
-    DATETIME_FORMAT_FILE_NAME, DEFAULT_DATETIME_FORMAT
+    DATETIME_FORMAT_FILE_NAME, DEFAULT_DATETIME_FORMAT, OHLCV_STORAGE_FORMAT, \
+    RESAMPLE_OHLCV_DATA, IN_MEMORY_BACKTEST_DATABASE, \
+    FLUSH_BACKTEST_DATABASE, REPOSITORY_STATISTICS, \
+    SNAPSHOT_FLUSH_SIZE, NUMERIC_STORAGE
 from .data_provider import DataProvider
 from .data_structures import PeekableQueue
 from .decimal_parsing import parse_decimal_to_string, parse_string_to_decimal
@@ -26,9 +29,9 @@ from .models import OrderStatus, OrderSide, OrderType, TimeInterval, \
     TakeProfitRule, StopLossRule, PositionSize, ScalingRule, TradingCost, \
     CooldownRule, CooldownTrigger, CooldownBlocks, CooldownTracker, \
     SyncResult, ScheduledDeposit, DateRule, TimeRule, Schedule, \
-    ScheduledFunction, Signal, SignalSide, SignalSeries, \
+    ScheduledFunction, Signal, SignalSide, SignalSeries, SignalMatrix, \
     signals_from_column, signal_series_from_column, \
-    signals_from_panel, ConflictPolicy, ConflictResolution
+    signals_from_panel, ConflictPolicy, ConflictResolution, NumericStorage
 from .order_executor import OrderExecutor
 from .portfolio_provider import PortfolioProvider
 from .blotter import Blotter, DefaultBlotter, SimulationBlotter, Transaction, \
@@ -45,7 +48,7 @@ from .utils import random_string, append_dict_as_row_to_csv, \
     add_column_headers_to_csv, get_total_amount_of_rows, \
     convert_polars_to_pandas, random_number, is_jupyter_notebook, \
     csv_to_list, StoppableThread, load_csv_into_dict, tqdm, \
-    is_timezone_aware, sync_timezones, get_timezone
+    is_timezone_aware, sync_timezones, get_timezone, PandasConversionCache
 from .backtesting import BacktestRun, BacktestSummaryMetrics, \
     BacktestDateRange, Backtest, BacktestMetrics, combine_backtests, \
     combine_multi_universe_backtest, BacktestEngine, \
@@ -56,7 +59,7 @@ from .backtesting import BacktestRun, BacktestSummaryMetrics, \
     resolve_backtest_path, BUNDLE_EXT, BUNDLE_FORMAT_VERSION, \
     BacktestIndex, build_strategy_universe_map, stamp_backtest, \
     stamp_backtests, Study, EngineSlot, ExecutionConfig, StudySampleType, \
-    WindowPart
+    WindowPart, TradeLedger
 from .pipeline import Pipeline, AverageDollarVolume, AverageTradedValue, \
     CrossSectionalMean, Neutralize, Returns, RollingBeta, RSI, SMA, \
     StaticPerSymbol, Volatility, Factor, CustomFactor, Filter
@@ -101,6 +104,7 @@ __all__ = [
     "parse_decimal_to_string",
     "parse_string_to_decimal",
     "BacktestRun",
+    "TradeLedger",
     "DATETIME_FORMAT_BACKTESTING",
     "BACKTESTING_FLAG",
     "PortfolioSnapshot",
@@ -113,6 +117,7 @@ __all__ = [
     "Signal",
     "SignalSide",
     "SignalSeries",
+    "SignalMatrix",
     "signals_from_column",
     "signals_from_panel",
     "signal_series_from_column",
@@ -139,6 +144,7 @@ __all__ = [
     "BacktestDateRange",
     "BacktestWindow",
     "convert_polars_to_pandas",
+    "PandasConversionCache",
     "DEFAULT_LOGGING_CONFIG",
     "DATABASE_DIRECTORY_NAME",
     "BACKTESTING_INITIAL_AMOUNT",
@@ -158,6 +164,7 @@ __all__ = [
     "Event",
     "SNAPSHOT_INTERVAL",
     "SnapshotInterval",
+    "NumericStorage",
     "AWS_S3_STATE_BUCKET_NAME",
     "AWS_LAMBDA_LOGGING_CONFIG",
     "DataType",
@@ -169,6 +176,13 @@ __all__ = [
     "BacktestMonteCarloTest",
     "LAST_SNAPSHOT_DATETIME",
     "DATA_DIRECTORY",
+    "OHLCV_STORAGE_FORMAT",
+    "RESAMPLE_OHLCV_DATA",
+    "IN_MEMORY_BACKTEST_DATABASE",
+    "FLUSH_BACKTEST_DATABASE",
+    "REPOSITORY_STATISTICS",
+    "SNAPSHOT_FLUSH_SIZE",
+    "NUMERIC_STORAGE",
     "INDEX_DATETIME",
     "DATETIME_FORMAT_FILE_NAME",
     "is_jupyter_notebook",
@@ -32,6 +32,7 @@ from ..models.trade.trade_take_profit import (
 from .backtest_date_range import BacktestDateRange
 from .backtest_metrics import BacktestMetrics
 from .backtest_window import BacktestWindow
+from .trade_ledger import TradeLedger
 
 
 logger = getLogger(__name__)
@@ -179,6 +180,16 @@ class BacktestRun:
     :pyattr:`window_role`; the full parent window stays accessible on
     :pyattr:`backtest_window` for consumers that need the training
     portion of a walk-forward run.
+
+    Vector backtests pass their columnar ``trade_ledger`` instead of
+    ``trades`` / ``orders``; the :class:`Trade` and :class:`Order`
+    objects are then only built the first time either attribute is
+    read. Metric functions consume the ledger columns directly.
+
+    ``engine_state`` holds the terminal state of the vector execution
+    engine (open positions, cooldowns, capital counters), so that a
+    vector run can later be continued with new bars instead of being
+    recomputed, see ``VectorBacktestService.extend``.
     """
 
     backtest_window: BacktestWindow
@@ -202,6 +213,46 @@ class BacktestRun:
     signal_events: List[Dict[str, Any]] = field(default_factory=list)
     recorded_values: Dict[str, List] = field(default_factory=dict)
     metadata: Dict[str, str] = field(default_factory=dict)
+    engine_state: Dict[str, Any] = field(default_factory=dict)
+    trade_ledger: Optional[TradeLedger] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Leave ``trades`` / ``orders`` unset so ``__getattr__``
+        # materialises them from the ledger on first access.
+        if self.trade_ledger is not None:
+            for name in ("trades", "orders"):
+                if not self.__dict__.get(name):
+                    self.__dict__.pop(name, None)
+
+    def __getattr__(self, name):
+        # Only reached for attributes missing from ``__dict__``
+        ledger = self.__dict__.get("trade_ledger")
+
+        if name not in ("trades", "orders") or ledger is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        trades, orders = ledger.to_domain()
+        self.__dict__["trades"] = trades
+        self.__dict__["orders"] = orders
+        return self.__dict__[name]
+
+    def _is_lazy(self, name) -> bool:
+        return self.trade_ledger is not None and name not in self.__dict__
+
+    def get_trade_source(self):
+        """Return the input for the trade metric functions.
+
+        The columnar ``trade_ledger`` as long as ``trades`` has not been
+        materialised or replaced, the ``trades`` list otherwise.
+        """
+        if self._is_lazy("trades"):
+            return self.trade_ledger
+
+        return self.trades
 
     # ------------------------------------------------------------------
     # Derived active-range fields
@@ -249,6 +300,13 @@ class BacktestRun:
 
     def to_dict(self) -> dict:
         """Return a JSON-friendly dict matching OBTF §Run structure."""
+        if self._is_lazy("trades") and self._is_lazy("orders"):
+            orders = self.trade_ledger.order_records()
+            trades = self.trade_ledger.trade_records(orders)
+        else:
+            orders = [o.to_dict() for o in self.orders]
+            trades = [t.to_dict() for t in self.trades]
+
         return {
             "backtest_window": self.backtest_window.to_dict(),
             "backtest_start_date": _ensure_utc_iso(self.backtest_start_date),
@@ -268,8 +326,8 @@ class BacktestRun:
             "portfolio_snapshots": [
                 ps.to_dict() for ps in self.portfolio_snapshots
             ],
-            "trades": [t.to_dict() for t in self.trades],
-            "orders": [o.to_dict() for o in self.orders],
+            "trades": trades,
+            "orders": orders,
             "positions": [p.to_dict() for p in self.positions],
             "number_of_trades": self.number_of_trades,
             "number_of_trades_closed": self.number_of_trades_closed,
@@ -283,6 +341,7 @@ class BacktestRun:
                 self.recorded_values
             ),
             "metadata": dict(self.metadata),
+            "engine_state": dict(self.engine_state),
         }
 
     @classmethod
@@ -772,5 +831,15 @@ class BacktestRun:
             f"role={self.window_role!r}, "
             f"start={self.backtest_start_date.isoformat()}, "
             f"end={self.backtest_end_date.isoformat()}, "
-            f"trades={len(self.trades)}, orders={len(self.orders)})"
+            f"trades={self._count('trades')}, "
+            f"orders={self._count('orders')})"
         )
+
+    def _count(self, name) -> int:
+        if self._is_lazy(name):
+            return (
+                self.trade_ledger.number_of_trades if name == "trades"
+                else self.trade_ledger.number_of_orders
+            )
+
+        return len(getattr(self, name))
@@ -0,0 +1,661 @@
+from datetime import timezone
+from typing import List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from investing_algorithm_framework.domain.models.order import (
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+)
+from investing_algorithm_framework.domain.models.trade import Trade
+from investing_algorithm_framework.domain.models.trade.trade_status import (
+    TradeStatus,
+)
+
+
+def _iso(value):
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+class TradeLedger:
+    """
+    Columnar (struct-of-arrays) record of the trades and orders of one
+    vector backtest run.
+
+    Every trade and every order is a row index into a set of parallel
+    column lists that the vector execution core appends to and updates
+    in place while it walks the bars. Timestamps are stored as bar
+    indices into ``dates``. :class:`Trade` and :class:`Order` domain
+    objects are only built on demand by :meth:`to_domain`, which is what
+    ``BacktestRun.trades`` / ``BacktestRun.orders`` call on first
+    access; metric functions read the columns directly through
+    :meth:`column`.
+
+    Trade columns:
+        symbol, is_short, open_bar, close_bar (-1 while open),
+        update_bar (-1 if never updated), open_price, amount,
+        available_amount, cost, net_gain, total_fees,
+        last_reported_price (NaN if never marked), entry_reason,
+        trade_orders (order rows per trade).
+
+    Order columns:
+        order_trade (trade row), order_side, order_bar, order_price,
+        order_amount, order_fee, order_fee_rate, order_slippage,
+        order_reason.
+
+    Attributes:
+        dates (List[datetime]): The bar timestamps the bar indices
+            refer to.
+        trading_symbol (str): The quote currency of the trades.
+        strategy_id (str): Stamped on the opening order of every trade.
+    """
+
+    # Numeric trade columns that :meth:`column` returns as float64.
+    FLOAT_COLUMNS = (
+        "open_price",
+        "amount",
+        "available_amount",
+        "cost",
+        "net_gain",
+        "total_fees",
+        "last_reported_price",
+    )
+
+    def __init__(self, dates, trading_symbol, strategy_id=None):
+        self.dates = dates
+        self.trading_symbol = trading_symbol
+        self.strategy_id = strategy_id
+
+        self.symbol = []
+        self.is_short = []
+        self.open_bar = []
+        self.close_bar = []
+        self.update_bar = []
+        self.open_price = []
+        self.amount = []
+        self.available_amount = []
+        self.cost = []
+        self.net_gain = []
+        self.total_fees = []
+        self.last_reported_price = []
+        self.entry_reason = []
+        self.trade_orders = []
+
+        self.order_trade = []
+        self.order_side = []
+        self.order_bar = []
+        self.order_price = []
+        self.order_amount = []
+        self.order_fee = []
+        self.order_fee_rate = []
+        self.order_slippage = []
+        self.order_reason = []
+
+        self._trade_ids = []
+        self._order_ids = []
+        self._domain = None
+        self._timestamps = None
+
+    TRADE_COLUMNS = (
+        "symbol",
+        "is_short",
+        "open_bar",
+        "close_bar",
+        "update_bar",
+        "open_price",
+        "amount",
+        "available_amount",
+        "cost",
+        "net_gain",
+        "total_fees",
+        "last_reported_price",
+        "entry_reason",
+    )
+    ORDER_COLUMNS = (
+        "order_trade",
+        "order_side",
+        "order_bar",
+        "order_price",
+        "order_amount",
+        "order_fee",
+        "order_fee_rate",
+        "order_slippage",
+        "order_reason",
+    )
+
+    @staticmethod
+    def from_domain(trades, dates, trading_symbol, strategy_id=None,
+                    orders=None) -> "TradeLedger":
+        """
+        Rebuild a ledger from :class:`Trade` objects, e.g. of a vector
+        run that was loaded from disk, so the run can be continued.
+
+        Args:
+            trades (List[Trade]): The trades with their orders, in the
+                order they were opened.
+            dates (List[datetime]): The bar timestamps of the run.
+                Every trade and order timestamp must be one of them.
+            trading_symbol (str): The quote currency of the trades.
+            strategy_id (str): The strategy id of the run.
+            orders (List[Order], optional): The orders of the trades in
+                fill order, e.g. the orders of the run. Orders filled on
+                the same bar are otherwise ordered by trade.
+
+        Returns:
+            TradeLedger: The ledger, keeping the trade and order ids.
+        """
+        ledger = TradeLedger(dates, trading_symbol, strategy_id)
+        bar_of = {date: bar for bar, date in enumerate(dates)}
+        trade_orders_by_row = []
+
+        def _bar(date):
+            return -1 if date is None else bar_of[date]
+
+        for row, trade in enumerate(trades):
+            trade_orders = list(trade.orders or [])
+            ledger.symbol.append(trade.target_symbol)
+            ledger.is_short.append(bool(trade.is_short))
+            ledger.open_bar.append(bar_of[trade.opened_at])
+            ledger.close_bar.append(_bar(trade.closed_at))
+            ledger.update_bar.append(_bar(trade.updated_at))
+            ledger.open_price.append(trade.open_price)
+            ledger.amount.append(trade.amount)
+            ledger.available_amount.append(trade.available_amount)
+            ledger.cost.append(trade.cost)
+            ledger.net_gain.append(trade.net_gain)
+            ledger.total_fees.append(trade.total_fees)
+            ledger.last_reported_price.append(
+                np.nan if trade.last_reported_price is None
+                else trade.last_reported_price
+            )
+            ledger.entry_reason.append(
+                (trade_orders[0].metadata or {}).get("order_reason")
+                if trade_orders else None
+            )
+            ledger.trade_orders.append([])
+            ledger._trade_ids.append(trade.id)
+            trade_orders_by_row.append(trade_orders)
+
+        row_of = {
+            order.id: row
+            for row, trade_orders in enumerate(trade_orders_by_row)
+            for order in trade_orders
+        }
+
+        if orders is None:
+            # Sort by bar; the sort is stable, so the orders of a trade
+            # keep their sequence.
+            orders = sorted(
+                (
+                    order for trade_orders in trade_orders_by_row
+                    for order in trade_orders
+                ),
+                key=lambda order: bar_of[order.created_at],
+            )
+
+        for order in orders:
+            row = row_of[order.id]
+            bar = bar_of[order.created_at]
+            ledger.add_order(
+                row, order.order_side, bar, order.price, order.amount,
+                order.order_fee, order.order_fee_rate, order.slippage,
+                (order.metadata or {}).get("order_reason"),
+            )
+            ledger._order_ids.append(order.id)
+
+        return ledger
+
+    def copy(self, dates=None) -> "TradeLedger":
+        """
+        Return a copy of the ledger whose rows can be updated and
+        appended to without touching this ledger.
+
+        Args:
+            dates (List[datetime], optional): The bar timestamps of the
+                copy, e.g. extended with the bars of a continued run.
+                They must start with the bars of this ledger. Defaults
+                to the dates of this ledger.
+        """
+        ledger = TradeLedger(
+            self.dates if dates is None else dates,
+            self.trading_symbol,
+            self.strategy_id,
+        )
+
+        for name in self.TRADE_COLUMNS + self.ORDER_COLUMNS:
+            setattr(ledger, name, list(getattr(self, name)))
+
+        self._ensure_ids()
+        ledger.trade_orders = [list(rows) for rows in self.trade_orders]
+        ledger._trade_ids = list(self._trade_ids)
+        ledger._order_ids = list(self._order_ids)
+        return ledger
+
+    @property
+    def number_of_trades(self) -> int:
+        return len(self.symbol)
+
+    @property
+    def number_of_orders(self) -> int:
+        return len(self.order_trade)
+
+    def __len__(self):
+        return len(self.symbol)
+
+    def __getitem__(self, index) -> Trade:
+        if isinstance(index, int):
+            return self.trade(index)
+
+        return self.to_domain()[0][index]
+
+    def __iter__(self):
+        return iter(self.to_domain()[0])
+
+    def __repr__(self):
+        return (
+            f"TradeLedger(trades={self.number_of_trades}, "
+            f"orders={self.number_of_orders})"
+        )
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def open_trade(
+        self,
+        symbol,
+        bar,
+        price,
+        amount,
+        cost,
+        fee,
+        fee_rate,
+        slippage,
+        reason,
+        is_short=False,
+    ) -> int:
+        """
+        Append a new open trade together with its opening order.
+
+        Returns:
+            int: The row index of the trade.
+        """
+        row = len(self.symbol)
+        self.symbol.append(symbol)
+        self.is_short.append(is_short)
+        self.open_bar.append(bar)
+        self.close_bar.append(-1)
+        self.update_bar.append(-1)
+        self.open_price.append(price)
+        self.amount.append(amount)
+        self.available_amount.append(amount)
+        self.cost.append(cost)
+        self.net_gain.append(0.0)
+        self.total_fees.append(fee)
+        self.last_reported_price.append(np.nan)
+        self.entry_reason.append(reason)
+        self.trade_orders.append([])
+        self.add_order(
+            row,
+            OrderSide.SELL.value if is_short else OrderSide.BUY.value,
+            bar, price, amount, fee, fee_rate, slippage, reason,
+        )
+        return row
+
+    def add_order(
+        self, trade, side, bar, price, amount, fee, fee_rate, slippage,
+        reason,
+    ) -> int:
+        """
+        Append a filled order to the given trade row.
+
+        Returns:
+            int: The row index of the order.
+        """
+        row = len(self.order_trade)
+        self.order_trade.append(trade)
+        self.order_side.append(side)
+        self.order_bar.append(bar)
+        self.order_price.append(price)
+        self.order_amount.append(amount)
+        self.order_fee.append(fee)
+        self.order_fee_rate.append(fee_rate)
+        self.order_slippage.append(slippage)
+        self.order_reason.append(reason)
+        self.trade_orders[trade].append(row)
+        return row
+
+    def extend(self, trades, orders):
+        """
+        Append many trades and orders at once, e.g. the round trips
+        of a vector run that were computed as arrays.
+
+        Args:
+            trades (dict): A list of values per trade column except
+                ``trade_orders``, all of the same length.
+            orders (dict): A list of values per order column, all of
+                the same length, in fill order. ``order_trade`` may
+                refer to the appended trades.
+        """
+        number_of_trades = len(self.symbol)
+
+        for name, values in trades.items():
+            getattr(self, name).extend(values)
+
+        self.trade_orders.extend(
+            [] for _ in range(len(self.symbol) - number_of_trades)
+        )
+        number_of_orders = len(self.order_trade)
+
+        for name, values in orders.items():
+            getattr(self, name).extend(values)
+
+        for row, trade in enumerate(orders["order_trade"], number_of_orders):
+            self.trade_orders[trade].append(row)
+
+    def is_open(self, trade) -> bool:
+        return self.close_bar[trade] < 0
+
+    def reset_cache(self):
+        """
+        Drop the cached domain objects so the next :meth:`to_domain`
+        call picks up columns that were updated in place.
+        """
+        self._domain = None
+
+    # ------------------------------------------------------------------
+    # Columnar access
+    # ------------------------------------------------------------------
+
+    def _bar_timestamps(self):
+        if self._timestamps is None or \
+                len(self._timestamps) != len(self.dates):
+            self._timestamps = np.array(
+                [date.timestamp() for date in self.dates], dtype=np.float64
+            )
+        return self._timestamps
+
+    def column(self, name) -> np.ndarray:
+        """
+        Return a trade column as a NumPy array.
+
+        Besides the stored columns the following derived columns are
+        available:
+
+        * ``closed`` / ``open`` — boolean status masks.
+        * ``net_gain_absolute`` — realised gain for closed trades,
+          realised plus unrealised gain (against
+          ``last_reported_price``) for open trades, matching
+          ``Trade.net_gain_absolute``.
+        * ``opened_at`` / ``closed_at`` — POSIX timestamps in seconds,
+          NaN for trades that are still open.
+        * ``high_water_mark`` / ``low_water_mark`` — always NaN; vector
+          trades are not marked to market bar by bar.
+
+        Args:
+            name (str): The column name.
+
+        Returns:
+            np.ndarray: One entry per trade.
+        """
+        if name in self.FLOAT_COLUMNS:
+            return np.asarray(getattr(self, name), dtype=np.float64)
+
+        if name == "closed":
+            return np.asarray(self.close_bar, dtype=np.int64) >= 0
+
+        if name == "open":
+            return np.asarray(self.close_bar, dtype=np.int64) < 0
+
+        if name == "is_short":
+            return np.asarray(self.is_short, dtype=bool)
+
+        if name == "net_gain_absolute":
+            net_gain = self.column("net_gain")
+            unrealised = self.column("available_amount") * (
+                self.column("last_reported_price")
+                - self.column("open_price")
+            )
+            unrealised = np.where(
+                self.column("open") & ~np.isnan(unrealised), unrealised, 0.0
+            )
+            return net_gain + unrealised
+
+        if name in ("opened_at", "closed_at"):
+            bars = np.asarray(
+                self.open_bar if name == "opened_at" else self.close_bar,
+                dtype=np.int64
+            )
+            timestamps = self._bar_timestamps()
+
+            if len(bars) == 0:
+                return np.empty(0, dtype=np.float64)
+
+            return np.where(
+                bars >= 0, timestamps[np.maximum(bars, 0)], np.nan
+            )
+
+        if name in ("high_water_mark", "low_water_mark"):
+            return np.full(len(self.symbol), np.nan)
+
+        return np.asarray(getattr(self, name))
+
+    # ------------------------------------------------------------------
+    # Materialisation
+    # ------------------------------------------------------------------
+
+    def _ensure_ids(self):
+        while len(self._trade_ids) < len(self.symbol):
+            self._trade_ids.append(uuid4())
+
+        while len(self._order_ids) < len(self.order_trade):
+            self._order_ids.append(uuid4())
+
+    def _order_metadata(self, row):
+        trade = self.order_trade[row]
+        metadata = {"order_reason": self.order_reason[row]}
+
+        if self.is_short[trade]:
+            if self.trade_orders[trade][0] == row:
+                metadata["is_short"] = True
+            else:
+                metadata["is_cover"] = True
+
+        return metadata
+
+    def _order_strategy_id(self, row):
+        trade = self.order_trade[row]
+
+        if self.trade_orders[trade][0] == row:
+            return self.strategy_id
+
+        return None
+
+    def _date(self, bar):
+        return self.dates[bar] if bar >= 0 else None
+
+    def trade(self, row) -> Trade:
+        """
+        Build the :class:`Trade` (and its orders) of a single row
+        without materialising the rest of the ledger.
+        """
+        if self._domain is not None:
+            return self.to_domain()[0][row]
+
+        self._ensure_ids()
+        row = range(len(self.symbol))[row]
+        return self._build_trade(
+            row, [self._build_order(o) for o in self.trade_orders[row]]
+        )
+
+    def _build_order(self, row) -> Order:
+        date = self.dates[self.order_bar[row]]
+        return Order(
+            id=self._order_ids[row],
+            target_symbol=self.symbol[self.order_trade[row]],
+            trading_symbol=self.trading_symbol,
+            order_type=OrderType.LIMIT,
+            price=self.order_price[row],
+            amount=self.order_amount[row],
+            status=OrderStatus.CLOSED,
+            created_at=date,
+            updated_at=date,
+            order_side=self.order_side[row],
+            order_fee=self.order_fee[row],
+            order_fee_rate=self.order_fee_rate[row],
+            slippage=self.order_slippage[row],
+            metadata=self._order_metadata(row),
+            strategy_id=self._order_strategy_id(row),
+        )
+
+    def _build_trade(self, row, orders) -> Trade:
+        last_reported_price = self.last_reported_price[row]
+        return Trade(
+            id=self._trade_ids[row],
+            orders=orders,
+            target_symbol=self.symbol[row],
+            trading_symbol=self.trading_symbol,
+            available_amount=self.available_amount[row],
+            remaining=0,
+            filled_amount=self.amount[row],
+            open_price=self.open_price[row],
+            opened_at=self.dates[self.open_bar[row]],
+            closed_at=self._date(self.close_bar[row]),
+            updated_at=self._date(self.update_bar[row]),
+            amount=self.amount[row],
+            status=TradeStatus.OPEN.value if self.is_open(row)
+            else TradeStatus.CLOSED.value,
+            cost=self.cost[row],
+            net_gain=self.net_gain[row],
+            total_fees=self.total_fees[row],
+            last_reported_price=None
+            if np.isnan(last_reported_price) else last_reported_price,
+            is_short=self.is_short[row],
+            metadata={"is_short": True} if self.is_short[row] else None,
+        )
+
+    def to_domain(self) -> Tuple[List[Trade], List[Order]]:
+        """
+        Build the :class:`Trade` and :class:`Order` objects of the
+        ledger. The result is cached, so repeated calls return the same
+        objects as long as no rows were added in between.
+
+        Returns:
+            Tuple[List[Trade], List[Order]]: The trades and the orders,
+                both in the order they were opened / filled. Orders are
+                shared between the two lists.
+        """
+        if self._domain is not None \
+                and len(self._domain[0]) == len(self.symbol) \
+                and len(self._domain[1]) == len(self.order_trade):
+            return self._domain
+
+        self._ensure_ids()
+        orders = [
+            self._build_order(row) for row in range(len(self.order_trade))
+        ]
+        trades = [
+            self._build_trade(row, [orders[o] for o in self.trade_orders[row]])
+            for row in range(len(self.symbol))
+        ]
+        self._domain = (trades, orders)
+        return self._domain
+
+    def order_records(self) -> List[dict]:
+        """
+        Return the orders as ``Order.to_dict()`` shaped dicts without
+        building the domain objects.
+        """
+        self._ensure_ids()
+        records = []
+        trading_symbol = self.trading_symbol.upper()
+
+        for row in range(len(self.order_trade)):
+            date = _iso(self.dates[self.order_bar[row]])
+            records.append({
+                "id": self._order_ids[row],
+                "external_id": None,
+                "target_symbol": self.symbol[self.order_trade[row]].upper(),
+                "trading_symbol": trading_symbol,
+                "order_side": self.order_side[row],
+                "order_type": OrderType.LIMIT.value,
+                "status": OrderStatus.CLOSED.value,
+                "price": self.order_price[row],
+                "amount": self.order_amount[row],
+                "created_at": date,
+                "updated_at": date,
+                "cost": None,
+                "filled": None,
+                "remaining": None,
+                "order_fee_currency": None,
+                "order_fee_rate": self.order_fee_rate[row],
+                "order_fee": self.order_fee[row],
+                "slippage": self.order_slippage[row],
+                "stop_price": None,
+                "triggered_at": None,
+                "metadata": self._order_metadata(row),
+                "strategy_id": self._order_strategy_id(row),
+            })
+
+        return records
+
+    def trade_records(self, order_records: Optional[List[dict]] = None) \
+            -> List[dict]:
+        """
+        Return the trades as ``Trade.to_dict()`` shaped dicts without
+        building the domain objects.
+
+        Args:
+            order_records (List[dict], optional): The result of
+                :meth:`order_records`, to avoid serialising the orders
+                twice.
+        """
+        if order_records is None:
+            order_records = self.order_records()
+
+        records = []
+
+        for row in range(len(self.symbol)):
+            last_reported_price = self.last_reported_price[row]
+            records.append({
+                "id": self._trade_ids[row],
+                "orders": [order_records[o] for o in self.trade_orders[row]],
+                "target_symbol": self.symbol[row],
+                "trading_symbol": self.trading_symbol,
+                "is_short": bool(self.is_short[row]),
+                "status": TradeStatus.OPEN.value if self.is_open(row)
+                else TradeStatus.CLOSED.value,
+                "amount": self.amount[row],
+                "remaining": 0,
+                "open_price": self.open_price[row],
+                "last_reported_price": None
+                if np.isnan(last_reported_price) else last_reported_price,
+                "last_reported_price_datetime": None,
+                "high_water_mark": None,
+                "high_water_mark_datetime": None,
+                "low_water_mark": None,
+                "low_water_mark_datetime": None,
+                "opened_at": _iso(self.dates[self.open_bar[row]]),
+                "closed_at": _iso(self._date(self.close_bar[row])),
+                "updated_at": _iso(self._date(self.update_bar[row])),
+                "net_gain": self.net_gain[row],
+                "total_fees": self.total_fees[row],
+                "cost": self.cost[row],
+                "stop_losses": None,
+                "take_profits": None,
+                "filled_amount": self.amount[row],
+                "available_amount": self.available_amount[row],
+                "metadata": {"is_short": True}
+                if self.is_short[row] else {},
+                "strategy_id": self.strategy_id
+                if self.trade_orders[row] else None,
+            })
+
+        return records
@@ -10,11 +10,17 @@ DATABASE_DIRECTORY_PATH = 'DATABASE_DIRECTORY_PATH'
 DATABASE_DIRECTORY_NAME = 'DATABASE_DIRECTORY_NAME'
 DATABASE_URL = 'DATABASE_URL'
 DEFAULT_DATABASE_NAME = "database"
+IN_MEMORY_BACKTEST_DATABASE = "IN_MEMORY_BACKTEST_DATABASE"
+FLUSH_BACKTEST_DATABASE = "FLUSH_BACKTEST_DATABASE"
+REPOSITORY_STATISTICS = "REPOSITORY_STATISTICS"
+NUMERIC_STORAGE = "NUMERIC_STORAGE"
 
 APPLICATION_DIRECTORY = "APP_DIR"
 RESOURCE_DIRECTORY = "RESOURCE_DIRECTORY"
 BACKTEST_DATA_DIRECTORY_NAME = "BACKTEST_DATA_DIRECTORY_NAME"
 DATA_DIRECTORY = "DATA_DIRECTORY"
+OHLCV_STORAGE_FORMAT = "OHLCV_STORAGE_FORMAT"
+RESAMPLE_OHLCV_DATA = "RESAMPLE_OHLCV_DATA"
 LOG_LEVEL = 'LOG_LEVEL'
 BASE_DIR = 'BASE_DIR'
 SQLALCHEMY_DATABASE_URI = 'SQLALCHEMY_DATABASE_URI'
@@ -46,6 +52,7 @@ TICKER_DATA_TYPE = "TICKER"
 OHLCV_DATA_TYPE = "OHLCV"
 CURRENT_UTC_DATETIME = "CURRENT_UTC_DATETIME"
 SNAPSHOT_INTERVAL = "SNAPSHOT_INTERVAL"
+SNAPSHOT_FLUSH_SIZE = "SNAPSHOT_FLUSH_SIZE"
 DATETIME_FORMAT = "DATETIME_FORMAT"
 DATETIME_FORMAT_FILE_NAME = "DATETIME_FORMAT_FILE_NAME"
 # Deployment
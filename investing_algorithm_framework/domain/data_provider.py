@@ -1,12 +1,17 @@
 from typing import List, Any, Union
 from abc import ABC, abstractmethod
 from datetime import datetime
+
+import polars as pl
+
 from investing_algorithm_framework.domain.exceptions import \
     ImproperlyConfigured
 from investing_algorithm_framework.domain.models.time_frame import TimeFrame
 from investing_algorithm_framework.domain.models.data.data_type import DataType
 from investing_algorithm_framework.domain.models.data.data_source import \
     DataSource
+from investing_algorithm_framework.domain.utils.polars import \
+    convert_polars_to_pandas, PandasConversionCache
 
 
 class DataProvider(ABC):
@@ -40,9 +45,13 @@ class DataProvider(ABC):
         storage_path (Optional[str]): The path to the storage location
             for the data. This is useful for data providers that support
             saving data to a file
+        shared_data_path (Optional[str]): Path of the Arrow IPC file the
+            provider's ``data`` frame is memory-mapped from, set by
+            :meth:`share_data`.
     """
     data_type: DataType = None
     data_provider_identifier: str = None
+    shared_data_path: str = None
 
     def __init__(
         self,
@@ -174,6 +183,98 @@ class DataProvider(ABC):
     def config(self, value):
         self._config = value
 
+    def share_data(self, path: str) -> bool:
+        """
+        Publish the provider's ``data`` frame to an uncompressed Arrow
+        IPC file and replace it with a zero-copy, memory-mapped view of
+        that file.
+
+        While shared, pickling the provider (e.g. to hand it to a
+        spawned worker process) only transfers ``path``; the
+        unpickled copy re-attaches to the same memory-mapped file, so
+        every process reads the OHLCV data from one copy in the OS
+        page cache instead of materialising its own. Precomputed
+        event-mode sliding windows are not transferred.
+
+        Args:
+            path (str): The file to write the Arrow IPC data to.
+
+        Returns:
+            bool: True if the provider holds a polars ``data`` frame
+                that is now shared, False otherwise.
+        """
+        data = getattr(self, "data", None)
+
+        if not isinstance(data, pl.DataFrame):
+            return False
+
+        data.write_ipc(path, compression="uncompressed")
+        self.data = pl.read_ipc(path, memory_map=True)
+        self.shared_data_path = path
+        return True
+
+    def unshare_data(self) -> None:
+        """
+        Load the shared ``data`` frame back into process memory so the
+        memory-mapped file can be removed.
+        """
+        if self.shared_data_path is None:
+            return
+
+        self.data = pl.read_ipc(self.shared_data_path, memory_map=False)
+        self.shared_data_path = None
+
+    def convert_to_pandas(
+        self, data: pl.DataFrame, source: pl.DataFrame = None
+    ):
+        """
+        Convert backtest data of the provider, a contiguous range of
+        rows of its data, to a pandas DataFrame.
+
+        The source data is converted once and every window is served
+        as a slice of the converted frame (see PandasConversionCache),
+        instead of converting each window on every backtest iteration.
+
+        Args:
+            data (pl.DataFrame): The backtest data to convert.
+            source (pl.DataFrame, optional): The data the backtest data
+                is taken from. Defaults to the ``data`` attribute of
+                the provider.
+
+        Returns:
+            pd.DataFrame: The backtest data as a pandas DataFrame.
+        """
+        if source is None:
+            source = getattr(self, "data", None)
+
+        if not isinstance(source, pl.DataFrame):
+            return convert_polars_to_pandas(data)
+
+        cache = self.__dict__.get("_pandas_conversion_cache")
+
+        if cache is None:
+            cache = PandasConversionCache()
+            self._pandas_conversion_cache = cache
+
+        return cache.convert(source, data)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+
+        if state.get("shared_data_path") is not None:
+            state["data"] = None
+
+            if "window_cache" in state:
+                state["window_cache"] = {}
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+        if self.shared_data_path is not None:
+            self.data = pl.read_ipc(self.shared_data_path, memory_map=True)
+
     @abstractmethod
     def has_data(
         self,
@@ -10,6 +10,7 @@ from .time_interval import TimeInterval
 from .time_unit import TimeUnit
 from .trade import Trade, TradeStatus, TradeStopLoss, TradeTakeProfit
 from .snapshot_interval import SnapshotInterval
+from .numeric_storage import NumericStorage
 from .event import Event
 from .data import DataSource, DataType
 from .risk_rules import TakeProfitRule, StopLossRule, ScalingRule, \
@@ -17,7 +18,7 @@ from .risk_rules import TakeProfitRule, StopLossRule, ScalingRule, \
     CooldownTracker
 from .scheduling import DateRule, Schedule, ScheduledFunction, TimeRule
 from .signal import Signal, SignalSide
-from .signal_series import SignalSeries
+from .signal_series import SignalSeries, SignalMatrix
 from .signal_helpers import signals_from_column, signals_from_panel, \
     signal_series_from_column
 from .conflict_policy import ConflictPolicy, ConflictResolution
@@ -47,6 +48,7 @@ __all__ = [
     "TradeTakeProfit",
     "DataSource",
     "SnapshotInterval",
+    "NumericStorage",
     "Event",
     "PositionSize",
     "ScalingRule",
@@ -66,6 +68,7 @@ __all__ = [
     "Signal",
     "SignalSide",
     "SignalSeries",
+    "SignalMatrix",
     "signals_from_column",
     "signals_from_panel",
     "signal_series_from_column",
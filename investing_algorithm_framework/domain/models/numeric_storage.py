@@ -0,0 +1,57 @@
+from enum import Enum
+
+
+class NumericStorage(Enum):
+    """
+    Storage of the numeric (monetary) columns in the SQLite database.
+
+    - DECIMAL: the exact decimal representation, stored as TEXT.
+    - FIXED_POINT: an integer scaled by 10^8, stored as a 64-bit
+      INTEGER. Values are rounded to 8 decimals and limited to about
+      +/- 9.2 * 10^10.
+    - REAL: a 64-bit float, stored as REAL.
+
+    The values are read back as floats with every storage.
+    """
+    DECIMAL = "DECIMAL"
+    FIXED_POINT = "FIXED_POINT"
+    REAL = "REAL"
+
+    @staticmethod
+    def from_string(value: str):
+
+        if isinstance(value, str):
+
+            for entry in NumericStorage:
+
+                if value.upper() == entry.value:
+                    return entry
+
+            raise ValueError(
+                f"Could not convert {value} to NumericStorage"
+            )
+        return None
+
+    @staticmethod
+    def from_value(value):
+
+        if isinstance(value, str):
+            return NumericStorage.from_string(value)
+
+        if isinstance(value, NumericStorage):
+
+            for entry in NumericStorage:
+
+                if value == entry:
+                    return entry
+
+        raise ValueError(
+            f"Could not convert {value} to NumericStorage"
+        )
+
+    def equals(self, other):
+
+        if isinstance(other, Enum):
+            return self.value == other.value
+        else:
+            return NumericStorage.from_string(other) == self
@@ -168,6 +168,27 @@ class CooldownTracker:
         """Forget all recorded events (used between backtest runs)."""
         self._last_event.clear()
 
+    def to_dict(self) -> dict:
+        """Serialise the recorded events, e.g. to continue a vector
+        backtest run later."""
+        return {
+            "events": [
+                [scope, trigger.value, bar_index]
+                for (scope, trigger), bar_index in self._last_event.items()
+            ]
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "CooldownTracker":
+        """Rebuild a tracker from a :meth:`to_dict` payload."""
+        tracker = CooldownTracker()
+
+        for scope, trigger, bar_index in data.get("events", []):
+            tracker._last_event[(scope, CooldownTrigger(trigger))] = \
+                bar_index
+
+        return tracker
+
     def record(
         self,
         *,
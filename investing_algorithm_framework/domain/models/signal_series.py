@@ -24,6 +24,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Mapping
 
+import numpy as np
+import pandas as pd
+
 from .signal import SignalSide
 
 
@@ -105,3 +108,102 @@ class SignalSeries:
             f"SignalSeries(symbol={self.symbol!r}, side={self.side.value}, "
             f"len={n}{src})"
         )
+
+
+@dataclass(frozen=True)
+class SignalMatrix:
+    """Stacked :class:`SignalSeries` for a parameter sweep.
+
+    A :class:`SignalMatrix` carries the boolean flags of one
+    ``(symbol, side)`` pair for *every* variant of a parameter sweep
+    at once: row ``k`` of :pyattr:`values` holds the flags of the
+    ``k``-th variant over the shared bar :pyattr:`index`. It is
+    yielded by :py:meth:`TradingStrategy.generate_signal_matrices`
+    so a strategy can compute its indicators for all variants in
+    one vectorised pass instead of once per variant.
+
+    Attributes:
+        symbol: Target symbol of the signal (e.g. ``"BTC"``).
+        side: The directional intent. See :class:`SignalSide`.
+        values: Boolean array-like of shape ``(variants, bars)``.
+        index: Timestamps of the ``bars`` columns of ``values``.
+        source: Free-form tag identifying the originator of the
+            signal.
+        metadata: Arbitrary JSON-serialisable extra context.
+
+    Examples:
+        >>> import numpy as np
+        >>> import pandas as pd
+        >>> from investing_algorithm_framework import (
+        ...     SignalMatrix, SignalSide
+        ... )
+        >>> index = pd.date_range("2024-01-01", periods=3)
+        >>> matrix = SignalMatrix(
+        ...     symbol="BTC",
+        ...     side=SignalSide.OPEN_LONG,
+        ...     values=np.array([[False, True, False], [True, True, False]]),
+        ...     index=index,
+        ... )
+        >>> matrix.to_signal_series(1).series.tolist()
+        [True, True, False]
+    """
+
+    symbol: str
+    side: SignalSide
+    values: Any
+    index: Any
+    source: str = ""
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.symbol, str) or not self.symbol:
+            raise ValueError(
+                f"SignalMatrix.symbol must be a non-empty str, "
+                f"got {self.symbol!r}"
+            )
+        if not isinstance(self.side, SignalSide):
+            object.__setattr__(
+                self, "side", SignalSide.from_value(self.side)
+            )
+        if self.values is None or self.index is None:
+            raise ValueError(
+                "SignalMatrix.values and SignalMatrix.index are required"
+            )
+
+        values = np.asarray(self.values).astype(bool)
+
+        if values.ndim != 2 or values.shape[1] != len(self.index):
+            raise ValueError(
+                "SignalMatrix.values must have shape (variants, bars) "
+                f"with bars == len(index), got {values.shape} for an "
+                f"index of length {len(self.index)}"
+            )
+        object.__setattr__(self, "values", values)
+
+    @property
+    def number_of_variants(self) -> int:
+        return self.values.shape[0]
+
+    def to_signal_series(self, variant: int) -> SignalSeries:
+        """Return the :class:`SignalSeries` of a single variant.
+
+        Args:
+            variant: Row of :pyattr:`values` to extract.
+
+        Returns:
+            SignalSeries: A pandas-backed series over :pyattr:`index`.
+        """
+        return SignalSeries(
+            symbol=self.symbol,
+            side=self.side,
+            series=pd.Series(self.values[variant], index=self.index),
+            source=self.source,
+            metadata=self.metadata,
+        )
+
+    def __repr__(self) -> str:  # pragma: no cover - trivial
+        src = f" source={self.source!r}" if self.source else ""
+        return (
+            f"SignalMatrix(symbol={self.symbol!r}, side={self.side.value}, "
+            f"shape={self.values.shape}{src})"
+        )
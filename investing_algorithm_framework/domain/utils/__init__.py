@@ -3,7 +3,7 @@ from .csv import get_total_amount_of_rows, append_dict_as_row_to_csv, \
 from .random import random_string, random_number
 from .stoppable_thread import StoppableThread
 from .synchronized import synchronized
-from .polars import convert_polars_to_pandas
+from .polars import convert_polars_to_pandas, PandasConversionCache
 from .dates import is_timezone_aware, sync_timezones, get_timezone
 from .jupyter_notebook_detection import is_jupyter_notebook
 from .custom_tqdm import tqdm
@@ -19,6 +19,7 @@ __all__ = [
     'csv_to_list',
     'load_csv_into_dict',
     'convert_polars_to_pandas',
+    'PandasConversionCache',
     'is_timezone_aware',
     'sync_timezones',
     'get_timezone',
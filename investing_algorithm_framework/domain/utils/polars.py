@@ -51,3 +51,70 @@ def convert_polars_to_pandas(
         df.set_index(datetime_column_name, inplace=True)
 
     return df
+
+
+class PandasConversionCache:
+    """
+    Cache of the pandas conversion of a polars dataframe, to serve
+    pandas windows of it without converting every window.
+
+    The source dataframe is converted once with
+    :func:`convert_polars_to_pandas` and a window, a contiguous range
+    of rows of the source, is looked up by its first and last datetime
+    in the (sorted) datetime index of the converted frame. The window
+    is returned as a copy of the row slice, so the caller can add or
+    change columns without affecting other windows.
+
+    The source is converted again when a different dataframe is
+    passed. Sources that are not sorted by their datetime column are
+    not cached, their windows are converted one by one.
+    """
+
+    def __init__(self, datetime_column_name="Datetime"):
+        self.datetime_column_name = datetime_column_name
+        self._source = None
+        self._frame = None
+
+    def __getstate__(self):
+        # The converted frame is rebuilt after unpickling
+        return {"datetime_column_name": self.datetime_column_name}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def convert(
+        self, source: PolarsDataFrame, window: PolarsDataFrame
+    ) -> pd.DataFrame:
+        """
+        Get the pandas conversion of a window of the source dataframe.
+
+        Args:
+            source: Polars Dataframe - The dataframe the window is
+                taken from
+            window: Polars Dataframe - A contiguous range of rows of
+                the source
+
+        Returns:
+            DataFrame: The window as a pandas DataFrame, equal to
+                convert_polars_to_pandas(window)
+        """
+        column = self.datetime_column_name
+
+        if source is not self._source:
+            self._source = source
+            self._frame = None
+
+            if len(source) > 0 and source[column].is_sorted():
+                self._frame = convert_polars_to_pandas(
+                    source, datetime_column_name=column
+                )
+
+        if self._frame is None or len(window) == 0:
+            return convert_polars_to_pandas(
+                window, datetime_column_name=column
+            )
+
+        index = self._frame.index
+        start = index.searchsorted(window[column][0], side="left")
+        stop = index.searchsorted(window[column][-1], side="right")
+        return self._frame.iloc[start:stop].copy()
@@ -1,5 +1,7 @@
 from .database import setup_sqlalchemy, Session, \
-    create_all_tables, clear_db, teardown_sqlalchemy
+    create_all_tables, clear_db, teardown_sqlalchemy, InMemoryDatabase, \
+    use_in_memory_database, get_in_memory_database, \
+    use_numeric_storage, get_numeric_storage
 from .models import SQLPortfolio, SQLOrder, SQLPosition, \
     SQLPortfolioSnapshot, SQLPositionSnapshot, SQLTrade, \
     SQLTradeTakeProfit, SQLTradeStopLoss
@@ -7,7 +9,9 @@ from .repositories import SQLOrderRepository, SQLPositionRepository, \
     SQLPortfolioRepository, SQLTradeRepository, \
     SQLPortfolioSnapshotRepository, SQLPositionSnapshotRepository, \
     SQLTradeTakeProfitRepository, SQLTradeStopLossRepository, \
-    SQLTradeAllocationRepository
+    SQLTradeAllocationRepository, RepositoryStatistics, \
+    RepositoryCallStatistics, use_repository_statistics, \
+    get_repository_statistics
 from .services import AzureBlobStorageStateHandler, AWSS3StorageStateHandler, \
     BacktestService
 from .data_providers import CSVOHLCVDataProvider, \
@@ -25,6 +29,15 @@ __all__ = [
     "clear_db",
     "create_all_tables",
     "teardown_sqlalchemy",
+    "InMemoryDatabase",
+    "use_in_memory_database",
+    "use_numeric_storage",
+    "get_numeric_storage",
+    "get_in_memory_database",
+    "RepositoryStatistics",
+    "RepositoryCallStatistics",
+    "use_repository_statistics",
+    "get_repository_statistics",
     "SQLPositionRepository",
     "SQLPortfolioRepository",
     "SQLOrderRepository",
@@ -80,7 +80,7 @@ class AlphaVantageOHLCVDataProvider(OHLCVDataProviderBase):
         _ensure_alpha_vantage()
         from alpha_vantage.timeseries import TimeSeries
 
-        av_config = self._get_provider_interval()
+        av_config = self._get_provider_interval(time_frame)
         series_type, interval = av_config
         api_key = self._get_api_key()
         ts = TimeSeries(key=api_key, output_format="pandas")
@@ -1,18 +1,21 @@
 import logging
 import os.path
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from time import sleep
 from typing import Union, List
 
 import ccxt
 import pandas as pd
 import polars as pl
-from dateutil import parser
 
 from investing_algorithm_framework.domain import OperationalException, \
-    DATETIME_FORMAT, DataProvider, convert_polars_to_pandas, \
+    DataProvider, convert_polars_to_pandas, \
     NetworkError, TimeFrame, MarketCredential, DataType, DataSource, \
-    RESOURCE_DIRECTORY, CCXT_DATETIME_FORMAT, DATA_DIRECTORY
+    RESOURCE_DIRECTORY, DATA_DIRECTORY, OHLCV_STORAGE_FORMAT
+
+from .rate_limiter import TokenBucket
+from .sliding_windows import SlidingWindows
 
 logger = logging.getLogger("investing_algorithm_framework")
 
@@ -37,6 +40,15 @@ class CCXTOHLCVDataProvider(DataProvider):
     The Datetime column should be in UTC timezone and in milliseconds.
     The data will be loaded into a Polars DataFrame and will be kept in memory.
 
+    With the "arrow" storage format (the ``storage_format`` argument or
+    the ``OHLCV_STORAGE_FORMAT`` config value), the cache of each
+    (symbol, market, time_frame) is instead a directory of Arrow IPC
+    files with typed millisecond timestamps and float64 columns. They
+    are memory-mapped on read, and newly downloaded bars after the
+    cached range are appended as a new file instead of rewriting the
+    cache. Existing CSV caches are migrated on first use, see also
+    :meth:`migrate_csv_cache`.
+
     Attributes:
         data_type (DataType): The type of data provided by this provider,
             which is OHLCV.
@@ -52,6 +64,17 @@ class CCXTOHLCVDataProvider(DataProvider):
     data_type = DataType.OHLCV
     data_provider_identifier = "ccxt_ohlcv_data_provider"
     storage_directory = None
+    storage_formats = ("csv", "arrow")
+    # Number of appended Arrow files after which a cache is rewritten
+    # as a single file
+    max_arrow_parts = 64
+    # Candles per concurrently downloaded page and the number of
+    # download threads of get_ohlcv
+    ohlcv_page_size = 500
+    max_download_workers = 4
+    # Exchange clients and rate limiters by (market, credential)
+    _exchange_pool = {}
+    _exchange_pool_lock = threading.Lock()
 
     def __init__(
         self,
@@ -63,7 +86,8 @@ class CCXTOHLCVDataProvider(DataProvider):
         data_provider_identifier: str = None,
         storage_directory=None,
         pandas: bool = False,
-        config=None
+        config=None,
+        storage_format: str = None,
     ):
         """
         Initialize the CCXT OHLCV Data Provider.
@@ -80,10 +104,20 @@ class CCXTOHLCVDataProvider(DataProvider):
                 as a pandas DataFrame instead of a Polars DataFrame.
             storage_directory: (str, optional): the storage directory where
                 the OHLCV data need to be stored.
+            storage_format (str, optional): The format of the OHLCV cache
+                in the storage directory, "csv" or "arrow". Defaults to
+                the OHLCV_STORAGE_FORMAT config value or "csv".
         """
         if warmup_window is not None and window_size is None:
             window_size = warmup_window
 
+        if storage_format is not None \
+                and storage_format not in self.storage_formats:
+            raise OperationalException(
+                f"Storage format {storage_format} is not supported, "
+                f"supported formats are {', '.join(self.storage_formats)}"
+            )
+
         if data_provider_identifier is None:
             data_provider_identifier = self.data_provider_identifier
 
@@ -105,6 +139,7 @@ class CCXTOHLCVDataProvider(DataProvider):
         self.total_number_of_data_points = 0
         self.missing_data_point_dates = []
         self.data_file_path = None
+        self.storage_format = storage_format
 
     def has_data(
         self,
@@ -258,24 +293,23 @@ class CCXTOHLCVDataProvider(DataProvider):
                 f"{storage_directory_path}"
             )
 
-        # Fill missing data if requested
+        # Fill missing data if requested. The completeness index of the
+        # cache file is persisted, so repeated runs over an unchanged
+        # cache only look up the missing dates of the range.
         if fill_missing_data:
-            from investing_algorithm_framework.services.data_providers.data \
-                import fill_missing_timeseries_data, \
-                get_missing_timeseries_data_entries
-
-            # Get the frequency string based on time_frame
-            time_frame_obj = TimeFrame.from_value(self.time_frame)
-            freq_minutes = time_frame_obj.amount_of_minutes
-            freq = f"{freq_minutes}min" if freq_minutes < 60 else \
-                f"{freq_minutes // 60}h" if freq_minutes < 1440 else "D"
-
-            # Check for missing dates
-            missing_dates = get_missing_timeseries_data_entries(
+            from investing_algorithm_framework.services.data_providers \
+                .completeness import get_completeness_index
+
+            completeness_index = get_completeness_index(
                 self.data,
-                start=required_start_date,
-                end=backtest_end_date,
-                freq=freq
+                self.time_frame,
+                data_file_path=(
+                    self.data_file_path
+                    if storage_directory_path is not None else None
+                ),
+            )
+            missing_dates = completeness_index.get_missing_timestamps(
+                required_start_date, backtest_end_date
             )
 
             if len(missing_dates) > 0:
@@ -291,15 +325,10 @@ class CCXTOHLCVDataProvider(DataProvider):
 
                 # Fill the missing data (never write back to the
                 # source file during backtest preparation)
-                filled_data = fill_missing_timeseries_data(
-                    self.data,
-                    missing_dates=missing_dates,
-                    save_to_file=False,
+                self.data = completeness_index.fill(
+                    self.data, required_start_date, backtest_end_date
                 )
-
-                if filled_data is not None:
-                    self.data = filled_data
-                    data = filled_data
+                data = self.data
 
         # Check if data is empty before accessing min/max
         if self.data is None or len(self.data) == 0:
@@ -501,6 +530,9 @@ class CCXTOHLCVDataProvider(DataProvider):
             pl.DataFrame: The backtest data for the given datasource.
         """
 
+        # The data the returned rows are taken from
+        source = self.data
+
         if backtest_start_date is not None and \
                 backtest_end_date is not None:
 
@@ -558,35 +590,30 @@ class CCXTOHLCVDataProvider(DataProvider):
             )
         else:
             # If window_size is set, use the precomputed window cache
-            if self.window_size is not None and len(self.window_cache) > 0:
-                try:
-                    data = self.window_cache[backtest_index_date]
-                except KeyError:
-
-                    try:
-                        # Return the key in the cache that is closest to the
-                        # backtest_index_date but not after it.
-                        closest_key = min(
-                            [k for k in self.window_cache.keys()
-                             if k >= backtest_index_date]
-                        )
-                        data = self.window_cache[closest_key]
-                    except ValueError:
+            if self.window_size is not None \
+                    and isinstance(self.window_cache, SlidingWindows) \
+                    and len(self.window_cache) > 0:
+                # The window of the first prepared timestamp at or
+                # after the backtest_index_date (binary search)
+                data = self.window_cache.at_or_after(backtest_index_date)
+                source = self.window_cache.data
 
-                        if data_source is not None:
-                            raise OperationalException(
-                                "No OHLCV data available for the "
-                                f"date: {backtest_index_date} "
-                                f"within the prepared backtest data "
-                                f"for data source {data_source.identifier}. "
-                            )
+                if data is None:
 
+                    if data_source is not None:
                         raise OperationalException(
                             "No OHLCV data available for the "
                             f"date: {backtest_index_date} "
                             f"within the prepared backtest data "
-                            f"for symbol {self.symbol}. "
+                            f"for data source {data_source.identifier}. "
                         )
+
+                    raise OperationalException(
+                        "No OHLCV data available for the "
+                        f"date: {backtest_index_date} "
+                        f"within the prepared backtest data "
+                        f"for symbol {self.symbol}. "
+                    )
             else:
                 # No window cache and no start/end dates -
                 # return all data up to backtest_index_date
@@ -616,7 +643,7 @@ class CCXTOHLCVDataProvider(DataProvider):
                     )
 
         if self.pandas:
-            data = convert_polars_to_pandas(data)
+            data = self.convert_to_pandas(data, source=source)
 
         return data
 
@@ -626,6 +653,12 @@ class CCXTOHLCVDataProvider(DataProvider):
         """
         Function to retrieve ohlcv data for a symbol, time frame and market
 
+        The range is split into pages of ``ohlcv_page_size`` candles
+        that are downloaded concurrently by ``max_download_workers``
+        threads. The requests to an exchange are spaced by its
+        ``rateLimit`` with a token bucket that is shared by every
+        download from the same market with the same credential.
+
         Args:
             symbol (str): The symbol to retrieve ohlcv data for
             time_frame: The time frame to retrieve ohlcv data for
@@ -639,67 +672,60 @@ class CCXTOHLCVDataProvider(DataProvider):
         """
         symbol = symbol.upper()
         market_credential = self.get_credential(market)
-        exchange = self.initialize_exchange(market, market_credential)
+        exchange, rate_limiter = self.get_exchange(market, market_credential)
         time_frame = time_frame.value
 
-        if from_timestamp > to_timestamp:
+        if to_timestamp is not None and from_timestamp > to_timestamp:
             raise OperationalException(
                 "OHLCV data start date must be before end date"
             )
 
-        if self.config is not None and DATETIME_FORMAT in self.config:
-            datetime_format = self.config[DATETIME_FORMAT]
-        else:
-            datetime_format = CCXT_DATETIME_FORMAT
-
         if not exchange.has['fetchOHLCV']:
             raise OperationalException(
                 f"Market service {market} does not support "
                 f"functionality get_ohclvs"
             )
 
-        from_timestamp = exchange.parse8601(
-            from_timestamp.strftime(datetime_format)
-        )
+        from_timestamp = self._to_milliseconds(from_timestamp)
 
         if to_timestamp is None:
             to_timestamp = exchange.milliseconds()
         else:
-            to_timestamp = exchange.parse8601(
-                to_timestamp.strftime(datetime_format)
-            )
-        data = []
-
-        try:
-            while from_timestamp < to_timestamp:
-                ohlcv = exchange.fetch_ohlcv(
-                    symbol, time_frame, from_timestamp
-                )
+            to_timestamp = self._to_milliseconds(to_timestamp)
+
+        time_frame_ms = exchange.parse_timeframe(time_frame) * 1000
+        page_length = time_frame_ms * self.ohlcv_page_size
+        # Pages of [start, end), the last page includes to_timestamp
+        pages = [
+            (start, min(start + page_length, to_timestamp + 1))
+            for start in range(from_timestamp, to_timestamp, page_length)
+        ]
 
-                if len(ohlcv) > 0:
-                    from_timestamp = \
-                        ohlcv[-1][0] + \
-                        exchange.parse_timeframe(time_frame) * 1000
-                else:
-                    from_timestamp = to_timestamp
+        def fetch_page(page):
+            start, end = page
+            candles = []
 
-                for candle in ohlcv:
-                    datetime_stamp = parser.parse(exchange.iso8601(candle[0]))
+            # An exchange can return less candles than a page holds
+            while start < end:
+                rate_limiter.acquire()
+                ohlcv = exchange.fetch_ohlcv(symbol, time_frame, start)
 
-                    to_timestamp_datetime = parser.parse(
-                        exchange.iso8601(to_timestamp),
-                    )
+                if len(ohlcv) == 0:
+                    break
 
-                    if datetime_stamp <= to_timestamp_datetime:
-                        datetime_stamp = datetime_stamp \
-                            .strftime(datetime_format)
+                candles.extend(ohlcv)
+                start = ohlcv[-1][0] + time_frame_ms
 
-                        data.append(
-                            [datetime_stamp] +
-                            [float(value) for value in candle[1:]]
-                        )
+            return [candle for candle in candles if candle[0] < end]
 
-                sleep(exchange.rateLimit / 1000)
+        try:
+            if len(pages) > 1 and self.max_download_workers > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_download_workers, len(pages))
+                ) as executor:
+                    results = list(executor.map(fetch_page, pages))
+            else:
+                results = [fetch_page(page) for page in pages]
         except ccxt.NetworkError as e:
             logger.error(
                 f"Network error occurred while fetching OHLCV data for "
@@ -710,22 +736,82 @@ class CCXTOHLCVDataProvider(DataProvider):
                 "internet connection"
             )
 
-        # Explicit dtypes so an empty `data` list (no candles in range)
+        # Explicit dtypes so an empty list (no candles in range)
         # still yields a typed Datetime column instead of Null.
         schema = {
-            "Datetime": pl.Utf8,
+            "Datetime": pl.Int64,
             "Open": pl.Float64,
             "High": pl.Float64,
             "Low": pl.Float64,
             "Close": pl.Float64,
             "Volume": pl.Float64,
         }
-
-        # Combine the Series into a DataFrame with given column names
-        df = pl.DataFrame(data, schema=schema, orient="row").with_columns(
-            pl.col("Datetime").str.to_datetime(time_unit="ms", time_zone="UTC")
+        candles = [
+            [candle[0]] + [float(value) for value in candle[1:6]]
+            for result in results for candle in result
+        ]
+        df = pl.DataFrame(candles, schema=schema, orient="row")
+        return df.unique(subset="Datetime", keep="first").sort(
+            "Datetime"
+        ).with_columns(
+            pl.col("Datetime").cast(pl.Datetime(time_unit="ms"))
+            .dt.replace_time_zone("UTC")
         )
-        return df
+
+    @staticmethod
+    def _to_milliseconds(date: datetime) -> int:
+        """
+        Converts a datetime to a millisecond timestamp, truncated to
+        whole seconds. Naive datetimes are interpreted as UTC.
+        """
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+
+        return int(date.timestamp()) * 1000
+
+    @classmethod
+    def get_exchange(cls, market, market_credential):
+        """
+        Function to get the pooled exchange client and rate limiter for
+        a market and market credential. The exchange is initialized
+        with `initialize_exchange` on first use and reused afterwards,
+        also by other data providers and threads.
+
+        Args:
+            market (str): The market to get the exchange for
+            market_credential (MarketCredential): The market credential
+                to use for the exchange
+
+        Returns:
+            Tuple[Exchange, TokenBucket]: CCXT exchange client and the
+                rate limiter for its requests
+        """
+        key = (market.lower(),)
+
+        if market_credential is not None:
+            key += (
+                market_credential.api_key, market_credential.secret_key
+            )
+
+        with cls._exchange_pool_lock:
+            if key not in cls._exchange_pool:
+                exchange = cls.initialize_exchange(market, market_credential)
+                rate_limit = getattr(exchange, "rateLimit", None) or 0
+                rate_limiter = TokenBucket(
+                    rate=1000 / rate_limit if rate_limit > 0
+                    else float("inf")
+                )
+                cls._exchange_pool[key] = (exchange, rate_limiter)
+
+            return cls._exchange_pool[key]
+
+    @classmethod
+    def clear_exchange_pool(cls):
+        """
+        Function to remove all pooled exchange clients.
+        """
+        with cls._exchange_pool_lock:
+            cls._exchange_pool.clear()
 
     def create_start_date(self, end_date, time_frame, window_size):
         minutes = TimeFrame.from_value(time_frame).amount_of_minutes
@@ -839,6 +925,197 @@ class CCXTOHLCVDataProvider(DataProvider):
             self._canonical_storage_file_name(symbol, market, time_frame),
         )
 
+    def get_storage_format(self) -> str:
+        """
+        Get the format of the OHLCV cache in the storage directory.
+
+        Returns:
+            str: The storage_format of the provider, the
+                OHLCV_STORAGE_FORMAT config value or "csv".
+        """
+        storage_format = self.storage_format
+
+        if storage_format is None and self.config is not None:
+            storage_format = self.config.get(OHLCV_STORAGE_FORMAT)
+
+        if storage_format is None:
+            return "csv"
+
+        if storage_format not in self.storage_formats:
+            raise OperationalException(
+                f"Storage format {storage_format} is not supported, "
+                f"supported formats are {', '.join(self.storage_formats)}"
+            )
+
+        return storage_format
+
+    def _canonical_arrow_directory_path(
+        self, storage_path, symbol: str, market: str, time_frame
+    ) -> Union[str, None]:
+        """
+        Directory of the Arrow IPC files of the canonical cache for
+        (symbol, market, time_frame), next to the canonical CSV file.
+        """
+        file_path = self._canonical_storage_file_path(
+            storage_path, symbol, market, time_frame
+        )
+
+        if file_path is None:
+            return None
+
+        return f"{os.path.splitext(file_path)[0]}.arrow"
+
+    @staticmethod
+    def _arrow_parts(directory_path: str) -> List[str]:
+        return sorted(
+            os.path.join(directory_path, file_name)
+            for file_name in os.listdir(directory_path)
+            if file_name.endswith(".arrow")
+        )
+
+    def _read_ohlcv_arrow(
+        self, directory_path: str
+    ) -> Union[pl.DataFrame, None]:
+        """
+        Reads the Arrow IPC files of a canonical cache directory. The
+        files are memory-mapped and already typed and sorted, the
+        frames of the appended files are concatenated without copying.
+        """
+        parts = self._arrow_parts(directory_path)
+
+        if not parts:
+            return None
+
+        try:
+            frames = [pl.read_ipc(part, memory_map=True) for part in parts]
+        except Exception as e:
+            logger.warning(
+                f"Error reading cached OHLCV data from {directory_path}: {e}"
+            )
+            return None
+
+        self.data_file_path = directory_path
+        return pl.concat(frames, how="vertical", rechunk=False)
+
+    def _write_arrow_directory(self, directory_path: str, data) -> None:
+        """
+        Writes OHLCV data to a canonical Arrow cache directory.
+
+        When the data only adds bars after the cached range (the
+        common case of a cache that is kept up to date), the new bars
+        are written as an additional file. Otherwise, or once the
+        cache has ``max_arrow_parts`` files, the cache is rewritten as
+        a single file.
+        """
+        data = data.select(
+            pl.col("Datetime").cast(pl.Datetime("ms", "UTC")),
+            *[
+                pl.col(column).cast(pl.Float64)
+                for column in ("Open", "High", "Low", "Close", "Volume")
+                if column in data.columns
+            ],
+        )
+        os.makedirs(directory_path, exist_ok=True)
+        parts = self._arrow_parts(directory_path)
+        append = False
+
+        if parts and len(parts) < self.max_arrow_parts:
+            first = pl.read_ipc(parts[0], memory_map=True)
+            last = pl.read_ipc(parts[-1], memory_map=True)
+            append = len(first) > 0 and len(last) > 0 \
+                and data["Datetime"][0] == first["Datetime"][0] \
+                and data.columns == first.columns
+            cached_end = last["Datetime"][-1] if append else None
+
+        if append:
+            data = data.filter(pl.col("Datetime") > cached_end)
+
+            if len(data) == 0:
+                return
+
+        index = int(
+            os.path.splitext(os.path.basename(parts[-1]))[0]
+        ) + 1 if parts else 0
+        part_path = os.path.join(directory_path, f"{index:06d}.arrow")
+        temporary_path = f"{part_path}.tmp"
+        data.write_ipc(temporary_path)
+        os.replace(temporary_path, part_path)
+
+        if not append:
+            for part in parts:
+                os.remove(part)
+
+        self.data_file_path = directory_path
+
+    def migrate_csv_cache(
+        self, storage_path: str = None, remove_csv: bool = False
+    ) -> List[str]:
+        """
+        Converts the CSV OHLCV caches in a storage directory, both
+        canonical and legacy (date-range-suffixed) files, to the Arrow
+        format, one cache directory per (symbol, market, time_frame).
+        Caches that already have an Arrow directory are skipped.
+
+        Args:
+            storage_path (str, optional): The storage directory.
+                Defaults to the storage directory of the provider.
+            remove_csv (bool): If True, the migrated CSV files are
+                removed.
+
+        Returns:
+            List[str]: The paths of the created Arrow cache directories.
+        """
+        if storage_path is None:
+            storage_path = self.get_storage_directory()
+
+        if storage_path is None or not os.path.isdir(storage_path):
+            return []
+
+        # "OHLCV_<SYMBOL>_<MARKET>_<TIME_FRAME>[_<START>_<END>].csv"
+        caches = {}
+
+        for file_name in sorted(os.listdir(storage_path)):
+            parts = file_name[:-len(".csv")].split("_")
+
+            if not file_name.endswith(".csv") or parts[0] != "OHLCV" \
+                    or len(parts) not in (4, 6):
+                continue
+
+            caches.setdefault(tuple(parts[1:4]), []).append(
+                os.path.join(storage_path, file_name)
+            )
+
+        storage_format = self.storage_format
+        migrated = []
+
+        try:
+            for (symbol, market, time_frame), files in caches.items():
+                directory_path = self._canonical_arrow_directory_path(
+                    storage_path, symbol, market, time_frame
+                )
+
+                if os.path.isdir(directory_path):
+                    continue
+
+                self.storage_format = "csv"
+                data = self._read_canonical_file(
+                    storage_path, symbol, market, time_frame
+                )
+
+                if data is None or len(data) == 0:
+                    continue
+
+                self._write_arrow_directory(directory_path, data)
+                migrated.append(directory_path)
+
+                if remove_csv:
+                    for file_path in files:
+                        os.remove(file_path)
+        finally:
+            self.storage_format = storage_format
+
+        return migrated
+
     def _read_ohlcv_csv(self, file_path: str) -> Union[pl.DataFrame, None]:
         """
         Reads a single OHLCV CSV file from disk and normalizes its
@@ -942,6 +1219,15 @@ class CCXTOHLCVDataProvider(DataProvider):
         never writes to disk. Returns None if there is no cached data
         at all yet.
         """
+        if self.get_storage_format() == "arrow":
+            directory_path = self._canonical_arrow_directory_path(
+                storage_path, symbol, market, time_frame
+            )
+
+            if directory_path is not None \
+                    and os.path.isdir(directory_path):
+                return self._read_ohlcv_arrow(directory_path)
+
         file_path = self._canonical_storage_file_path(
             storage_path, symbol, market, time_frame
         )
@@ -959,6 +1245,15 @@ class CCXTOHLCVDataProvider(DataProvider):
         if data is None or len(data) == 0:
             return
 
+        if self.get_storage_format() == "arrow":
+            self._write_arrow_directory(
+                self._canonical_arrow_directory_path(
+                    storage_path, symbol, market, time_frame
+                ),
+                data,
+            )
+            return
+
         file_path = self._canonical_storage_file_path(
             storage_path, symbol, market, time_frame
         )
@@ -1055,6 +1350,18 @@ class CCXTOHLCVDataProvider(DataProvider):
 
         if not gaps:
             merged = cached
+
+            # Migrate an existing CSV cache to the Arrow format
+            if persist and cached is not None \
+                    and self.get_storage_format() == "arrow" \
+                    and not os.path.isdir(
+                        self._canonical_arrow_directory_path(
+                            storage_path, symbol, market, time_frame
+                        )
+                    ):
+                self._write_canonical_file(
+                    storage_path, symbol, market, time_frame, merged
+                )
         else:
             downloaded = [
                 self.get_ohlcv(
@@ -1134,6 +1441,9 @@ class CCXTOHLCVDataProvider(DataProvider):
         A sliding window is calculated as a subset of the data. It will
         take for each timestamp in the data a window of size `window_size`
         and stores it in a cache with the last timestamp of the window.
+        The cache is a :class:`SlidingWindows` index that only keeps the
+        row offsets of every window and returns zero-copy slices of the
+        data on lookup.
 
         So if the window size is 200, the first window will be
         the first 200 rows of the data, the second window will be
@@ -1153,28 +1463,24 @@ class CCXTOHLCVDataProvider(DataProvider):
         Returns:
             None
         """
-        self.window_cache = {}
-        timestamps = data["Datetime"].to_list()
-        # Only select the entries after the start date
-        timestamps = [
-            ts for ts in timestamps if start_date <= ts <= end_date
-        ]
-
-        # Create sliding windows of size <window_size> for each timestamp
-        # in the data with the given the time frame and window size
-        for timestamp in timestamps:
-            # Use timestamp as key
-            self.window_cache[timestamp] = data.filter(
-                (data["Datetime"] <= timestamp) &
-                (data["Datetime"] >= timestamp - timedelta(
-                    minutes=time_frame.amount_of_minutes * window_size
-                ))
-            )
+        # The row offsets of the windows require sorted data
+        if not data["Datetime"].is_sorted():
+            data = data.sort("Datetime")
+
+        self.window_cache = SlidingWindows(
+            data,
+            window=timedelta(
+                minutes=time_frame.amount_of_minutes * window_size
+            ),
+            start_date=start_date,
+            end_date=end_date,
+        )
 
         # Make sure the end datetime of the backtest is included in the
         # sliding windows cache
         if end_date not in self.window_cache:
-            self.window_cache[end_date] = data[-window_size:]
+            offset = max(len(data) - window_size, 0)
+            self.window_cache.append(end_date, offset, len(data) - offset)
 
     def get_storage_directory(self) -> Union[str, None]:
         """
@@ -1252,6 +1558,7 @@ class CCXTOHLCVDataProvider(DataProvider):
             storage_directory=storage_path,
             config=self.config,
             pandas=data_source.pandas,
+            storage_format=self.storage_format,
         )
         provider.data = self.data
         provider.missing_data_point_dates = \
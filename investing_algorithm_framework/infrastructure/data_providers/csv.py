@@ -1,11 +1,27 @@
 from typing import List, Union
 from datetime import datetime, timezone, timedelta
 
+import numpy as np
 import polars as pl
 
 from investing_algorithm_framework.domain import DataProvider, \
-    OperationalException, DataSource, DataType, TimeFrame, \
-    convert_polars_to_pandas
+    OperationalException, DataSource, DataType, TimeFrame
+
+from .sliding_windows import SlidingWindows
+
+
+def _naive_utc(date: datetime) -> datetime:
+    if date.tzinfo is not None:
+        date = date.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return date
+
+
+def _to_milliseconds(date: datetime) -> int:
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return int(date.timestamp() * 1000)
 
 
 class CSVOHLCVDataProvider(DataProvider):
@@ -16,6 +32,11 @@ class CSVOHLCVDataProvider(DataProvider):
     The Datetime column should be in UTC timezone and in milliseconds.
     The data will be loaded into a Polars DataFrame and will be kept in memory.
 
+    With ``lazy=True`` the file is not loaded on initialization. Only
+    the date range of the file is read, and the rows that are needed
+    (e.g. the backtest range plus its warmup window) are loaded on
+    first use, filtered while the file is scanned.
+
     Attributes:
         data_type (DataType): The type of data provided by this provider,
             which is OHLCV.
@@ -26,6 +47,8 @@ class CSVOHLCVDataProvider(DataProvider):
         _end_date_data_source (datetime): The end date of the data
             source, determined from the last row of the data.
         data (polars.DataFrame): The OHLCV data loaded from the CSV file.
+        lazy (bool): If True, only the rows that are needed are
+            loaded from the CSV file.
     """
     data_type = DataType.OHLCV
     data_provider_identifier = "csv_ohlcv_data_provider"
@@ -40,6 +63,7 @@ class CSVOHLCVDataProvider(DataProvider):
         warmup_window=None,
         data_provider_identifier: str = None,
         pandas: bool = False,
+        lazy: bool = False,
     ):
         """
         Initialize the CSV Data Provider.
@@ -51,6 +75,9 @@ class CSVOHLCVDataProvider(DataProvider):
             market (str, optional): The market for the data. Defaults to None.
             window_size (int, optional): The window size for the data.
                 Defaults to None.
+            lazy (bool, optional): If True, only the rows that are
+                needed are loaded from the CSV file, when they are
+                first needed. Defaults to False.
         """
         if warmup_window is not None and window_size is None:
             window_size = warmup_window
@@ -70,6 +97,8 @@ class CSVOHLCVDataProvider(DataProvider):
         self._end_date_data_source = None
         self._columns = ["Datetime", "Open", "High", "Low", "Close", "Volume"]
         self.window_cache = {}
+        self.lazy = lazy
+        self._loaded_range = None
         self._load_data(self.storage_path)
         self.pandas = pandas
         self.number_of_missing_data_points = 0
@@ -171,6 +200,7 @@ class CSVOHLCVDataProvider(DataProvider):
                     self.time_frame
                 ).amount_of_minutes * windows_size
             )
+            self._ensure_data(start_date, end_date)
             df = self.data
             df = df.filter(
                 (df['Datetime'] >= start_date) & (df['Datetime'] <= end_date)
@@ -189,6 +219,7 @@ class CSVOHLCVDataProvider(DataProvider):
             if start_date > self._end_date_data_source:
                 return pl.DataFrame()
 
+            self._ensure_data(start_date, end_date)
             df = self.data
             df = df.filter(
                 (df['Datetime'] >= start_date) & (df['Datetime'] <= end_date)
@@ -208,12 +239,14 @@ class CSVOHLCVDataProvider(DataProvider):
             if end_date > self._end_date_data_source:
                 return pl.DataFrame()
 
+            self._ensure_data(start_date, end_date)
             df = self.data
             df = df.filter(
                 (df['Datetime'] >= start_date) & (df['Datetime'] <= end_date)
             )
             return df
 
+        self._ensure_data()
         return self.data
 
     def prepare_backtest_data(
@@ -262,6 +295,7 @@ class CSVOHLCVDataProvider(DataProvider):
                 minutes=TimeFrame.from_value(self.time_frame)
                 .amount_of_minutes * self.window_size
             )
+        self._ensure_data(required_start_date, backtest_end_date)
 
         # Create cache with sliding windows
         self._precompute_sliding_windows(
@@ -321,6 +355,9 @@ class CSVOHLCVDataProvider(DataProvider):
         Returns:
            pl.DataFrame: The backtest data for the given datasource.
         """
+        # The data the returned rows are taken from
+        source = self.data
+
         if backtest_start_date is not None and \
                 backtest_end_date is not None:
 
@@ -364,41 +401,38 @@ class CSVOHLCVDataProvider(DataProvider):
                     f"- {self._end_date_data_source}."
                 )
 
+            self._ensure_data(backtest_start_date, backtest_end_date)
             data = self.data.filter(
                 (pl.col("Datetime") >= backtest_start_date) &
                 (pl.col("Datetime") <= backtest_end_date)
             )
         else:
-            try:
-                data = self.window_cache[backtest_index_date]
-            except KeyError:
-
-                try:
-                    # Return the key in the cache that is closest to the
-                    # backtest_index_date but not after it.
-                    closest_key = min(
-                        [k for k in self.window_cache.keys()
-                         if k >= backtest_index_date]
-                    )
-                    data = self.window_cache[closest_key]
-                except ValueError:
+            data = None
+
+            # The window of the first prepared timestamp at or after
+            # the backtest_index_date.
+            if isinstance(self.window_cache, SlidingWindows):
+                data = self.window_cache.at_or_after(backtest_index_date)
+                source = self.window_cache.data
 
-                    if data_source is not None:
-                        raise OperationalException(
-                            "No data available for the "
-                            f"date: {backtest_index_date} "
-                            "within the prepared backtest data "
-                            f"for data source {data_source.identifier}."
-                        )
+            if data is None:
 
+                if data_source is not None:
                     raise OperationalException(
                         "No data available for the "
                         f"date: {backtest_index_date} "
-                        "within the prepared backtest data."
+                        "within the prepared backtest data "
+                        f"for data source {data_source.identifier}."
                     )
 
+                raise OperationalException(
+                    "No data available for the "
+                    f"date: {backtest_index_date} "
+                    "within the prepared backtest data."
+                )
+
         if self.pandas:
-            data = convert_polars_to_pandas(data)
+            data = self.convert_to_pandas(data, source=source)
 
         return data
 
@@ -411,6 +445,9 @@ class CSVOHLCVDataProvider(DataProvider):
 
         The Datetime column should be in UTC timezone and in milliseconds.
 
+        In lazy mode only the first and last date of the file are read,
+        the rows themselves are loaded by `_ensure_data`.
+
         Args:
             storage_path (str): The path to the CSV file containing OHLCV data.
 
@@ -421,33 +458,108 @@ class CSVOHLCVDataProvider(DataProvider):
         Returns:
             None
         """
-        df = pl.read_csv(storage_path)
+        # The columns are validated from the header of the file
+        columns = pl.scan_csv(storage_path).collect_schema().names()
 
         # Check if all column names are in the csv file
-        if not all(column in df.columns for column in self._columns):
+        if not all(column in columns for column in self._columns):
             # Identify missing columns
             missing_columns = [column for column in self._columns if
-                               column not in df.columns]
+                               column not in columns]
             raise OperationalException(
                 f"Csv file {storage_path} does not contain "
                 f"all required ohlcv columns. "
                 f"Missing columns: {missing_columns}"
             )
 
-        self.data = pl.read_csv(
+        if self.lazy:
+            self.data = None
+            self._loaded_range = None
+            bounds = self._scan_data(storage_path).select(
+                pl.col("Datetime").first().alias("start"),
+                pl.col("Datetime").last().alias("end"),
+            ).collect()
+            self._start_date_data_source = bounds["start"][0]
+            self._end_date_data_source = bounds["end"][0]
+            return
+
+        self.data = self._scan_data(storage_path).collect()
+        self._loaded_range = (None, None)
+
+        first_row = self.data.head(1)
+        last_row = self.data.tail(1)
+        self._start_date_data_source = first_row["Datetime"][0]
+        self._end_date_data_source = last_row["Datetime"][0]
+
+    @staticmethod
+    def _scan_data(
+        storage_path: str,
+        start_date: datetime = None,
+        end_date: datetime = None
+    ) -> pl.LazyFrame:
+        """
+        Scan the OHLCV data of a CSV file, optionally only the rows
+        between start_date and end_date (inclusive).
+
+        The date filter is applied on the parsed Datetime column, before
+        it is converted to UTC, so that Polars can push it down into the
+        CSV scan and only the matching rows are materialised.
+        """
+        data = pl.scan_csv(
             storage_path,
             schema_overrides={"Datetime": pl.Datetime},
             low_memory=True
-        ).with_columns(
+        )
+
+        # Datetimes with a UTC offset are parsed as naive UTC datetimes
+        if start_date is not None:
+            data = data.filter(pl.col("Datetime") >= _naive_utc(start_date))
+
+        if end_date is not None:
+            data = data.filter(pl.col("Datetime") <= _naive_utc(end_date))
+
+        return data.with_columns(
             pl.col("Datetime").cast(
                 pl.Datetime(time_unit="ms", time_zone="UTC")
             )
         )
 
-        first_row = self.data.head(1)
-        last_row = self.data.tail(1)
-        self._start_date_data_source = first_row["Datetime"][0]
-        self._end_date_data_source = last_row["Datetime"][0]
+    def _ensure_data(
+        self, start_date: datetime = None, end_date: datetime = None
+    ) -> None:
+        """
+        In lazy mode, load the rows between start_date and end_date
+        from the CSV file if they are not loaded yet. A None date
+        means the start or end of the file. The loaded range only
+        grows, so data that was loaded before stays available.
+        """
+        if not self.lazy:
+            return
+
+        if self._loaded_range is not None:
+            loaded_start, loaded_end = self._loaded_range
+
+            if (loaded_start is None or (
+                    start_date is not None and start_date >= loaded_start
+            )) and (loaded_end is None or (
+                    end_date is not None and end_date <= loaded_end
+            )):
+                return
+
+            if start_date is not None and loaded_start is not None:
+                start_date = min(start_date, loaded_start)
+            else:
+                start_date = None
+
+            if end_date is not None and loaded_end is not None:
+                end_date = max(end_date, loaded_end)
+            else:
+                end_date = None
+
+        self.data = self._scan_data(
+            self.storage_path, start_date, end_date
+        ).collect()
+        self._loaded_range = (start_date, end_date)
 
     def _precompute_sliding_windows(
         self,
@@ -461,6 +573,9 @@ class CSVOHLCVDataProvider(DataProvider):
         A sliding window is calculated as a subset of the data. It will
         take for each timestamp in the data a window of size `window_size`
         and stores it in a cache with the last timestamp of the window.
+        The cache is a :class:`SlidingWindows` index that only keeps the
+        row offsets of every window and returns zero-copy slices of the
+        data on lookup.
 
         So if the window size is 200, the first window will be
         the first 200 rows of the data, the second window will be
@@ -478,25 +593,18 @@ class CSVOHLCVDataProvider(DataProvider):
         Returns:
             None
         """
-        self.window_cache = {}
-        timestamps = self.data["Datetime"].to_list()
-
-        # Only select the entries after the start date
-        timestamps = [
-            ts for ts in timestamps
-            if start_date <= ts <= end_date
-        ]
-
-        # Create sliding windows of size <window_size> for each timestamp
-        # in the data with the given the time frame and window size
-        for timestamp in timestamps:
-            # Use timestamp as key
-            self.window_cache[timestamp] = self.data.filter(
-                (self.data["Datetime"] <= timestamp) &
-                (self.data["Datetime"] >= timestamp - timedelta(
-                    minutes=self.time_frame.amount_of_minutes * window_size
-                ))
-            )
+        # The row offsets of the windows require sorted data
+        if not self.data["Datetime"].is_sorted():
+            self.data = self.data.sort("Datetime")
+
+        self.window_cache = SlidingWindows(
+            self.data,
+            window=timedelta(
+                minutes=self.time_frame.amount_of_minutes * window_size
+            ),
+            start_date=start_date,
+            end_date=end_date,
+        )
 
     def copy(self, data_source: DataSource) -> "DataProvider":
         """
@@ -522,7 +630,8 @@ class CSVOHLCVDataProvider(DataProvider):
             market=data_source.market,
             warmup_window=data_source.warmup_window,
             data_provider_identifier=self.data_provider_identifier,
-            pandas=data_source.pandas
+            pandas=data_source.pandas,
+            lazy=self.lazy,
         )
 
     def get_number_of_data_points(
@@ -543,6 +652,7 @@ class CSVOHLCVDataProvider(DataProvider):
             int: The number of available data points between the given
                 start and end dates.
         """
+        self._ensure_data(start_date, end_date)
         available_dates = [
             date for date in self.data["Datetime"].to_list()
             if start_date <= date <= end_date
@@ -594,6 +704,10 @@ class CSVTickerDataProvider(DataProvider):
     Close to bid, ask, and last (since CSV has no live
     order-book data).
 
+    The rows are kept sorted by date next to an int64 array of
+    their timestamps, so the row of a date is found with a
+    binary search instead of filtering the data.
+
     Attributes:
         data_type (DataType): DataType.TICKER
         data_provider_identifier (str): Identifier for the CSV
@@ -638,7 +752,9 @@ class CSVTickerDataProvider(DataProvider):
         self._columns = [
             "Datetime", "Open", "High", "Low", "Close", "Volume"
         ]
-        self._backtest_data = {}
+        self._timestamps = None
+        self._rows = []
+        self._backtest_rows = None
         self._load_data(self.storage_path)
 
     def has_data(
@@ -710,9 +826,7 @@ class CSVTickerDataProvider(DataProvider):
         if lookup_date is None:
             lookup_date = datetime.now(tz=timezone.utc)
 
-        return self._row_to_ticker(
-            self._find_closest_row(self.data, lookup_date)
-        )
+        return self._row_to_ticker(self._find_closest_row(lookup_date))
 
     def prepare_backtest_data(
         self,
@@ -722,7 +836,8 @@ class CSVTickerDataProvider(DataProvider):
         show_progress: bool = False,
     ) -> None:
         """
-        Prepare backtest data by indexing rows for fast lookup.
+        Prepare backtest data by looking up the rows of the
+        backtest range in the index.
 
         Args:
             backtest_start_date (datetime): Start of the
@@ -748,14 +863,16 @@ class CSVTickerDataProvider(DataProvider):
                 f"{self._end_date_data_source}"
             )
 
-        filtered = self.data.filter(
-            (pl.col("Datetime") >= backtest_start_date)
-            & (pl.col("Datetime") <= backtest_end_date)
+        self._backtest_rows = (
+            int(np.searchsorted(
+                self._timestamps, _to_milliseconds(backtest_start_date)
+            )),
+            int(np.searchsorted(
+                self._timestamps,
+                _to_milliseconds(backtest_end_date),
+                side="right"
+            )),
         )
-        self._backtest_data = {}
-
-        for row in filtered.iter_rows(named=True):
-            self._backtest_data[row["Datetime"]] = row
 
     def get_backtest_data(
         self,
@@ -780,18 +897,13 @@ class CSVTickerDataProvider(DataProvider):
         Returns:
             dict: Ticker dict for the given date.
         """
-        if backtest_index_date in self._backtest_data:
-            return self._row_to_ticker(
-                self._backtest_data[backtest_index_date]
-            )
-
-        # Find the closest date that is <= backtest_index_date
-        candidates = [
-            k for k in self._backtest_data.keys()
-            if k <= backtest_index_date
-        ]
+        first, stop = self._backtest_rows or (0, 0)
+        # The last prepared row at or before backtest_index_date
+        position = min(
+            self._find_position(backtest_index_date), stop - 1
+        )
 
-        if not candidates:
+        if position < first:
             if data_source is not None:
                 raise OperationalException(
                     "No ticker data available for "
@@ -807,10 +919,7 @@ class CSVTickerDataProvider(DataProvider):
                 "within the prepared backtest data."
             )
 
-        closest = max(candidates)
-        return self._row_to_ticker(
-            self._backtest_data[closest]
-        )
+        return self._row_to_ticker(self._rows[position])
 
     def copy(
         self, data_source: DataSource
@@ -847,11 +956,13 @@ class CSVTickerDataProvider(DataProvider):
         Returns the number of data points between the
         given dates.
         """
-        available = [
-            d for d in self.data["Datetime"].to_list()
-            if start_date <= d <= end_date
-        ]
-        return len(available)
+        return int(
+            np.searchsorted(
+                self._timestamps, _to_milliseconds(end_date), side="right"
+            ) - np.searchsorted(
+                self._timestamps, _to_milliseconds(start_date)
+            )
+        )
 
     def get_missing_data_dates(
         self,
@@ -905,7 +1016,7 @@ class CSVTickerDataProvider(DataProvider):
                     time_unit="ms", time_zone="UTC"
                 )
             )
-        )
+        ).sort("Datetime")
 
         first_row = self.data.head(1)
         last_row = self.data.tail(1)
@@ -914,29 +1025,41 @@ class CSVTickerDataProvider(DataProvider):
         self._end_date_data_source = \
             last_row["Datetime"][0]
 
-    @staticmethod
-    def _find_closest_row(
-        data: pl.DataFrame, target_date: datetime
-    ) -> dict:
+        # Index of the rows for binary search lookups
+        self._timestamps = self.data["Datetime"].dt.epoch("ms").to_numpy()
+        self._rows = self.data.rows(named=True)
+
+    def _find_position(self, target_date: datetime) -> int:
         """
-        Find the row closest to target_date (not after it).
+        Find the position of the last row at or before target_date.
 
         Args:
-            data (pl.DataFrame): The data to search.
             target_date (datetime): The target date.
 
         Returns:
-            dict: The matching row as a dict.
+            int: The position of the row, -1 if every row is after
+                target_date.
         """
-        filtered = data.filter(
-            pl.col("Datetime") <= target_date
-        )
+        return int(
+            np.searchsorted(
+                self._timestamps,
+                _to_milliseconds(target_date),
+                side="right"
+            )
+        ) - 1
 
-        if filtered.is_empty():
-            # Fall back to the first available row
-            return data.head(1).to_dicts()[0]
+    def _find_closest_row(self, target_date: datetime) -> dict:
+        """
+        Find the row closest to target_date (not after it).
 
-        return filtered.tail(1).to_dicts()[0]
+        Args:
+            target_date (datetime): The target date.
+
+        Returns:
+            dict: The matching row as a dict.
+        """
+        # Fall back to the first available row
+        return self._rows[max(self._find_position(target_date), 0)]
 
     def _row_to_ticker(self, row: dict) -> dict:
         """
@@ -1,8 +1,10 @@
 import logging
 import os
+import time
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Union, Dict
+from typing import Union, Dict, List
 
 import polars as pl
 import pandas as pd
@@ -31,6 +33,7 @@ class OHLCVDataProviderBase(DataProvider):
     - `get_backtest_data()` — slice cached data by index date
     - `copy()` — clone instance for a specific DataSource
     - `get_number_of_data_points()` / `get_missing_data_dates()`
+    - `download_ohlcv()` — chunked, concurrent download of many symbols
     - CSV-based storage helpers
 
     Subclasses only need to implement:
@@ -56,6 +59,13 @@ class OHLCVDataProviderBase(DataProvider):
     # e.g. {"1d": "1d", "1W": "1wk"} for Yahoo
     timeframe_map: Dict[str, object] = {}
 
+    # Candles per downloaded chunk, download threads, and retries of a
+    # failed chunk (with exponential backoff in seconds) of download_ohlcv
+    download_chunk_size = 5000
+    max_download_workers = 4
+    max_download_retries = 3
+    download_retry_backoff = 1.0
+
     def __init__(
         self,
         symbol: str = None,
@@ -235,7 +245,7 @@ class OHLCVDataProviderBase(DataProvider):
         )
 
         if self.pandas:
-            return convert_polars_to_pandas(filtered)
+            return self.convert_to_pandas(filtered)
 
         return filtered
 
@@ -368,6 +378,127 @@ class OHLCVDataProviderBase(DataProvider):
     def get_data_source_file_path(self) -> Union[str, None]:
         return self.data_file_path
 
+    def download_ohlcv(
+        self,
+        symbols: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        time_frame=None,
+        max_workers: int = None,
+        save: bool = True,
+    ) -> Dict[str, pl.DataFrame]:
+        """
+        Download the OHLCV data of many symbols at once.
+
+        The date range is split into chunks of ``download_chunk_size``
+        candles and every (symbol, chunk) pair is downloaded with
+        `_download_ohlcv` by a pool of ``max_download_workers`` threads.
+        A failing chunk is retried ``max_download_retries`` times, with
+        a backoff of ``download_retry_backoff`` seconds that doubles
+        every attempt. The chunks of a symbol are merged with the data
+        already in storage and written in one write per symbol.
+
+        Args:
+            symbols (List[str]): The symbols to download.
+            start_date (datetime): The start date of the data.
+            end_date (datetime): The end date of the data.
+            time_frame: The time frame of the data, defaults to the
+                time frame of the data provider.
+            max_workers (int): The number of download threads, defaults
+                to ``max_download_workers``.
+            save (bool): Whether to save the data to the storage
+                directory of the data provider.
+
+        Returns:
+            Dict[str, pl.DataFrame]: The downloaded data by symbol.
+        """
+        time_frame = time_frame or self.time_frame
+
+        if time_frame is None:
+            raise OperationalException(
+                "Time frame is not set. Please set the time frame "
+                "before requesting ohlcv data."
+            )
+
+        if start_date > end_date:
+            raise OperationalException(
+                "OHLCV data start date must be before end date"
+            )
+
+        storage_dir = None
+
+        if save:
+            storage_dir = self.get_storage_directory()
+
+            if storage_dir is None:
+                raise OperationalException(
+                    "Storage directory is not set for "
+                    f"the {self.__class__.__name__}."
+                )
+
+        if max_workers is None:
+            max_workers = self.max_download_workers
+
+        tasks = [
+            (symbol, chunk_start, chunk_end)
+            for symbol in symbols
+            for chunk_start, chunk_end in self._split_date_range(
+                time_frame, start_date, end_date
+            )
+        ]
+
+        def download(task):
+            symbol, chunk_start, chunk_end = task
+
+            try:
+                return self._download_chunk(
+                    symbol, time_frame, chunk_start, chunk_end
+                )
+            except Exception as e:
+                return e
+
+        if len(tasks) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(tasks))
+            ) as executor:
+                results = list(executor.map(download, tasks))
+        else:
+            results = [download(task) for task in tasks]
+
+        chunks = {symbol: [] for symbol in symbols}
+        errors = {}
+
+        for (symbol, _, _), result in zip(tasks, results):
+            if isinstance(result, Exception):
+                errors.setdefault(symbol, result)
+            else:
+                chunks[symbol].append(result)
+
+        data = {}
+
+        for symbol in symbols:
+            if symbol in errors:
+                continue
+
+            data[symbol] = self._merge_chunks(
+                chunks[symbol], start_date, end_date
+            )
+
+            if storage_dir is not None:
+                self._merge_into_storage(
+                    symbol, time_frame, data[symbol], storage_dir
+                )
+
+        if errors:
+            raise OperationalException(
+                f"Failed to download {self.market_name} data for "
+                + ", ".join(
+                    f"{symbol} ({error})" for symbol, error in errors.items()
+                )
+            )
+
+        return data
+
     # ── Subclass hooks ──────────────────────────────────────────
 
     @abstractmethod
@@ -397,9 +528,12 @@ class OHLCVDataProviderBase(DataProvider):
 
     # ── Shared private helpers ──────────────────────────────────
 
-    def _get_provider_interval(self) -> object:
-        """Get the provider-specific interval for the current time frame."""
-        tf = self.time_frame
+    def _get_provider_interval(self, time_frame=None) -> object:
+        """
+        Get the provider-specific interval for the given time frame,
+        defaults to the time frame of the data provider.
+        """
+        tf = time_frame or self.time_frame
 
         if hasattr(tf, "value"):
             tf = tf.value
@@ -433,6 +567,124 @@ class OHLCVDataProviderBase(DataProvider):
             f"api_key='your_key'))"
         )
 
+    def _split_date_range(
+        self, time_frame, start_date: datetime, end_date: datetime
+    ) -> List[tuple]:
+        """
+        Split a date range into (start, end) chunks of
+        ``download_chunk_size`` candles. Consecutive chunks share their
+        boundary date.
+        """
+        n_minutes = TimeFrame.from_value(time_frame).amount_of_minutes
+        length = timedelta(minutes=n_minutes * self.download_chunk_size)
+        chunks = []
+        chunk_start = start_date
+
+        while True:
+            chunk_end = min(chunk_start + length, end_date)
+            chunks.append((chunk_start, chunk_end))
+
+            if chunk_end >= end_date:
+                return chunks
+
+            chunk_start = chunk_end
+
+    def _download_chunk(
+        self,
+        symbol: str,
+        time_frame,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> pl.DataFrame:
+        """
+        Download a chunk with `_download_ohlcv`, retrying failed
+        downloads with exponential backoff. Configuration errors and
+        missing dependencies are not retried.
+        """
+        attempt = 0
+
+        while True:
+            try:
+                return self._download_ohlcv(
+                    symbol=symbol,
+                    time_frame=time_frame,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+            except (OperationalException, ImportError):
+                raise
+            except Exception as e:
+                if attempt >= self.max_download_retries:
+                    raise
+
+                delay = self.download_retry_backoff * 2 ** attempt
+                attempt += 1
+                logger.warning(
+                    f"Error downloading {self.market_name} data for "
+                    f"{symbol} from {start_date} to {end_date}: {e}. "
+                    f"Retrying in {delay} seconds "
+                    f"({attempt}/{self.max_download_retries})"
+                )
+                time.sleep(delay)
+
+    @staticmethod
+    def _merge_chunks(
+        chunks: List[pl.DataFrame], start_date: datetime, end_date: datetime
+    ) -> pl.DataFrame:
+        """
+        Merge downloaded chunks into one DataFrame of the date range,
+        without the duplicate candles of overlapping chunks.
+        """
+        non_empty = [chunk for chunk in chunks if len(chunk) > 0]
+
+        if len(non_empty) == 0:
+            return chunks[0]
+
+        return pl.concat(non_empty, how="vertical_relaxed").filter(
+            (pl.col("Datetime") >= start_date)
+            & (pl.col("Datetime") <= end_date)
+        ).unique(subset="Datetime", keep="first").sort("Datetime")
+
+    def _merge_into_storage(
+        self,
+        symbol: str,
+        time_frame,
+        data: pl.DataFrame,
+        storage_directory_path: str,
+    ):
+        """
+        Merge data into the stored data of a symbol, the new data
+        replacing stored candles of the same date.
+        """
+        if data is None or len(data) == 0:
+            return
+
+        stored = self._get_data_from_storage(
+            symbol=symbol,
+            time_frame=time_frame,
+            storage_path=storage_directory_path,
+        )
+
+        if stored is not None:
+            data = pl.concat(
+                [
+                    stored,
+                    data.with_columns(
+                        pl.col("Datetime").cast(stored.schema["Datetime"])
+                    ),
+                ],
+                how="vertical_relaxed",
+            ).unique(subset="Datetime", keep="last").sort("Datetime")
+
+        self._save_data_to_storage(
+            symbol=symbol,
+            time_frame=time_frame,
+            start_date=data["Datetime"].min(),
+            end_date=data["Datetime"].max(),
+            data=data,
+            storage_directory_path=storage_directory_path,
+        )
+
     def _resolve_date_range(
         self,
         date: datetime = None,
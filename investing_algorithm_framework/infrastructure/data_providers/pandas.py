@@ -5,8 +5,7 @@ import pandas as pd
 import polars as pl
 
 from investing_algorithm_framework.domain import DataProvider, \
-    OperationalException, DataSource, DataType, TimeFrame, \
-    convert_polars_to_pandas
+    OperationalException, DataSource, DataType, TimeFrame
 
 
 class PandasOHLCVDataProvider(DataProvider):
@@ -420,7 +419,7 @@ class PandasOHLCVDataProvider(DataProvider):
                     )
 
         if self.pandas:
-            data = convert_polars_to_pandas(data)
+            data = self.convert_to_pandas(data)
 
         return data
 
@@ -73,7 +73,7 @@ class PolygonOHLCVDataProvider(OHLCVDataProviderBase):
         _ensure_polygon()
         from polygon import RESTClient
 
-        timespan, multiplier = self._get_provider_interval()
+        timespan, multiplier = self._get_provider_interval(time_frame)
         api_key = self._get_api_key()
         client = RESTClient(api_key=api_key)
 
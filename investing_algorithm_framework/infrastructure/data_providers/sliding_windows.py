@@ -0,0 +1,128 @@
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import polars as pl
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_microseconds(date: datetime) -> int:
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return (date - EPOCH) // timedelta(microseconds=1)
+
+
+class SlidingWindows(Mapping):
+    """
+    Read-only mapping of timestamp to the sliding window of OHLCV data
+    that ends at that timestamp.
+
+    Instead of materialising one DataFrame per timestamp, only the
+    sorted window end timestamps and the (start, stop) row offsets of
+    their windows are kept, computed with ``searchsorted`` in O(n).
+    Looking up a window is a binary search and returns a zero-copy
+    ``DataFrame.slice`` of the underlying data.
+
+    The window of a timestamp ``t`` holds the rows with
+    ``t - window <= Datetime <= t``, like
+    ``data.filter((Datetime <= t) & (Datetime >= t - window))``.
+
+    Attributes:
+        data (polars.DataFrame): The OHLCV data, sorted by its
+            ``Datetime`` column.
+    """
+
+    def __init__(
+        self,
+        data: pl.DataFrame,
+        window: timedelta,
+        start_date: datetime,
+        end_date: datetime,
+    ):
+        """
+        Args:
+            data (polars.DataFrame): The OHLCV data, sorted by its
+                ``Datetime`` column.
+            window (timedelta): The length of each window.
+            start_date (datetime): Only rows at or after this date
+                get a window.
+            end_date (datetime): Only rows at or before this date
+                get a window.
+        """
+        self.data = data
+        timestamps = data["Datetime"].dt.epoch("us").to_numpy()
+        first = np.searchsorted(
+            timestamps, _to_microseconds(start_date), side="left"
+        )
+        last = np.searchsorted(
+            timestamps, _to_microseconds(end_date), side="right"
+        )
+        self._keys = np.unique(timestamps[first:last])
+        self._stops = np.searchsorted(timestamps, self._keys, side="right")
+        self._starts = np.searchsorted(
+            timestamps,
+            self._keys - window // timedelta(microseconds=1),
+            side="left",
+        )
+
+    def __getitem__(self, date: datetime) -> pl.DataFrame:
+        key = _to_microseconds(date)
+        position = np.searchsorted(self._keys, key)
+
+        if position == len(self._keys) or self._keys[position] != key:
+            raise KeyError(date)
+
+        return self._window(position)
+
+    def __iter__(self):
+        for key in self._keys:
+            yield EPOCH + timedelta(microseconds=int(key))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def append(self, date: datetime, offset: int, length: int) -> None:
+        """
+        Add the window of a timestamp after every timestamp of the
+        mapping, given as ``length`` rows starting at row ``offset``.
+
+        Args:
+            date (datetime): The timestamp of the window.
+            offset (int): The first row of the window.
+            length (int): The number of rows of the window.
+        """
+        key = _to_microseconds(date)
+
+        if len(self._keys) and key <= self._keys[-1]:
+            raise ValueError(
+                f"Cannot append the window of {date}, it is not after "
+                "the last timestamp"
+            )
+
+        self._keys = np.append(self._keys, key)
+        self._starts = np.append(self._starts, offset)
+        self._stops = np.append(self._stops, offset + length)
+
+    def at_or_after(self, date: datetime):
+        """
+        Return the window of the first timestamp at or after ``date``.
+
+        Args:
+            date (datetime): The date to look up.
+
+        Returns:
+            polars.DataFrame: The window, or None if every timestamp
+            is before ``date``.
+        """
+        position = np.searchsorted(self._keys, _to_microseconds(date))
+
+        if position == len(self._keys):
+            return None
+
+        return self._window(position)
+
+    def _window(self, position: int) -> pl.DataFrame:
+        start = int(self._starts[position])
+        return self.data.slice(start, int(self._stops[position]) - start)
@@ -80,7 +80,7 @@ class YahooOHLCVDataProvider(OHLCVDataProviderBase):
         end_date: datetime,
     ) -> pl.DataFrame:
         yf = _ensure_yfinance()
-        interval = self._get_provider_interval()
+        interval = self._get_provider_interval(time_frame)
 
         # yfinance expects string dates or datetime objects
         # Add 1 day to end_date because yfinance end is exclusive
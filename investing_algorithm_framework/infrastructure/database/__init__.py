@@ -1,5 +1,8 @@
 from .sql_alchemy import Session, setup_sqlalchemy, SQLBaseModel, \
-    create_all_tables, clear_db, teardown_sqlalchemy, SqliteDecimal
+    create_all_tables, clear_db, teardown_sqlalchemy, SqliteDecimal, \
+    use_numeric_storage, get_numeric_storage
+from .in_memory_database import InMemoryDatabase, InMemoryQuery, \
+    InMemoryTable, use_in_memory_database, get_in_memory_database
 
 __all__ = [
     "Session",
@@ -8,5 +11,12 @@ __all__ = [
     "create_all_tables",
     "clear_db",
     "teardown_sqlalchemy",
-    "SqliteDecimal"
+    "SqliteDecimal",
+    "use_numeric_storage",
+    "get_numeric_storage",
+    "InMemoryDatabase",
+    "InMemoryQuery",
+    "InMemoryTable",
+    "use_in_memory_database",
+    "get_in_memory_database",
 ]
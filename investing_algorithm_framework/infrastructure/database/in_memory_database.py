@@ -0,0 +1,1034 @@
+import logging
+import operator
+from datetime import date, datetime
+
+from sqlalchemy import Boolean, DateTime, Float, Integer, Numeric, String, \
+    TypeDecorator, UniqueConstraint
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import instance_state, set_committed_value, \
+    get_history, NO_VALUE
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.orm.interfaces import MANYTOMANY, MANYTOONE, ONETOMANY
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter, \
+    BooleanClauseList, Cast, ColumnClause, Null, UnaryExpression
+from sqlalchemy.sql.selectable import ScalarSelect, Select
+
+from investing_algorithm_framework.domain import OperationalException
+from .sql_alchemy import Session, SQLBaseModel
+
+logger = logging.getLogger("investing_algorithm_framework")
+_in_memory_database = None
+
+
+def use_in_memory_database(database):
+    """
+    Plug an in-memory database in for the SQL repositories. While a
+    database is in use, every repository reads and writes its rows
+    instead of the SQL database. Pass None to switch the repositories
+    back to the SQL database.
+
+    Args:
+        database (InMemoryDatabase): The database to use, or None.
+
+    Returns:
+        None
+    """
+    global _in_memory_database
+    _in_memory_database = database
+
+
+def get_in_memory_database():
+    """
+    Get the in-memory database the repositories use, or None if the
+    repositories use the SQL database.
+    """
+    return _in_memory_database
+
+
+def _convert_datetime(value):
+    # SQLite stores datetimes without their timezone
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+
+    return value
+
+
+def _convert_boolean(value):
+    return bool(value)
+
+
+def _convert_integer(value):
+    # Integer affinity: integral text and reals are stored as integers
+    if isinstance(value, bool):
+        return int(value)
+
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+
+    if isinstance(value, str) and value.lstrip("-").isdigit():
+        return int(value)
+
+    return value
+
+
+def _convert_string(value):
+    # Text affinity: numbers and dates are stored as text, like the
+    # sqlite3 adapters of dates store them, and str subclasses (e.g.
+    # str enums) as their string value
+    if isinstance(value, str):
+        return str.__str__(value)
+
+    if isinstance(value, datetime):
+        return value.isoformat(" ")
+
+    if isinstance(value, date):
+        return value.isoformat()
+
+    if isinstance(value, bool):
+        return str(int(value))
+
+    if isinstance(value, (int, float)):
+        return str(value)
+
+    return value
+
+
+def _column_converter(column):
+    """
+    Get the function that converts a value to the value read back after
+    storing it in the column of a SQLite database, or None if the value
+    is read back unchanged.
+    """
+    column_type = column.type
+
+    if isinstance(column_type, TypeDecorator):
+
+        def convert(value):
+            return column_type.process_result_value(
+                column_type.process_bind_param(value, None), None
+            )
+
+        return convert
+
+    if isinstance(column_type, DateTime):
+        return _convert_datetime
+
+    if isinstance(column_type, Boolean):
+        return _convert_boolean
+
+    if isinstance(column_type, Integer):
+        return _convert_integer
+
+    if isinstance(column_type, String):
+        return _convert_string
+
+    return None
+
+
+def _cast_converter(cast):
+    # Convert a value like a SQLite CAST to the numeric type of the cast
+    if isinstance(cast.type, Integer):
+        return int
+
+    if isinstance(cast.type, (Float, Numeric)):
+        return float
+
+    raise OperationalException(f"Unsupported in-memory cast: {cast}")
+
+
+_COMPARISONS = {
+    operators.eq: operator.eq,
+    operators.ne: operator.ne,
+    operators.gt: operator.gt,
+    operators.ge: operator.ge,
+    operators.lt: operator.lt,
+    operators.le: operator.le,
+}
+
+
+def _default_value(default):
+
+    if default.is_callable:
+        return default.arg(None)
+
+    return default.arg
+
+
+class InMemoryTable:
+    """
+    In-memory storage of the rows of a table.
+
+    Rows are dicts of column values, stored by their rowid: the integer
+    primary key of the table, or a surrogate key for tables without
+    one. Values are converted on write to the values a SQLite database
+    reads back, column defaults and onupdate values are applied, and
+    unique constraints are checked.
+
+    Secondary indexes from column value to rowids are built on the
+    first lookup of a column and maintained on every write.
+
+    Attributes:
+        table (Table): The SQLAlchemy table.
+        rows (dict): The rows by rowid.
+        indexes (dict): The secondary indexes by column key.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.rows = {}
+        self.indexes = {}
+        self.last_rowid = 0
+        self.columns = {column.key: column for column in table.columns}
+        self.converters = {
+            column.key: _column_converter(column)
+            for column in table.columns
+        }
+        primary_key = list(table.primary_key.columns)
+
+        if len(primary_key) == 1 \
+                and isinstance(primary_key[0].type, Integer):
+            self.primary_key = primary_key[0].key
+        else:
+            self.primary_key = None
+
+        self.unique_keys = [
+            tuple(column.key for column in constraint.columns)
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        ] + [
+            (column.key,) for column in table.columns
+            if column.unique and not column.primary_key
+        ]
+
+    def convert(self, key, value):
+        converter = self.converters[key]
+
+        if value is None or converter is None:
+            return value
+
+        return converter(value)
+
+    def insert(self, values):
+        """
+        Insert a row.
+
+        Args:
+            values (dict): The column values of the row by column key.
+
+        Returns:
+            int: The rowid of the row.
+        """
+        row = {}
+
+        for key, column in self.columns.items():
+            value = values.get(key)
+
+            if value is None and column.default is not None:
+                value = _default_value(column.default)
+
+            row[key] = self.convert(key, value)
+
+        rowid = row[self.primary_key] if self.primary_key else None
+
+        if rowid is None:
+            rowid = self.last_rowid + 1
+
+            if self.primary_key:
+                row[self.primary_key] = rowid
+        elif rowid in self.rows:
+            raise IntegrityError(
+                f"INSERT INTO {self.table.name}", None,
+                Exception(f"UNIQUE constraint failed: {self.table.name}.id")
+            )
+
+        self._check_unique_keys(rowid, row)
+        self.rows[rowid] = row
+        self.last_rowid = max(self.last_rowid, rowid)
+
+        for key, index in self.indexes.items():
+            index.setdefault(row[key], {})[rowid] = None
+
+        return rowid
+
+    def update(self, rowid, values):
+        """
+        Update the column values of a row. The onupdate values of the
+        columns that are not updated are applied.
+
+        Args:
+            rowid (int): The rowid of the row.
+            values (dict): The changed column values by column key.
+
+        Returns:
+            None
+        """
+        row = self.rows.get(rowid)
+
+        if row is None:
+            raise StaleDataError(
+                f"Row {rowid} of table {self.table.name} does not exist"
+            )
+
+        changes = {
+            key: self.convert(key, value) for key, value in values.items()
+        }
+
+        for key, column in self.columns.items():
+
+            if key not in changes and column.onupdate is not None:
+                changes[key] = self.convert(
+                    key, _default_value(column.onupdate)
+                )
+
+        self._check_unique_keys(rowid, {**row, **changes})
+
+        for key, value in changes.items():
+            index = self.indexes.get(key)
+
+            if index is not None and row[key] != value:
+                del index[row[key]][rowid]
+                index.setdefault(value, {})[rowid] = None
+
+            row[key] = value
+
+    def delete(self, rowid):
+        row = self.rows.pop(rowid)
+
+        for key, index in self.indexes.items():
+            del index[row[key]][rowid]
+
+        if rowid == self.last_rowid:
+            self.last_rowid = max(self.rows, default=0)
+
+    def lookup(self, key, value):
+        """
+        Get the rowids of the rows with the given (converted) value in
+        a column.
+        """
+        index = self.indexes.get(key)
+
+        if index is None:
+            index = {}
+
+            for rowid, row in self.rows.items():
+                index.setdefault(row[key], {})[rowid] = None
+
+            self.indexes[key] = index
+
+        return index.get(value, {})
+
+    def clear(self):
+        self.rows = {}
+        self.indexes = {}
+        self.last_rowid = 0
+
+    def _check_unique_keys(self, rowid, row):
+
+        for unique_key in self.unique_keys:
+            values = [row[key] for key in unique_key]
+
+            # NULL values never conflict
+            if any(value is None for value in values):
+                continue
+
+            for other in self.lookup(unique_key[0], values[0]):
+
+                if other != rowid and all(
+                    self.rows[other][key] == value
+                    for key, value in zip(unique_key, values)
+                ):
+                    raise IntegrityError(
+                        f"INSERT INTO {self.table.name}", None,
+                        Exception(
+                            "UNIQUE constraint failed: "
+                            f"{self.table.name}.{', '.join(unique_key)}"
+                        )
+                    )
+
+
+class InMemoryQuery:
+    """
+    Query on the rows of a table of an InMemoryDatabase, the in-memory
+    counterpart of a SQLAlchemy query. Like a SQLAlchemy query, every
+    filter returns a new query.
+
+    The filters and the order of a query are SQLAlchemy expressions,
+    so the query parameters of a repository are defined once, by its
+    `_apply_query_params`, for both databases. Supported are
+    comparisons of a column, or of a cast of a column, with a value,
+    `in_` with a list of values or with a select of one column of one
+    table, `is_` and `is_not` None, and `and_` of these. Values are
+    converted like the stored values, NULL values never match a
+    comparison, and rows are returned in rowid order unless the query
+    is ordered.
+    """
+
+    def __init__(self, database, table, mapper=None):
+        self._database = database
+        self._table = table
+        self._mapper = mapper
+        self._equal = []
+        self._within = []
+        self._predicates = []
+        self._order_by = []
+
+    def _clone(self):
+        query = InMemoryQuery.__new__(InMemoryQuery)
+        query.__dict__.update(self.__dict__)
+        query._equal = list(self._equal)
+        query._within = list(self._within)
+        query._predicates = list(self._predicates)
+        return query
+
+    def filter_by(self, **kwargs):
+        """
+        Filter on rows with the given column values.
+        """
+        query = self._clone()
+
+        for key, value in kwargs.items():
+            query._equal.append((key, self._table.convert(key, value)))
+
+        return query
+
+    def filter(self, *criteria):
+        """
+        Filter on rows that match the SQLAlchemy criteria.
+        """
+        query = self._clone()
+
+        for criterion in criteria:
+            query._add_criterion(criterion)
+
+        return query
+
+    def order_by(self, *clauses):
+        """
+        Order the rows by the SQLAlchemy columns, or their `asc()` or
+        `desc()`.
+        """
+        query = self._clone()
+
+        for clause in clauses:
+            descending = False
+
+            if isinstance(clause, UnaryExpression):
+                descending = clause.modifier is operators.desc_op
+                clause = clause.element
+
+            query._order_by.append(
+                (self._get_column_key(clause), descending)
+            )
+
+        return query
+
+    def _add_criterion(self, criterion):
+
+        if isinstance(criterion, BooleanClauseList) \
+                and criterion.operator is operators.and_:
+
+            for clause in criterion.clauses:
+                self._add_criterion(clause)
+
+            return
+
+        if not isinstance(criterion, BinaryExpression):
+            raise OperationalException(
+                f"Unsupported in-memory filter: {criterion}"
+            )
+
+        operator_ = criterion.operator
+        left = criterion.left
+
+        if isinstance(left, Cast):
+            key = self._get_column_key(left.clause)
+            convert = _cast_converter(left)
+
+            def get_value(row):
+                value = row[key]
+                return None if value is None else convert(value)
+        else:
+            key = self._get_column_key(left)
+
+            def convert(value):
+                return self._table.convert(key, value)
+
+            def get_value(row):
+                return row[key]
+
+        if operator_ in (operators.is_, operators.is_not):
+
+            if not isinstance(criterion.right, Null):
+                raise OperationalException(
+                    f"Unsupported in-memory filter: {criterion}"
+                )
+
+            is_null = operator_ is operators.is_
+            self._predicates.append(
+                lambda row: (get_value(row) is None) == is_null
+            )
+            return
+
+        if operator_ in (operators.in_op, operators.not_in_op):
+            values = set(
+                convert(value)
+                for value in self._get_values(criterion.right)
+                if value is not None
+            )
+
+            if operator_ is operators.in_op and not isinstance(left, Cast):
+                self._within.append((key, values))
+            elif operator_ is operators.in_op:
+                self._predicates.append(
+                    lambda row: get_value(row) in values
+                )
+            else:
+                self._predicates.append(
+                    lambda row: get_value(row) is not None
+                    and get_value(row) not in values
+                )
+
+            return
+
+        compare = _COMPARISONS.get(operator_)
+
+        if compare is None or not isinstance(criterion.right, BindParameter):
+            raise OperationalException(
+                f"Unsupported in-memory filter: {criterion}"
+            )
+
+        value = criterion.right.effective_value
+
+        if value is None:
+            # A comparison with NULL never matches
+            self._predicates.append(lambda row: False)
+            return
+
+        value = convert(value)
+
+        if compare is operator.eq and not isinstance(left, Cast):
+            self._equal.append((key, value))
+            return
+
+        def matches(row):
+            row_value = get_value(row)
+            return row_value is not None and compare(row_value, value)
+
+        self._predicates.append(matches)
+
+    def _get_column_key(self, clause):
+        table = getattr(clause, "table", None)
+
+        if not isinstance(clause, ColumnClause) or table is None \
+                or table.name != self._table.table.name:
+            raise OperationalException(
+                f"Unsupported in-memory column: {clause}"
+            )
+
+        return clause.key
+
+    def _get_values(self, clause):
+
+        if isinstance(clause, BindParameter):
+            return clause.effective_value
+
+        if isinstance(clause, ScalarSelect):
+            clause = clause.element
+
+        if not isinstance(clause, Select):
+            raise OperationalException(
+                f"Unsupported in-memory values: {clause}"
+            )
+
+        # A select of one column of one table
+        froms = clause.get_final_froms()
+        columns = list(clause.selected_columns)
+
+        if len(froms) != 1 or len(columns) != 1:
+            raise OperationalException(
+                f"Unsupported in-memory select: {clause}"
+            )
+
+        query = InMemoryQuery(
+            self._database, self._database.table(froms[0].name)
+        )
+
+        if clause.whereclause is not None:
+            query = query.filter(clause.whereclause)
+
+        key = query._get_column_key(columns[0])
+        return [row[key] for row in query.rows()]
+
+    def _get_rowids(self):
+        table = self._table
+        candidates = None
+
+        for key, value in self._equal:
+            rowids = table.lookup(key, value)
+
+            if candidates is None or len(rowids) < len(candidates):
+                candidates = rowids
+
+        for key, values in self._within:
+            rowids = {}
+
+            for value in values:
+                rowids.update(table.lookup(key, value))
+
+            if candidates is None or len(rowids) < len(candidates):
+                candidates = rowids
+
+        if candidates is None:
+            candidates = table.rows
+
+        rows = table.rows
+        rowids = [
+            rowid for rowid in candidates
+            if self._matches(rows[rowid])
+        ]
+        rowids.sort()
+
+        # NULL values sort first, like in SQLite
+        for key, descending in reversed(self._order_by):
+            rowids.sort(
+                key=lambda rowid: (rows[rowid][key] is not None,
+                                   rows[rowid][key]),
+                reverse=descending
+            )
+
+        return rowids
+
+    def _matches(self, row):
+
+        for key, value in self._equal:
+            if row[key] != value:
+                return False
+
+        for key, values in self._within:
+            if row[key] not in values:
+                return False
+
+        for predicate in self._predicates:
+            if not predicate(row):
+                return False
+
+        return True
+
+    def rows(self):
+        """
+        Get the matching row dicts.
+        """
+        rows = self._table.rows
+        return [rows[rowid] for rowid in self._get_rowids()]
+
+    def all(self):
+        return [
+            self._database.load(self._mapper, rowid)
+            for rowid in self._get_rowids()
+        ]
+
+    def first(self):
+        rowids = self._get_rowids()
+
+        if len(rowids) == 0:
+            return None
+
+        return self._database.load(self._mapper, rowids[0])
+
+    def count(self):
+        return len(self._get_rowids())
+
+
+class InMemoryDatabase:
+    """
+    In-memory database for the SQLAlchemy models, used as the storage
+    of the repositories in event backtests.
+
+    The rows of every table of the model metadata are kept in an
+    InMemoryTable. Objects are read like SQLAlchemy loads them from a
+    session that is closed afterwards: as new, detached instances, with
+    their eagerly loaded relationships and their load events
+    (reconstructors, UTC datetimes) applied. Saving an object writes
+    its changed columns, and cascades to its loaded relationships.
+
+    The rows can be flushed to the SQL database at the end of a
+    backtest run.
+
+    Attributes:
+        metadata (MetaData): The metadata of the models.
+        tables (dict): The InMemoryTable of every table by table name.
+    """
+
+    def __init__(self, metadata=None):
+
+        if metadata is None:
+            metadata = SQLBaseModel.metadata
+
+        self.metadata = metadata
+        self.tables = {
+            table.name: InMemoryTable(table)
+            for table in metadata.sorted_tables
+        }
+        self._mappers = {
+            mapper.class_: mapper
+            for mapper in SQLBaseModel.registry.mappers
+        }
+        self._columns = {}
+        self._eager_relationships = {}
+
+    def table(self, name):
+        return self.tables[name]
+
+    def mapper(self, model):
+        return self._mappers[model]
+
+    def query(self, model):
+        mapper = self.mapper(model)
+        return InMemoryQuery(
+            self, self.tables[mapper.local_table.name], mapper
+        )
+
+    def clear(self):
+
+        for table in self.tables.values():
+            table.clear()
+
+    def get(self, model, object_id):
+        """
+        Get the object of a model by its id, or None if it does not exist.
+        """
+        mapper = self.mapper(model)
+        table = self.tables[mapper.local_table.name]
+        rowid = table.convert(table.primary_key, object_id)
+
+        if rowid not in table.rows:
+            return None
+
+        return self.load(mapper, rowid)
+
+    def _get_columns(self, mapper):
+        # Attribute key and column key of the columns of a model
+        columns = self._columns.get(mapper)
+
+        if columns is None:
+            columns = [
+                (prop.key, prop.columns[0].key)
+                for prop in mapper.column_attrs
+            ]
+            self._columns[mapper] = columns
+
+        return columns
+
+    def _get_eager_relationships(self, mapper):
+        relationships = self._eager_relationships.get(mapper)
+
+        if relationships is None:
+            relationships = [
+                relationship for relationship in mapper.relationships
+                if relationship.lazy in ("joined", "selectin")
+            ]
+            self._eager_relationships[mapper] = relationships
+
+        return relationships
+
+    def load(self, mapper, rowid):
+        """
+        Load a row as a new, detached instance of its model.
+        """
+        row = self.tables[mapper.local_table.name].rows[rowid]
+        instance = mapper.class_manager.new_instance()
+        state = instance_state(instance)
+        state.dict.update(
+            (attribute, row[column])
+            for attribute, column in self._get_columns(mapper)
+        )
+
+        for relationship in self._get_eager_relationships(mapper):
+            related = self._load_related(relationship, row)
+
+            if not relationship.uselist:
+                related = related[0] if related else None
+
+            set_committed_value(instance, relationship.key, related)
+
+        make_transient_to_detached(instance)
+        state.manager.dispatch.load(state, None)
+        return instance
+
+    def _load_related(self, relationship, row):
+        target = relationship.mapper
+        target_table = self.tables[target.local_table.name]
+
+        if relationship.direction is MANYTOONE:
+            target_column, local_column = relationship.synchronize_pairs[0]
+            rowid = row[local_column.key]
+
+            if rowid is None or rowid not in target_table.rows:
+                return []
+
+            return [self.load(target, rowid)]
+
+        if relationship.direction is ONETOMANY:
+            local_column, remote_column = relationship.synchronize_pairs[0]
+            rowids = sorted(target_table.lookup(
+                remote_column.key, row[local_column.key]
+            ))
+        else:
+            rowids = self._get_secondary_rowids(relationship, row)
+
+        return [self.load(target, rowid) for rowid in rowids]
+
+    def _get_secondary_rowids(self, relationship, row):
+        # The related rowids in the order their association rows were
+        # inserted, e.g. the buy order of a trade first
+        local_column, secondary_local = relationship.synchronize_pairs[0]
+        target_column, secondary_remote = \
+            relationship.secondary_synchronize_pairs[0]
+        secondary = self.tables[relationship.secondary.name]
+        return [
+            secondary.rows[rowid][secondary_remote.key]
+            for rowid in sorted(secondary.lookup(
+                secondary_local.key, row[local_column.key]
+            ))
+        ]
+
+    def save(self, instance):
+        """
+        Save an object: insert it if it is new, otherwise write its
+        changed columns. The save cascades to the objects of its loaded
+        relationships.
+        """
+        self._save(instance, set())
+
+    def _save(self, instance, saved):
+
+        if id(instance) in saved:
+            return
+
+        saved.add(id(instance))
+        state = instance_state(instance)
+        mapper = state.mapper
+        table = self.tables[mapper.local_table.name]
+        relationships = [
+            relationship for relationship in mapper.relationships
+            if relationship.key in state.dict
+            and relationship.lazy != "dynamic"
+        ]
+
+        # Related objects of many-to-one relationships are saved first,
+        # so their ids can be set as the foreign keys of the object
+        for relationship in relationships:
+
+            if relationship.direction is not MANYTOONE:
+                continue
+
+            related = state.dict[relationship.key]
+
+            if related is None:
+                continue
+
+            self._save(related, saved)
+            self._set_foreign_key(relationship, instance, related)
+
+        if state.key is None:
+            values = {
+                column: state.dict.get(attribute)
+                for attribute, column in self._get_columns(mapper)
+            }
+            rowid = table.insert(values)
+            set_committed_value(instance, table.primary_key, rowid)
+            make_transient_to_detached(instance)
+        else:
+            rowid = state.key[1][0]
+            changes = {}
+
+            for attribute, column in self._get_columns(mapper):
+
+                if attribute not in state.committed_state \
+                        or attribute not in state.dict:
+                    continue
+
+                original = state.committed_state[attribute]
+                value = state.dict[attribute]
+
+                if original is NO_VALUE or value != original:
+                    changes[column] = value
+
+            if changes:
+                table.update(rowid, changes)
+
+            for attribute, column in self._get_columns(mapper):
+
+                if attribute in state.committed_state \
+                        and attribute in state.dict:
+                    set_committed_value(
+                        instance, attribute, state.dict[attribute]
+                    )
+
+        for relationship in relationships:
+
+            if relationship.direction is MANYTOONE:
+                continue
+
+            history = get_history(instance, relationship.key)
+
+            for related in list(history.added) + list(history.unchanged):
+
+                if relationship.direction is ONETOMANY:
+                    self._set_foreign_key(relationship, related, instance)
+
+                self._save(related, saved)
+
+                if relationship.direction is MANYTOMANY:
+                    self._link(relationship, instance, related)
+
+            for related in history.deleted:
+
+                if relationship.direction is ONETOMANY:
+                    self._set_foreign_key(relationship, related, None)
+                    self._save(related, saved)
+                else:
+                    self._unlink(relationship, instance, related)
+
+    @staticmethod
+    def _set_foreign_key(relationship, child, parent):
+        # Set the foreign key of the child (referencing) side of a
+        # relationship to the key of its parent (referenced) side
+        if relationship.direction is ONETOMANY:
+            parent_mapper, child_mapper = \
+                relationship.parent, relationship.mapper
+        else:
+            parent_mapper, child_mapper = \
+                relationship.mapper, relationship.parent
+
+        for parent_column, child_column in relationship.synchronize_pairs:
+            value = None
+
+            if parent is not None:
+                value = getattr(
+                    parent,
+                    parent_mapper.get_property_by_column(parent_column).key
+                )
+
+            key = child_mapper.get_property_by_column(child_column).key
+
+            if getattr(child, key) != value:
+                setattr(child, key, value)
+
+    def _secondary_values(self, relationship, instance, related):
+        local_column, secondary_local = relationship.synchronize_pairs[0]
+        target_column, secondary_remote = \
+            relationship.secondary_synchronize_pairs[0]
+        local_value = getattr(
+            instance,
+            relationship.parent.get_property_by_column(local_column).key
+        )
+        remote_value = getattr(
+            related,
+            relationship.mapper.get_property_by_column(target_column).key
+        )
+        return secondary_local.key, local_value, \
+            secondary_remote.key, remote_value
+
+    def _link(self, relationship, instance, related):
+        local_key, local_value, remote_key, remote_value = \
+            self._secondary_values(relationship, instance, related)
+        secondary = self.tables[relationship.secondary.name]
+
+        for rowid in secondary.lookup(local_key, local_value):
+            if secondary.rows[rowid][remote_key] == remote_value:
+                return
+
+        secondary.insert({local_key: local_value, remote_key: remote_value})
+
+    def _unlink(self, relationship, instance, related):
+        local_key, local_value, remote_key, remote_value = \
+            self._secondary_values(relationship, instance, related)
+        secondary = self.tables[relationship.secondary.name]
+
+        for rowid in list(secondary.lookup(local_key, local_value)):
+            if secondary.rows[rowid][remote_key] == remote_value:
+                secondary.delete(rowid)
+
+    def delete(self, instance):
+        """
+        Delete an object. Objects of its one-to-many relationships are
+        deleted if the relationship cascades deletes, otherwise their
+        foreign key is set to NULL.
+        """
+        state = instance_state(instance)
+        mapper = state.mapper
+        table = self.tables[mapper.local_table.name]
+        rowid = table.convert(
+            table.primary_key, getattr(instance, table.primary_key)
+        )
+
+        if rowid not in table.rows:
+            raise StaleDataError(
+                f"Row {rowid} of table {table.table.name} does not exist"
+            )
+
+        self._delete(mapper, rowid)
+
+    def _delete(self, mapper, rowid):
+        table = self.tables[mapper.local_table.name]
+        row = table.rows[rowid]
+
+        for relationship in mapper.relationships:
+
+            if relationship.direction is MANYTOMANY:
+                local_column, secondary_local = \
+                    relationship.synchronize_pairs[0]
+                secondary = self.tables[relationship.secondary.name]
+
+                for secondary_rowid in list(secondary.lookup(
+                    secondary_local.key, row[local_column.key]
+                )):
+                    secondary.delete(secondary_rowid)
+
+            elif relationship.direction is ONETOMANY:
+                local_column, remote_column = \
+                    relationship.synchronize_pairs[0]
+                target_table = self.tables[
+                    relationship.mapper.local_table.name
+                ]
+
+                for child_rowid in list(target_table.lookup(
+                    remote_column.key, row[local_column.key]
+                )):
+                    if relationship.cascade.delete:
+                        self._delete(relationship.mapper, child_rowid)
+                    else:
+                        target_table.update(
+                            child_rowid, {remote_column.key: None}
+                        )
+
+        table.delete(rowid)
+
+    def flush(self):
+        """
+        Write all rows to the SQL database, replacing its rows.
+
+        Returns:
+            None
+        """
+        with Session() as db:
+            try:
+                for table in reversed(self.metadata.sorted_tables):
+                    db.execute(table.delete())
+
+                for table in self.metadata.sorted_tables:
+                    rows = list(self.tables[table.name].rows.values())
+
+                    if rows:
+                        db.execute(table.insert(), rows)
+
+                db.commit()
+            except SQLAlchemyError as e:
+                logger.error(e)
+                db.rollback()
+                raise OperationalException(
+                    "Error flushing the in-memory database"
+                )
@@ -1,16 +1,81 @@
 import logging
 from decimal import Decimal
 
-from sqlalchemy import create_engine, StaticPool, String
+from sqlalchemy import create_engine, StaticPool, String, BigInteger, \
+    Float, Integer, Column, event
 from sqlalchemy import inspect
 from sqlalchemy.orm import DeclarativeBase, sessionmaker, close_all_sessions
 from sqlalchemy import TypeDecorator
 
 from investing_algorithm_framework.domain import SQLALCHEMY_DATABASE_URI, \
-    OperationalException
+    OperationalException, NUMERIC_STORAGE, NumericStorage
 
 Session = sessionmaker()
 logger = logging.getLogger("investing_algorithm_framework")
+FIXED_POINT_SCALE = 10 ** 8
+FIXED_POINT_LIMIT = 2.0 ** 63
+_numeric_storage = NumericStorage.DECIMAL
+
+
+def use_numeric_storage(storage):
+    """
+    Set the storage of the SqliteDecimal columns. The storage must be
+    set before the tables are created, `setup_sqlalchemy` sets it from
+    the NUMERIC_STORAGE config value. The columns of existing tables
+    are converted to the storage by `create_all_tables`.
+
+    Args:
+        storage (NumericStorage): The storage, or its string value.
+
+    Returns:
+        None
+    """
+    global _numeric_storage
+    _numeric_storage = NumericStorage.from_value(storage)
+
+
+def get_numeric_storage():
+    """
+    Get the storage of the SqliteDecimal columns.
+    """
+    return _numeric_storage
+
+
+def _store_numeric(value, storage, column_name=None):
+    # Convert a numeric value to the value stored with the storage
+
+    if storage is NumericStorage.REAL:
+        return float(value)
+
+    if storage is NumericStorage.FIXED_POINT:
+        scaled = float(value) * FIXED_POINT_SCALE
+
+        # The scaled value must fit in a 64-bit INTEGER
+        if not abs(scaled) < FIXED_POINT_LIMIT:
+            column = f" of column {column_name}" \
+                if column_name is not None else ""
+            raise OperationalException(
+                f"The value {value}{column} can not be stored with the "
+                f"FIXED_POINT numeric storage, which is limited to about "
+                f"+/- 9.2 * 10^10. Use the DECIMAL or REAL numeric "
+                f"storage instead"
+            )
+
+        return round(scaled)
+
+    return str(Decimal(str(value)))
+
+
+def _load_numeric(value, storage):
+    # Convert a value stored with the storage to a float
+
+    if storage is NumericStorage.REAL:
+        return float(value)
+
+    if storage is NumericStorage.FIXED_POINT:
+        return int(value) / FIXED_POINT_SCALE
+
+    return float(Decimal(value))
 
 
 class SqliteDecimal(TypeDecorator):
@@ -31,21 +96,47 @@ class SqliteDecimal(TypeDecorator):
 
     Use this instead of Column(Float) for monetary values, balances,
     prices, and amounts where storage precision matters.
+
+    The string round trips make reading and writing these columns
+    relatively slow. With the NUMERIC_STORAGE config value, the values
+    can instead be stored as scaled 64-bit integers (FIXED_POINT) or
+    as floats (REAL), e.g. for backtests where the exact decimal
+    storage does not matter. See `NumericStorage`.
     """
     impl = String
     cache_ok = True
+    # The table and name of the column, set when the column is
+    # attached to its table
+    column_name = None
+
+    def load_dialect_impl(self, dialect):
+
+        if _numeric_storage is NumericStorage.FIXED_POINT:
+            return dialect.type_descriptor(BigInteger())
+
+        if _numeric_storage is NumericStorage.REAL:
+            return dialect.type_descriptor(Float())
+
+        return dialect.type_descriptor(String())
 
     def process_bind_param(self, value, dialect):
         if value is not None:
-            return str(Decimal(str(value)))
+            return _store_numeric(value, _numeric_storage, self.column_name)
         return None
 
     def process_result_value(self, value, dialect):
         if value is not None:
-            return float(Decimal(value))
+            return _load_numeric(value, _numeric_storage)
         return None
 
 
+@event.listens_for(Column, "after_parent_attach")
+def _set_numeric_column_name(column, table):
+
+    if isinstance(column.type, SqliteDecimal):
+        column.type.column_name = f"{table.name}.{column.name}"
+
+
 class SQLAlchemyAdapter:
 
     def __init__(self, app):
@@ -55,6 +146,9 @@ class SQLAlchemyAdapter:
             raise OperationalException("SQLALCHEMY_DATABASE_URI not set")
 
         global Session
+        use_numeric_storage(
+            app.config.get(NUMERIC_STORAGE, NumericStorage.DECIMAL.value)
+        )
         engine = create_engine(
             app.config[SQLALCHEMY_DATABASE_URI],
             connect_args={'check_same_thread': False},
@@ -83,6 +177,7 @@ def create_all_tables():
     bind = Session().bind
     SQLBaseModel.metadata.create_all(bind=bind)
     _apply_forward_only_migrations(bind)
+    _migrate_numeric_storage(bind)
 
 
 def _apply_forward_only_migrations(bind):
@@ -90,9 +185,10 @@ def _apply_forward_only_migrations(bind):
     Tiny idempotent migration helper.
 
     The framework has no Alembic; new tables come from
-    ``metadata.create_all`` but new *columns* on existing tables do not.
-    Live customer SQLite files therefore need an in-place ALTER for any
-    column we add post-1.0.
+    ``metadata.create_all`` but new *columns* and *indexes* on existing
+    tables do not. Live customer SQLite files therefore need an in-place
+    ALTER for any column we add post-1.0, and the indexes of the models
+    are created if they are missing.
 
     Each entry below is run once per startup, wrapped in try/except so
     a column that already exists or a non-SQLite backend that handles
@@ -127,6 +223,151 @@ def _apply_forward_only_migrations(bind):
             # dialect with different syntax — all benign at boot.
             pass
 
+    # Indexes of the query filters of the repositories, added after
+    # the tables of existing databases were created.
+    for table in SQLBaseModel.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=bind, checkfirst=True)
+            except Exception:
+                pass
+
+
+def _get_numeric_storage_of_type(column_type):
+    # The storage of a SqliteDecimal column by its reflected type
+
+    if isinstance(column_type, Integer):
+        return NumericStorage.FIXED_POINT
+
+    if isinstance(column_type, Float):
+        return NumericStorage.REAL
+
+    return NumericStorage.DECIMAL
+
+
+def _migrate_numeric_storage(bind):
+    """
+    Convert the SqliteDecimal columns of existing tables to the numeric
+    storage in use, e.g. after the NUMERIC_STORAGE config value of an
+    existing database has been changed.
+
+    The storage of a column is derived from its declared type in the
+    database. SQLite can not change the type of a column, so a table
+    with columns of another storage is recreated and its rows are
+    copied with the converted values. Converting to FIXED_POINT rounds
+    the values to 8 decimals.
+
+    The values of all tables are converted before any table is
+    recreated, so a value that can not be converted, e.g. a value out
+    of the range of the FIXED_POINT storage, raises an
+    OperationalException before the database is changed. The tables
+    are then recreated in one transaction, so a failure rolls back
+    the tables that were already recreated.
+
+    A table with columns that are not in its model is not migrated:
+    recreating it would drop these columns, so an OperationalException
+    is raised instead.
+    """
+    inspector = inspect(bind)
+    table_names = set(inspector.get_table_names())
+    migrations = []
+
+    for table in SQLBaseModel.metadata.sorted_tables:
+
+        if table.name not in table_names:
+            continue
+
+        existing_columns = {
+            column["name"]: column["type"]
+            for column in inspector.get_columns(table.name)
+        }
+        conversions = {}
+
+        for column in table.columns:
+
+            if not isinstance(column.type, SqliteDecimal) \
+                    or column.name not in existing_columns:
+                continue
+
+            storage = _get_numeric_storage_of_type(
+                existing_columns[column.name]
+            )
+
+            if storage is not _numeric_storage:
+                conversions[column.name] = storage
+
+        if len(conversions) == 0:
+            continue
+
+        unknown_columns = [
+            name for name in existing_columns if name not in table.columns
+        ]
+
+        if len(unknown_columns) > 0:
+            raise OperationalException(
+                f"Can not convert the numeric columns of table "
+                f"{table.name} to {_numeric_storage.value} storage, the "
+                f"columns {', '.join(unknown_columns)} of the table are "
+                "not in its model and would be dropped"
+            )
+
+        logger.info(
+            f"Converting the numeric columns of table {table.name} "
+            f"to {_numeric_storage.value} storage"
+        )
+        column_names = [
+            column.name for column in table.columns
+            if column.name in existing_columns
+        ]
+        quoted_column_names = ", ".join(
+            f'"{name}"' for name in column_names
+        )
+
+        with bind.connect() as connection:
+            rows = connection.exec_driver_sql(
+                f'SELECT {quoted_column_names} FROM "{table.name}"'
+            ).fetchall()
+
+        converted_rows = []
+
+        for row in rows:
+            converted_row = []
+
+            for name, value in zip(column_names, row):
+
+                if value is not None and name in conversions:
+                    value = _store_numeric(
+                        _load_numeric(value, conversions[name]),
+                        _numeric_storage,
+                        f"{table.name}.{name}"
+                    )
+
+                converted_row.append(value)
+
+            converted_rows.append(tuple(converted_row))
+
+        migrations.append((table, quoted_column_names, converted_rows))
+
+    if len(migrations) == 0:
+        return
+
+    with bind.begin() as connection:
+        # pysqlite does not begin a transaction before DDL statements,
+        # so it is begun explicitly to also roll back the dropped tables
+        connection.exec_driver_sql("BEGIN")
+
+        for table, quoted_column_names, converted_rows in migrations:
+            connection.exec_driver_sql(f'DROP TABLE "{table.name}"')
+            table.create(bind=connection)
+
+            if converted_rows:
+                placeholders = ", ".join("?" for _ in converted_rows[0])
+                connection.exec_driver_sql(
+                    f'INSERT INTO "{table.name}" ({quoted_column_names}) '
+                    f'VALUES ({placeholders})',
+                    converted_rows
+                )
+
 
 def teardown_sqlalchemy():
     """
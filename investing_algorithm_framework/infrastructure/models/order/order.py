@@ -2,7 +2,8 @@ import json
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, \
+    Index
 from sqlalchemy.orm import relationship, reconstructor
 
 from investing_algorithm_framework.domain import OrderType, \
@@ -60,6 +61,21 @@ class SQLOrder(Order, SQLBaseModel, SQLAlchemyModelExtension):
     trade_allocations = relationship(
         'SQLTradeAllocation', back_populates='order'
     )
+    # Indexes of the filters of the order repository: the open orders
+    # of every iteration, the orders of a portfolio (by its positions)
+    # and the orders of a symbol, newest first
+    __table_args__ = (
+        Index("ix_orders_status_created_at", "status", "created_at"),
+        Index(
+            "ix_orders_position_id_created_at", "position_id", "created_at"
+        ),
+        Index(
+            "ix_orders_target_symbol_order_side_status",
+            "target_symbol",
+            "order_side",
+            "status",
+        ),
+    )
 
     def __init__(self, metadata=None, **kwargs):
         super().__init__(metadata=metadata, **kwargs)
@@ -6,5 +6,11 @@ order_trade_association = Table(
     'order_trade',  # Table name
     SQLBaseModel.metadata,
     Column('order_id', Integer, ForeignKey('orders.id'), primary_key=True),
-    Column('trade_id', Integer, ForeignKey('trades.id'), primary_key=True)
+    Column(
+        'trade_id',
+        Integer,
+        ForeignKey('trades.id'),
+        primary_key=True,
+        index=True
+    )
 )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from sqlalchemy.orm import relationship
 
 from investing_algorithm_framework.domain import PortfolioSnapshot
@@ -37,3 +37,10 @@ class SQLPortfolioSnapshot(
         lazy="dynamic",
         cascade="all,delete",
     )
+    __table_args__ = (
+        Index(
+            "ix_portfolio_snapshots_portfolio_id_created_at",
+            "portfolio_id",
+            "created_at",
+        ),
+    )
@@ -22,7 +22,7 @@ class SQLPosition(SQLBaseModel, Position, SQLAlchemyModelExtension):
         lazy="dynamic",
         cascade="all, delete-orphan"
     )
-    portfolio_id = Column(Integer, ForeignKey('portfolios.id'))
+    portfolio_id = Column(Integer, ForeignKey('portfolios.id'), index=True)
     portfolio = relationship("SQLPortfolio", back_populates="positions")
     __table_args__ = (
         UniqueConstraint(
@@ -1,6 +1,7 @@
 import json
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, \
+    text, Index
 from sqlalchemy.orm import relationship, reconstructor
 
 from investing_algorithm_framework.domain import Trade, TradeStatus
@@ -50,11 +51,14 @@ class SQLTrade(Trade, SQLBaseModel, SQLAlchemyModelExtension):
 
     __tablename__ = "trades"
     id = Column(Integer, primary_key=True, unique=True)
+    # Loaded with a second query on the trade_id index of the
+    # association table: as a joined load, SQLite materializes the
+    # join of the association table with all orders for every query
     orders = relationship(
         'SQLOrder',
         secondary=order_trade_association,
         back_populates='trades',
-        lazy='joined'
+        lazy='selectin'
     )
     target_symbol = Column(String)
     trading_symbol = Column(String)
@@ -100,6 +104,16 @@ class SQLTrade(Trade, SQLBaseModel, SQLAlchemyModelExtension):
         back_populates='trade',
         lazy='joined'
     )
+    # Indexes of the filters of the trade repository: the open trades
+    # of every iteration and the trades of a symbol
+    __table_args__ = (
+        Index("ix_trades_status_target_symbol", "status", "target_symbol"),
+        Index(
+            "ix_trades_target_symbol_trading_symbol",
+            "target_symbol",
+            "trading_symbol",
+        ),
+    )
 
     def __init__(
         self,
@@ -41,7 +41,7 @@ class SQLTradeStopLoss(TradeStopLoss, SQLBaseModel, SQLAlchemyModelExtension):
 
     __tablename__ = "trade_stop_losses"
     id = Column(Integer, primary_key=True, unique=True)
-    trade_id = Column(Integer, ForeignKey('trades.id'))
+    trade_id = Column(Integer, ForeignKey('trades.id'), index=True)
     trade = relationship('SQLTrade', back_populates='stop_losses')
     trailing = Column(Boolean)
     percentage = Column(SqliteDecimal())
@@ -37,7 +37,7 @@ class SQLTradeTakeProfit(
 
     __tablename__ = "trade_take_profits"
     id = Column(Integer, primary_key=True, unique=True)
-    trade_id = Column(Integer, ForeignKey('trades.id'))
+    trade_id = Column(Integer, ForeignKey('trades.id'), index=True)
     trade = relationship('SQLTrade', back_populates='take_profits')
     trailing = Column(Boolean)
     percentage = Column(SqliteDecimal())
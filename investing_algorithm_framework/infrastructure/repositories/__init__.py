@@ -7,6 +7,9 @@ from .position_snapshot_repository import SQLPositionSnapshotRepository
 from .trade_repository import SQLTradeRepository
 from .trade_stop_loss_repository import SQLTradeStopLossRepository
 from .trade_take_profit_repository import SQLTradeTakeProfitRepository
+from .repository_statistics import RepositoryStatistics, \
+    RepositoryCallStatistics, use_repository_statistics, \
+    get_repository_statistics
 
 __all__ = [
     "SQLOrderRepository",
@@ -17,5 +20,9 @@ __all__ = [
     "SQLTradeRepository",
     "SQLTradeTakeProfitRepository",
     "SQLTradeStopLossRepository",
-    "SQLTradeAllocationRepository"
+    "SQLTradeAllocationRepository",
+    "RepositoryStatistics",
+    "RepositoryCallStatistics",
+    "use_repository_statistics",
+    "get_repository_statistics",
 ]
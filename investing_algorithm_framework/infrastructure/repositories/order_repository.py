@@ -1,7 +1,9 @@
+from sqlalchemy import select
+
 from investing_algorithm_framework.domain import OrderStatus, OrderType, \
     OrderSide
 from investing_algorithm_framework.infrastructure.models import SQLOrder, \
-    SQLPosition, SQLPortfolio
+    SQLPosition
 from .repository import Repository
 
 
@@ -39,18 +41,11 @@ class SQLOrderRepository(Repository):
             query = query.filter_by(id=id_query_param)
 
         if portfolio_query_param is not None:
-            portfolio = db.query(SQLPortfolio).filter_by(
-                id=portfolio_query_param
-            ).first()
-
-            if portfolio:
-                positions = db.query(SQLPosition).filter_by(
-                    portfolio_id=portfolio.id
-                ).all()
-                position_ids = [p.id for p in positions]
-                query = query.filter(SQLOrder.position_id.in_(position_ids))
-            else:
-                query = query.filter_by(id=None)
+            query = query.filter(SQLOrder.position_id.in_(
+                select(SQLPosition.id).where(
+                    SQLPosition.portfolio_id == portfolio_query_param
+                )
+            ))
 
         if external_id_query_param:
             query = query.filter_by(external_id=external_id_query_param)
@@ -88,9 +83,14 @@ class SQLOrderRepository(Repository):
                 SQLOrder.trading_symbol == trading_symbol_query_param
             )
 
+        # Orders created at the same time are ordered by their id
         if order_by_created_at_asc:
-            query = query.order_by(SQLOrder.created_at.asc())
+            query = query.order_by(
+                SQLOrder.created_at.asc(), SQLOrder.id.asc()
+            )
         else:
-            query = query.order_by(SQLOrder.created_at.desc())
+            query = query.order_by(
+                SQLOrder.created_at.desc(), SQLOrder.id.desc()
+            )
 
         return query
@@ -1,3 +1,5 @@
+from sqlalchemy import select
+
 from investing_algorithm_framework.infrastructure.models import SQLPortfolio, \
     SQLPosition
 from .repository import Repository
@@ -23,8 +25,10 @@ class SQLPortfolioRepository(Repository):
             query = query.filter_by(identifier=identifier_query_param.upper())
 
         if position_query_param:
-            position = db.query(SQLPosition)\
-                .filter_by(id=position_query_param).first()
-            query = query.filter_by(id=position.portfolio_id)
+            query = query.filter(SQLPortfolio.id.in_(
+                select(SQLPosition.portfolio_id).where(
+                    SQLPosition.id == position_query_param
+                )
+            ))
 
         return query
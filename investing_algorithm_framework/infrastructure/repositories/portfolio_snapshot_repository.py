@@ -40,7 +40,7 @@ class SQLPortfolioSnapshotRepository(Repository):
 
         if created_at_gte_query_param is not None:
             query = query.filter(
-                SQLPortfolioSnapshot.created_at >= created_at_gt_query_param
+                SQLPortfolioSnapshot.created_at >= created_at_gte_query_param
             )
 
         if created_at_lt_query_param is not None:
@@ -1,6 +1,7 @@
-from sqlalchemy import cast, Numeric, Float
+from sqlalchemy import cast, select, Numeric, Float
 
-from investing_algorithm_framework.infrastructure.models import SQLPosition
+from investing_algorithm_framework.infrastructure.models import SQLPosition, \
+    SQLOrder
 from .repository import Repository
 
 
@@ -59,8 +60,10 @@ class SQLPositionRepository(Repository):
         # Filter by order_id, orders is a one-to-many relationship
         # with 3 position
         if order_id_query_param:
-            query = query.filter(
-                SQLPosition.orders.any(id=order_id_query_param)
-            )
+            query = query.filter(SQLPosition.id.in_(
+                select(SQLOrder.position_id).where(
+                    SQLOrder.id == order_id_query_param
+                )
+            ))
 
         return query
@@ -3,12 +3,15 @@ from abc import ABC, abstractmethod
 from typing import Callable
 from dateutil.parser import parse
 
+from sqlalchemy import inspect, insert
 from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.datastructures import MultiDict
 
 from investing_algorithm_framework.domain import OperationalException, \
     DEFAULT_PAGE_VALUE, DEFAULT_PER_PAGE_VALUE
-from investing_algorithm_framework.infrastructure.database import Session
+from investing_algorithm_framework.infrastructure.database import Session, \
+    get_in_memory_database
+from .repository_statistics import record_repository_call
 
 logger = logging.getLogger("investing_algorithm_framework")
 
@@ -24,14 +27,34 @@ def convert_datetime_fields(data, datetime_fields):
 
 
 class Repository(ABC):
+    """
+    Repository of a SQLAlchemy model.
+
+    The objects are stored in the SQL database, or in the in-memory
+    database set with `use_in_memory_database` (e.g. during event
+    backtests). The query parameters of a repository are applied by
+    `_apply_query_params` with SQLAlchemy expressions, to both SQL
+    queries and in-memory queries.
+    """
     base_class: Callable
     DEFAULT_NOT_FOUND_MESSAGE = "The requested resource was not found"
     DEFAULT_PER_PAGE = DEFAULT_PER_PAGE_VALUE
     DEFAULT_PAGE = DEFAULT_PAGE_VALUE
 
+    @record_repository_call
     def create(self, data, save=True):
         created_object = self.base_class(**data)
         if save:
+            database = get_in_memory_database()
+
+            if database is not None:
+                try:
+                    database.save(created_object)
+                    return self.get(created_object.id)
+                except SQLAlchemyError as e:
+                    logger.error(e)
+                    raise OperationalException("Error creating object")
+
             with Session() as db:
                 try:
                     db.add(created_object)
@@ -44,6 +67,7 @@ class Repository(ABC):
 
         return created_object
 
+    @record_repository_call
     def update(self, object_id, data):
         # List all datetime fields for your model
         datetime_fields = [
@@ -51,6 +75,18 @@ class Repository(ABC):
             "triggered_at"
         ]
         data = convert_datetime_fields(data, datetime_fields)
+        database = get_in_memory_database()
+
+        if database is not None:
+            try:
+                update_object = self.get(object_id)
+                update_object.update(data)
+                database.save(update_object)
+                return self.get(object_id)
+            except SQLAlchemyError as e:
+                logger.error(e)
+                raise OperationalException("Error updating object")
+
         with Session() as db:
             try:
                 update_object = self.get(object_id)
@@ -63,7 +99,20 @@ class Repository(ABC):
                 db.rollback()
                 raise OperationalException("Error updating object")
 
+    @record_repository_call
     def update_all(self, query_params, data):
+        database = get_in_memory_database()
+
+        if database is not None:
+            try:
+                for item in self.get_all(query_params):
+                    item.update(data)
+                    database.save(item)
+            except SQLAlchemyError as e:
+                logger.error(e)
+                raise OperationalException("Error updating object")
+
+            return
 
         with Session() as db:
             try:
@@ -83,7 +132,18 @@ class Repository(ABC):
                 db.rollback()
                 raise OperationalException("Error updating object")
 
+    @record_repository_call
     def delete(self, object_id):
+        database = get_in_memory_database()
+
+        if database is not None:
+            try:
+                delete_object = self.get(object_id)
+                database.delete(delete_object)
+                return delete_object
+            except SQLAlchemyError as e:
+                logger.error(e)
+                raise OperationalException("Error deleting object")
 
         with Session() as db:
             try:
@@ -96,7 +156,26 @@ class Repository(ABC):
                 db.rollback()
                 raise OperationalException("Error deleting object")
 
+    @record_repository_call
     def delete_all(self, query_params):
+        database = get_in_memory_database()
+
+        if database is not None:
+            if query_params is None:
+                raise OperationalException("No parameters are required")
+
+            try:
+                query = self.apply_query_params(
+                    database, database.query(self.base_class), query_params
+                )
+
+                for item in query.all():
+                    database.delete(item)
+            except SQLAlchemyError as e:
+                logger.error(e)
+                raise OperationalException("Error deleting all objects")
+
+            return
 
         with Session() as db:
             if query_params is None:
@@ -117,8 +196,16 @@ class Repository(ABC):
                 db.rollback()
                 raise OperationalException("Error deleting all objects")
 
+    @record_repository_call
     def get_all(self, query_params=None):
         query_params = MultiDict(query_params)
+        database = get_in_memory_database()
+
+        if database is not None:
+            query = self.apply_query_params(
+                database, database.query(self.base_class), query_params
+            )
+            return query.all()
 
         with Session() as db:
             try:
@@ -131,7 +218,19 @@ class Repository(ABC):
                 logger.error(e)
                 raise OperationalException("Error getting all objects")
 
+    @record_repository_call
     def get(self, object_id):
+        database = get_in_memory_database()
+
+        if database is not None:
+            match = database.get(self.base_class, object_id)
+
+            if not match:
+                raise OperationalException(
+                    self.DEFAULT_NOT_FOUND_MESSAGE
+                )
+
+            return match
 
         with Session() as db:
             match = db.query(self.base_class).filter_by(id=object_id) \
@@ -146,6 +245,13 @@ class Repository(ABC):
 
     @abstractmethod
     def _apply_query_params(self, db, query, query_params):
+        """
+        Apply the query parameters to a query. The same definition is
+        used for both databases: db is a SQLAlchemy session or the
+        InMemoryDatabase, and query a SQLAlchemy query or an
+        InMemoryQuery. Use only the filters and expressions that the
+        InMemoryQuery supports.
+        """
         raise NotImplementedError()
 
     def apply_query_params(self, db, query, query_params):
@@ -156,7 +262,16 @@ class Repository(ABC):
 
         return query
 
+    @record_repository_call
     def exists(self, query_params):
+        database = get_in_memory_database()
+
+        if database is not None:
+            query = self.apply_query_params(
+                database, database.query(self.base_class), query_params
+            )
+            return query.first() is not None
+
         with Session() as db:
             try:
                 query = db.query(self.base_class)
@@ -166,11 +281,25 @@ class Repository(ABC):
                 logger.error(e)
                 raise OperationalException("Error checking if object exists")
 
+    @record_repository_call
     def find(self, query_params):
 
         if query_params is None or len(query_params) == 0:
             raise OperationalException("Find requires query parameters")
 
+        database = get_in_memory_database()
+
+        if database is not None:
+            query = self.apply_query_params(
+                database, database.query(self.base_class), query_params
+            )
+            result = query.first()
+
+            if result is None:
+                raise OperationalException(self.DEFAULT_NOT_FOUND_MESSAGE)
+
+            return result
+
         with Session() as db:
             try:
                 query = db.query(self.base_class)
@@ -185,7 +314,15 @@ class Repository(ABC):
                 logger.error(e)
                 raise OperationalException(self.DEFAULT_NOT_FOUND_MESSAGE)
 
+    @record_repository_call
     def count(self, query_params=None):
+        database = get_in_memory_database()
+
+        if database is not None:
+            query = self.apply_query_params(
+                database, database.query(self.base_class), query_params
+            )
+            return query.count()
 
         with Session() as db:
             try:
@@ -266,6 +403,7 @@ class Repository(ABC):
 
         return new_selection
 
+    @record_repository_call
     def save(self, object_to_save):
         """
         Save an object to the database with SQLAlchemy.
@@ -276,6 +414,16 @@ class Repository(ABC):
         Returns:
             Object: The saved object.
         """
+        database = get_in_memory_database()
+
+        if database is not None:
+            try:
+                database.save(object_to_save)
+                return self.get(object_to_save.id)
+            except SQLAlchemyError as e:
+                logger.error(e)
+                raise OperationalException("Error saving object")
+
         with Session() as db:
             try:
                 db.add(object_to_save)
@@ -286,7 +434,18 @@ class Repository(ABC):
                 db.rollback()
                 raise OperationalException("Error saving object")
 
+    @record_repository_call
     def save_objects(self, objects):
+        database = get_in_memory_database()
+
+        if database is not None:
+            try:
+                for object in objects:
+                    database.save(object)
+                return objects
+            except SQLAlchemyError as e:
+                logger.error(e)
+                raise OperationalException("Error saving objects")
 
         with Session() as db:
             try:
@@ -298,3 +457,55 @@ class Repository(ABC):
                 logger.error(e)
                 db.rollback()
                 raise OperationalException("Error saving objects")
+
+    @record_repository_call
+    def insert_objects(self, objects):
+        """
+        Insert new objects with one bulk insert of their column values
+        instead of adding them one by one to the session. Use this
+        for write-only objects, such as snapshots, that are created in
+        large numbers: the relationships of the objects are not saved
+        and, with the SQL database, the objects are not refreshed.
+
+        Args:
+            objects: list of new instances of the model.
+
+        Returns:
+            List: The inserted objects.
+        """
+
+        if len(objects) == 0:
+            return objects
+
+        database = get_in_memory_database()
+
+        if database is not None:
+            try:
+                for object in objects:
+                    database.save(object)
+                return objects
+            except SQLAlchemyError as e:
+                logger.error(e)
+                raise OperationalException("Error inserting objects")
+
+        # Only the set attributes are inserted, so the column defaults
+        # apply to the others
+        keys = [attribute.key for attribute in
+                inspect(self.base_class).column_attrs]
+        rows = []
+
+        for object in objects:
+            values = inspect(object).dict
+            rows.append(
+                {key: values[key] for key in keys if key in values}
+            )
+
+        with Session() as db:
+            try:
+                db.execute(insert(self.base_class), rows)
+                db.commit()
+                return objects
+            except SQLAlchemyError as e:
+                logger.error(e)
+                db.rollback()
+                raise OperationalException("Error inserting objects")
@@ -0,0 +1,183 @@
+import threading
+import time
+from functools import wraps
+
+_repository_statistics = None
+_call_depth = threading.local()
+
+
+def use_repository_statistics(statistics):
+    """
+    Record the calls of the repositories in the given statistics.
+    Pass None to stop recording.
+
+    Args:
+        statistics (RepositoryStatistics): The statistics to record
+            the calls in, or None.
+
+    Returns:
+        None
+    """
+    global _repository_statistics
+    _repository_statistics = statistics
+
+
+def get_repository_statistics():
+    """
+    Get the statistics the repository calls are recorded in, or None
+    if the calls are not recorded.
+    """
+    return _repository_statistics
+
+
+def record_repository_call(method):
+    """
+    Decorator of a repository method that records the number of calls
+    and the duration of the method in the repository statistics in
+    use. Calls made by another repository call (e.g. the get of an
+    update) are part of the outer call and are not recorded.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        statistics = _repository_statistics
+        depth = getattr(_call_depth, "depth", 0)
+
+        if statistics is None or depth > 0:
+            return method(self, *args, **kwargs)
+
+        _call_depth.depth = depth + 1
+        started_at = time.perf_counter()
+
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _call_depth.depth = depth
+            statistics.record(
+                f"{type(self).__name__}.{method.__name__}",
+                time.perf_counter() - started_at,
+            )
+
+    return wrapper
+
+
+class RepositoryCallStatistics:
+    """
+    Statistics of the calls of one repository method.
+
+    Attributes:
+        name (str): The name of the method, e.g.
+            "SQLOrderRepository.get_all".
+        count (int): The number of calls.
+        total_duration (float): The total duration of the calls in
+            seconds.
+        max_duration (float): The duration of the slowest call in
+            seconds.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+
+    @property
+    def average_duration(self):
+
+        if self.count == 0:
+            return 0.0
+
+        return self.total_duration / self.count
+
+    def __repr__(self):
+        return f"RepositoryCallStatistics(name={self.name}, " \
+            f"count={self.count}, total_duration={self.total_duration})"
+
+
+class RepositoryStatistics:
+    """
+    Query count and latency statistics of the repository calls, e.g.
+    of one event backtest. Use with `use_repository_statistics`.
+
+    Attributes:
+        calls (dict): The statistics of the calls by method name.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, duration):
+        """
+        Record a call of a repository method.
+
+        Args:
+            name (str): The name of the method.
+            duration (float): The duration of the call in seconds.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            call = self.calls.get(name)
+
+            if call is None:
+                call = RepositoryCallStatistics(name)
+                self.calls[name] = call
+
+            call.count += 1
+            call.total_duration += duration
+            call.max_duration = max(call.max_duration, duration)
+
+    @property
+    def number_of_calls(self):
+        return sum(call.count for call in self.calls.values())
+
+    @property
+    def total_duration(self):
+        return sum(call.total_duration for call in self.calls.values())
+
+    def get_slowest_calls(self, number_of_calls=10):
+        """
+        Get the statistics of the repository methods with the highest
+        total duration.
+
+        Args:
+            number_of_calls (int): The number of methods to return.
+
+        Returns:
+            List[RepositoryCallStatistics]: The statistics, slowest
+                first.
+        """
+        return sorted(
+            self.calls.values(),
+            key=lambda call: call.total_duration,
+            reverse=True,
+        )[:number_of_calls]
+
+    def report(self, number_of_calls=10):
+        """
+        Format the slowest repository methods as a table.
+
+        Args:
+            number_of_calls (int): The number of methods to report.
+
+        Returns:
+            str: The report.
+        """
+        lines = [
+            f"{self.number_of_calls} repository calls in "
+            f"{self.total_duration:.3f}s, slowest:",
+            f"{'method':<50} {'calls':>8} {'total (s)':>10} "
+            f"{'avg (ms)':>10} {'max (ms)':>10}",
+        ]
+
+        for call in self.get_slowest_calls(number_of_calls):
+            lines.append(
+                f"{call.name:<50} {call.count:>8} "
+                f"{call.total_duration:>10.3f} "
+                f"{call.average_duration * 1000:>10.3f} "
+                f"{call.max_duration * 1000:>10.3f}"
+            )
+
+        return "\n".join(lines)
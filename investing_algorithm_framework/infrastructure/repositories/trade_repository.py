@@ -1,12 +1,17 @@
 import logging
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 
 from investing_algorithm_framework.domain import TradeStatus, ApiException
 from investing_algorithm_framework.infrastructure.models import SQLPosition, \
     SQLPortfolio, SQLTrade, SQLOrder
-from investing_algorithm_framework.infrastructure.database import Session
+from investing_algorithm_framework.infrastructure.models\
+    .order_trade_association import order_trade_association
+from investing_algorithm_framework.infrastructure.database import Session, \
+    get_in_memory_database
 
 from .repository import Repository
+from .repository_statistics import record_repository_call
 
 logger = logging.getLogger("investing_algorithm_framework")
 
@@ -27,20 +32,35 @@ class SQLTradeRepository(Repository):
         order_id_query_param = self.get_query_param("order_id", query_params)
 
         if order_id_query_param:
-            query = query.filter(SQLTrade.orders.any(id=order_id_query_param))
+            query = query.filter(SQLTrade.id.in_(
+                select(order_trade_association.c.trade_id).where(
+                    order_trade_association.c.order_id
+                    == order_id_query_param
+                )
+            ))
 
         if portfolio_query_param is not None:
-            portfolio = db.query(SQLPortfolio).filter_by(
-                id=portfolio_query_param
-            ).first()
 
-            if portfolio is None:
+            if db.query(SQLPortfolio).filter_by(
+                id=portfolio_query_param
+            ).count() == 0:
                 raise ApiException("Portfolio not found")
 
-            # Query trades belonging to the portfolio
-            query = db.query(SQLTrade).join(SQLOrder, SQLTrade.orders) \
-                .join(SQLPosition, SQLOrder.position_id == SQLPosition.id) \
-                .filter(SQLPosition.portfolio_id == portfolio.id)
+            # Query trades with orders of the positions of the portfolio
+            query = query.filter(SQLTrade.id.in_(
+                select(order_trade_association.c.trade_id).where(
+                    order_trade_association.c.order_id.in_(
+                        select(SQLOrder.id).where(
+                            SQLOrder.position_id.in_(
+                                select(SQLPosition.id).where(
+                                    SQLPosition.portfolio_id
+                                    == portfolio_query_param
+                                )
+                            )
+                        )
+                    )
+                )
+            ))
 
         if status_query_param:
             status = TradeStatus.from_value(status_query_param)
@@ -57,7 +77,19 @@ class SQLTradeRepository(Repository):
 
         return query
 
+    @record_repository_call
     def add_order_to_trade(self, trade, order):
+        database = get_in_memory_database()
+
+        if database is not None:
+            try:
+                trade.orders.append(order)
+                database.save(trade)
+                return trade
+            except SQLAlchemyError as e:
+                logger.error(f"Error saving trade: {e}")
+                raise ApiException("Error saving trade")
+
         with Session() as db:
             try:
                 db.add(order)
@@ -5,6 +5,7 @@ import logging
 import multiprocessing
 import os
 import threading
+from contextlib import nullcontext
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -20,10 +21,16 @@ from investing_algorithm_framework.domain import BacktestRun, \
     generate_backtest_summary_metrics, DataSource, Study, EngineSlot, \
     PortfolioConfiguration, tqdm, SnapshotInterval, \
     save_backtests_to_directory, TimeFrame, resolve_backtest_path, \
-    BUNDLE_EXT, Universe, build_strategy_universe_map, stamp_backtests
+    BUNDLE_EXT, Universe, build_strategy_universe_map, stamp_backtests, \
+    IN_MEMORY_BACKTEST_DATABASE, FLUSH_BACKTEST_DATABASE, \
+    REPOSITORY_STATISTICS
+from investing_algorithm_framework.infrastructure.database import \
+    InMemoryDatabase, use_in_memory_database, get_in_memory_database
+from investing_algorithm_framework.infrastructure.repositories import \
+    RepositoryStatistics, use_repository_statistics, \
+    get_repository_statistics
 from investing_algorithm_framework.services.data_providers import \
-    DataProviderService, fill_missing_timeseries_data, \
-    get_missing_timeseries_data_entries
+    DataProviderService, get_completeness_index
 from investing_algorithm_framework.services.metrics import \
     create_backtest_metrics
 from investing_algorithm_framework.services.portfolios import \
@@ -147,18 +154,22 @@ def _fill_missing_data_for_data_sources(
 
                 required_end_date = backtest_date_range.end_date
 
-                # Get the frequency string based on time_frame
-                time_frame = TimeFrame.from_value(data_source.time_frame)
-                freq_minutes = time_frame.amount_of_minutes
-                freq = f"{freq_minutes}min" if freq_minutes < 60 else \
-                    f"{freq_minutes // 60}h" if freq_minutes < 1440 else "D"
+                # The completeness index of the data file is persisted
+                # in the cache directory and reused while the file does
+                # not change
+                data_file_path = None
 
-                # Check for missing dates
-                missing_dates = get_missing_timeseries_data_entries(
+                if hasattr(data_provider, "get_data_source_file_path"):
+                    data_file_path = \
+                        data_provider.get_data_source_file_path()
+
+                completeness_index = get_completeness_index(
                     data,
-                    start=required_start_date,
-                    end=required_end_date,
-                    freq=freq
+                    data_source.time_frame,
+                    data_file_path=data_file_path,
+                )
+                missing_dates = completeness_index.get_missing_timestamps(
+                    required_start_date, required_end_date
                 )
 
                 if len(missing_dates) > 0:
@@ -171,15 +182,10 @@ def _fill_missing_data_for_data_sources(
 
                     # Fill the missing data (never write back to
                     # the source file during backtest preparation)
-                    filled_data = fill_missing_timeseries_data(
-                        data,
-                        missing_dates=missing_dates,
-                        save_to_file=False,
+                    data_provider.data = completeness_index.fill(
+                        data, required_start_date, required_end_date
                     )
 
-                    # Update the data provider's data
-                    data_provider.data = filled_data
-
         except Exception as e:
             logger.warning(
                 f"Could not fill missing data for data source "
@@ -756,6 +762,8 @@ class BacktestService:
         dynamic_position_sizing: bool = False,
         fill_missing_data: bool = True,
         iterative_summary_update: bool = False,
+        share_ohlcv_data: bool = False,
+        single_pass_windows: bool = False,
     ):
         """
         OPTIMIZED version: Run vectorized backtests with optional
@@ -808,6 +816,22 @@ class BacktestService:
             iterative_summary_update: If True, update backtest_summary
                 after each window to enable window_filter_function to
                 access up-to-date summary metrics (default: False).
+            share_ohlcv_data: If True and n_workers is set, the OHLCV
+                data of the data providers is written once to
+                memory-mapped Arrow IPC files that all worker processes
+                read from, instead of pickling a full copy of the data
+                into every worker (default: False).
+            single_pass_windows: If True and the study has several
+                date ranges (e.g. rolling or anchored windows), the data
+                sources are initialized once over the union of the date
+                ranges, and the market data and signals of every
+                strategy are loaded and generated once over it. Each
+                date range is then simulated on a slice of those shared
+                arrays. Indicators with unbounded memory (e.g. an EMA)
+                are primed on more history than in a separate run per
+                window, so results can differ slightly from the default
+                per-window runs. Only supported without n_workers
+                (default: False).
 
         Returns:
             List[Backtest]: List of backtest results.
@@ -959,13 +983,47 @@ class BacktestService:
         # Validate algorithm IDs
         self._validate_algorithm_ids(strategies)
 
+        # Single pass over the date ranges: one VectorBacktestService
+        # keeps the market data and signals of every strategy over the
+        # union of the date ranges, so each date range only slices them.
+        shared_vector_backtest_service = None
+
+        if single_pass_windows and len(backtest_date_ranges) > 1:
+            if n_workers is not None and n_workers != 0:
+                logger.warning(
+                    "single_pass_windows is not supported with parallel "
+                    "workers, running every date range separately"
+                )
+            else:
+                shared_date_range = BacktestDateRange(
+                    start_date=backtest_date_ranges[0].start_date,
+                    end_date=max(
+                        date_range.end_date
+                        for date_range in backtest_date_ranges
+                    ),
+                )
+
+                if not skip_data_sources_initialization:
+                    self.initialize_data_sources_backtest(
+                        data_sources,
+                        shared_date_range,
+                        show_progress=show_progress,
+                        fill_missing_data=fill_missing_data
+                    )
+
+                shared_vector_backtest_service = VectorBacktestService(
+                    data_provider_service=self._data_provider_service,
+                    shared_date_range=shared_date_range,
+                )
+
         for backtest_date_range in tqdm(
             backtest_date_ranges,
             colour="green",
             desc="Running backtests for all date ranges",
             disable=not show_progress
         ):
-            if not skip_data_sources_initialization:
+            if not skip_data_sources_initialization \
+                    and shared_vector_backtest_service is None:
                 self.initialize_data_sources_backtest(
                     data_sources,
                     backtest_date_range,
@@ -1164,8 +1222,16 @@ class BacktestService:
                     # (a ``mp_ctx.Value``) and ``shared_data_provider``
                     # are passed through the initializer so they are
                     # inherited once per worker rather than pickled per
-                    # task.
-                    with ProcessPoolExecutor(
+                    # task. With ``share_ohlcv_data`` the providers only
+                    # carry the path of a memory-mapped file, so the
+                    # workers share one copy of the OHLCV data.
+                    if share_ohlcv_data:
+                        ohlcv_sharing = \
+                            shared_data_provider.shared_ohlcv_data()
+                    else:
+                        ohlcv_sharing = nullcontext()
+
+                    with ohlcv_sharing, ProcessPoolExecutor(
                         max_workers=n_workers,
                         mp_context=mp_ctx,
                         initializer=_init_worker,
@@ -1305,7 +1371,12 @@ class BacktestService:
 
                         try:
                             batch_result = \
-                                self._run_batch_backtest_worker(worker_args)
+                                self._run_batch_backtest_worker(
+                                    worker_args,
+                                    vector_backtest_service=(
+                                        shared_vector_backtest_service
+                                    ),
+                                )
 
                             if batch_result:
                                 # Phase 2b: stamp study fields and the
@@ -1433,6 +1504,11 @@ class BacktestService:
                                           for b in filtered_backtests]
                 ]
 
+                if shared_vector_backtest_service is not None:
+                    shared_vector_backtest_service.release_shared_signals(
+                        active_strategies
+                    )
+
                 # Update tracking based on whether we're using
                 # storage or memory
                 if backtest_storage_directory is None:
@@ -2213,7 +2289,7 @@ class BacktestService:
             gc.collect()
 
     @staticmethod
-    def _run_batch_backtest_worker(args):
+    def _run_batch_backtest_worker(args, vector_backtest_service=None):
         """
         Static worker function for parallel BATCH backtest execution.
 
@@ -2238,6 +2314,10 @@ class BacktestService:
                 dynamic_position_sizing,
                 progress_counter (optional),
             )
+            vector_backtest_service: Optional VectorBacktestService to
+                run the batch with, e.g. one sharing market data and
+                signals across date ranges. A new service is created
+                when omitted.
 
         Returns:
             List[Backtest]: List of completed backtest results
@@ -2282,30 +2362,39 @@ class BacktestService:
         if progress_counter is None:
             progress_counter = _worker_progress_counter
 
-        vector_backtest_service = VectorBacktestService(
-            data_provider_service=data_provider_service
-        )
+        if vector_backtest_service is None:
+            vector_backtest_service = VectorBacktestService(
+                data_provider_service=data_provider_service
+            )
 
         batch_results = []
         start_date = backtest_date_range.start_date.strftime('%Y-%m-%d')
         end_date = backtest_date_range.end_date.strftime('%Y-%m-%d')
+
+        # Strategies of the batch that share data sources share one
+        # load / alignment of the market data (and, for parameter
+        # sweeps of one class, one signal generation pass).
+        batch_runs = vector_backtest_service.run_batch(
+            strategies=strategy_batch,
+            backtest_date_range=backtest_date_range,
+            portfolio_configuration=portfolio_configuration,
+            risk_free_rate=risk_free_rate,
+            dynamic_position_sizing=dynamic_position_sizing,
+        )
         if show_progress:
-            strategy_batch = tqdm(
-                strategy_batch,
+            batch_runs = tqdm(
+                batch_runs,
+                total=len(strategy_batch),
                 colour="green",
                 desc=f"Running backtests for {start_date} to {end_date}",
                 disable=not show_progress
             )
 
-        for strategy in strategy_batch:
+        for strategy, backtest_run in batch_runs:
             try:
-                backtest_run = vector_backtest_service.run(
-                    strategy=strategy,
-                    backtest_date_range=backtest_date_range,
-                    portfolio_configuration=portfolio_configuration,
-                    risk_free_rate=risk_free_rate,
-                    dynamic_position_sizing=dynamic_position_sizing,
-                )
+                if isinstance(backtest_run, Exception):
+                    raise backtest_run
+
                 backtest = Backtest(
                     algorithm_id=strategy.algorithm_id,
                     metadata=strategy.metadata if hasattr(
@@ -2554,16 +2643,36 @@ class BacktestService:
         loop's snapshot-cadence guard (see ``EventLoopService``) thinks
         a snapshot was already taken from a previous algorithm's/
         window's run and skips taking a fresh one for this run.
+
+        Unless the ``IN_MEMORY_BACKTEST_DATABASE`` config value is
+        False, the run state is kept in a fresh in-memory database
+        instead of the SQL database, see
+        ``_release_event_backtest_state``. If the
+        ``REPOSITORY_STATISTICS`` config value is True, the repository
+        calls of the run are recorded and the slowest calls are logged
+        when the run is released.
         """
         from investing_algorithm_framework.domain import \
             BACKTESTING_INITIAL_AMOUNT, LAST_SNAPSHOT_DATETIME
         from investing_algorithm_framework.infrastructure.database \
             .sql_alchemy import Session, SQLBaseModel
 
-        with Session() as db:
-            for table in reversed(SQLBaseModel.metadata.sorted_tables):
-                db.execute(table.delete())
-            db.commit()
+        config = self._configuration_service.config
+
+        if config.get(IN_MEMORY_BACKTEST_DATABASE, True):
+            use_in_memory_database(InMemoryDatabase())
+        else:
+            use_in_memory_database(None)
+
+            with Session() as db:
+                for table in reversed(SQLBaseModel.metadata.sorted_tables):
+                    db.execute(table.delete())
+                db.commit()
+
+        if config.get(REPOSITORY_STATISTICS, False):
+            use_repository_statistics(RepositoryStatistics())
+        else:
+            use_repository_statistics(None)
 
         initial_amount = self._configuration_service.config.get(
             BACKTESTING_INITIAL_AMOUNT, None
@@ -2575,6 +2684,41 @@ class BacktestService:
 
         self._configuration_service.add_value(LAST_SNAPSHOT_DATETIME, None)
 
+    def _release_event_backtest_state(self, flush=False):
+        """
+        Switch the repositories back to the SQL database after an
+        event backtest run that kept its state in an in-memory
+        database, and log the slowest repository calls of the run
+        if they were recorded.
+
+        Args:
+            flush (bool): Write the state of the run to the SQL
+                database if the ``FLUSH_BACKTEST_DATABASE`` config
+                value is True.
+
+        Returns:
+            None
+        """
+        statistics = get_repository_statistics()
+
+        if statistics is not None:
+            use_repository_statistics(None)
+            logger.info(
+                "Repository calls of the event backtest: "
+                f"{statistics.report()}"
+            )
+
+        database = get_in_memory_database()
+
+        if database is None:
+            return
+
+        use_in_memory_database(None)
+        config = self._configuration_service.config
+
+        if flush and config.get(FLUSH_BACKTEST_DATABASE, False):
+            database.flush()
+
     def run_backtests(
         self,
         algorithms: List,
@@ -2962,6 +3106,8 @@ class BacktestService:
                             else:
                                 backtest.metadata = {}
 
+                            self._release_event_backtest_state(flush=True)
+
                             # Store with algorithm object id for tracking
                             backtest._algorithm_obj_id = id(algorithm)
                             all_backtests.append(backtest)
@@ -2988,6 +3134,8 @@ class BacktestService:
                                 continue
                             else:
                                 raise
+                        finally:
+                            self._release_event_backtest_state()
 
                     # Periodic garbage collection
                     if (batch_idx + 1) % 5 == 0:
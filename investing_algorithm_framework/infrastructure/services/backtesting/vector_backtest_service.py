@@ -1,21 +1,21 @@
 from datetime import datetime, timezone
-from uuid import uuid4
 
 import logging
 
+import numpy as np
 import pandas as pd
 
 from investing_algorithm_framework.domain import BacktestDateRange, \
     BacktestRun, BacktestWindow, Portfolio, TimeFrame, \
-    PortfolioConfiguration, \
-    PortfolioSnapshot, OperationalException, Order, OrderType, OrderStatus, \
-    OrderSide, Trade, TradeStatus, DataType, TradingCost, CooldownTracker, \
-    SignalSide
+    PortfolioConfiguration, PortfolioSnapshot, OperationalException, \
+    DataType, TradingCost, SignalSide, TradeLedger
 from investing_algorithm_framework.services import DataProviderService, \
     create_backtest_metrics
 from investing_algorithm_framework.services.pipeline import \
     VectorPipelineEngine
 
+from .vector_execution_core import VectorExecutionCore, build_signal_mask
+
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +23,28 @@ logger = logging.getLogger(__name__)
 class VectorBacktestService:
 
     def __init__(
-        self, data_provider_service: DataProviderService
+        self,
+        data_provider_service: DataProviderService,
+        shared_date_range: BacktestDateRange = None,
     ):
+        """
+        Args:
+            data_provider_service: The data provider service to read
+                the market data from.
+            shared_date_range: Optional date range enclosing every
+                date range this service is asked to run, e.g. the
+                union of the windows of a rolling or anchored study.
+                When set, the market data of strategies with identical
+                data sources is loaded once over this range and the
+                signals of every strategy are generated once over it;
+                each run inside the range is then simulated on a slice
+                of those shared arrays instead of reloading the data
+                and regenerating the signals per window.
+        """
         self.data_provider_service = data_provider_service
+        self.shared_date_range = shared_date_range
+        self._shared_market_data = {}
+        self._shared_signals = {}
 
     def run(
         self,
@@ -63,12 +82,306 @@ class VectorBacktestService:
             trades. If you need to replicate signals externally, make
             sure to include the same warmup period in your data.
         """
-        initial_amount = portfolio_configuration.initial_balance
-        trading_symbol = portfolio_configuration.trading_symbol
-        portfolio = Portfolio.from_portfolio_configuration(
-            portfolio_configuration
+        return self._run_with_market_data(
+            strategy=strategy,
+            market_data=self._market_data(strategy, backtest_date_range),
+            backtest_date_range=backtest_date_range,
+            portfolio_configuration=portfolio_configuration,
+            risk_free_rate=risk_free_rate,
+            dynamic_position_sizing=dynamic_position_sizing,
+        )
+
+    def run_batch(
+        self,
+        strategies,
+        backtest_date_range: BacktestDateRange,
+        portfolio_configuration: PortfolioConfiguration,
+        risk_free_rate: float = 0.027,
+        dynamic_position_sizing: bool = False,
+    ):
+        """
+        Vectorized backtests for many strategies sharing their market
+        data.
+
+        Strategies with identical data sources (and pipelines) share
+        one load of the vectorized backtest data and one alignment of
+        the OHLCV close prices to the master index. When several
+        strategies of the same class share their data and the class
+        implements ``generate_signal_matrices``, the signals of all
+        those variants are generated in one call and simulated on the
+        shared price arrays.
+
+        Args:
+            strategies: The strategies to backtest.
+            backtest_date_range: The date range for the backtests.
+            portfolio_configuration: Portfolio configuration shared by
+                every backtest.
+            risk_free_rate: The risk-free rate used for the metrics.
+            dynamic_position_sizing: See :meth:`run`.
+
+        Yields:
+            tuple: ``(strategy, result)`` in the order of
+            ``strategies``, where ``result`` is the strategy's
+            ``BacktestRun`` or the exception raised while running it.
+        """
+        strategies = list(strategies)
+        groups = {}
+
+        for strategy in strategies:
+            groups.setdefault(
+                self._market_data_key(strategy), []
+            ).append(strategy)
+
+        market_data_by_key = {}
+        signal_series_by_strategy = {}
+
+        for strategy in strategies:
+            key = self._market_data_key(strategy)
+
+            try:
+                if key not in market_data_by_key:
+                    market_data_by_key[key] = self._market_data(
+                        strategy, backtest_date_range
+                    )
+                    signal_series_by_strategy.update(
+                        self._generate_signal_matrices(
+                            [
+                                variant for variant in groups[key]
+                                if not self.has_shared_signals(variant)
+                            ],
+                            market_data_by_key[key]
+                        )
+                    )
+
+                yield strategy, self._run_with_market_data(
+                    strategy=strategy,
+                    market_data=market_data_by_key[key],
+                    backtest_date_range=backtest_date_range,
+                    portfolio_configuration=portfolio_configuration,
+                    risk_free_rate=risk_free_rate,
+                    dynamic_position_sizing=dynamic_position_sizing,
+                    signal_series=signal_series_by_strategy.pop(
+                        id(strategy), None
+                    ),
+                )
+            except Exception as e:
+                yield strategy, e
+
+    def run_sweep(
+        self,
+        strategy_class,
+        parameter_grid,
+        backtest_date_range: BacktestDateRange,
+        portfolio_configuration: PortfolioConfiguration,
+        risk_free_rate: float = 0.027,
+        dynamic_position_sizing: bool = False,
+        **strategy_kwargs,
+    ):
+        """
+        Vectorized parameter sweep of one strategy class.
+
+        Instantiates one variant per combination of ``parameter_grid``
+        (see ``TradingStrategy.from_parameter_grid``) and runs them
+        through :meth:`run_batch`, so the OHLCV data is loaded and
+        aligned once for the whole sweep.
+
+        Args:
+            strategy_class: The ``TradingStrategy`` subclass to sweep.
+            parameter_grid: Dict of candidate values per constructor
+                argument, or a list of keyword-argument dicts.
+            backtest_date_range: The date range for the backtests.
+            portfolio_configuration: Portfolio configuration shared by
+                every variant.
+            risk_free_rate: The risk-free rate used for the metrics.
+            dynamic_position_sizing: See :meth:`run`.
+            **strategy_kwargs: Constructor arguments shared by every
+                variant.
+
+        Returns:
+            List[Tuple[TradingStrategy, BacktestRun]]: One entry per
+            variant, in grid order.
+        """
+        results = []
+
+        for strategy, result in self.run_batch(
+            strategies=strategy_class.from_parameter_grid(
+                parameter_grid, **strategy_kwargs
+            ),
+            backtest_date_range=backtest_date_range,
+            portfolio_configuration=portfolio_configuration,
+            risk_free_rate=risk_free_rate,
+            dynamic_position_sizing=dynamic_position_sizing,
+        ):
+            if isinstance(result, Exception):
+                raise result
+
+            results.append((strategy, result))
+
+        return results
+
+    def extend(
+        self,
+        strategy,
+        backtest_run: BacktestRun,
+        end_date: datetime,
+        portfolio_configuration: PortfolioConfiguration,
+        risk_free_rate: float = 0.027,
+    ) -> BacktestRun:
+        """
+        Continue a vectorized backtest run up to a later end date.
+
+        Instead of recomputing the whole history, only the data after
+        the end date of ``backtest_run`` (plus the warmup window) is
+        loaded and only the signals of those bars are generated. The
+        execution engine resumes from the ``engine_state`` stored on
+        the run, the portfolio snapshots, trades, orders, signals and
+        signal events of the new bars are appended to those of the
+        run, and the metrics are recomputed over the merged run.
+
+        The result matches a full run over the extended date range as
+        long as the strategy's signals on a bar only depend on the
+        bars of its warmup window before it. The portfolio snapshots
+        of ``backtest_run`` are kept as they are: a trade that is
+        scaled in or out after the old end date is only revalued on
+        the new bars, whereas a full run values it at its final size
+        from its first bar on.
+
+        Args:
+            strategy: The strategy that produced ``backtest_run``.
+            backtest_run: The vector backtest run to continue, in
+                memory or loaded from disk.
+            end_date: The new end date of the run.
+            portfolio_configuration: The portfolio configuration the
+                run was created with.
+            risk_free_rate: The risk-free rate used for the metrics.
+
+        Returns:
+            BacktestRun: A new run from the start date of
+            ``backtest_run`` up to ``end_date``. ``backtest_run`` is
+            left unchanged.
+        """
+        if not backtest_run.engine_state:
+            raise OperationalException(
+                "The backtest run has no engine state to continue "
+                "from, only vector backtest runs can be extended"
+            )
+
+        previous_end_date = backtest_run.backtest_end_date
+
+        if end_date <= previous_end_date:
+            raise OperationalException(
+                f"End date {end_date} must be after the end date "
+                f"{previous_end_date} of the backtest run"
+            )
+
+        new_bars_range = BacktestDateRange(
+            start_date=previous_end_date, end_date=end_date
+        )
+        return self._run_with_market_data(
+            strategy=strategy,
+            market_data=_MarketDataWindow(
+                self._load_market_data(strategy, new_bars_range),
+                new_bars_range,
+                after=previous_end_date,
+            ),
+            backtest_date_range=BacktestDateRange(
+                start_date=backtest_run.backtest_start_date,
+                end_date=end_date,
+                name=backtest_run.backtest_date_range_name,
+            ),
+            portfolio_configuration=portfolio_configuration,
+            risk_free_rate=risk_free_rate,
+            dynamic_position_sizing=backtest_run.engine_state[
+                "dynamic_position_sizing"
+            ],
+            resume=backtest_run,
+        )
+
+    def has_shared_signals(self, strategy) -> bool:
+        """Whether the signals of ``strategy`` were already generated
+        over the shared date range."""
+        shared = self._shared_signals.get(id(strategy))
+        return shared is not None and shared[0] is strategy
+
+    def release_shared_signals(self, strategies):
+        """Drop the shared signals of every strategy not in
+        ``strategies``, e.g. the ones eliminated by a window filter.
+
+        Args:
+            strategies: The strategies that will still be run.
+
+        Returns:
+            None
+        """
+        keep = {id(strategy) for strategy in strategies}
+
+        for key in list(self._shared_signals):
+            if key not in keep:
+                del self._shared_signals[key]
+
+    def _in_shared_date_range(self, backtest_date_range):
+        return (
+            self.shared_date_range is not None
+            and self.shared_date_range.start_date
+            <= backtest_date_range.start_date
+            and backtest_date_range.end_date
+            <= self.shared_date_range.end_date
+        )
+
+    def _market_data(self, strategy, backtest_date_range):
+        if not self._in_shared_date_range(backtest_date_range):
+            return self._load_market_data(strategy, backtest_date_range)
+
+        key = self._market_data_key(strategy)
+
+        if key not in self._shared_market_data:
+            self._shared_market_data[key] = self._load_market_data(
+                strategy, self.shared_date_range
+            )
+
+        return _MarketDataWindow(
+            self._shared_market_data[key], backtest_date_range, shared=True
+        )
+
+    def _signals(self, strategy, market_data, signal_series=None):
+        """Signal series and raw recorded values of ``strategy``.
+
+        For a window of shared market data they are generated once
+        over the whole shared date range and reused by every later
+        window of the same strategy.
+        """
+        shared = getattr(market_data, "shared", False)
+
+        if shared and self.has_shared_signals(strategy):
+            _, signal_series, raw_recorded = \
+                self._shared_signals[id(strategy)]
+            return signal_series, market_data.clip(raw_recorded)
+
+        data = market_data.data_for_variant()
+
+        if signal_series is None:
+            signal_series = strategy.generate_signal_series(data)
+
+        # Generate optional recorded values
+        raw_recorded = strategy.generate_recorded_values(data)
+
+        if shared:
+            signal_series = list(signal_series)
+            self._shared_signals[id(strategy)] = (
+                strategy, signal_series, raw_recorded
+            )
+            raw_recorded = market_data.clip(raw_recorded)
+
+        return signal_series, raw_recorded
+
+    @staticmethod
+    def _market_data_key(strategy):
+        return (
+            tuple(repr(ds) for ds in strategy.data_sources or []),
+            tuple(getattr(strategy, "pipelines", None) or []),
         )
 
+    def _load_market_data(self, strategy, backtest_date_range):
         # Load vectorized backtest data
         data = self.data_provider_service.get_vectorized_backtest_data(
             data_sources=strategy.data_sources,
@@ -89,6 +402,94 @@ class VectorBacktestService:
             backtest_date_range=backtest_date_range,
         )
 
+        # Build master index from the most granular OHLCV data
+        most_granular_ohlcv_data_source = (
+            self.get_most_granular_ohlcv_data_source(
+                strategy.data_sources
+            )
+        )
+        most_granular_ohlcv_data = self.data_provider_service.get_ohlcv_data(
+            symbol=most_granular_ohlcv_data_source.symbol,
+            start_date=backtest_date_range.start_date,
+            end_date=backtest_date_range.end_date,
+            pandas=True
+        )
+        return _MarketData(
+            data_provider_service=self.data_provider_service,
+            backtest_date_range=backtest_date_range,
+            data=data,
+            index=pd.Index([]).union(
+                most_granular_ohlcv_data.index
+            ).sort_values(),
+        )
+
+    @staticmethod
+    def _generate_signal_matrices(strategies, market_data):
+        """Generate the signals of every same-class variant in
+        ``strategies`` through ``generate_signal_matrices``.
+
+        Returns:
+            dict: ``id(strategy) -> List[SignalSeries]`` for every
+            variant whose class produced matrices.
+        """
+        by_class = {}
+
+        for strategy in strategies:
+            by_class.setdefault(type(strategy), []).append(strategy)
+
+        signal_series = {}
+
+        for strategy_class, variants in by_class.items():
+            if len(variants) < 2:
+                continue
+
+            matrices = strategy_class.generate_signal_matrices(
+                market_data.data_for_variant(), variants
+            )
+
+            if matrices is None:
+                continue
+
+            per_variant = [[] for _ in variants]
+
+            for matrix in matrices:
+                if matrix.number_of_variants != len(variants):
+                    raise OperationalException(
+                        f"{strategy_class.__name__}.generate_signal_"
+                        f"matrices returned a SignalMatrix for "
+                        f"{matrix.symbol} with "
+                        f"{matrix.number_of_variants} rows, expected one "
+                        f"row per variant ({len(variants)})"
+                    )
+
+                for k in range(len(variants)):
+                    per_variant[k].append(matrix.to_signal_series(k))
+
+            for variant, series in zip(variants, per_variant):
+                signal_series[id(variant)] = series
+
+        return signal_series
+
+    def _run_with_market_data(
+        self,
+        strategy,
+        market_data,
+        backtest_date_range: BacktestDateRange,
+        portfolio_configuration: PortfolioConfiguration,
+        risk_free_rate: float,
+        dynamic_position_sizing: bool,
+        signal_series=None,
+        resume: BacktestRun = None,
+    ) -> BacktestRun:
+        initial_amount = portfolio_configuration.initial_balance
+        trading_symbol = portfolio_configuration.trading_symbol
+        portfolio = Portfolio.from_portfolio_configuration(
+            portfolio_configuration
+        )
+        signal_series, raw_recorded = self._signals(
+            strategy, market_data, signal_series
+        )
+
         # Compute signals from strategy via the v9.0 SignalSeries
         # protocol. The strategy yields one SignalSeries per
         # (symbol, side) pair; we bucket them back into the six
@@ -103,65 +504,38 @@ class VectorBacktestService:
             scale_out_signals,
             short_signals,
             cover_signals,
-        ) = self._bucket_signal_series(
-            strategy.generate_signal_series(data)
-        )
+        ) = self._bucket_signal_series(signal_series)
         shorting_enabled = (
             short_signals is not None and cover_signals is not None
         )
 
-        # Generate optional recorded values
-        raw_recorded = strategy.generate_recorded_values(data)
-
         if scale_in_signals is None:
             scale_in_signals = buy_signals
 
-        # Build master index (union of all indices in signal dict)
-        index = pd.Index([])
-
-        most_granular_ohlcv_data_source = (
-            self.get_most_granular_ohlcv_data_source(
-                strategy.data_sources
-            )
-        )
-
-        most_granular_ohlcv_data = self.data_provider_service.get_ohlcv_data(
-            symbol=most_granular_ohlcv_data_source.symbol,
-            start_date=backtest_date_range.start_date,
-            end_date=backtest_date_range.end_date,
-            pandas=True
-        )
+        index = market_data.index
 
         # Make sure to filter out the buy and sell signals that are before
-        # the backtest start date
-        buy_signals = {k: v[v.index >= backtest_date_range.start_date]
-                       for k, v in buy_signals.items()}
-        sell_signals = {k: v[v.index >= backtest_date_range.start_date]
-                        for k, v in sell_signals.items()}
-        scale_in_signals = {k: v[v.index >= backtest_date_range.start_date]
-                            for k, v in scale_in_signals.items()}
-        if scale_out_signals is not None:
-            scale_out_signals = {
-                k: v[v.index >= backtest_date_range.start_date]
-                for k, v in scale_out_signals.items()
-            }
-        if shorting_enabled:
-            short_signals = {
-                k: v[v.index >= backtest_date_range.start_date]
-                for k, v in short_signals.items()
-            }
-            cover_signals = {
-                k: v[v.index >= backtest_date_range.start_date]
-                for k, v in cover_signals.items()
+        # the backtest start date (the warmup) or, for a window of
+        # shared signals, after the backtest end date
+        def _in_range(signal_dict):
+            return {
+                k: v[
+                    (v.index >= backtest_date_range.start_date)
+                    & (v.index <= backtest_date_range.end_date)
+                ]
+                for k, v in signal_dict.items()
             }
 
-        index = index.union(most_granular_ohlcv_data.index)
-        index = index.sort_values()
+        buy_signals = _in_range(buy_signals)
+        sell_signals = _in_range(sell_signals)
+        scale_in_signals = _in_range(scale_in_signals)
+        if scale_out_signals is not None:
+            scale_out_signals = _in_range(scale_out_signals)
+        if shorting_enabled:
+            short_signals = _in_range(short_signals)
+            cover_signals = _in_range(cover_signals)
 
-        # Initialize trades and portfolio values
-        trades = []
-        orders = []
-        granular_ohlcv_data_order_by_symbol = {}
+        # Initialize portfolio values
         snapshots = [
             PortfolioSnapshot(
                 trading_symbol=trading_symbol,
@@ -173,22 +547,63 @@ class VectorBacktestService:
             )
         ]
 
-        # Pre-compute all data needed for each symbol
-        symbol_data = {}
+        # Pre-compute all data needed for each symbol. Symbols are
+        # laid out as columns of preallocated (bars x symbols) arrays
+        # consumed by the array-backed execution core.
+        #
         # v9.0 (#433) — iterate the union of all signal dicts so
         # short-only strategies (no OPEN_LONG signals) still get a
-        # symbol_data entry. Previously iterating only
-        # ``buy_signals.keys()`` silently dropped every symbol that had
-        # exclusively SHORT / COVER signals.
-        all_signal_symbols = set(buy_signals.keys()) \
-            | set(sell_signals.keys()) \
-            | set(scale_in_signals.keys() if scale_in_signals else [])
-        if scale_out_signals is not None:
-            all_signal_symbols |= set(scale_out_signals.keys())
+        # column. Symbols are ordered by first appearance in the
+        # signal dicts (i.e. strategy emission order) so the per-bar
+        # processing order, and therefore capital allocation between
+        # symbols on the same bar, is deterministic.
+        symbol_signal_dicts = [
+            buy_signals, sell_signals, scale_in_signals, scale_out_signals
+        ]
         if shorting_enabled:
-            all_signal_symbols |= set(short_signals.keys())
-            all_signal_symbols |= set(cover_signals.keys())
-        for symbol in all_signal_symbols:
+            symbol_signal_dicts += [short_signals, cover_signals]
+
+        symbols = []
+        for signal_dict in symbol_signal_dicts:
+            for symbol in signal_dict or {}:
+                if symbol not in symbols:
+                    symbols.append(symbol)
+
+        # A continued run keeps the symbol columns of the engine state
+        if resume is not None:
+            state = resume.engine_state
+            new_symbols = set(symbols) - set(state["symbols"])
+
+            if new_symbols:
+                raise OperationalException(
+                    "Cannot extend the backtest run, the strategy emits "
+                    f"signals for symbols {sorted(new_symbols)} that "
+                    "are not part of the run"
+                )
+
+            symbols = list(state["symbols"])
+            snapshots = list(resume.portfolio_snapshots)
+
+        close_matrix = np.empty((len(index), len(symbols)), dtype=np.float64)
+        signal_matrix = np.zeros(
+            (len(index), len(symbols)), dtype=np.uint8
+        )
+        position_sizes = []
+        scaling_rules = []
+        trading_costs = []
+        initial_capitals_for_trade = []
+
+        def _aligned(signal_dict, symbol):
+            # Use raw boolean signals directly instead of an ffill
+            # state machine (which discards subsequent buy signals in
+            # the same cluster). A missing side is all-False.
+            if signal_dict is None or symbol not in signal_dict:
+                return None
+            return signal_dict[symbol].reindex(
+                index, fill_value=False
+            ).to_numpy()
+
+        for column, symbol in enumerate(symbols):
             full_symbol = f"{symbol}/{trading_symbol}"
 
             # find PositionSize object
@@ -204,58 +619,23 @@ class VectorBacktestService:
                     f"register a PositionSize object in the strategy."
                 )
 
-            # Load most granular OHLCV data for the symbol
-            df = self.data_provider_service.get_ohlcv_data(
-                symbol=full_symbol,
-                start_date=backtest_date_range.start_date,
-                end_date=backtest_date_range.end_date,
-                pandas=True
-            )
-            granular_ohlcv_data_order_by_symbol[full_symbol] = df
-
-            # Align signals with most granular OHLCV data
-            close = df["Close"].reindex(index, method='ffill')
-
-            # Use raw boolean signals directly instead of ffill
-            # state machine (which discards subsequent buy signals
-            # in the same cluster). The per-bar last_trade check
-            # already enforces one-position-at-a-time per symbol.
-            # v9.0 (#433) — default to all-False when this symbol
-            # only emits SHORT / COVER signals.
-            buy_signal = buy_signals[symbol].reindex(
-                index, fill_value=False
-            ) if symbol in buy_signals else pd.Series(False, index=index)
-            sell_signal = sell_signals[symbol].reindex(
-                index, fill_value=False
-            ) if symbol in sell_signals else pd.Series(False, index=index)
-
-            # Align scale-in / scale-out signals
-            si_signal = scale_in_signals[symbol].reindex(
-                index, fill_value=False
-            ) if symbol in scale_in_signals else pd.Series(
-                False, index=index
+            # Close prices aligned to the master index (shared between
+            # strategies running on the same market data)
+            close = market_data.close(full_symbol)
+            close_matrix[:, column] = close
+            signal_matrix[:, column] = build_signal_mask(
+                len(index),
+                buy=_aligned(buy_signals, symbol),
+                sell=_aligned(sell_signals, symbol),
+                scale_in=_aligned(scale_in_signals, symbol),
+                scale_out=_aligned(scale_out_signals, symbol),
+                short=_aligned(
+                    short_signals if shorting_enabled else None, symbol
+                ),
+                cover=_aligned(
+                    cover_signals if shorting_enabled else None, symbol
+                ),
             )
-            so_signal = pd.Series(False, index=index)
-            if (scale_out_signals is not None
-                    and symbol in scale_out_signals):
-                so_signal = scale_out_signals[symbol].reindex(
-                    index, fill_value=False
-                )
-
-            # Align SHORT / COVER signals (#433). Defaults to all-False
-            # series when shorting is disabled so the per-bar branches
-            # remain cheap.
-            short_signal = pd.Series(False, index=index)
-            cover_signal = pd.Series(False, index=index)
-            if shorting_enabled:
-                if symbol in short_signals:
-                    short_signal = short_signals[symbol].reindex(
-                        index, fill_value=False
-                    )
-                if symbol in cover_signals:
-                    cover_signal = cover_signals[symbol].reindex(
-                        index, fill_value=False
-                    )
 
             # Find the ScalingRule for this symbol, if any
             scaling_rule = None
@@ -266,1150 +646,117 @@ class VectorBacktestService:
                     None
                 )
 
+            position_sizes.append(pos_size_obj)
+            scaling_rules.append(scaling_rule)
             # Resolve TradingCost for this symbol
-            trading_cost = TradingCost.resolve(
-                symbol,
-                getattr(strategy, 'trading_costs', None),
-                portfolio_configuration,
+            trading_costs.append(
+                TradingCost.resolve(
+                    symbol,
+                    getattr(strategy, 'trading_costs', None),
+                    portfolio_configuration,
+                )
             )
-
             # Calculate initial capital for trade
             # (used when dynamic_position_sizing=False)
-            initial_capital_for_trade = pos_size_obj.get_size(
-                Portfolio(
-                    unallocated=portfolio_configuration.initial_balance,
-                    initial_balance=portfolio_configuration.initial_balance,
-                    trading_symbol=trading_symbol,
-                    net_size=0,
-                    market="BACKTEST",
-                    identifier="vector_backtest"
-                ),
-                asset_price=close.iloc[0] if len(close) > 0 else 1.0
+            initial_capitals_for_trade.append(
+                pos_size_obj.get_size(
+                    Portfolio(
+                        unallocated=portfolio_configuration.initial_balance,
+                        initial_balance=(
+                            portfolio_configuration.initial_balance
+                        ),
+                        trading_symbol=trading_symbol,
+                        net_size=0,
+                        market="BACKTEST",
+                        identifier="vector_backtest"
+                    ),
+                    asset_price=close[0] if len(close) > 0 else 1.0
+                )
             )
 
-            symbol_data[symbol] = {
-                'full_symbol': full_symbol,
-                'pos_size_obj': pos_size_obj,
-                'close': close,
-                'buy_signal': buy_signal,
-                'sell_signal': sell_signal,
-                'scale_in_signal': si_signal,
-                'scale_out_signal': so_signal,
-                'short_signal': short_signal,
-                'cover_signal': cover_signal,
-                'scaling_rule': scaling_rule,
-                'trading_cost': trading_cost,
-                'initial_capital_for_trade': initial_capital_for_trade,
-                'last_trade': None,  # Track open trade per symbol
-                'open_trades': [],   # All open trades for this symbol
-                'is_short': False,   # True iff last_trade is a short (#433)
-                'cooldown_remaining': 0,  # Bars remaining in cooldown
-                'scale_out_count': 0,     # Number of scale-outs done
-                'entry_count': 0,         # Number of entries so far
-            }
-
-        # Signal event log — records every fired signal and its outcome
-        signal_events = []
-
-        # Portfolio-scoped cooldown tracker for CooldownRule evaluation.
-        # Shared across symbols so portfolio-scoped rules (symbol=None) work.
-        cooldown_tracker = CooldownTracker()
-        strategy_cooldowns = list(getattr(strategy, 'cooldowns', None) or [])
-
-        # Shared portfolio state for dynamic position sizing
-        current_unallocated = initial_amount
-        total_realized_gains = 0.0
-        total_allocated = 0.0  # Track total allocated in static mode
-        open_trades_value = {}  # Track value of open trades per symbol
-
         # Pre-compute scheduled external deposits (e.g. monthly paychecks)
         # for the backtest window. Vector backtests are single-pass and
         # have no Context, so we eagerly resolve the full schedule into a
-        # sorted (timestamp, amount) list and credit ``current_unallocated``
-        # the first bar at-or-after each timestamp. Net effect for the
-        # strategy: the simulated broker balance grows on cadence, and the
-        # equity curve / metrics include the external cash flows just like
-        # the event backtest does after a sync_portfolio call.
+        # sorted (timestamp, amount) list and credit the unallocated
+        # balance the first bar at-or-after each timestamp. Net effect
+        # for the strategy: the simulated broker balance grows on
+        # cadence, and the equity curve / metrics include the external
+        # cash flows just like the event backtest does after a
+        # sync_portfolio call.
         deposit_events = self._resolve_deposit_schedule(
             portfolio_configuration=portfolio_configuration,
             backtest_date_range=backtest_date_range,
         )
-        deposit_event_idx = 0
-
-        def _close_trade(sym, sym_data, price, date):
-            """Helper to close an open trade for a symbol."""
-            nonlocal current_unallocated, total_realized_gains, \
-                total_allocated
-
-            lt = sym_data['last_trade']
-            tc = sym_data['trading_cost']
-            sell_fill = tc.get_sell_fill_price(price)
-            gross = sell_fill * lt.available_amount
-            sell_fee = tc.get_fee(gross)
-            net_gain_val = gross - sell_fee - lt.cost
-
-            # Update shared portfolio state
-            if dynamic_position_sizing:
-                current_unallocated += lt.cost + net_gain_val
-                total_realized_gains += net_gain_val
-                if sym in open_trades_value:
-                    del open_trades_value[sym]
-            else:
-                total_allocated -= lt.cost
-
-            sell_order = Order(
-                id=uuid4(),
-                target_symbol=sym,
-                trading_symbol=trading_symbol,
-                order_type=OrderType.LIMIT,
-                price=sell_fill,
-                amount=lt.available_amount,
-                status=OrderStatus.CLOSED,
-                created_at=date,
-                updated_at=date,
-                order_side=OrderSide.SELL,
-                order_fee=sell_fee,
-                order_fee_rate=tc.fee_percentage / 100
-                if tc.fee_percentage else None,
-                slippage=price - sell_fill,
-                metadata={"order_reason": "sell_signal"},
-            )
-            orders.append(sell_order)
-            trade_orders = lt.orders
-            trade_orders.append(sell_order)
-
-            lt_total_fees = (lt.total_fees or 0) + sell_fee
-            lt.update(
-                {
-                    "orders": trade_orders,
-                    "closed_at": date,
-                    "status": TradeStatus.CLOSED.value,
-                    "updated_at": date,
-                    "net_gain": net_gain_val,
-                    "total_fees": lt_total_fees,
-                }
-            )
-            sym_data['last_trade'] = None
-            # Close all open trades when fully exiting
-            for ot in sym_data['open_trades']:
-                if ot.id != lt.id and TradeStatus.OPEN.equals(ot.status):
-                    ot_gross = ot.available_amount * sell_fill
-                    ot_sell_fee = tc.get_fee(ot_gross)
-                    ot_gain = ot_gross - ot_sell_fee - ot.cost
-                    sell_o = Order(
-                        id=uuid4(),
-                        target_symbol=sym,
-                        trading_symbol=trading_symbol,
-                        order_type=OrderType.LIMIT,
-                        price=sell_fill,
-                        amount=ot.available_amount,
-                        status=OrderStatus.CLOSED,
-                        created_at=date,
-                        updated_at=date,
-                        order_side=OrderSide.SELL,
-                        order_fee=ot_sell_fee,
-                        order_fee_rate=tc.fee_percentage / 100
-                        if tc.fee_percentage else None,
-                        slippage=price - sell_fill,
-                        metadata={"order_reason": "sell_signal"},
-                    )
-                    orders.append(sell_o)
-                    ot_orders = ot.orders
-                    ot_orders.append(sell_o)
-                    ot_total_fees = (ot.total_fees or 0) + ot_sell_fee
-                    ot.update({
-                        "orders": ot_orders,
-                        "closed_at": date,
-                        "status": TradeStatus.CLOSED.value,
-                        "updated_at": date,
-                        "net_gain": ot_gain,
-                        "total_fees": ot_total_fees,
-                    })
-                    if dynamic_position_sizing:
-                        current_unallocated += ot.cost + ot_gain
-                        total_realized_gains += ot_gain
-                    else:
-                        total_allocated -= ot.cost
-            sym_data['open_trades'] = []
-            sym_data['entry_count'] = 0
-            sym_data['scale_out_count'] = 0
-
-        def _open_trade(
-            sym, sym_data, price, date, capital,
-            order_reason="buy_signal"
-        ):
-            """Helper to open a new trade for a symbol."""
-            nonlocal current_unallocated, total_allocated
-
-            tc = sym_data['trading_cost']
-            fill_price = tc.get_buy_fill_price(price)
-
-            # Fee comes out of capital; remainder buys the asset
-            buy_fee = tc.get_fee(capital)
-            net_capital = capital - buy_fee
-
-            if net_capital <= 0:
-                return None
-
-            amount = float(net_capital / fill_price)
-
-            if dynamic_position_sizing:
-                current_unallocated -= capital
-            else:
-                total_allocated += capital
+        dates = market_data.dates
+        previous_dates = []
 
-            buy_order = Order(
-                id=uuid4(),
-                target_symbol=sym,
-                trading_symbol=trading_symbol,
-                order_type=OrderType.LIMIT,
-                price=fill_price,
-                amount=amount,
-                status=OrderStatus.CLOSED,
-                created_at=date,
-                updated_at=date,
-                order_side=OrderSide.BUY,
-                order_fee=buy_fee,
-                order_fee_rate=tc.fee_percentage / 100
-                if tc.fee_percentage else None,
-                slippage=fill_price - price,
-                metadata={"order_reason": order_reason},
-                strategy_id=getattr(strategy, "strategy_id", None),
-            )
-            orders.append(buy_order)
-            trade = Trade(
-                id=uuid4(),
-                orders=[buy_order],
-                target_symbol=sym,
-                trading_symbol=trading_symbol,
-                available_amount=amount,
-                remaining=0,
-                filled_amount=amount,
-                open_price=fill_price,
-                opened_at=date,
-                closed_at=None,
-                amount=amount,
-                status=TradeStatus.OPEN.value,
-                cost=net_capital,
-                total_fees=buy_fee,
+        if resume is not None:
+            previous_ledger, previous_dates = self._resumable_ledger(
+                resume, trading_symbol, getattr(strategy, "strategy_id", None)
             )
-            sym_data['last_trade'] = trade
-            sym_data['open_trades'].append(trade)
-            sym_data['entry_count'] += 1
-            trades.append(trade)
-
-            if dynamic_position_sizing:
-                open_trades_value[sym] = \
-                    open_trades_value.get(sym, 0) + net_capital
-
-            return trade
-
-        def _get_capital_for_trade(sym_data, price, pct_of_base=100):
-            """Calculate capital for a trade, respecting portfolio limits."""
-            pos_size_obj = sym_data['pos_size_obj']
-            if dynamic_position_sizing:
-                open_total = sum(open_trades_value.values())
-                portfolio_value = current_unallocated + open_total
-                base = pos_size_obj.get_size(
-                    Portfolio(
-                        unallocated=portfolio_value,
-                        initial_balance=initial_amount,
-                        trading_symbol=trading_symbol,
-                        net_size=0,
-                        market="BACKTEST",
-                        identifier="vector_backtest"
-                    ),
-                    asset_price=price
-                )
-                capital = base * pct_of_base / 100
-                return min(capital, current_unallocated)
-            else:
-                base = sym_data['initial_capital_for_trade']
-                capital = base * pct_of_base / 100
-                if total_allocated + capital > initial_amount:
-                    return 0
-                return capital
-
-        def _partial_close(sym, sym_data, price, date, sell_pct):
-            """Partial close of the most recent open trade."""
-            nonlocal current_unallocated, total_realized_gains, \
-                total_allocated
-
-            lt = sym_data['last_trade']
-            if lt is None:
-                return
-
-            tc = sym_data['trading_cost']
-            sell_amount = lt.available_amount * sell_pct / 100
-            if sell_amount <= 0:
-                return
-
-            sell_fill = tc.get_sell_fill_price(price)
-
-            # Proportional cost (fraction of total cost)
-            sell_cost = lt.cost * (sell_amount / lt.available_amount)
-            gross = sell_amount * sell_fill
-            sell_fee = tc.get_fee(gross)
-            net_gain_val = gross - sell_fee - sell_cost
-
-            if dynamic_position_sizing:
-                current_unallocated += sell_cost + net_gain_val
-                total_realized_gains += net_gain_val
-                if sym in open_trades_value:
-                    open_trades_value[sym] = max(
-                        0, open_trades_value[sym] - sell_cost
-                    )
-            else:
-                total_allocated -= sell_cost
+            initial_capitals_for_trade = state["initial_capital_for_trade"]
 
-            sell_order = Order(
-                id=uuid4(),
-                target_symbol=sym,
-                trading_symbol=trading_symbol,
-                order_type=OrderType.LIMIT,
-                price=sell_fill,
-                amount=sell_amount,
-                status=OrderStatus.CLOSED,
-                created_at=date,
-                updated_at=date,
-                order_side=OrderSide.SELL,
-                order_fee=sell_fee,
-                order_fee_rate=tc.fee_percentage / 100
-                if tc.fee_percentage else None,
-                slippage=price - sell_fill,
-                metadata={"order_reason": "scale_out"},
-            )
-            orders.append(sell_order)
-            trade_orders = lt.orders
-            trade_orders.append(sell_order)
-            new_available = lt.available_amount - sell_amount
-            new_cost = lt.cost - sell_cost
-            old_net = lt.net_gain if lt.net_gain else 0.0
-            lt_total_fees = (lt.total_fees or 0) + sell_fee
-            update_dict = {
-                "orders": trade_orders,
-                "available_amount": new_available,
-                "cost": new_cost,
-                "net_gain": old_net + net_gain_val,
-                "total_fees": lt_total_fees,
-                "updated_at": date,
-            }
-            if new_available <= 0:
-                update_dict["closed_at"] = date
-                update_dict["status"] = TradeStatus.CLOSED.value
-                sym_data['open_trades'] = [
-                    t for t in sym_data['open_trades'] if t.id != lt.id
+            if previous_dates:
+                deposit_events = [
+                    event for event in deposit_events
+                    if event[0] > previous_dates[-1]
                 ]
-                sym_data['last_trade'] = (
-                    sym_data['open_trades'][-1]
-                    if sym_data['open_trades'] else None
-                )
-            lt.update(update_dict)
 
-        # ------------------------------------------------------------------
-        # SHORT / COVER helpers (#433)
-        #
-        # A short is a SELL-first / BUY-to-cover trade. Cash mechanics are
-        # the mirror of a long: opening a short *credits* unallocated with
-        # the sale proceeds; covering *debits* unallocated for the cost to
-        # buy the borrowed amount back. P&L therefore equals
-        # ``(open_price - cover_price) * amount - fees``.
-        #
-        # Sizing reuses the existing ``PositionSize`` mechanism: ``capital``
-        # (in quote-currency units) is the *notional* committed to the
-        # short. We allow the proceeds back into ``unallocated`` only on
-        # open; the engine does not currently model margin requirements
-        # — vector backtests are a directional-P&L tool.
-        # ------------------------------------------------------------------
-        def _open_short_trade(
-            sym, sym_data, price, date, capital,
-            order_reason="short_signal"
-        ):
-            nonlocal current_unallocated, total_allocated
-
-            tc = sym_data['trading_cost']
-            # On a SHORT entry the broker fills our SELL — slippage moves
-            # against us in the same direction as a long exit, hence the
-            # sell-side fill price.
-            fill_price = tc.get_sell_fill_price(price)
-
-            amount = float(capital / fill_price)
-            gross_proceeds = amount * fill_price
-            short_fee = tc.get_fee(gross_proceeds)
-            net_proceeds = gross_proceeds - short_fee
-
-            if amount <= 0 or net_proceeds <= 0:
-                return None
-
-            if dynamic_position_sizing:
-                # Short entry releases cash into the wallet (proceeds in,
-                # fee out).
-                current_unallocated += net_proceeds
-            else:
-                # Static mode still reserves notional against the original
-                # budget so a short cannot exceed portfolio capacity.
-                total_allocated += capital
-
-            short_order = Order(
-                id=uuid4(),
-                target_symbol=sym,
-                trading_symbol=trading_symbol,
-                order_type=OrderType.LIMIT,
-                price=fill_price,
-                amount=amount,
-                status=OrderStatus.CLOSED,
-                created_at=date,
-                updated_at=date,
-                order_side=OrderSide.SELL,
-                order_fee=short_fee,
-                order_fee_rate=tc.fee_percentage / 100
-                if tc.fee_percentage else None,
-                slippage=price - fill_price,
-                metadata={"order_reason": order_reason, "is_short": True},
-                strategy_id=getattr(strategy, "strategy_id", None),
-            )
-            orders.append(short_order)
-            trade = Trade(
-                id=uuid4(),
-                orders=[short_order],
-                target_symbol=sym,
-                trading_symbol=trading_symbol,
-                available_amount=amount,
-                remaining=0,
-                filled_amount=amount,
-                open_price=fill_price,
-                opened_at=date,
-                closed_at=None,
-                amount=amount,
-                status=TradeStatus.OPEN.value,
-                # ``cost`` for a short is the notional (proceeds before
-                # fees). This keeps net_gain_percentage and percentage
-                # change calculations consistent with the long path.
-                cost=gross_proceeds,
-                total_fees=short_fee,
-                is_short=True,
-                metadata={"is_short": True},
-            )
-            sym_data['last_trade'] = trade
-            sym_data['open_trades'].append(trade)
-            sym_data['entry_count'] += 1
-            sym_data['is_short'] = True
-            trades.append(trade)
-
-            if dynamic_position_sizing:
-                # Track the short's notional liability so portfolio value
-                # computations see the open position. At open the
-                # liability matches the gross proceeds, so the residual
-                # (proceeds - liability) is ~0 — the per-bar reprice
-                # loop updates it as price drifts.
-                open_trades_value[sym] = 0.0
-
-            return trade
-
-        def _close_short_trade(sym, sym_data, price, date):
-            nonlocal current_unallocated, total_realized_gains, \
-                total_allocated
-
-            lt = sym_data['last_trade']
-            if lt is None:
-                return
-
-            tc = sym_data['trading_cost']
-            # Covering = BUY back; pay buy-side slippage.
-            cover_fill = tc.get_buy_fill_price(price)
-            cover_gross = cover_fill * lt.available_amount
-            cover_fee = tc.get_fee(cover_gross)
-            # P&L mirror: long is gross_sell - cost - fee; short is
-            # proceeds(=cost) - gross_buy - fee.
-            net_gain_val = lt.cost - cover_gross - cover_fee
-
-            if dynamic_position_sizing:
-                current_unallocated -= (cover_gross + cover_fee)
-                total_realized_gains += net_gain_val
-                if sym in open_trades_value:
-                    del open_trades_value[sym]
-            else:
-                total_allocated -= lt.cost
-
-            cover_order = Order(
-                id=uuid4(),
-                target_symbol=sym,
-                trading_symbol=trading_symbol,
-                order_type=OrderType.LIMIT,
-                price=cover_fill,
-                amount=lt.available_amount,
-                status=OrderStatus.CLOSED,
-                created_at=date,
-                updated_at=date,
-                order_side=OrderSide.BUY,
-                order_fee=cover_fee,
-                order_fee_rate=tc.fee_percentage / 100
-                if tc.fee_percentage else None,
-                slippage=cover_fill - price,
-                metadata={"order_reason": "cover_signal", "is_cover": True},
-            )
-            orders.append(cover_order)
-            trade_orders = lt.orders
-            trade_orders.append(cover_order)
-
-            lt_total_fees = (lt.total_fees or 0) + cover_fee
-            lt.update(
-                {
-                    "orders": trade_orders,
-                    "closed_at": date,
-                    "status": TradeStatus.CLOSED.value,
-                    "updated_at": date,
-                    "net_gain": net_gain_val,
-                    "total_fees": lt_total_fees,
-                }
-            )
-            sym_data['last_trade'] = None
-            sym_data['open_trades'] = []
-            sym_data['entry_count'] = 0
-            sym_data['scale_out_count'] = 0
-            sym_data['is_short'] = False
-
-        # v9.0 (#487) — fixed-percentage TP / SL evaluators for the
-        # vector engine. Trailing rules are intentionally NOT supported
-        # here yet; strategies that need trailing TP/SL should run in
-        # event mode (which uses ``trade_service`` with full state).
-        strategy_take_profits = list(
-            getattr(strategy, 'take_profits', None) or []
+        core = VectorExecutionCore(
+            symbols=symbols,
+            dates=previous_dates + dates,
+            close=close_matrix,
+            signals=signal_matrix,
+            position_sizes=position_sizes,
+            scaling_rules=scaling_rules,
+            trading_costs=trading_costs,
+            initial_capital_for_trade=initial_capitals_for_trade,
+            trading_symbol=trading_symbol,
+            initial_amount=initial_amount,
+            dynamic_position_sizing=dynamic_position_sizing,
+            strategy_id=getattr(strategy, "strategy_id", None),
+            cooldowns=getattr(strategy, 'cooldowns', None),
+            take_profits=getattr(strategy, 'take_profits', None),
+            stop_losses=getattr(strategy, 'stop_losses', None),
+            deposit_events=deposit_events,
         )
-        strategy_stop_losses = list(
-            getattr(strategy, 'stop_losses', None) or []
-        )
-
-        def _matches_symbol(rule, sym):
-            rule_sym = getattr(rule, 'symbol', None)
-            return rule_sym is None or rule_sym == sym
-
-        def _tp_triggered(rule, entry_price, current, is_short):
-            pct = float(rule.percentage_threshold) / 100.0
-            if is_short:
-                threshold = entry_price * (1.0 - pct)
-                return current <= threshold
-            threshold = entry_price * (1.0 + pct)
-            return current >= threshold
-
-        def _sl_triggered(rule, entry_price, current, is_short):
-            pct = float(rule.percentage_threshold) / 100.0
-            if is_short:
-                threshold = entry_price * (1.0 + pct)
-                return current >= threshold
-            threshold = entry_price * (1.0 - pct)
-            return current <= threshold
-
-        def _evaluate_tp_sl(sym, sym_data, current_price, current_date, i):
-            """Close the open trade if any fixed TP / SL rule has
-            triggered against ``current_price``. Returns the reason
-            string (``"take_profit"`` / ``"stop_loss"``) or ``None``.
-            """
-            last = sym_data['last_trade']
-            if last is None:
-                return None
-            entry_price = float(last.open_price)
-            is_short = bool(getattr(last, 'is_short', False))
-            # Take-profit wins ties with stop-loss to match the event
-            # engine's evaluation order.
-            for rule in strategy_take_profits:
-                if not _matches_symbol(rule, sym):
-                    continue
-                if getattr(rule, 'trailing', False):
-                    continue
-                if _tp_triggered(rule, entry_price, current_price, is_short):
-                    if is_short:
-                        _close_short_trade(
-                            sym, sym_data, current_price, current_date
-                        )
-                    else:
-                        _close_trade(
-                            sym, sym_data, current_price, current_date
-                        )
-                    cooldown_tracker.record(
-                        symbol=sym,
-                        order_side="buy" if is_short else "sell",
-                        bar_index=i,
-                    )
-                    return "take_profit"
-            for rule in strategy_stop_losses:
-                if not _matches_symbol(rule, sym):
-                    continue
-                if getattr(rule, 'trailing', False):
-                    continue
-                if _sl_triggered(rule, entry_price, current_price, is_short):
-                    if is_short:
-                        _close_short_trade(
-                            sym, sym_data, current_price, current_date
-                        )
-                    else:
-                        _close_trade(
-                            sym, sym_data, current_price, current_date
-                        )
-                    cooldown_tracker.record(
-                        symbol=sym,
-                        order_side="buy" if is_short else "sell",
-                        bar_index=i,
-                    )
-                    return "stop_loss"
-            return None
-
-        # Process all timestamps in chronological order
-        for i in range(len(index)):
-            current_date = index[i]
-
-            # Convert the pd.Timestamp to an utc datetime object
-            if isinstance(current_date, pd.Timestamp):
-                current_date = current_date.to_pydatetime()
 
-            if current_date.tzinfo is None:
-                current_date = current_date.replace(tzinfo=timezone.utc)
+        if resume is not None:
+            core.restore(resume.engine_state, previous_ledger)
 
-            # Apply any scheduled external deposits whose timestamp has
-            # been reached by ``current_date``. Each event fires exactly
-            # once at the first bar at-or-after its scheduled time.
-            while (
-                deposit_event_idx < len(deposit_events)
-                and deposit_events[deposit_event_idx][0] <= current_date
-            ):
-                _, deposit_amount = deposit_events[deposit_event_idx]
-                current_unallocated += deposit_amount
-                deposit_event_idx += 1
-
-            # Process each symbol at this timestamp
-            for symbol, data in symbol_data.items():
-                current_price = float(data['close'].iloc[i])
-                last_trade = data['last_trade']
-                scaling_rule = data['scaling_rule']
-                has_position = last_trade is not None
-
-                # v9.0 (#487) — evaluate fixed TP / SL before signal
-                # processing. A triggered TP/SL closes the open trade
-                # for ``symbol`` immediately, records a side-specific
-                # cooldown via ``cooldown_tracker``, and emits a
-                # ``signal_event`` so downstream tooling can attribute
-                # the exit.
-                if has_position:
-                    tp_sl_reason = _evaluate_tp_sl(
-                        symbol, data, current_price, current_date, i
-                    )
-                    if tp_sl_reason is not None:
-                        signal_events.append({
-                            "date": current_date,
-                            "symbol": symbol,
-                            "signal": tp_sl_reason,
-                            "executed": True,
-                            "reason": "executed",
-                        })
-                        last_trade = data['last_trade']  # now None
-                        has_position = False
-
-                # Tick down cooldown
-                if data['cooldown_remaining'] > 0:
-                    data['cooldown_remaining'] -= 1
-
-                in_cooldown = data['cooldown_remaining'] > 0
-
-                # CooldownRule gating (portfolio-aware, side-specific)
-                rule_block_buy, _rule_buy = cooldown_tracker.is_blocked(
-                    strategy_cooldowns,
-                    signal_side="buy",
-                    symbol=symbol,
-                    bar_index=i,
-                )
-                rule_block_sell, _rule_sell = cooldown_tracker.is_blocked(
-                    strategy_cooldowns,
-                    signal_side="sell",
-                    symbol=symbol,
-                    bar_index=i,
-                )
-
-                # Read raw boolean signals for this bar
-                is_buy = bool(data['buy_signal'].iloc[i])
-                is_sell = bool(data['sell_signal'].iloc[i])
-                is_scale_in = bool(data['scale_in_signal'].iloc[i])
-                is_scale_out = bool(data['scale_out_signal'].iloc[i])
-                # SHORT / COVER (#433). When shorting is disabled these
-                # series are all-False and the branches are no-ops.
-                is_short_sig = bool(data['short_signal'].iloc[i])
-                is_cover_sig = bool(data['cover_signal'].iloc[i])
-                is_short_pos = data['is_short']
-                is_long_pos = has_position and not is_short_pos
-
-                # ---- SELL always takes priority (long-only close) ----
-                if (is_sell and is_long_pos and not in_cooldown
-                        and rule_block_sell):
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "sell",
-                        "executed": False,
-                        "reason": "in_cooldown_rule",
-                    })
-                elif is_sell and is_long_pos and not in_cooldown:
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "sell",
-                        "executed": True,
-                        "reason": "executed",
-                    })
-                    _close_trade(
-                        symbol, data, current_price, current_date
-                    )
-                    last_trade = data['last_trade']
-                    has_position = False
-                    if scaling_rule and scaling_rule.cooldown_in_bars > 0:
-                        data['cooldown_remaining'] = \
-                            scaling_rule.cooldown_in_bars
-                        in_cooldown = True
-                    cooldown_tracker.record(
-                        symbol=symbol, order_side="sell", bar_index=i,
-                    )
-                    rule_block_sell, _ = cooldown_tracker.is_blocked(
-                        strategy_cooldowns, signal_side="sell",
-                        symbol=symbol, bar_index=i,
-                    )
-                    rule_block_buy, _ = cooldown_tracker.is_blocked(
-                        strategy_cooldowns, signal_side="buy",
-                        symbol=symbol, bar_index=i,
-                    )
-                    # Reset is_buy if sell also fired on same bar
-                    is_buy = False
-                    is_scale_in = False
-                    is_scale_out = False
-                elif is_sell and not has_position:
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "sell",
-                        "executed": False,
-                        "reason": "no_position_to_close",
-                    })
-                elif is_sell and in_cooldown:
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "sell",
-                        "executed": False,
-                        "reason": "in_cooldown",
-                    })
-
-                # ---- COVER (close short) — mirror of SELL (#433) ----
-                if is_cover_sig and is_short_pos and not in_cooldown:
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "cover",
-                        "executed": True,
-                        "reason": "executed",
-                    })
-                    _close_short_trade(
-                        symbol, data, current_price, current_date
-                    )
-                    last_trade = data['last_trade']
-                    has_position = False
-                    is_short_pos = False
-                    is_long_pos = False
-                    cooldown_tracker.record(
-                        symbol=symbol, order_side="buy", bar_index=i,
-                    )
-                    # A cover on the same bar shouldn't also re-enter
-                    # short / long.
-                    is_buy = False
-                    is_short_sig = False
-                elif is_cover_sig and not is_short_pos:
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "cover",
-                        "executed": False,
-                        "reason": "no_short_position_to_cover",
-                    })
-                elif is_cover_sig and in_cooldown:
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "cover",
-                        "executed": False,
-                        "reason": "in_cooldown",
-                    })
-
-                # ---- SCALE-OUT (partial close) ----
-                # Scaling rules apply to long positions only.
-                if (is_scale_out and is_long_pos
-                        and scaling_rule is not None and not in_cooldown
-                        and rule_block_sell):
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "scale_out",
-                        "executed": False,
-                        "reason": "in_cooldown_rule",
-                    })
-                elif (is_scale_out and is_long_pos
-                        and scaling_rule is not None and not in_cooldown):
-                    so_idx = data['scale_out_count']
-                    pct = scaling_rule.get_scale_out_percentage(so_idx)
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "scale_out",
-                        "executed": True,
-                        "reason": "executed",
-                    })
-                    _partial_close(
-                        symbol, data, current_price, current_date, pct
-                    )
-                    data['scale_out_count'] += 1
-                    last_trade = data['last_trade']
-                    has_position = last_trade is not None
-                    if scaling_rule.cooldown_in_bars > 0:
-                        data['cooldown_remaining'] = \
-                            scaling_rule.cooldown_in_bars
-                        in_cooldown = True
-                    cooldown_tracker.record(
-                        symbol=symbol, order_side="sell", bar_index=i,
-                    )
-                    rule_block_sell, _ = cooldown_tracker.is_blocked(
-                        strategy_cooldowns, signal_side="sell",
-                        symbol=symbol, bar_index=i,
-                    )
-                    rule_block_buy, _ = cooldown_tracker.is_blocked(
-                        strategy_cooldowns, signal_side="buy",
-                        symbol=symbol, bar_index=i,
-                    )
+        core.run()
+        ledger = core.ledger
+        signal_events = core.signal_events
 
-                # ---- BUY (new entry) ----
-                if (is_buy and not has_position and not in_cooldown
-                        and rule_block_buy):
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "buy",
-                        "executed": False,
-                        "reason": "in_cooldown_rule",
-                    })
-                elif is_buy and not has_position and not in_cooldown:
-                    capital = _get_capital_for_trade(
-                        data, current_price, 100
-                    )
-                    if capital <= 0:
-                        signal_events.append({
-                            "date": current_date,
-                            "symbol": symbol,
-                            "signal": "buy",
-                            "executed": False,
-                            "reason": "insufficient_capital",
-                        })
-                    else:
-                        _open_trade(
-                            symbol, data, current_price,
-                            current_date, capital
-                        )
-                        signal_events.append({
-                            "date": current_date,
-                            "symbol": symbol,
-                            "signal": "buy",
-                            "executed": True,
-                            "reason": "executed",
-                        })
-                        if scaling_rule and \
-                                scaling_rule.cooldown_in_bars > 0:
-                            data['cooldown_remaining'] = \
-                                scaling_rule.cooldown_in_bars
-                            in_cooldown = True
-                        cooldown_tracker.record(
-                            symbol=symbol, order_side="buy", bar_index=i,
-                        )
-                        rule_block_sell, _ = cooldown_tracker.is_blocked(
-                            strategy_cooldowns, signal_side="sell",
-                            symbol=symbol, bar_index=i,
-                        )
-                        rule_block_buy, _ = cooldown_tracker.is_blocked(
-                            strategy_cooldowns, signal_side="buy",
-                            symbol=symbol, bar_index=i,
-                        )
-                elif is_buy and is_long_pos and not in_cooldown:
-                    # Possible scale-in via buy signal (if no separate
-                    # scale_in_signals provided, buy = scale_in)
-                    if scaling_rule is not None:
-                        is_scale_in = True  # treat as scale-in below
-                    else:
-                        signal_events.append({
-                            "date": current_date,
-                            "symbol": symbol,
-                            "signal": "buy",
-                            "executed": False,
-                            "reason": "already_in_position",
-                        })
-                elif is_buy and is_short_pos and not in_cooldown:
-                    # Buy signals never flip an open short — the
-                    # strategy must cover first (#433).
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "buy",
-                        "executed": False,
-                        "reason": "open_short_position",
-                    })
-                elif is_buy and in_cooldown:
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "buy",
-                        "executed": False,
-                        "reason": "in_cooldown",
-                    })
-
-                # ---- SCALE-IN (add to position) ----
-                # Scaling rules apply to long positions only.
-                if (is_scale_in and is_long_pos
-                        and scaling_rule is not None and not in_cooldown
-                        and rule_block_buy):
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "scale_in",
-                        "executed": False,
-                        "reason": "in_cooldown_rule",
-                    })
-                elif (is_scale_in and is_long_pos
-                        and scaling_rule is not None and in_cooldown):
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "scale_in",
-                        "executed": False,
-                        "reason": "in_cooldown",
-                    })
-                elif (is_scale_in and is_long_pos
-                        and scaling_rule is not None and not in_cooldown):
-                    entry_count = data['entry_count']
-                    if entry_count >= scaling_rule.max_entries:
-                        signal_events.append({
-                            "date": current_date,
-                            "symbol": symbol,
-                            "signal": "scale_in",
-                            "executed": False,
-                            "reason": "max_entries_reached",
-                        })
-                    else:
-                        si_idx = entry_count - 1  # 0-indexed scale-in
-                        pct = scaling_rule.get_scale_in_percentage(si_idx)
-                        capital = _get_capital_for_trade(
-                            data, current_price, pct
-                        )
-                        if capital <= 0:
-                            signal_events.append({
-                                "date": current_date,
-                                "symbol": symbol,
-                                "signal": "scale_in",
-                                "executed": False,
-                                "reason": "insufficient_capital",
-                            })
-                        else:
-                            _open_trade(
-                                symbol, data, current_price,
-                                current_date, capital,
-                                order_reason="scale_in"
-                            )
-                            signal_events.append({
-                                "date": current_date,
-                                "symbol": symbol,
-                                "signal": "scale_in",
-                                "executed": True,
-                                "reason": "executed",
-                            })
-                            if scaling_rule.cooldown_in_bars > 0:
-                                data['cooldown_remaining'] = \
-                                    scaling_rule.cooldown_in_bars
-                            cooldown_tracker.record(
-                                symbol=symbol, order_side="buy",
-                                bar_index=i,
-                            )
-
-                # ---- SHORT (open short, #433) ----
-                # Open a new short only when flat. Buy signals on the
-                # same bar take priority because an opened long already
-                # consumed ``has_position``; check both to be defensive.
-                if (is_short_sig and not has_position
-                        and not in_cooldown and rule_block_sell):
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "short",
-                        "executed": False,
-                        "reason": "in_cooldown_rule",
-                    })
-                elif (is_short_sig and not has_position
-                        and not in_cooldown):
-                    capital = _get_capital_for_trade(
-                        data, current_price, 100
-                    )
-                    if capital <= 0:
-                        signal_events.append({
-                            "date": current_date,
-                            "symbol": symbol,
-                            "signal": "short",
-                            "executed": False,
-                            "reason": "insufficient_capital",
-                        })
-                    else:
-                        opened = _open_short_trade(
-                            symbol, data, current_price,
-                            current_date, capital,
-                        )
-                        if opened is not None:
-                            signal_events.append({
-                                "date": current_date,
-                                "symbol": symbol,
-                                "signal": "short",
-                                "executed": True,
-                                "reason": "executed",
-                            })
-                            cooldown_tracker.record(
-                                symbol=symbol, order_side="sell",
-                                bar_index=i,
-                            )
-                elif is_short_sig and has_position:
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "short",
-                        "executed": False,
-                        "reason": "already_in_position",
-                    })
-                elif is_short_sig and in_cooldown:
-                    signal_events.append({
-                        "date": current_date,
-                        "symbol": symbol,
-                        "signal": "short",
-                        "executed": False,
-                        "reason": "in_cooldown",
-                    })
-
-            # Update open trade values at each timestamp for
-            # accurate portfolio value
-            if dynamic_position_sizing:
-                for symbol, data in symbol_data.items():
-                    if data['open_trades']:
-                        current_price = float(data['close'].iloc[i])
-                        if data['is_short']:
-                            # For shorts the proceeds are already in
-                            # ``current_unallocated``; this slot holds
-                            # the residual = proceeds - live liability
-                            # so total portfolio value = unallocated +
-                            # sum(open_trades_value) stays correct.
-                            liability = sum(
-                                t.available_amount * current_price
-                                for t in data['open_trades']
-                                if TradeStatus.OPEN.equals(t.status)
-                            )
-                            proceeds = sum(
-                                t.cost
-                                for t in data['open_trades']
-                                if TradeStatus.OPEN.equals(t.status)
-                            )
-                            open_trades_value[symbol] = proceeds - liability
-                        else:
-                            open_trades_value[symbol] = sum(
-                                t.available_amount * current_price
-                                for t in data['open_trades']
-                                if TradeStatus.OPEN.equals(t.status)
-                            )
-
-        unallocated = initial_amount
-        total_net_gain = 0.0
-        open_trades = []
-        # Replay deposit events for snapshot bookkeeping. Each snapshot
-        # gets ``cash_flow`` set to whatever external cash landed between
-        # the previous snapshot and this one — this is what enables
+        # Rebuild the portfolio snapshots from the trade open / close
+        # events in a single sweep. ``cash_flow`` holds whatever
+        # external cash landed on each bar — this is what enables
         # TWR-aware return metrics (CAGR, monthly/yearly returns) to
         # subtract external deposits before computing returns.
-        deposit_replay_idx = 0
-
-        # Create portfolio snapshots
-        for ts in index:
-            allocated = 0
-            interval_datetime = pd.Timestamp(ts).to_pydatetime()
-            interval_datetime = interval_datetime.replace(tzinfo=timezone.utc)
-
-            # Apply any deposits that fired between the previous snapshot
-            # and this one, accumulating them into snapshot_cash_flow.
-            snapshot_cash_flow = 0.0
-            while (
-                deposit_replay_idx < len(deposit_events)
-                and deposit_events[deposit_replay_idx][0] <= interval_datetime
-            ):
-                _, deposit_amount = deposit_events[deposit_replay_idx]
-                unallocated += deposit_amount
-                snapshot_cash_flow += deposit_amount
-                deposit_replay_idx += 1
-
-            for trade in trades:
-
-                if trade.opened_at == interval_datetime:
-                    if trade.is_short:
-                        # Short entry credits the wallet with sale
-                        # proceeds (#433).
-                        unallocated += trade.cost
-                    else:
-                        # Snapshot taken at the moment a trade is opened
-                        unallocated -= trade.cost
-                    open_trades.append(trade)
-
-                if trade.closed_at == interval_datetime:
-                    if trade.is_short:
-                        # Covering pays cover_cost = cost - net_gain
-                        # back out of unallocated.
-                        unallocated -= (trade.cost - trade.net_gain)
-                    else:
-                        # Snapshot taken at the moment a trade is closed
-                        unallocated += trade.cost + trade.net_gain
-                    total_net_gain += trade.net_gain
-                    open_trades.remove(trade)
-
-            for open_trade in open_trades:
-                ohlcv = granular_ohlcv_data_order_by_symbol[
-                    f"{open_trade.target_symbol}/{trading_symbol}"
-                ]
-                try:
-                    price = ohlcv.loc[:ts, "Close"].iloc[-1]
-                    open_trade.last_reported_price = price
-                except IndexError:
-                    continue  # skip if no price yet
-
-                if open_trade.is_short:
-                    # Open short = liability of ``amount * current_price``
-                    # against the proceeds already in unallocated.
-                    allocated -= open_trade.filled_amount * price
-                else:
-                    allocated += open_trade.filled_amount * price
-
-            # total_value = invested_value + unallocated
-            # total_net_gain = total_value - initial_amount - sum(cash_flow)
+        (
+            unallocated,
+            total_value,
+            total_net_gain,
+            cash_flow,
+        ) = core.portfolio_series()
+
+        # total_value = invested_value + unallocated
+        # total_net_gain = total_value - initial_amount - sum(cash_flow)
+        for i, created_at in enumerate(dates):
             snapshots.append(
                 PortfolioSnapshot(
                     portfolio_id=portfolio.identifier,
-                    created_at=interval_datetime,
-                    unallocated=unallocated,
-                    total_value=unallocated + allocated,
-                    total_net_gain=total_net_gain,
-                    cash_flow=snapshot_cash_flow,
+                    created_at=created_at,
+                    unallocated=float(unallocated[i]),
+                    total_value=float(total_value[i]),
+                    total_net_gain=float(total_net_gain[i]),
+                    cash_flow=float(cash_flow[i]),
                 )
             )
 
-        unique_symbols = set()
-        for trade in trades:
-            unique_symbols.add(trade.target_symbol)
-
-        number_of_trades_closed = len(
-            [t for t in trades if TradeStatus.CLOSED.equals(t.status)]
-        )
-        number_of_trades_open = len(
-            [t for t in trades if TradeStatus.OPEN.equals(t.status)]
-        )
+        unique_symbols = set(ledger.symbol)
+        number_of_trades_closed = int(ledger.column("closed").sum())
+        number_of_trades_open = len(ledger) - number_of_trades_closed
         # Issue 8: Store raw signals for analysis
         raw_signals = {}
         for symbol in buy_signals.keys():
@@ -1430,27 +777,42 @@ class VectorBacktestService:
             if shorting_enabled and symbol in cover_signals:
                 raw_signals[symbol]["cover"] = cover_signals[symbol]
 
+        recorded_values = self._convert_recorded_values(raw_recorded)
+
+        if resume is not None:
+            after = resume.backtest_end_date
+            signal_events = list(resume.signal_events) + signal_events
+            raw_signals = self._merge_signals(
+                resume.signals, raw_signals, after
+            )
+            recorded_values = {
+                key: list(resume.recorded_values.get(key, [])) + [
+                    (dt, value) for dt, value in values if dt > after
+                ]
+                for key, values in recorded_values.items()
+            }
+
         # Create a backtest run object
         run = BacktestRun(
             initial_unallocated=initial_amount,
             number_of_runs=1,
             portfolio_snapshots=snapshots,
-            trades=trades,
-            orders=orders,
+            trade_ledger=ledger,
             positions=[],
             created_at=datetime.now(timezone.utc),
             backtest_window=BacktestWindow(train_range=backtest_date_range),
             number_of_days=(
                 backtest_date_range.end_date - backtest_date_range.start_date
             ).days,
-            number_of_trades=len(trades),
-            number_of_orders=len(orders),
+            number_of_trades=ledger.number_of_trades,
+            number_of_orders=ledger.number_of_orders,
             number_of_trades_closed=number_of_trades_closed,
             number_of_trades_open=number_of_trades_open,
             number_of_positions=len(unique_symbols),
             signals=raw_signals,
             signal_events=signal_events,
-            recorded_values=self._convert_recorded_values(raw_recorded),
+            recorded_values=recorded_values,
+            engine_state=core.state(),
         )
 
         # Create backtest metrics
@@ -1459,6 +821,57 @@ class VectorBacktestService:
         )
         return run
 
+    @staticmethod
+    def _resumable_ledger(backtest_run, trading_symbol, strategy_id):
+        """The trade ledger and bar dates of a run to continue.
+
+        Runs loaded from disk only have their trades, so the ledger is
+        rebuilt from them, with the bar dates taken from the per-bar
+        portfolio snapshots.
+        """
+        ledger = backtest_run.trade_ledger
+
+        if ledger is not None:
+            return ledger, list(ledger.dates)
+
+        bars = backtest_run.engine_state["bars"]
+        snapshots = backtest_run.portfolio_snapshots
+        dates = [
+            snapshot.created_at
+            for snapshot in snapshots[len(snapshots) - bars:]
+        ]
+        return TradeLedger.from_domain(
+            backtest_run.trades, dates, trading_symbol, strategy_id,
+            orders=backtest_run.orders,
+        ), dates
+
+    @staticmethod
+    def _merge_signals(previous, signals, after):
+        """Append the signals after ``after`` to the (possibly
+        serialised) signals of a continued run."""
+        merged = {
+            symbol: dict(sides) for symbol, sides in previous.items()
+        }
+
+        for symbol, sides in signals.items():
+            for side, series in sides.items():
+                series = series[series.index > after]
+                earlier = merged.setdefault(symbol, {}).get(side)
+
+                if earlier is None:
+                    merged[symbol][side] = series
+                elif hasattr(earlier, "iloc"):
+                    merged[symbol][side] = pd.concat([earlier, series])
+                else:
+                    # Serialised as the ISO dates of the truthy bars
+                    merged[symbol][side] = list(earlier) + [
+                        (ts if ts.tzinfo else ts.tz_localize(timezone.utc))
+                        .isoformat()
+                        for ts, value in series.items() if value
+                    ]
+
+        return merged
+
     @staticmethod
     def _bucket_signal_series(signal_series_iterable):
         """Bucket a stream of :class:`SignalSeries` into per-side dicts.
@@ -1680,3 +1093,119 @@ class VectorBacktestService:
                 most_granular = source
 
         return most_granular
+
+
+class _MarketData:
+    """Market data of a vector backtest that can be shared between
+    strategies with identical data sources.
+
+    Holds the vectorized backtest data, the master index and the
+    close prices of every symbol aligned to that index. Aligned close
+    arrays are loaded lazily and cached, so a batch of strategies
+    reads and reindexes the OHLCV data of a symbol only once.
+    """
+
+    def __init__(self, data_provider_service, backtest_date_range, data,
+                 index):
+        self._data_provider_service = data_provider_service
+        self._backtest_date_range = backtest_date_range
+        self._data = data
+        self._close = {}
+        self.index = index
+
+        # Convert the master index to utc datetime objects once
+        self.dates = []
+
+        for current_date in index:
+            if isinstance(current_date, pd.Timestamp):
+                current_date = current_date.to_pydatetime()
+
+            if current_date.tzinfo is None:
+                current_date = current_date.replace(tzinfo=timezone.utc)
+
+            self.dates.append(current_date)
+
+    def data_for_variant(self):
+        """Return a copy of the data dict for one strategy.
+
+        Strategies are free to add columns to the pandas frames they
+        receive, so every strategy gets its own copy of those frames
+        to keep variants from seeing each other's columns.
+        """
+        return {
+            key: value.copy() if isinstance(value, pd.DataFrame) else value
+            for key, value in self._data.items()
+        }
+
+    def close(self, symbol):
+        """Close prices of ``symbol`` forward-filled onto the master
+        index, as a read-only ``float64`` array."""
+
+        if symbol not in self._close:
+            # Load most granular OHLCV data for the symbol
+            df = self._data_provider_service.get_ohlcv_data(
+                symbol=symbol,
+                start_date=self._backtest_date_range.start_date,
+                end_date=self._backtest_date_range.end_date,
+                pandas=True
+            )
+            close = df["Close"].reindex(self.index, method='ffill') \
+                .to_numpy(dtype=np.float64)
+            close.flags.writeable = False
+            self._close[symbol] = close
+
+        return self._close[symbol]
+
+
+class _MarketDataWindow:
+    """One date range of :class:`_MarketData` loaded over a larger
+    date range, e.g. shared between windows or including the bars of
+    a run that is continued.
+
+    Exposes the same interface as ``_MarketData``, with the master
+    index, dates and aligned close prices sliced (without copying) to
+    the bars inside the window. Strategies still receive the data of
+    the whole shared range, so their signals only have to be
+    generated once for all windows.
+    """
+
+    def __init__(self, market_data, backtest_date_range, after=None,
+                 shared=False):
+        self._market_data = market_data
+        self._backtest_date_range = backtest_date_range
+        # Whether the data is shared between the windows of one
+        # VectorBacktestService, see ``shared_date_range``
+        self.shared = shared
+        index = market_data.index
+        in_window = (index >= backtest_date_range.start_date) \
+            & (index <= backtest_date_range.end_date)
+
+        # Bars up to and including ``after`` belong to a continued run
+        if after is not None:
+            in_window &= index > after
+
+        positions = np.flatnonzero(in_window)
+        self._start = int(positions[0]) if len(positions) else 0
+        self._stop = int(positions[-1]) + 1 if len(positions) else 0
+        self.index = index[self._start:self._stop]
+        self.dates = market_data.dates[self._start:self._stop]
+
+    def data_for_variant(self):
+        return self._market_data.data_for_variant()
+
+    def close(self, symbol):
+        return self._market_data.close(symbol)[self._start:self._stop]
+
+    def clip(self, raw_recorded):
+        """Restrict recorded values generated over the shared date
+        range to the window."""
+        if raw_recorded is None:
+            return None
+
+        return {
+            key: series[
+                (series.index >= self._backtest_date_range.start_date)
+                & (series.index <= self._backtest_date_range.end_date)
+            ]
+            for key, series in raw_recorded.items()
+        }
@@ -0,0 +1,1276 @@
+"""Array-backed per-bar execution core for the vector backtest engine.
+
+:class:`VectorExecutionCore` runs the vector engine's per-bar state
+machine (entries, exits, scale-in / scale-out, shorts, fixed TP / SL,
+cooldowns and deposits) over preallocated NumPy arrays instead of
+per-symbol dicts of pandas Series:
+
+* ``close`` — ``float64`` matrix of shape ``(bars, symbols)`` with
+  the close price of every symbol aligned to the master index.
+* ``signals`` — ``uint8`` matrix of the same shape where every bar /
+  symbol cell is a bitmask of the ``SIGNAL_*`` flags below.
+* Per-symbol state (cooldown counters, entry / scale-out counts,
+  short flag, open-position value) lives in typed 1-D arrays indexed
+  by the symbol's column.
+* Trades and orders are rows of a :class:`TradeLedger`; the per-symbol
+  ``last_trade`` / ``open_trades`` slots hold ledger row indices.
+
+Bars on which a symbol has no signal and no position that a TP / SL
+rule could close are skipped entirely, which is where most of the
+speed-up over the dict-backed loop comes from on sparse signals.
+
+Plain long-only entry / exit strategies (static position sizing, no
+TP / SL, scaling, cooldown or slippage-model rules, no short / cover
+signals) skip the per-bar loop altogether: the position state of
+every bar is derived from the signal matrix with cumulative-sum /
+forward-fill operations and the trades are priced with array
+arithmetic, see :meth:`VectorExecutionCore.closed_form_applicable`.
+The produced trades, orders and signal events are identical to the
+previous loop; see ``tests/infrastructure/services/backtesting/
+test_vector_backtest_parity.py``.
+
+A finished run can be continued with more bars: :meth:`state` returns
+the terminal engine state as a JSON-serialisable dict, and a core
+built with the dates of both the old and the new bars (but the
+``close`` / ``signals`` rows of the new bars only) resumes from it
+with :meth:`restore`, appending to a copy of the old ledger.
+"""
+from bisect import bisect_left
+
+import numpy as np
+
+from investing_algorithm_framework.domain import Portfolio, OrderSide, \
+    CooldownTracker, TradeLedger, OperationalException
+
+SIGNAL_BUY = 1
+SIGNAL_SELL = 2
+SIGNAL_SCALE_IN = 4
+SIGNAL_SCALE_OUT = 8
+SIGNAL_SHORT = 16
+SIGNAL_COVER = 32
+
+
+def build_signal_mask(
+    length,
+    buy=None,
+    sell=None,
+    scale_in=None,
+    scale_out=None,
+    short=None,
+    cover=None,
+):
+    """Pack per-side boolean arrays into one ``uint8`` bitmask array.
+
+    Args:
+        length: Number of bars.
+        buy, sell, scale_in, scale_out, short, cover: Optional
+            array-likes of length ``length``. Truthy entries set the
+            corresponding ``SIGNAL_*`` bit. ``None`` leaves the bit
+            unset for every bar.
+
+    Returns:
+        np.ndarray: ``uint8`` array of shape ``(length,)``.
+    """
+    mask = np.zeros(length, dtype=np.uint8)
+
+    for values, flag in (
+        (buy, SIGNAL_BUY),
+        (sell, SIGNAL_SELL),
+        (scale_in, SIGNAL_SCALE_IN),
+        (scale_out, SIGNAL_SCALE_OUT),
+        (short, SIGNAL_SHORT),
+        (cover, SIGNAL_COVER),
+    ):
+        if values is not None:
+            mask[np.asarray(values).astype(bool)] |= flag
+
+    return mask
+
+
+def _tp_triggered(rule, entry_price, current, is_short):
+    pct = float(rule.percentage_threshold) / 100.0
+
+    if is_short:
+        return current <= entry_price * (1.0 - pct)
+
+    return current >= entry_price * (1.0 + pct)
+
+
+def _sl_triggered(rule, entry_price, current, is_short):
+    pct = float(rule.percentage_threshold) / 100.0
+
+    if is_short:
+        return current >= entry_price * (1.0 + pct)
+
+    return current <= entry_price * (1.0 - pct)
+
+
+class VectorExecutionCore:
+    """Per-bar execution state machine of the vector backtest engine.
+
+    Args:
+        symbols: Target symbols, one per column of ``close`` /
+            ``signals``. Symbols are processed in this order on every
+            bar.
+        dates: Timezone-aware ``datetime`` per bar.
+        close: ``float64`` array of shape ``(bars, symbols)``. When it
+            has fewer rows than ``dates``, its rows are the last bars
+            of ``dates`` and the bars before them belong to the run
+            that is continued with :meth:`restore`.
+        signals: ``uint8`` bitmask array of the same shape as
+            ``close``.
+        position_sizes: ``PositionSize`` per symbol.
+        scaling_rules: ``ScalingRule`` (or ``None``) per symbol.
+        trading_costs: ``TradingCost`` per symbol.
+        initial_capital_for_trade: Static-mode capital per symbol.
+        trading_symbol: Quote currency of the portfolio.
+        initial_amount: Initial portfolio balance.
+        dynamic_position_sizing: Recompute sizes from the running
+            portfolio value instead of the initial balance.
+        strategy_id: Stamped on every entry order.
+        cooldowns: ``CooldownRule`` list of the strategy.
+        take_profits: ``TakeProfitRule`` list of the strategy.
+        stop_losses: ``StopLossRule`` list of the strategy.
+        deposit_events: Sorted ``(timestamp, amount)`` deposit list.
+    """
+
+    def __init__(
+        self,
+        symbols,
+        dates,
+        close,
+        signals,
+        position_sizes,
+        scaling_rules,
+        trading_costs,
+        initial_capital_for_trade,
+        trading_symbol,
+        initial_amount,
+        dynamic_position_sizing=False,
+        strategy_id=None,
+        cooldowns=None,
+        take_profits=None,
+        stop_losses=None,
+        deposit_events=None,
+    ):
+        self.symbols = list(symbols)
+        self.dates = dates
+        self.close = close
+        self.signals = signals
+        # Bars before ``first_bar`` were processed by the continued run
+        self.first_bar = len(dates) - len(close)
+        self.position_sizes = list(position_sizes)
+        self.scaling_rules = list(scaling_rules)
+        self.trading_costs = list(trading_costs)
+        self.initial_capital_for_trade = list(initial_capital_for_trade)
+        self.trading_symbol = trading_symbol
+        self.initial_amount = initial_amount
+        self.dynamic_position_sizing = dynamic_position_sizing
+        self.strategy_id = strategy_id
+        self.cooldowns = list(cooldowns or [])
+        self.deposit_events = list(deposit_events or [])
+
+        # v9.0 (#487) — fixed-percentage TP / SL only. Trailing rules
+        # are evaluated in event mode (``trade_service``) instead.
+        self.take_profits = [
+            rule for rule in (take_profits or [])
+            if not getattr(rule, 'trailing', False)
+        ]
+        self.stop_losses = [
+            rule for rule in (stop_losses or [])
+            if not getattr(rule, 'trailing', False)
+        ]
+
+        n = len(self.symbols)
+        self.cooldown_remaining = np.zeros(n, dtype=np.int64)
+        self.entry_count = np.zeros(n, dtype=np.int64)
+        self.scale_out_count = np.zeros(n, dtype=np.int64)
+        self.is_short = np.zeros(n, dtype=bool)
+        self.has_position = np.zeros(n, dtype=bool)
+        # Open-position value per symbol used by dynamic sizing. For a
+        # short this holds the residual ``proceeds - liability``.
+        self.open_value = np.zeros(n, dtype=np.float64)
+        # Ledger row of the most recent / every open trade per symbol
+        self.last_trade = [None] * n
+        self.open_trades = [[] for _ in range(n)]
+
+        self.current_unallocated = initial_amount
+        self.total_realized_gains = 0.0
+        # Capital committed in static mode
+        self.total_allocated = 0.0
+        self.deposit_event_idx = 0
+        # External deposits credited before ``first_bar``
+        self.prior_deposits = 0.0
+        self.cooldown_tracker = CooldownTracker()
+
+        self.ledger = TradeLedger(dates, trading_symbol, strategy_id)
+        self.signal_events = []
+        # Set by ``run`` when the closed-form path was taken
+        self.closed_form = False
+
+    @property
+    def trades(self):
+        """The ledger's trades as :class:`Trade` objects."""
+        return self.ledger.to_domain()[0]
+
+    @property
+    def orders(self):
+        """The ledger's orders as :class:`Order` objects."""
+        return self.ledger.to_domain()[1]
+
+    def run(self):
+        """Process every bar in chronological order.
+
+        Returns:
+            VectorExecutionCore: ``self``, with ``ledger`` and
+            ``signal_events`` populated.
+        """
+        self.closed_form = self.closed_form_applicable() \
+            and self._run_closed_form()
+
+        if self.closed_form:
+            return self
+
+        signals = self.signals
+        cooldown_remaining = self.cooldown_remaining
+        has_position = self.has_position
+        tp_sl_enabled = bool(self.take_profits or self.stop_losses)
+        active_bars = signals.any(axis=1)
+
+        for i in range(self.first_bar, len(self.dates)):
+            self._apply_deposits(self.dates[i])
+
+            # Tick down the scaling-rule cooldown of every symbol. No
+            # branch below reads a counter before its own tick, so
+            # doing this once per bar is equivalent to ticking inside
+            # the per-symbol loop.
+            np.subtract(
+                cooldown_remaining, 1,
+                out=cooldown_remaining, where=cooldown_remaining > 0,
+            )
+
+            k = i - self.first_bar
+
+            if active_bars[k]:
+                if tp_sl_enabled:
+                    columns = np.flatnonzero(signals[k] | has_position)
+                else:
+                    columns = np.flatnonzero(signals[k])
+            elif tp_sl_enabled and has_position.any():
+                columns = np.flatnonzero(has_position)
+            else:
+                columns = ()
+
+            for j in columns:
+                self._process(i, int(j))
+
+            if self.dynamic_position_sizing and has_position.any():
+                self._mark_open_positions(i)
+
+        return self
+
+    def closed_form_applicable(self):
+        """Whether :meth:`run` can skip the per-bar loop.
+
+        That is the case for long-only entry / exit strategies with
+        static position sizing and no take-profit, stop-loss, scaling
+        or cooldown rules, no slippage model and no short / cover
+        signals. Scale-in / scale-out signals are ignored by the loop
+        without a scaling rule, so they do not matter here either.
+
+        Returns:
+            bool: True if the closed-form path may be taken.
+        """
+        if self.dynamic_position_sizing or self.cooldowns \
+                or self.take_profits or self.stop_losses \
+                or self.signals.size == 0 or self.first_bar > 0:
+            return False
+
+        if any(rule is not None for rule in self.scaling_rules):
+            return False
+
+        if any(
+            getattr(tc, 'slippage_model', None) is not None
+            for tc in self.trading_costs
+        ):
+            return False
+
+        return not (self.signals & (SIGNAL_SHORT | SIGNAL_COVER)).any()
+
+    def state(self):
+        """Return the terminal engine state after :meth:`run`.
+
+        Everything except the ledger itself that a continued run
+        needs: the per-symbol position, scaling and cooldown state,
+        the capital counters and the rows of the ledger's open trades.
+        All values are plain Python types, so the dict can be stored
+        as JSON with the run.
+
+        Returns:
+            dict: The engine state, see :meth:`restore`.
+        """
+        return {
+            "symbols": list(self.symbols),
+            "bars": len(self.dates),
+            "initial_capital_for_trade": [
+                float(capital) for capital in self.initial_capital_for_trade
+            ],
+            "dynamic_position_sizing": self.dynamic_position_sizing,
+            "cooldown_remaining": self.cooldown_remaining.tolist(),
+            "entry_count": self.entry_count.tolist(),
+            "scale_out_count": self.scale_out_count.tolist(),
+            "is_short": self.is_short.tolist(),
+            "has_position": self.has_position.tolist(),
+            "open_value": self.open_value.tolist(),
+            "last_trade": list(self.last_trade),
+            "open_trades": [list(rows) for rows in self.open_trades],
+            "current_unallocated": self.current_unallocated,
+            "total_realized_gains": self.total_realized_gains,
+            "total_allocated": self.total_allocated,
+            "deposits": self.prior_deposits + sum(
+                amount for _, amount
+                in self.deposit_events[:self.deposit_event_idx]
+            ),
+            "cooldown_tracker": self.cooldown_tracker.to_dict(),
+        }
+
+    def restore(self, state, ledger):
+        """Continue the run that produced ``state`` and ``ledger``.
+
+        Must be called before :meth:`run` on a core whose ``dates``
+        start with the ``state["bars"]`` bars of the continued run.
+        The trades of ``ledger`` are copied, so the continued run's
+        ledger is left untouched.
+
+        Args:
+            state (dict): The result of :meth:`state` of the continued
+                run.
+            ledger (TradeLedger): The ledger of the continued run.
+
+        Returns:
+            VectorExecutionCore: ``self``.
+        """
+        if state["symbols"] != self.symbols \
+                or state["bars"] != self.first_bar:
+            raise OperationalException(
+                "The engine state does not match the bars and symbols "
+                "of the run to continue"
+            )
+
+        self.cooldown_remaining[:] = state["cooldown_remaining"]
+        self.entry_count[:] = state["entry_count"]
+        self.scale_out_count[:] = state["scale_out_count"]
+        self.is_short[:] = state["is_short"]
+        self.has_position[:] = state["has_position"]
+        self.open_value[:] = state["open_value"]
+        self.last_trade = list(state["last_trade"])
+        self.open_trades = [list(rows) for rows in state["open_trades"]]
+        self.current_unallocated = state["current_unallocated"]
+        self.total_realized_gains = state["total_realized_gains"]
+        self.total_allocated = state["total_allocated"]
+        self.prior_deposits = state["deposits"]
+        self.cooldown_tracker = CooldownTracker.from_dict(
+            state["cooldown_tracker"]
+        )
+        self.ledger = ledger.copy(dates=self.dates)
+        return self
+
+    def _run_closed_form(self):
+        """Produce the trades and signal events of :meth:`run` without
+        walking the bars.
+
+        Per symbol a bar with only a buy (sell) signal leaves the
+        symbol in (out of) a position whatever the state before it.
+        A bar with both signals flips the state: an open position is
+        closed and the buy suppressed, a flat symbol ignores the sell
+        and opens. The state after every bar is therefore the state
+        after the last one-sided bar (forward-filled), flipped once
+        per two-sided bar since (cumulative sum). Entries are buys on
+        flat bars, exits sells on held bars.
+
+        The static capital budget is shared between symbols and
+        drifts by the entry fees of every round trip, so the entries
+        are replayed against it in bar order with a cumulative sum.
+
+        Returns:
+            bool: False, with the core left untouched, if the budget
+            would reject an entry or a position size yields no
+            capital; ``run`` then falls back to the per-bar loop.
+        """
+        bars, width = self.signals.shape
+        trading_costs = self.trading_costs
+        # Same expressions as ``_get_capital_for_trade`` and
+        # ``_open_trade`` so every value is bit-identical to the loop.
+        capital = [
+            base * 100 / 100 for base in self.initial_capital_for_trade
+        ]
+        entry_fee = [tc.get_fee(c) for tc, c in zip(trading_costs, capital)]
+        net_capital = [c - fee for c, fee in zip(capital, entry_fee)]
+
+        if any(c <= 0 for c in capital) or any(c <= 0 for c in net_capital):
+            return False
+
+        buy = (self.signals & SIGNAL_BUY) != 0
+        sell = (self.signals & SIGNAL_SELL) != 0
+        columns = np.arange(width)
+        last = np.maximum.accumulate(
+            np.where(buy != sell, np.arange(bars)[:, None], -1), axis=0
+        )
+        anchored = last >= 0
+        last = np.maximum(last, 0)
+        flips = np.cumsum(buy & sell, axis=0)
+        flips = flips - np.where(anchored, flips[last, columns], 0)
+        held = (anchored & buy[last, columns]) ^ (flips % 2 == 1)
+        held_before = np.zeros_like(held)
+        held_before[1:] = held[:-1]
+
+        # Entries and exits alternate per symbol, so the k-th exit of
+        # a symbol closes its k-th entry.
+        open_columns, open_bars = np.nonzero((buy & ~held_before).T)
+        close_columns, close_bars = np.nonzero((sell & held_before).T)
+        closes = (
+            np.searchsorted(open_columns, close_columns)
+            + np.arange(len(close_columns))
+            - np.searchsorted(close_columns, close_columns)
+        )
+        exit_bars = np.full(len(open_columns), -1, dtype=np.int64)
+        exit_bars[closes] = close_bars
+
+        # Entry / exit events in the (bar, symbol) order of the loop;
+        # a symbol has at most one of them per bar.
+        event_bars = np.concatenate((open_bars, close_bars))
+        event_columns = np.concatenate((open_columns, close_columns))
+        sequence = np.lexsort((event_columns, event_bars))
+        is_entry = sequence < len(open_columns)
+        delta = np.where(
+            is_entry,
+            np.asarray(capital, dtype=np.float64)[event_columns[sequence]],
+            -np.asarray(net_capital, dtype=np.float64)[
+                event_columns[sequence]
+            ],
+        )
+        allocated = np.cumsum(delta)
+        before = np.concatenate(([0.0], allocated[:-1]))
+
+        if (before + delta > self.initial_amount)[is_entry].any():
+            return False
+
+        slippage = np.array(
+            [tc.slippage_percentage for tc in trading_costs],
+            dtype=np.float64,
+        )
+        fee_percentage = np.array(
+            [tc.fee_percentage for tc in trading_costs], dtype=np.float64
+        )
+        fee_fixed = np.array(
+            [tc.fee_fixed for tc in trading_costs], dtype=np.float64
+        )
+        fee_rate = [self._fee_rate(j) for j in range(width)]
+        entry_fee = np.asarray(entry_fee, dtype=np.float64)[open_columns]
+        cost = np.asarray(net_capital, dtype=np.float64)[open_columns]
+
+        entry_price = self.close[open_bars, open_columns]
+        fill_price = entry_price * (1 + slippage[open_columns] / 100)
+        amount = cost / fill_price
+        exit_price = self.close[close_bars, close_columns]
+        sell_fill = exit_price * (1 - slippage[close_columns] / 100)
+        gross = sell_fill * amount[closes]
+        sell_fee = gross * fee_percentage[close_columns] / 100 \
+            + fee_fixed[close_columns]
+        net_gain = np.zeros(len(open_columns), dtype=np.float64)
+        net_gain[closes] = gross - sell_fee - cost[closes]
+        total_fees = entry_fee.copy()
+        total_fees[closes] += sell_fee
+
+        # Ledger rows follow the entry order of the loop
+        ledger = self.ledger
+        rows = np.lexsort((open_columns, open_bars))
+        trade_of = np.empty(len(rows), dtype=np.int64)
+        trade_of[rows] = np.arange(len(ledger), len(ledger) + len(rows))
+        exit_rows = exit_bars[rows].tolist()
+        amount_rows = amount[rows].tolist()
+        ledger.extend(
+            trades={
+                "symbol": [self.symbols[j] for j in open_columns[rows]],
+                "is_short": [False] * len(rows),
+                "open_bar": open_bars[rows].tolist(),
+                "close_bar": exit_rows,
+                "update_bar": exit_rows,
+                "open_price": fill_price[rows].tolist(),
+                "amount": amount_rows,
+                "available_amount": amount_rows,
+                "cost": cost[rows].tolist(),
+                "net_gain": net_gain[rows].tolist(),
+                "total_fees": total_fees[rows].tolist(),
+                "last_reported_price": [np.nan] * len(rows),
+                "entry_reason": ["buy_signal"] * len(rows),
+            },
+            orders={
+                "order_trade": np.concatenate(
+                    (trade_of, trade_of[closes])
+                )[sequence].tolist(),
+                "order_side": [
+                    OrderSide.BUY.value if entry else OrderSide.SELL.value
+                    for entry in is_entry.tolist()
+                ],
+                "order_bar": event_bars[sequence].tolist(),
+                "order_price": np.concatenate(
+                    (fill_price, sell_fill)
+                )[sequence].tolist(),
+                "order_amount": np.concatenate(
+                    (amount, amount[closes])
+                )[sequence].tolist(),
+                "order_fee": np.concatenate(
+                    (entry_fee, sell_fee)
+                )[sequence].tolist(),
+                "order_fee_rate": [
+                    fee_rate[j] for j in event_columns[sequence].tolist()
+                ],
+                "order_slippage": np.concatenate(
+                    (fill_price - entry_price, exit_price - sell_fill)
+                )[sequence].tolist(),
+                "order_reason": [
+                    "buy_signal" if entry else "sell_signal"
+                    for entry in is_entry.tolist()
+                ],
+            },
+        )
+
+        cells = np.nonzero(buy | sell)
+        is_buy, is_sell, was_held = (
+            flags[cells].tolist() for flags in (buy, sell, held_before)
+        )
+
+        for i, j, b, s, h in zip(
+            cells[0].tolist(), cells[1].tolist(), is_buy, is_sell, was_held
+        ):
+            date = self.dates[i]
+
+            if s and h:
+                # The exit suppresses a buy on the same bar
+                self._event(date, j, "sell", True, "executed")
+                continue
+
+            if s:
+                self._event(date, j, "sell", False, "no_position_to_close")
+
+            if b and h:
+                self._event(date, j, "buy", False, "already_in_position")
+            elif b:
+                self._event(date, j, "buy", True, "executed")
+
+        # Leave the per-symbol state as the loop would
+        for k in np.flatnonzero(exit_bars < 0).tolist():
+            j = int(open_columns[k])
+            self.last_trade[j] = int(trade_of[k])
+            self.open_trades[j] = [int(trade_of[k])]
+            self.has_position[j] = True
+            self.entry_count[j] = 1
+
+        self.total_allocated = float(allocated[-1]) if len(allocated) \
+            else 0.0
+        self._apply_deposits(self.dates[-1])
+        return True
+
+    def portfolio_series(self):
+        """Reconstruct the per-bar portfolio state after :meth:`run`.
+
+        Instead of scanning every trade on every bar, each trade is
+        turned into at most two events (open bar, close bar) that are
+        scattered into per-bar cash / realised-gain deltas and a
+        ``(bars, symbols)`` position-delta matrix. Cumulative sums of
+        those arrays give the running unallocated balance, realised
+        net gain and open position per symbol, which are then marked
+        to market against ``close`` in one vectorised product. The
+        cost is ``O(bars x symbols + trades)``.
+
+        As a side effect the ``last_reported_price`` of every trade
+        that was held over at least one bar is set to the close of
+        the last bar it was open on.
+
+        Returns:
+            tuple: ``(unallocated, total_value, total_net_gain,
+            cash_flow)``, each a ``float64`` array with one entry per
+            bar.
+        """
+        first_bar = self.first_bar
+        bars = len(self.dates) - first_bar
+        ledger = self.ledger
+        # One extra slot / row so trades still open at the end can
+        # write their (never applied) closing delta without a bounds
+        # check.
+        cash_delta = np.zeros(bars + 1, dtype=np.float64)
+        gain_delta = np.zeros(bars + 1, dtype=np.float64)
+        cash_flow = np.zeros(bars, dtype=np.float64)
+        position_delta = np.zeros(
+            (bars + 1, len(self.symbols)), dtype=np.float64
+        )
+
+        # Deposits land on the first bar at-or-after their timestamp.
+        for timestamp, amount in self.deposit_events:
+            i = bisect_left(self.dates, timestamp, lo=first_bar) - first_bar
+
+            if i < bars:
+                cash_flow[i] += amount
+
+        if len(ledger):
+            column_of = {symbol: j for j, symbol in enumerate(self.symbols)}
+            columns = np.array([column_of[s] for s in ledger.symbol])
+            closed = ledger.column("closed")
+            open_bars = np.asarray(ledger.open_bar, dtype=np.int64)
+            close_bars = np.where(
+                closed, np.asarray(ledger.close_bar, dtype=np.int64),
+                len(self.dates)
+            )
+            cost = ledger.column("cost")
+            net_gain = ledger.column("net_gain")
+            held = open_bars < close_bars
+
+            if first_bar:
+                # Events of a continued run collapse onto the first
+                # new bar, where their sum is the starting state.
+                open_bars = np.maximum(open_bars - first_bar, 0)
+                close_bars = np.maximum(close_bars - first_bar, 0)
+            # Short entry credits the wallet with the sale proceeds;
+            # covering pays ``cost - net_gain`` back.
+            sign = np.where(ledger.column("is_short"), -1.0, 1.0)
+
+            # Open / close events are interleaved per trade and
+            # scattered with the unbuffered ``np.add.at``, which applies
+            # them in order, so every bar sums its contributions in the
+            # same order as a per-trade loop would.
+            bar_index = np.empty(2 * len(ledger), dtype=np.int64)
+            bar_index[0::2] = open_bars
+            bar_index[1::2] = close_bars
+            cash = np.empty(2 * len(ledger), dtype=np.float64)
+            cash[0::2] = -sign * cost
+            cash[1::2] = sign * cost + net_gain
+            position = np.empty(2 * len(ledger), dtype=np.float64)
+            position[0::2] = np.where(
+                held, sign * ledger.column("amount"), 0.0
+            )
+            position[1::2] = -position[0::2]
+
+            np.add.at(cash_delta, bar_index, cash)
+            np.add.at(gain_delta, close_bars, net_gain)
+            np.add.at(
+                position_delta, (bar_index, np.repeat(columns, 2)), position
+            )
+
+            for row in np.flatnonzero(held & (close_bars > 0)):
+                price = self.close[close_bars[row] - 1, columns[row]]
+
+                if not np.isnan(price):
+                    ledger.last_reported_price[row] = float(price)
+
+            ledger.reset_cache()
+
+        unallocated = self.initial_amount + self.prior_deposits \
+            + np.cumsum(cash_delta[:bars] + cash_flow)
+        positions = np.cumsum(position_delta[:bars], axis=0)
+        # Bars before a symbol's first price contribute nothing.
+        allocated = (positions * np.nan_to_num(self.close)).sum(axis=1)
+        return (
+            unallocated,
+            unallocated + allocated,
+            np.cumsum(gain_delta[:bars]),
+            cash_flow,
+        )
+
+    def _apply_deposits(self, current_date):
+        # Apply any scheduled external deposits whose timestamp has
+        # been reached by ``current_date``. Each event fires exactly
+        # once at the first bar at-or-after its scheduled time.
+        while (
+            self.deposit_event_idx < len(self.deposit_events)
+            and self.deposit_events[self.deposit_event_idx][0]
+                <= current_date
+        ):
+            _, deposit_amount = self.deposit_events[self.deposit_event_idx]
+            self.current_unallocated += deposit_amount
+            self.deposit_event_idx += 1
+
+    def _mark_open_positions(self, i):
+        # Update open trade values at each timestamp for accurate
+        # portfolio value
+        available_amount = self.ledger.available_amount
+        cost = self.ledger.cost
+
+        for j in np.flatnonzero(self.has_position):
+            current_price = float(self.close[i - self.first_bar, j])
+            open_trades = self.open_trades[j]
+
+            if self.is_short[j]:
+                # For shorts the proceeds are already in
+                # ``current_unallocated``; this slot holds the
+                # residual = proceeds - live liability so total
+                # portfolio value = unallocated + sum(open_value)
+                # stays correct.
+                liability = sum(
+                    available_amount[t] * current_price for t in open_trades
+                )
+                proceeds = sum(cost[t] for t in open_trades)
+                self.open_value[j] = proceeds - liability
+            else:
+                self.open_value[j] = sum(
+                    available_amount[t] * current_price for t in open_trades
+                )
+
+    def _event(self, current_date, j, signal, executed, reason):
+        self.signal_events.append({
+            "date": current_date,
+            "symbol": self.symbols[j],
+            "signal": signal,
+            "executed": executed,
+            "reason": reason,
+        })
+
+    def _is_blocked(self, j, signal_side, i):
+        if not self.cooldowns:
+            return False
+
+        blocked, _ = self.cooldown_tracker.is_blocked(
+            self.cooldowns,
+            signal_side=signal_side,
+            symbol=self.symbols[j],
+            bar_index=i,
+        )
+        return blocked
+
+    def _record(self, j, order_side, i):
+        self.cooldown_tracker.record(
+            symbol=self.symbols[j], order_side=order_side, bar_index=i,
+        )
+
+    def _process(self, i, j):
+        """Run the state machine for symbol column ``j`` on bar ``i``."""
+        current_date = self.dates[i]
+        current_price = float(self.close[i - self.first_bar, j])
+        mask = int(self.signals[i - self.first_bar, j])
+        scaling_rule = self.scaling_rules[j]
+        has_position = bool(self.has_position[j])
+
+        # v9.0 (#487) — evaluate fixed TP / SL before signal
+        # processing. A triggered TP/SL closes the open trade for the
+        # symbol immediately, records a side-specific cooldown, and
+        # emits a ``signal_event`` so downstream tooling can attribute
+        # the exit.
+        if has_position:
+            tp_sl_reason = self._evaluate_tp_sl(j, current_price, i)
+
+            if tp_sl_reason is not None:
+                self._event(
+                    current_date, j, tp_sl_reason, True, "executed"
+                )
+                has_position = False
+
+        if mask == 0:
+            return
+
+        in_cooldown = self.cooldown_remaining[j] > 0
+
+        # CooldownRule gating (portfolio-aware, side-specific)
+        rule_block_buy = self._is_blocked(j, "buy", i)
+        rule_block_sell = self._is_blocked(j, "sell", i)
+
+        is_buy = bool(mask & SIGNAL_BUY)
+        is_sell = bool(mask & SIGNAL_SELL)
+        is_scale_in = bool(mask & SIGNAL_SCALE_IN)
+        is_scale_out = bool(mask & SIGNAL_SCALE_OUT)
+        # SHORT / COVER (#433)
+        is_short_sig = bool(mask & SIGNAL_SHORT)
+        is_cover_sig = bool(mask & SIGNAL_COVER)
+        is_short_pos = bool(self.is_short[j])
+        is_long_pos = has_position and not is_short_pos
+
+        # ---- SELL always takes priority (long-only close) ----
+        if is_sell and is_long_pos and not in_cooldown and rule_block_sell:
+            self._event(current_date, j, "sell", False, "in_cooldown_rule")
+        elif is_sell and is_long_pos and not in_cooldown:
+            self._event(current_date, j, "sell", True, "executed")
+            self._close_trade(j, current_price, i)
+            has_position = False
+
+            if scaling_rule and scaling_rule.cooldown_in_bars > 0:
+                self.cooldown_remaining[j] = scaling_rule.cooldown_in_bars
+                in_cooldown = True
+
+            self._record(j, "sell", i)
+            rule_block_sell = self._is_blocked(j, "sell", i)
+            rule_block_buy = self._is_blocked(j, "buy", i)
+            # Reset is_buy if sell also fired on same bar
+            is_buy = False
+            is_scale_in = False
+            is_scale_out = False
+        elif is_sell and not has_position:
+            self._event(
+                current_date, j, "sell", False, "no_position_to_close"
+            )
+        elif is_sell and in_cooldown:
+            self._event(current_date, j, "sell", False, "in_cooldown")
+
+        # ---- COVER (close short) — mirror of SELL (#433) ----
+        if is_cover_sig and is_short_pos and not in_cooldown:
+            self._event(current_date, j, "cover", True, "executed")
+            self._close_short_trade(j, current_price, i)
+            has_position = False
+            is_short_pos = False
+            is_long_pos = False
+            self._record(j, "buy", i)
+            # A cover on the same bar shouldn't also re-enter
+            # short / long.
+            is_buy = False
+            is_short_sig = False
+        elif is_cover_sig and not is_short_pos:
+            self._event(
+                current_date, j, "cover", False,
+                "no_short_position_to_cover"
+            )
+        elif is_cover_sig and in_cooldown:
+            self._event(current_date, j, "cover", False, "in_cooldown")
+
+        # ---- SCALE-OUT (partial close) ----
+        # Scaling rules apply to long positions only.
+        if (is_scale_out and is_long_pos and scaling_rule is not None
+                and not in_cooldown and rule_block_sell):
+            self._event(
+                current_date, j, "scale_out", False, "in_cooldown_rule"
+            )
+        elif (is_scale_out and is_long_pos and scaling_rule is not None
+                and not in_cooldown):
+            pct = scaling_rule.get_scale_out_percentage(
+                int(self.scale_out_count[j])
+            )
+            self._event(current_date, j, "scale_out", True, "executed")
+            self._partial_close(j, current_price, i, pct)
+            self.scale_out_count[j] += 1
+            has_position = bool(self.has_position[j])
+
+            if scaling_rule.cooldown_in_bars > 0:
+                self.cooldown_remaining[j] = scaling_rule.cooldown_in_bars
+                in_cooldown = True
+
+            self._record(j, "sell", i)
+            rule_block_sell = self._is_blocked(j, "sell", i)
+            rule_block_buy = self._is_blocked(j, "buy", i)
+
+        # ---- BUY (new entry) ----
+        if is_buy and not has_position and not in_cooldown \
+                and rule_block_buy:
+            self._event(current_date, j, "buy", False, "in_cooldown_rule")
+        elif is_buy and not has_position and not in_cooldown:
+            capital = self._get_capital_for_trade(j, current_price, 100)
+
+            if capital <= 0:
+                self._event(
+                    current_date, j, "buy", False, "insufficient_capital"
+                )
+            else:
+                self._open_trade(j, current_price, i, capital)
+                self._event(current_date, j, "buy", True, "executed")
+
+                if scaling_rule and scaling_rule.cooldown_in_bars > 0:
+                    self.cooldown_remaining[j] = \
+                        scaling_rule.cooldown_in_bars
+                    in_cooldown = True
+
+                self._record(j, "buy", i)
+                rule_block_sell = self._is_blocked(j, "sell", i)
+                rule_block_buy = self._is_blocked(j, "buy", i)
+        elif is_buy and is_long_pos and not in_cooldown:
+            # Possible scale-in via buy signal (if no separate
+            # scale_in_signals provided, buy = scale_in)
+            if scaling_rule is not None:
+                is_scale_in = True
+            else:
+                self._event(
+                    current_date, j, "buy", False, "already_in_position"
+                )
+        elif is_buy and is_short_pos and not in_cooldown:
+            # Buy signals never flip an open short — the strategy
+            # must cover first (#433).
+            self._event(
+                current_date, j, "buy", False, "open_short_position"
+            )
+        elif is_buy and in_cooldown:
+            self._event(current_date, j, "buy", False, "in_cooldown")
+
+        # ---- SCALE-IN (add to position) ----
+        # Scaling rules apply to long positions only.
+        if (is_scale_in and is_long_pos and scaling_rule is not None
+                and not in_cooldown and rule_block_buy):
+            self._event(
+                current_date, j, "scale_in", False, "in_cooldown_rule"
+            )
+        elif (is_scale_in and is_long_pos and scaling_rule is not None
+                and in_cooldown):
+            self._event(current_date, j, "scale_in", False, "in_cooldown")
+        elif (is_scale_in and is_long_pos and scaling_rule is not None
+                and not in_cooldown):
+            entry_count = int(self.entry_count[j])
+
+            if entry_count >= scaling_rule.max_entries:
+                self._event(
+                    current_date, j, "scale_in", False,
+                    "max_entries_reached"
+                )
+            else:
+                # 0-indexed scale-in
+                pct = scaling_rule.get_scale_in_percentage(entry_count - 1)
+                capital = self._get_capital_for_trade(
+                    j, current_price, pct
+                )
+
+                if capital <= 0:
+                    self._event(
+                        current_date, j, "scale_in", False,
+                        "insufficient_capital"
+                    )
+                else:
+                    self._open_trade(
+                        j, current_price, i, capital,
+                        order_reason="scale_in"
+                    )
+                    self._event(
+                        current_date, j, "scale_in", True, "executed"
+                    )
+
+                    if scaling_rule.cooldown_in_bars > 0:
+                        self.cooldown_remaining[j] = \
+                            scaling_rule.cooldown_in_bars
+
+                    self._record(j, "buy", i)
+
+        # ---- SHORT (open short, #433) ----
+        # Open a new short only when flat. Buy signals on the same bar
+        # take priority because an opened long already consumed
+        # ``has_position``; check both to be defensive.
+        if is_short_sig and not has_position and not in_cooldown \
+                and rule_block_sell:
+            self._event(
+                current_date, j, "short", False, "in_cooldown_rule"
+            )
+        elif is_short_sig and not has_position and not in_cooldown:
+            capital = self._get_capital_for_trade(j, current_price, 100)
+
+            if capital <= 0:
+                self._event(
+                    current_date, j, "short", False, "insufficient_capital"
+                )
+            else:
+                opened = self._open_short_trade(
+                    j, current_price, i, capital,
+                )
+
+                if opened is not None:
+                    self._event(current_date, j, "short", True, "executed")
+                    self._record(j, "sell", i)
+        elif is_short_sig and has_position:
+            self._event(
+                current_date, j, "short", False, "already_in_position"
+            )
+        elif is_short_sig and in_cooldown:
+            self._event(current_date, j, "short", False, "in_cooldown")
+
+    def _get_capital_for_trade(self, j, price, pct_of_base=100):
+        """Calculate capital for a trade, respecting portfolio limits."""
+
+        if self.dynamic_position_sizing:
+            portfolio_value = self.current_unallocated \
+                + float(self.open_value.sum())
+            base = self.position_sizes[j].get_size(
+                Portfolio(
+                    unallocated=portfolio_value,
+                    initial_balance=self.initial_amount,
+                    trading_symbol=self.trading_symbol,
+                    net_size=0,
+                    market="BACKTEST",
+                    identifier="vector_backtest"
+                ),
+                asset_price=price
+            )
+            capital = base * pct_of_base / 100
+            return min(capital, self.current_unallocated)
+
+        base = self.initial_capital_for_trade[j]
+        capital = base * pct_of_base / 100
+
+        if self.total_allocated + capital > self.initial_amount:
+            return 0
+
+        return capital
+
+    def _fee_rate(self, j):
+        tc = self.trading_costs[j]
+        return tc.fee_percentage / 100 if tc.fee_percentage else None
+
+    def _open_trade(
+        self, j, price, i, capital, order_reason="buy_signal"
+    ):
+        """Open a new long trade for symbol column ``j``."""
+        tc = self.trading_costs[j]
+        fill_price = tc.get_buy_fill_price(price)
+
+        # Fee comes out of capital; remainder buys the asset
+        buy_fee = tc.get_fee(capital)
+        net_capital = capital - buy_fee
+
+        if net_capital <= 0:
+            return None
+
+        amount = float(net_capital / fill_price)
+
+        if self.dynamic_position_sizing:
+            self.current_unallocated -= capital
+        else:
+            self.total_allocated += capital
+
+        trade = self.ledger.open_trade(
+            self.symbols[j], i, fill_price, amount, net_capital, buy_fee,
+            self._fee_rate(j), fill_price - price, order_reason,
+        )
+        self.last_trade[j] = trade
+        self.open_trades[j].append(trade)
+        self.has_position[j] = True
+        self.entry_count[j] += 1
+
+        if self.dynamic_position_sizing:
+            self.open_value[j] += net_capital
+
+        return trade
+
+    def _close_trade(self, j, price, i):
+        """Close every open long trade for symbol column ``j``."""
+        ledger = self.ledger
+        lt = self.last_trade[j]
+        tc = self.trading_costs[j]
+        sell_fill = tc.get_sell_fill_price(price)
+        fee_rate = self._fee_rate(j)
+
+        # The most recent trade is closed first, then every other
+        # trade that is still open for the symbol.
+        for trade in [lt] + [
+            t for t in self.open_trades[j]
+            if t != lt and ledger.is_open(t)
+        ]:
+            available_amount = ledger.available_amount[trade]
+            gross = sell_fill * available_amount
+            sell_fee = tc.get_fee(gross)
+            cost = ledger.cost[trade]
+            net_gain_val = gross - sell_fee - cost
+
+            # Update shared portfolio state
+            if self.dynamic_position_sizing:
+                self.current_unallocated += cost + net_gain_val
+                self.total_realized_gains += net_gain_val
+
+                if trade == lt:
+                    self.open_value[j] = 0.0
+            else:
+                self.total_allocated -= cost
+
+            ledger.add_order(
+                trade, OrderSide.SELL.value, i, sell_fill,
+                available_amount, sell_fee, fee_rate, price - sell_fill,
+                "sell_signal",
+            )
+            ledger.close_bar[trade] = i
+            ledger.update_bar[trade] = i
+            ledger.net_gain[trade] = net_gain_val
+            ledger.total_fees[trade] = \
+                (ledger.total_fees[trade] or 0) + sell_fee
+
+        self._reset_position(j)
+
+    def _partial_close(self, j, price, i, sell_pct):
+        """Partial close of the most recent open trade."""
+        ledger = self.ledger
+        lt = self.last_trade[j]
+
+        if lt is None:
+            return
+
+        tc = self.trading_costs[j]
+        available_amount = ledger.available_amount[lt]
+        sell_amount = available_amount * sell_pct / 100
+
+        if sell_amount <= 0:
+            return
+
+        sell_fill = tc.get_sell_fill_price(price)
+
+        # Proportional cost (fraction of total cost)
+        sell_cost = ledger.cost[lt] * (sell_amount / available_amount)
+        gross = sell_amount * sell_fill
+        sell_fee = tc.get_fee(gross)
+        net_gain_val = gross - sell_fee - sell_cost
+
+        if self.dynamic_position_sizing:
+            self.current_unallocated += sell_cost + net_gain_val
+            self.total_realized_gains += net_gain_val
+            self.open_value[j] = max(0, self.open_value[j] - sell_cost)
+        else:
+            self.total_allocated -= sell_cost
+
+        ledger.add_order(
+            lt, OrderSide.SELL.value, i, sell_fill, sell_amount, sell_fee,
+            self._fee_rate(j), price - sell_fill, "scale_out",
+        )
+        new_available = available_amount - sell_amount
+        old_net = ledger.net_gain[lt] if ledger.net_gain[lt] else 0.0
+        ledger.available_amount[lt] = new_available
+        ledger.cost[lt] = ledger.cost[lt] - sell_cost
+        ledger.net_gain[lt] = old_net + net_gain_val
+        ledger.total_fees[lt] = (ledger.total_fees[lt] or 0) + sell_fee
+        ledger.update_bar[lt] = i
+
+        if new_available <= 0:
+            ledger.close_bar[lt] = i
+            open_trades = [t for t in self.open_trades[j] if t != lt]
+            self.open_trades[j] = open_trades
+            self.last_trade[j] = open_trades[-1] if open_trades else None
+            self.has_position[j] = bool(open_trades)
+
+    # ------------------------------------------------------------------
+    # SHORT / COVER helpers (#433)
+    #
+    # A short is a SELL-first / BUY-to-cover trade. Cash mechanics are
+    # the mirror of a long: opening a short *credits* unallocated with
+    # the sale proceeds; covering *debits* unallocated for the cost to
+    # buy the borrowed amount back. P&L therefore equals
+    # ``(open_price - cover_price) * amount - fees``.
+    #
+    # Sizing reuses the existing ``PositionSize`` mechanism: ``capital``
+    # (in quote-currency units) is the *notional* committed to the
+    # short. The engine does not model margin requirements — vector
+    # backtests are a directional-P&L tool.
+    # ------------------------------------------------------------------
+    def _open_short_trade(
+        self, j, price, i, capital, order_reason="short_signal"
+    ):
+        tc = self.trading_costs[j]
+        # On a SHORT entry the broker fills our SELL — slippage moves
+        # against us in the same direction as a long exit, hence the
+        # sell-side fill price.
+        fill_price = tc.get_sell_fill_price(price)
+
+        amount = float(capital / fill_price)
+        gross_proceeds = amount * fill_price
+        short_fee = tc.get_fee(gross_proceeds)
+        net_proceeds = gross_proceeds - short_fee
+
+        if amount <= 0 or net_proceeds <= 0:
+            return None
+
+        if self.dynamic_position_sizing:
+            # Short entry releases cash into the wallet (proceeds in,
+            # fee out).
+            self.current_unallocated += net_proceeds
+        else:
+            # Static mode still reserves notional against the original
+            # budget so a short cannot exceed portfolio capacity.
+            self.total_allocated += capital
+
+        # ``cost`` for a short is the notional (proceeds before fees).
+        # This keeps net_gain_percentage and percentage change
+        # calculations consistent with the long path.
+        trade = self.ledger.open_trade(
+            self.symbols[j], i, fill_price, amount, gross_proceeds,
+            short_fee, self._fee_rate(j), price - fill_price, order_reason,
+            is_short=True,
+        )
+        self.last_trade[j] = trade
+        self.open_trades[j].append(trade)
+        self.has_position[j] = True
+        self.entry_count[j] += 1
+        self.is_short[j] = True
+
+        if self.dynamic_position_sizing:
+            # At open the liability matches the gross proceeds, so the
+            # residual (proceeds - liability) is ~0 — the per-bar
+            # reprice updates it as price drifts.
+            self.open_value[j] = 0.0
+
+        return trade
+
+    def _close_short_trade(self, j, price, i):
+        ledger = self.ledger
+        lt = self.last_trade[j]
+
+        if lt is None:
+            return
+
+        tc = self.trading_costs[j]
+        available_amount = ledger.available_amount[lt]
+        cost = ledger.cost[lt]
+        # Covering = BUY back; pay buy-side slippage.
+        cover_fill = tc.get_buy_fill_price(price)
+        cover_gross = cover_fill * available_amount
+        cover_fee = tc.get_fee(cover_gross)
+        # P&L mirror: long is gross_sell - cost - fee; short is
+        # proceeds(=cost) - gross_buy - fee.
+        net_gain_val = cost - cover_gross - cover_fee
+
+        if self.dynamic_position_sizing:
+            self.current_unallocated -= (cover_gross + cover_fee)
+            self.total_realized_gains += net_gain_val
+            self.open_value[j] = 0.0
+        else:
+            self.total_allocated -= cost
+
+        ledger.add_order(
+            lt, OrderSide.BUY.value, i, cover_fill, available_amount,
+            cover_fee, self._fee_rate(j), cover_fill - price, "cover_signal",
+        )
+        ledger.close_bar[lt] = i
+        ledger.update_bar[lt] = i
+        ledger.net_gain[lt] = net_gain_val
+        ledger.total_fees[lt] = (ledger.total_fees[lt] or 0) + cover_fee
+        self._reset_position(j)
+
+    def _reset_position(self, j):
+        self.last_trade[j] = None
+        self.open_trades[j] = []
+        self.has_position[j] = False
+        self.entry_count[j] = 0
+        self.scale_out_count[j] = 0
+        self.is_short[j] = False
+
+    def _evaluate_tp_sl(self, j, current_price, i):
+        """Close the open trade if any fixed TP / SL rule has
+        triggered against ``current_price``. Returns the reason
+        string (``"take_profit"`` / ``"stop_loss"``) or ``None``.
+        """
+        last = self.last_trade[j]
+
+        if last is None:
+            return None
+
+        symbol = self.symbols[j]
+        entry_price = float(self.ledger.open_price[last])
+        is_short = bool(self.ledger.is_short[last])
+
+        # Take-profit wins ties with stop-loss to match the event
+        # engine's evaluation order.
+        for rules, triggered, reason in (
+            (self.take_profits, _tp_triggered, "take_profit"),
+            (self.stop_losses, _sl_triggered, "stop_loss"),
+        ):
+            for rule in rules:
+                rule_symbol = getattr(rule, 'symbol', None)
+
+                if rule_symbol is not None and rule_symbol != symbol:
+                    continue
+
+                if not triggered(rule, entry_price, current_price, is_short):
+                    continue
+
+                if is_short:
+                    self._close_short_trade(j, current_price, i)
+                else:
+                    self._close_trade(j, current_price, i)
+
+                self._record(j, "buy" if is_short else "sell", i)
+                return reason
+
+        return None
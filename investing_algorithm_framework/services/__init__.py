@@ -3,13 +3,13 @@ from .trade_order_evaluator import BacktestTradeOrderEvaluator, \
 from .trade_hooks import TradeHookDispatcher
 from .configuration_service import ConfigurationService
 from .market_credential_service import MarketCredentialService
-from .data_providers import DataProviderService
+from .data_providers import DataProviderService, DataPrefetchResult
 from .order_service import OrderService, OrderBacktestService, \
     OrderExecutorLookup
 from .portfolios import PortfolioService, BacktestPortfolioService, \
     PortfolioConfigurationService, PortfolioSyncService, \
     PortfolioSnapshotService, PortfolioProviderLookup, \
-    BrokerBalanceTracker
+    BrokerBalanceTracker, PortfolioSnapshotWriter
 from .positions import PositionService, PositionSnapshotService
 from .repository_service import RepositoryService
 from .trade_service import TradeService, TradeStopLossService, \
@@ -58,11 +58,13 @@ __all__ = [
     "ConfigurationService",
     "PortfolioSyncService",
     "PortfolioSnapshotService",
+    "PortfolioSnapshotWriter",
     "PositionSnapshotService",
     "MarketCredentialService",
     "BacktestPortfolioService",
     "TradeService",
     "DataProviderService",
+    "DataPrefetchResult",
     "OrderExecutorLookup",
     "BacktestTradeOrderEvaluator",
     "PortfolioProviderLookup",
@@ -1,9 +1,17 @@
-from .data_provider_service import DataProviderService
+from .data_provider_service import DataProviderService, \
+    DataPrefetchResult
 from .data import fill_missing_timeseries_data, \
     get_missing_timeseries_data_entries
+from .completeness import CompletenessIndex, get_completeness_index
+from .resampling import OHLCVResampler, ResampledOHLCVDataProvider
 
 __all__ = [
     "DataProviderService",
+    "DataPrefetchResult",
+    "CompletenessIndex",
+    "get_completeness_index",
+    "OHLCVResampler",
+    "ResampledOHLCVDataProvider",
     "fill_missing_timeseries_data",
     "get_missing_timeseries_data_entries",
 ]
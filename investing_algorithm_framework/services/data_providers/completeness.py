@@ -0,0 +1,368 @@
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from typing import List, Union
+
+import numpy as np
+import polars as pl
+
+from investing_algorithm_framework.domain import TimeFrame
+
+logger = logging.getLogger("investing_algorithm_framework")
+
+
+def _get_cache_directory() -> str:
+    """
+    The per-user cache directory of the completeness indexes:
+    investing_algorithm_framework/completeness in $XDG_CACHE_HOME, or
+    in ~/.cache if XDG_CACHE_HOME is not set.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") \
+        or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(
+        cache_home, "investing_algorithm_framework", "completeness"
+    )
+
+
+def _to_milliseconds(date: datetime) -> int:
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return int(date.timestamp() * 1000)
+
+
+def file_fingerprint(path: str) -> Union[list, None]:
+    """
+    Fingerprint of a data file, or of the files of a data directory,
+    from their names, sizes and modification times.
+
+    Args:
+        path (str): The path of the data file or directory.
+
+    Returns:
+        list: The fingerprint, or None if the path does not exist.
+    """
+    if path is None or not os.path.exists(path):
+        return None
+
+    if os.path.isdir(path):
+        fingerprint = []
+
+        for file_name in sorted(os.listdir(path)):
+            stat = os.stat(os.path.join(path, file_name))
+            fingerprint.append([file_name, stat.st_size, stat.st_mtime_ns])
+
+        return fingerprint
+
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class CompletenessIndex:
+    """
+    Completeness index of a stored time series: the timestamps missing
+    from its expected grid of one candle per time frame interval.
+
+    The index is computed once from the data with numpy set operations
+    and persisted in the completeness cache directory, together with
+    the fingerprint of the data file. Finding or filling the missing
+    timestamps of a date range then only needs the index, and the index
+    is reused until the data file changes.
+
+    Attributes:
+        interval (int): The interval of the grid in milliseconds.
+        start (int): The first timestamp of the data in milliseconds.
+        end (int): The last timestamp of the data in milliseconds.
+        missing (np.ndarray): The sorted timestamps of the grid between
+            start and end that are missing from the data.
+        extra (np.ndarray): The sorted timestamps of the data that are
+            not on the grid.
+        fingerprint (list): The fingerprint of the data file the index
+            was computed for.
+    """
+    # The cache directory of the persisted indexes, outside of the data
+    # directories so that those are left unchanged. It is only readable
+    # by its user.
+    directory = _get_cache_directory()
+    file_suffix = ".completeness.json"
+    version = 1
+
+    def __init__(
+        self,
+        interval: int,
+        start: int,
+        end: int,
+        missing: np.ndarray,
+        extra: np.ndarray,
+        fingerprint: list = None,
+    ):
+        self.interval = interval
+        self.start = start
+        self.end = end
+        self.missing = missing
+        self.extra = extra
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_data(
+        cls, data: pl.DataFrame, time_frame, fingerprint: list = None
+    ) -> "CompletenessIndex":
+        """
+        Compute the completeness index of time series data.
+
+        Args:
+            data (pl.DataFrame): The data, with a Datetime column.
+            time_frame: The time frame of the data.
+            fingerprint (list): The fingerprint of the data file.
+
+        Returns:
+            CompletenessIndex: The completeness index of the data.
+        """
+        interval = TimeFrame.from_value(time_frame).amount_of_minutes \
+            * 60 * 1000
+        timestamps = np.unique(data["Datetime"].dt.epoch("ms").to_numpy())
+        start = int(timestamps[0])
+        end = int(timestamps[-1])
+        on_grid = (timestamps - start) % interval == 0
+        grid = np.arange(start, end + 1, interval, dtype=np.int64)
+        return cls(
+            interval=interval,
+            start=start,
+            end=end,
+            missing=np.setdiff1d(grid, timestamps[on_grid], True),
+            extra=timestamps[~on_grid],
+            fingerprint=fingerprint,
+        )
+
+    @classmethod
+    def index_path(cls, data_file_path: str) -> str:
+        """
+        The path of the persisted index of a data file or directory in
+        the cache directory, named after the data file and a hash of
+        its absolute path.
+        """
+        data_file_path = os.path.abspath(data_file_path.rstrip(os.sep))
+        name = os.path.splitext(os.path.basename(data_file_path))[0]
+        digest = hashlib.sha1(data_file_path.encode()).hexdigest()[:16]
+        return os.path.join(
+            cls.directory, f"{name}-{digest}{cls.file_suffix}"
+        )
+
+    @classmethod
+    def load(cls, path: str) -> Union["CompletenessIndex", None]:
+        """
+        Load a persisted completeness index.
+
+        Args:
+            path (str): The path of the index file.
+
+        Returns:
+            CompletenessIndex: The index, or None if the file does not
+                exist or can not be read.
+        """
+        if not os.path.isfile(path):
+            return None
+
+        try:
+            with open(path) as file:
+                entry = json.load(file)
+
+            if entry.get("version") != cls.version:
+                return None
+
+            return cls(
+                interval=entry["interval"],
+                start=entry["start"],
+                end=entry["end"],
+                missing=np.array(entry["missing"], dtype=np.int64),
+                extra=np.array(entry["extra"], dtype=np.int64),
+                fingerprint=entry["fingerprint"],
+            )
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not read completeness index {path}: {e}")
+            return None
+
+    def save(self, path: str) -> None:
+        """
+        Persist the completeness index.
+
+        Args:
+            path (str): The path of the index file.
+        """
+        entry = {
+            "version": self.version,
+            "fingerprint": self.fingerprint,
+            "interval": self.interval,
+            "start": self.start,
+            "end": self.end,
+            "missing": self.missing.tolist(),
+            "extra": self.extra.tolist(),
+        }
+        temporary_path = f"{path}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+
+            with open(temporary_path, "w") as file:
+                json.dump(entry, file)
+
+            os.replace(temporary_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write completeness index {path}: {e}")
+
+    def covers(self, data: pl.DataFrame, time_frame) -> bool:
+        """
+        Check if the index describes the given data.
+        """
+        interval = TimeFrame.from_value(time_frame).amount_of_minutes \
+            * 60 * 1000
+        datetimes = data["Datetime"]
+        return interval == self.interval \
+            and _to_milliseconds(datetimes.min()) >= self.start \
+            and _to_milliseconds(datetimes.max()) <= self.end
+
+    def get_missing_timestamps(
+        self, start_date: datetime, end_date: datetime
+    ) -> np.ndarray:
+        """
+        Get the timestamps of the grid from start_date to end_date,
+        one per interval, that are missing from the data.
+
+        Args:
+            start_date (datetime): The start date of the grid.
+            end_date (datetime): The end date of the grid.
+
+        Returns:
+            np.ndarray: The missing timestamps in milliseconds.
+        """
+        start = _to_milliseconds(start_date)
+        end = _to_milliseconds(end_date)
+
+        # The requested grid is within the data and on its grid, and
+        # none of its timestamps is missing
+        if self.start <= start and end <= self.end \
+                and (start - self.start) % self.interval == 0:
+            low, high = np.searchsorted(self.missing, [start, end + 1])
+
+            if low == high:
+                return np.empty(0, dtype=np.int64)
+
+        grid = np.arange(start, end + 1, self.interval, dtype=np.int64)
+        present = (grid >= self.start) & (grid <= self.end) \
+            & ((grid - self.start) % self.interval == 0) \
+            & ~np.isin(grid, self.missing)
+        present |= np.isin(grid, self.extra)
+        return grid[~present]
+
+    def get_missing_dates(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[datetime]:
+        """
+        Get the dates of the grid from start_date to end_date that are
+        missing from the data.
+
+        Args:
+            start_date (datetime): The start date of the grid.
+            end_date (datetime): The end date of the grid.
+
+        Returns:
+            List[datetime]: The missing dates in UTC.
+        """
+        return [
+            datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc)
+            for timestamp in self.get_missing_timestamps(
+                start_date, end_date
+            ).tolist()
+        ]
+
+    def fill(
+        self, data: pl.DataFrame, start_date: datetime, end_date: datetime
+    ) -> pl.DataFrame:
+        """
+        Fill the missing dates from start_date to end_date with a copy
+        of the previous row, or of the first row for missing dates
+        before the data, like `fill_missing_timeseries_data`.
+
+        Args:
+            data (pl.DataFrame): The data, with a Datetime column.
+            start_date (datetime): The start date to fill from.
+            end_date (datetime): The end date to fill to.
+
+        Returns:
+            pl.DataFrame: The filled data, or the given data if no date
+                is missing.
+        """
+        if len(data) == 0:
+            return data
+
+        # The data may already contain dates that are missing from the
+        # index, e.g. when it was filled before
+        missing = self.get_missing_timestamps(start_date, end_date)
+        missing = missing[
+            ~np.isin(missing, data["Datetime"].dt.epoch("ms").to_numpy())
+        ]
+
+        if len(missing) == 0:
+            return data
+
+        dtype = data.schema["Datetime"]
+        rows = pl.DataFrame({"Datetime": pl.Series(missing)}).with_columns(
+            pl.col("Datetime").cast(pl.Datetime("ms")).dt.replace_time_zone(
+                "UTC"
+            ).cast(dtype)
+        )
+        # Every missing row takes the position of the previous data row
+        # (or of the first data row) as its source row
+        combined = pl.concat(
+            [data.with_columns(pl.lit(True).alias("_data")), rows],
+            how="diagonal",
+        ).sort("Datetime", maintain_order=True).with_row_index(
+            "_row"
+        ).with_columns(
+            pl.when(pl.col("_data")).then(pl.col("_row"))
+            .forward_fill().backward_fill().alias("_source")
+        )
+        columns = [column for column in data.columns if column != "Datetime"]
+        return combined.select(
+            pl.col("Datetime"),
+            *[pl.col(column).gather(pl.col("_source")) for column in columns],
+        ).select(data.columns)
+
+
+def get_completeness_index(
+    data: pl.DataFrame, time_frame, data_file_path: str = None
+) -> CompletenessIndex:
+    """
+    Get the completeness index of data read from a data file. The
+    index persisted for the data file in the cache directory is reused
+    if the file did not change and the index describes the data.
+    Otherwise the index is computed from the data and persisted.
+
+    Args:
+        data (pl.DataFrame): The data, with a Datetime column.
+        time_frame: The time frame of the data.
+        data_file_path (str): The path of the data file or directory
+            the data was read from. Without a path the index is not
+            persisted.
+
+    Returns:
+        CompletenessIndex: The completeness index of the data.
+    """
+    fingerprint = file_fingerprint(data_file_path)
+
+    if fingerprint is None:
+        return CompletenessIndex.from_data(data, time_frame)
+
+    path = CompletenessIndex.index_path(data_file_path)
+    index = CompletenessIndex.load(path)
+
+    if index is not None and index.fingerprint == fingerprint \
+            and index.covers(data, time_frame):
+        return index
+
+    index = CompletenessIndex.from_data(data, time_frame, fingerprint)
+    index.save(path)
+    return index
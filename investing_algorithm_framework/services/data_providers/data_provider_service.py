@@ -1,17 +1,58 @@
 import logging
+import os
+import shutil
+import tempfile
+import time
 import pandas as pd
 import polars as pl
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import List, Tuple, Optional, Dict, Any
 
 from investing_algorithm_framework.domain import DataProvider, \
     OperationalException, ImproperlyConfigured, DataSource, DataType, \
-    BacktestDateRange, tqdm, convert_polars_to_pandas, TimeFrame
+    BacktestDateRange, tqdm, convert_polars_to_pandas, TimeFrame, \
+    RESAMPLE_OHLCV_DATA
+
+from .price_index import PriceIndex
+from .resampling import OHLCVResampler, ResampledOHLCVDataProvider, \
+    can_resample
 
 logger = logging.getLogger("investing_algorithm_framework")
 
 
+@dataclass
+class DataPrefetchResult:
+    """
+    Result of prefetching the backtest data of a single data source.
+
+    Attributes:
+        data_source (DataSource): The data source.
+        number_of_rows (int): The number of rows of the prepared data.
+        duration (float): The time it took to prefetch the data,
+            in seconds.
+        error (str, optional): The error message if prefetching failed.
+    """
+    data_source: DataSource
+    number_of_rows: int = 0
+    duration: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.duration <= 0:
+            return 0.0
+
+        return self.number_of_rows / self.duration
+
+
 class DataProviderIndex:
     """
     Efficient lookup for data providers in O(1) time.
@@ -195,27 +236,38 @@ class DataProviderIndex:
 
         return data_provider
 
-    def register_backtest_data_source(
+    def find_backtest_data_provider(
         self,
         data_source: DataSource,
         backtest_date_range: BacktestDateRange
     ) -> DataProvider:
         """
-        Register a backtest data source for a given market and symbol.
-
-        This method will also check if the data provider supports
-        the market. If no data provider is found for the market and symbol,
-        it will raise an ImproperlyConfigured exception.
+        Find the data provider with the highest priority that has data
+        for a backtest data source, without registering it.
 
         Args:
-            data_source (DataSource): The data source to register the
+            data_source (DataSource): The data source to find the
                 backtest data provider for.
             backtest_date_range (BacktestDateRange): The date range for the
                 backtest data provider.
 
+        Raises:
+            ImproperlyConfigured: If no data provider has data for
+                the data source.
+
         Returns:
-            DataProvider: The registered data provider.
+            DataProvider: A copy of the data provider for the data source.
         """
+        best_provider = self._match_backtest_data_provider(
+            data_source, backtest_date_range
+        )
+        return best_provider.copy(data_source)
+
+    def _match_backtest_data_provider(
+        self,
+        data_source: DataSource,
+        backtest_date_range: BacktestDateRange
+    ) -> DataProvider:
         matches = []
 
         for data_provider in self.data_providers:
@@ -238,8 +290,32 @@ class DataProviderIndex:
             )
 
         # Sort by priority and pick the best one (lowest priority first)
-        best_provider = sorted(matches, key=lambda x: x.priority)[0]
-        best_provider = best_provider.copy(data_source)
+        return sorted(matches, key=lambda x: x.priority)[0]
+
+    def register_backtest_data_source(
+        self,
+        data_source: DataSource,
+        backtest_date_range: BacktestDateRange
+    ) -> DataProvider:
+        """
+        Register a backtest data source for a given market and symbol.
+
+        This method will also check if the data provider supports
+        the market. If no data provider is found for the market and symbol,
+        it will raise an ImproperlyConfigured exception.
+
+        Args:
+            data_source (DataSource): The data source to register the
+                backtest data provider for.
+            backtest_date_range (BacktestDateRange): The date range for the
+                backtest data provider.
+
+        Returns:
+            DataProvider: The registered data provider.
+        """
+        best_provider = self.find_backtest_data_provider(
+            data_source, backtest_date_range
+        )
         self.data_providers_lookup[data_source] = best_provider
 
         symbol = data_source.symbol
@@ -456,6 +532,14 @@ class DataProviderService:
         )
         self.configuration_service = configuration_service
         self.market_credential_service = market_credential_service
+        self._price_indexes = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Price indexes are keyed by the id of the data providers,
+        # rebuild them in the process the service is unpickled in
+        state["_price_indexes"] = {}
+        return state
 
     def initialize(self, data_sources, data_providers):
         """
@@ -625,6 +709,13 @@ class DataProviderService:
                 )
             else:
                 if self.backtest_mode:
+                    ticker = self._get_backtest_ticker(
+                        ohlcv_data_provider, symbol, market, date
+                    )
+
+                    if ticker is not None:
+                        return ticker
+
                     data = ohlcv_data_provider.get_backtest_data(
                         backtest_index_date=date,
                     )
@@ -681,6 +772,46 @@ class DataProviderService:
             else:
                 return data_provider.get_data(date=date)
 
+    def _get_backtest_ticker(self, data_provider, symbol, market, date):
+        """
+        Look up the ticker of a backtest date in the price index of an
+        OHLCV data provider, without materialising its backtest window.
+
+        The price index is built from the ``data`` frame of the data
+        provider and rebuilt whenever the provider replaces that frame.
+
+        Args:
+            data_provider (DataProvider): The OHLCV data provider.
+            symbol (str): The symbol of the ticker.
+            market (str): The market of the ticker.
+            date (datetime): The backtest index date.
+
+        Returns:
+            dict: The ticker, or None if the data provider has no polars
+                OHLCV data or no candle for the date.
+        """
+        data = getattr(data_provider, "data", None)
+
+        if date is None or not isinstance(data, pl.DataFrame) \
+                or len(data) == 0 \
+                or not PriceIndex.columns.issubset(data.columns):
+            return None
+
+        price_index = self._price_indexes.get(id(data_provider))
+
+        if price_index is None or price_index.data is not data:
+            price_index = PriceIndex(data)
+            self._price_indexes[id(data_provider)] = price_index
+
+        # Without a warmup window the backtest data of a date ends at
+        # the last candle at or before it
+        return price_index.get(
+            symbol,
+            market,
+            date,
+            at_or_before=getattr(data_provider, "window_size", None) is None
+        )
+
     def get_ohlcv_data(
         self,
         symbol: str,
@@ -926,6 +1057,13 @@ class DataProviderService:
 
         # Filter out duplicate data_sources
         unique_data_sources = set(data_sources)
+        config = self.configuration_service.get_config() \
+            if self.configuration_service is not None else {}
+
+        if config.get(RESAMPLE_OHLCV_DATA, False):
+            unique_data_sources = self._index_resampled_data_sources(
+                unique_data_sources, backtest_date_range
+            )
 
         if show_progress:
 
@@ -953,6 +1091,118 @@ class DataProviderService:
 
         self.backtest_mode = True
 
+    def _index_resampled_data_sources(
+        self,
+        data_sources,
+        backtest_date_range: BacktestDateRange,
+    ) -> List[DataSource]:
+        """
+        Register resampled data providers for the OHLCV data sources
+        of a symbol that have multiple time frames.
+
+        The data provider of the finest time frame is prepared once,
+        with a warmup window that covers the warmup windows of all
+        time frames, and the other time frames are aggregated from its
+        data (see OHLCVResampler). A time frame is only resampled if
+        the data provider that would otherwise serve it is the same as
+        the one of the finest time frame, so data sources with their
+        own data (e.g. a CSV file per time frame) are left as is.
+
+        Args:
+            data_sources: The unique data sources to index.
+            backtest_date_range (BacktestDateRange): The date range for the
+                backtest data providers.
+
+        Returns:
+            List[DataSource]: The data sources that still need to be
+                registered.
+        """
+        index = self.data_provider_index
+        remaining = []
+        groups = defaultdict(list)
+
+        for data_source in data_sources:
+
+            if DataType.OHLCV.equals(data_source.data_type) \
+                    and data_source.time_frame is not None \
+                    and data_source.symbol is not None \
+                    and data_source.market is not None:
+                groups[(data_source.symbol, data_source.market)]\
+                    .append(data_source)
+            else:
+                remaining.append(data_source)
+
+        for group in groups.values():
+            finest = min(
+                group, key=lambda ds: ds.time_frame.amount_of_minutes
+            )
+            targets = [
+                ds for ds in group
+                if can_resample(finest.time_frame, ds.time_frame)
+            ]
+
+            try:
+                template = index._match_backtest_data_provider(
+                    finest, backtest_date_range
+                )
+                targets = [
+                    ds for ds in targets
+                    if index._match_backtest_data_provider(
+                        ds, backtest_date_range
+                    ) is template
+                ]
+            except ImproperlyConfigured:
+                targets = []
+
+            if len(targets) == 0:
+                remaining.extend(group)
+                continue
+
+            # The finest time frame needs enough candles for the
+            # warmup window of every resampled time frame, plus one
+            # candle that may not be complete
+            minutes = finest.time_frame.amount_of_minutes
+            warmup_window = max(
+                [finest.warmup_window or 0] + [
+                    -(-((ds.warmup_window or 0) + 1)
+                      * ds.time_frame.amount_of_minutes // minutes)
+                    for ds in targets
+                ]
+            )
+            source = replace(
+                finest,
+                warmup_window=warmup_window,
+                window_size=None,
+                pandas=False,
+            )
+            resampler = OHLCVResampler(
+                template.copy(source),
+                time_frames=[ds.time_frame for ds in targets],
+            )
+            data_provider = ResampledOHLCVDataProvider(
+                resampler=resampler,
+                symbol=finest.symbol,
+                market=finest.market,
+                time_frame=finest.time_frame,
+            )
+
+            # The finest time frame is served from the same data
+            for data_source in [finest] + targets:
+                index.register_data_source_and_backtest_data_provider(
+                    data_source, data_provider
+                )
+                logger.debug(
+                    "Registered resampled backtest "
+                    f"data provider for data source: {data_source}"
+                )
+
+            remaining.extend(
+                ds for ds in group
+                if ds is not finest and not any(ds is t for t in targets)
+            )
+
+        return remaining
+
     def prepare_backtest_data(
         self,
         backtest_date_range: BacktestDateRange,
@@ -1021,6 +1271,139 @@ class DataProviderService:
                         f"Error preparing backtest data for {data_source}: {e}"
                     )
 
+    def prefetch_data(
+        self,
+        data_sources: List[DataSource],
+        backtest_date_range: BacktestDateRange,
+        max_workers: int = 4,
+        show_progress: bool = True,
+    ) -> List[DataPrefetchResult]:
+        """
+        Download and cache the backtest data of many data sources in
+        parallel, e.g. before running a large sweep over a universe of
+        symbols.
+
+        The OHLCV data sources are deduplicated by
+        (symbol, market, time_frame), keeping the largest warmup window.
+        Each unique data source gets a data provider as in
+        :meth:`index_backtest_data_providers` (without registering it),
+        whose backtest data is prepared in one of ``max_workers``
+        threads. Data providers that download their data share the rate
+        limit of their market (see CCXTOHLCVDataProvider.get_exchange).
+
+        A data source that fails does not stop the other ones, its
+        error is reported in its result.
+
+        Args:
+            data_sources (List[DataSource]): The data sources to prefetch.
+            backtest_date_range (BacktestDateRange): The date range of
+                the backtests the data is prefetched for.
+            max_workers (int): The number of data sources that are
+                prefetched at the same time.
+            show_progress (bool): Whether to show a progress bar with the
+                last prefetched data source and its throughput.
+
+        Returns:
+            List[DataPrefetchResult]: The result of every unique data
+                source, in the order of the given data sources.
+        """
+        unique_data_sources = {}
+
+        for data_source in data_sources:
+
+            if not DataType.OHLCV.equals(data_source.data_type):
+                continue
+
+            key = (
+                data_source.symbol.upper() if data_source.symbol else None,
+                data_source.market.upper() if data_source.market else None,
+                data_source.time_frame,
+            )
+            existing = unique_data_sources.get(key)
+
+            if existing is None or (data_source.warmup_window or 0) > \
+                    (existing.warmup_window or 0):
+                unique_data_sources[key] = data_source
+
+        config = self.configuration_service.get_config() \
+            if self.configuration_service is not None else None
+
+        def prefetch(data_source):
+            started_at = time.perf_counter()
+
+            try:
+                data_provider = self.data_provider_index\
+                    .find_backtest_data_provider(
+                        data_source, backtest_date_range
+                    )
+
+                if config is not None:
+                    data_provider.config = config
+
+                data_provider.prepare_backtest_data(
+                    backtest_start_date=backtest_date_range.start_date,
+                    backtest_end_date=backtest_date_range.end_date,
+                )
+                data = getattr(data_provider, "data", None)
+                return DataPrefetchResult(
+                    data_source=data_source,
+                    number_of_rows=len(data) if data is not None else 0,
+                    duration=time.perf_counter() - started_at,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error prefetching data for {data_source}: {e}"
+                )
+                return DataPrefetchResult(
+                    data_source=data_source,
+                    duration=time.perf_counter() - started_at,
+                    error=str(e),
+                )
+
+        results = {}
+        started_at = time.perf_counter()
+        progress = tqdm(
+            total=len(unique_data_sources),
+            desc="Prefetching data",
+            colour="green",
+            disable=not show_progress,
+        )
+
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            futures = {
+                executor.submit(prefetch, data_source): key
+                for key, data_source in unique_data_sources.items()
+            }
+
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                logger.info(
+                    f"Prefetched {result.number_of_rows} rows for "
+                    f"{result.data_source.get_identifier()} in "
+                    f"{result.duration:.1f}s "
+                    f"({result.rows_per_second:.0f} rows/s)"
+                )
+                progress.set_postfix_str(
+                    f"{result.data_source.get_identifier()}: "
+                    + (
+                        f"{result.rows_per_second:.0f} rows/s"
+                        if result.succeeded else "failed"
+                    )
+                )
+                progress.update(1)
+
+        progress.close()
+        number_of_rows = sum(
+            result.number_of_rows for result in results.values()
+        )
+        duration = time.perf_counter() - started_at
+        logger.info(
+            f"Prefetched {number_of_rows} rows for {len(results)} "
+            f"data sources in {duration:.1f}s"
+        )
+        return [results[key] for key in unique_data_sources]
+
     def get_data_files(self):
         """
         Function to get the data files for the market data sources.
@@ -1052,6 +1435,7 @@ class DataProviderService:
         lookup index.
         """
         self.data_provider_index.reset()
+        self._price_indexes = {}
         self.backtest_mode = False
 
     def copy(self):
@@ -1069,3 +1453,72 @@ class DataProviderService:
         new_service.data_provider_index = self.data_provider_index
         new_service.backtest_mode = self.backtest_mode
         return new_service
+
+    def share_ohlcv_data(self, directory: str) -> int:
+        """
+        Move the data frames of all registered data providers into
+        memory-mapped Arrow IPC files in the given directory.
+
+        Pickled copies of the data providers (e.g. the ones sent to
+        ``ProcessPoolExecutor`` workers) then reference these files
+        instead of carrying their own copy of the data, so all
+        worker processes share the same pages through the OS page
+        cache.
+
+        Args:
+            directory (str): The directory to write the shared files to.
+
+        Returns:
+            int: The number of data providers whose data is shared.
+        """
+        providers = {
+            id(provider): provider for provider
+            in self.data_provider_index.data_providers_lookup.values()
+        }
+        shared = 0
+
+        for number, provider in enumerate(providers.values()):
+            path = os.path.join(directory, f"data_provider_{number}.arrow")
+
+            if provider.share_data(path):
+                shared += 1
+
+        return shared
+
+    def unshare_ohlcv_data(self):
+        """
+        Load the data of all data providers shared with
+        :meth:`share_ohlcv_data` back into process memory.
+        """
+        for provider in \
+                self.data_provider_index.data_providers_lookup.values():
+            provider.unshare_data()
+
+    @contextmanager
+    def shared_ohlcv_data(self, directory: Optional[str] = None):
+        """
+        Context manager that shares the data of all registered data
+        providers through memory-mapped files for the duration of the
+        block, see :meth:`share_ohlcv_data`. The files are removed
+        when the block exits.
+
+        Args:
+            directory (str, optional): The directory for the shared
+                files. Defaults to a new temporary directory.
+
+        Yields:
+            DataProviderService: This service.
+        """
+        owns_directory = directory is None
+
+        if owns_directory:
+            directory = tempfile.mkdtemp(prefix="iaf_ohlcv_")
+
+        try:
+            self.share_ohlcv_data(directory)
+            yield self
+        finally:
+            self.unshare_ohlcv_data()
+
+            if owns_directory:
+                shutil.rmtree(directory, ignore_errors=True)
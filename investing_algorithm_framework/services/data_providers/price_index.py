@@ -0,0 +1,97 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+import numpy as np
+import polars as pl
+
+
+def _to_milliseconds(date: datetime) -> int:
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return int(date.timestamp() * 1000)
+
+
+class PriceIndex:
+    """
+    Price-at-time index of OHLCV data, used to look up the candle of a
+    backtest index date without materialising a DataFrame.
+
+    The index keeps the sorted timestamps of the data as an int64 array
+    and the prices as numpy arrays. A lookup is a binary search for the
+    last candle of the backtest data the OHLCV data providers return for
+    a date: the first candle at or after the date for providers with a
+    warmup window, the last candle at or before it otherwise.
+
+    Attributes:
+        data (pl.DataFrame): The OHLCV data the index is built from.
+    """
+    columns = {"Datetime", "Open", "High", "Low", "Close"}
+
+    def __init__(self, data: pl.DataFrame):
+        """
+        Args:
+            data (pl.DataFrame): The OHLCV data, with a Datetime, Open,
+                High, Low and Close column.
+        """
+        self.data = data
+
+        if not data["Datetime"].is_sorted():
+            data = data.sort("Datetime")
+
+        self._datetimes = data["Datetime"]
+        self._timestamps = self._datetimes.dt.epoch("ms").to_numpy()
+        self._open = data["Open"].to_numpy()
+        self._high = data["High"].to_numpy()
+        self._low = data["Low"].to_numpy()
+        self._close = data["Close"].to_numpy()
+
+    def __len__(self):
+        return len(self._timestamps)
+
+    def get(
+        self,
+        symbol: str,
+        market: str,
+        date: datetime,
+        at_or_before: bool = False,
+    ) -> Optional[dict]:
+        """
+        Get the ticker of the first candle at or after the given date.
+
+        Args:
+            symbol (str): The symbol of the ticker.
+            market (str): The market of the ticker.
+            date (datetime): The date to look up.
+            at_or_before (bool): If True, get the ticker of the last
+                candle at or before the date instead.
+
+        Returns:
+            dict: The ticker, or None if there is no such candle.
+        """
+        timestamp = _to_milliseconds(date)
+
+        if at_or_before:
+            position = int(
+                np.searchsorted(self._timestamps, timestamp, side="right")
+            ) - 1
+        else:
+            position = int(np.searchsorted(self._timestamps, timestamp))
+
+        if position < 0 or position == len(self._timestamps):
+            return None
+
+        close = self._close[position].item()
+        return {
+            "symbol": symbol,
+            "market": market,
+            "datetime": self._datetimes[position],
+            "open": self._open[position].item(),
+            "high": self._high[position].item(),
+            "low": self._low[position].item(),
+            "close": close,
+            "volume": close,
+            "ask": close,
+            "bid": close,
+        }
@@ -0,0 +1,418 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from investing_algorithm_framework.domain import DataProvider, \
+    OperationalException, DataSource, DataType, TimeFrame
+
+MINUTES_PER_DAY = 1440
+
+
+def _to_milliseconds(date: datetime) -> int:
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return int(date.timestamp() * 1000)
+
+
+def can_resample(source_time_frame, target_time_frame) -> bool:
+    """
+    Check if the OHLCV data of a time frame can be aggregated into the
+    candles of another time frame.
+
+    The target time frame must be a multiple of the source time frame
+    and its candles must start at the same times as the candles of
+    exchanges, which only holds for time frames that divide a day
+    (the candles are aligned to the UTC epoch).
+
+    Args:
+        source_time_frame: The time frame of the source data.
+        target_time_frame: The time frame to aggregate into.
+
+    Returns:
+        bool: True if the target time frame can be resampled from
+            the source time frame.
+    """
+    source_minutes = TimeFrame.from_value(source_time_frame)\
+        .amount_of_minutes
+    target_minutes = TimeFrame.from_value(target_time_frame)\
+        .amount_of_minutes
+    return target_minutes > source_minutes \
+        and target_minutes % source_minutes == 0 \
+        and MINUTES_PER_DAY % target_minutes == 0
+
+
+class OHLCVResampler:
+    """
+    Aggregates the OHLCV data of a data provider into coarser time
+    frames.
+
+    The backtest data of the data provider is prepared once per
+    backtest date range and every time frame is resampled from it at
+    most once, with ``group_by_dynamic``. The resampler is shared by
+    the ResampledOHLCVDataProvider instances of a symbol and is safe
+    to use from multiple threads.
+
+    Attributes:
+        data_provider (DataProvider): The data provider of the finest
+            time frame, whose data is aggregated.
+        time_frames (List[TimeFrame]): The time frames that are
+            resampled from the data provider.
+    """
+
+    def __init__(self, data_provider: DataProvider, time_frames: List):
+        """
+        Args:
+            data_provider (DataProvider): The data provider of the finest
+                time frame.
+            time_frames (List): The time frames that are resampled
+                from the data provider.
+        """
+        self.data_provider = data_provider
+        self.time_frames = [
+            TimeFrame.from_value(time_frame) for time_frame in time_frames
+        ]
+        self._prepared_range = None
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def prepare(
+        self,
+        backtest_start_date: datetime,
+        backtest_end_date: datetime,
+        fill_missing_data: bool = False,
+    ) -> None:
+        """
+        Prepare the backtest data of the data provider, if it is not
+        prepared for the given date range yet.
+
+        The data is prepared up to the end of the last candle of the
+        coarsest time frame, so that the candle that opens at the
+        backtest end date is complete.
+
+        Args:
+            backtest_start_date (datetime): The start date of the backtest.
+            backtest_end_date (datetime): The end date of the backtest.
+            fill_missing_data (bool): If True, missing time series data
+                entries will be filled automatically.
+
+        Returns:
+            None
+        """
+        prepared_range = (backtest_start_date, backtest_end_date)
+
+        with self._lock:
+
+            if self._prepared_range == prepared_range:
+                return
+
+            source_minutes = TimeFrame.from_value(
+                self.data_provider.time_frame
+            ).amount_of_minutes
+            extension = max(
+                time_frame.amount_of_minutes for time_frame in self.time_frames
+            ) - source_minutes
+            self.data_provider.prepare_backtest_data(
+                backtest_start_date=backtest_start_date,
+                backtest_end_date=backtest_end_date + timedelta(
+                    minutes=extension
+                ),
+                fill_missing_data=fill_missing_data,
+            )
+            self._cache = {}
+            self._prepared_range = prepared_range
+
+    def resample(self, time_frame) -> pl.DataFrame:
+        """
+        Get the OHLCV data of the data provider aggregated into the
+        candles of the given time frame.
+
+        A candle holds the first open, highest high, lowest low, last
+        close and total volume of the source candles within it and is
+        labeled with its open time. Candles that are not fully covered
+        by the source data are dropped.
+
+        Args:
+            time_frame: The time frame to aggregate into.
+
+        Raises:
+            OperationalException: If the data is not prepared.
+
+        Returns:
+            pl.DataFrame: The resampled OHLCV data.
+        """
+        time_frame = TimeFrame.from_value(time_frame)
+
+        with self._lock:
+
+            if time_frame in self._cache:
+                return self._cache[time_frame]
+
+            source = getattr(self.data_provider, "data", None)
+
+            if self._prepared_range is None or source is None:
+                raise OperationalException(
+                    "The OHLCV data is not prepared. Please call prepare "
+                    "before resampling the data."
+                )
+
+            if isinstance(source, pd.DataFrame):
+                source = pl.from_pandas(source.reset_index())
+
+            source_minutes = TimeFrame.from_value(
+                self.data_provider.time_frame
+            ).amount_of_minutes
+            minutes = time_frame.amount_of_minutes
+
+            if minutes == source_minutes:
+                data = source.sort("Datetime")
+                self._cache[time_frame] = data
+                return data
+
+            data = source.sort("Datetime").group_by_dynamic(
+                "Datetime",
+                every=f"{minutes}m",
+                closed="left",
+                label="left",
+            ).agg(
+                pl.col("Open").first(),
+                pl.col("High").max(),
+                pl.col("Low").min(),
+                pl.col("Close").last(),
+                pl.col("Volume").sum(),
+            )
+
+            if len(source) > 0:
+                first = source["Datetime"].min()
+                last = source["Datetime"].max() \
+                    + timedelta(minutes=source_minutes)
+                data = data.filter(
+                    (pl.col("Datetime") >= first) &
+                    (
+                        pl.col("Datetime") + timedelta(minutes=minutes)
+                        <= last
+                    )
+                )
+
+            self._cache[time_frame] = data
+            return data
+
+
+class ResampledOHLCVDataProvider(DataProvider):
+    """
+    Backtest data provider that serves the OHLCV data of a time frame
+    by resampling the data of a finer time frame of the same symbol,
+    see OHLCVResampler.
+
+    The provider mirrors the backtest behaviour of the
+    CCXTOHLCVDataProvider: a backtest index date gets the window of
+    the first candle at or after it, looked up with a binary search.
+    It only serves backtest data.
+
+    Attributes:
+        resampler (OHLCVResampler): The resampler the data is taken from.
+        data (pl.DataFrame): The resampled data of the backtest.
+        pandas (bool): If True, the data is returned as a pandas
+            DataFrame.
+    """
+    data_type = DataType.OHLCV
+    data_provider_identifier = "resampled_ohlcv_data_provider"
+
+    def __init__(
+        self,
+        resampler: OHLCVResampler,
+        symbol: str,
+        market: str,
+        time_frame,
+        window_size: int = None,
+        pandas: bool = False,
+    ):
+        super().__init__(
+            symbol=symbol,
+            market=market,
+            time_frame=time_frame,
+            window_size=window_size,
+        )
+        self.resampler = resampler
+        self.pandas = pandas
+        self.data = None
+        self._timestamps = None
+        self._start_date_data_source = None
+        self._end_date_data_source = None
+        self.missing_data_point_dates = []
+
+    def has_data(
+        self,
+        data_source: DataSource,
+        start_date: datetime = None,
+        end_date: datetime = None,
+    ) -> bool:
+        return DataType.OHLCV.equals(data_source.data_type) \
+            and data_source.symbol == self.symbol \
+            and data_source.market == self.market \
+            and data_source.time_frame == self.time_frame
+
+    def get_data(
+        self,
+        date: datetime = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        save: bool = False,
+    ):
+        raise OperationalException(
+            "Resampled OHLCV data is only available in backtests."
+        )
+
+    def prepare_backtest_data(
+        self,
+        backtest_start_date,
+        backtest_end_date,
+        fill_missing_data: bool = False,
+        show_progress: bool = False,
+    ) -> None:
+        self.resampler.prepare(
+            backtest_start_date, backtest_end_date, fill_missing_data
+        )
+        # Candles after the end date are only there to complete the
+        # candles of coarser time frames
+        self.data = self.resampler.resample(self.time_frame).filter(
+            pl.col("Datetime") <= backtest_end_date
+        )
+
+        if len(self.data) == 0:
+            raise OperationalException(
+                f"No data available for {self.symbol} in the date range "
+                f"{backtest_start_date} - {backtest_end_date}."
+            )
+
+        self._timestamps = self.data["Datetime"].dt.epoch("ms").to_numpy()
+        self._start_date_data_source = self.data["Datetime"].min()
+        self._end_date_data_source = self.data["Datetime"].max()
+        minutes = self.time_frame.amount_of_minutes
+        required_start_date = backtest_start_date
+
+        if self.window_size is not None:
+            required_start_date = backtest_start_date - timedelta(
+                minutes=minutes * self.window_size
+            )
+
+        expected_dates = pl.datetime_range(
+            start=required_start_date,
+            end=backtest_end_date,
+            interval=f"{minutes}m",
+            eager=True
+        ).to_list()
+        self.missing_data_point_dates = sorted(
+            set(expected_dates) - set(self.data["Datetime"].to_list())
+        )
+
+    def get_backtest_data(
+        self,
+        backtest_index_date: datetime,
+        backtest_start_date: datetime = None,
+        backtest_end_date: datetime = None,
+        data_source: DataSource = None,
+    ) -> Union[pl.DataFrame, pd.DataFrame]:
+        identifier = data_source.identifier \
+            if data_source is not None else self.symbol
+
+        if self.data is None:
+            raise OperationalException(
+                f"No OHLCV data available for data source {identifier}. "
+                "Data has not been prepared."
+            )
+
+        if backtest_start_date is not None and \
+                backtest_end_date is not None:
+
+            if backtest_start_date < self._start_date_data_source or \
+                    backtest_end_date > self._end_date_data_source:
+                raise OperationalException(
+                    f"Request data range {backtest_start_date} - "
+                    f"{backtest_end_date} is outside the range of the "
+                    f"available data {self._start_date_data_source} - "
+                    f"{self._end_date_data_source} for data source "
+                    f"{identifier}."
+                )
+
+            data = self.data.filter(
+                (pl.col("Datetime") >= backtest_start_date) &
+                (pl.col("Datetime") <= backtest_end_date)
+            )
+        elif self.window_size is not None:
+            # The window of the first candle at or after the index date
+            position = np.searchsorted(
+                self._timestamps, _to_milliseconds(backtest_index_date)
+            )
+
+            if position == len(self._timestamps):
+                raise OperationalException(
+                    "No OHLCV data available for the "
+                    f"date: {backtest_index_date} "
+                    "within the prepared backtest data "
+                    f"for data source {identifier}. "
+                )
+
+            window = self.window_size * self.time_frame.amount_of_minutes \
+                * 60 * 1000
+            start = np.searchsorted(
+                self._timestamps, self._timestamps[position] - window
+            )
+            data = self.data.slice(int(start), int(position - start + 1))
+        else:
+            stop = np.searchsorted(
+                self._timestamps,
+                _to_milliseconds(backtest_index_date),
+                side="right"
+            )
+
+            if stop == 0:
+                raise OperationalException(
+                    "No OHLCV data available for the "
+                    f"date: {backtest_index_date} "
+                    f"for data source {identifier}. "
+                    f"Data starts at {self._start_date_data_source}."
+                )
+
+            data = self.data.slice(0, int(stop))
+
+        if self.pandas:
+            data = self.convert_to_pandas(data)
+
+        return data
+
+    def copy(self, data_source: DataSource) -> "ResampledOHLCVDataProvider":
+        return ResampledOHLCVDataProvider(
+            resampler=self.resampler,
+            symbol=data_source.symbol,
+            market=data_source.market,
+            time_frame=data_source.time_frame,
+            window_size=data_source.window_size,
+            pandas=data_source.pandas,
+        )
+
+    def get_number_of_data_points(
+        self, start_date: datetime, end_date: datetime
+    ) -> int:
+        return int(
+            np.searchsorted(
+                self._timestamps, _to_milliseconds(end_date), side="right"
+            ) - np.searchsorted(self._timestamps, _to_milliseconds(start_date))
+        )
+
+    def get_missing_data_dates(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[datetime]:
+        return [
+            date for date in self.missing_data_point_dates
+            if start_date <= date <= end_date
+        ]
+
+    def get_data_source_file_path(self) -> Union[str, None]:
+        # Resampled data is kept in memory only
+        return None
@@ -0,0 +1,90 @@
+"""Columnar access to trades for the trade metric functions.
+
+The trade metrics accept either a list of :class:`Trade` objects or the
+:class:`TradeLedger` of a vector backtest. :func:`trade_columns` returns
+the requested fields as NumPy arrays for both, so the metrics only deal
+with arrays: a ledger hands out its columns without building any
+domain objects, a list is scanned once per requested field.
+
+Datetime fields (``opened_at`` / ``closed_at``) are returned as seconds
+since the epoch, NaN where the value is ``None``. Naive datetimes are
+read as UTC.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import numpy as np
+
+from investing_algorithm_framework.domain import TradeStatus
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+_BOOLEAN_COLUMNS = ("closed", "open", "is_short")
+_DATETIME_COLUMNS = ("opened_at", "closed_at")
+
+
+def to_seconds(value) -> float:
+    """Return a datetime as seconds since the epoch, NaN for ``None``."""
+    if value is None:
+        return np.nan
+
+    epoch = _EPOCH if value.tzinfo is None else _EPOCH_UTC
+    return (value - epoch).total_seconds()
+
+
+def _value(trade, name):
+    if name == "closed":
+        return TradeStatus.CLOSED.equals(trade.status)
+
+    if name == "open":
+        return TradeStatus.OPEN.equals(trade.status)
+
+    if name == "is_short":
+        return bool(getattr(trade, "is_short", False))
+
+    value = getattr(trade, name)
+
+    if name in _DATETIME_COLUMNS:
+        return to_seconds(value)
+
+    return np.nan if value is None else value
+
+
+def trade_columns(trades, *names):
+    """Return the given trade fields as NumPy arrays.
+
+    Besides plain ``Trade`` attributes, ``closed`` / ``open`` give the
+    trade status as boolean masks.
+
+    Args:
+        trades: A list of trades or a ``TradeLedger``.
+        *names: The fields to return.
+
+    Returns:
+        One array per name, or the array itself for a single name.
+    """
+    if hasattr(trades, "column"):
+        columns = [trades.column(name) for name in names]
+    else:
+        trades = trades or []
+        columns = [
+            np.array(
+                [_value(trade, name) for trade in trades],
+                dtype=bool if name in _BOOLEAN_COLUMNS else np.float64,
+            )
+            for name in names
+        ]
+
+    return columns[0] if len(columns) == 1 else tuple(columns)
+
+
+def longest_run(flags) -> int:
+    """Return the length of the longest run of ``True`` in ``flags``."""
+    if not flags.any():
+        return 0
+
+    edges = np.flatnonzero(
+        np.diff(np.concatenate(([0], flags.astype(np.int8), [0])))
+    )
+    return int((edges[1::2] - edges[0::2]).max())
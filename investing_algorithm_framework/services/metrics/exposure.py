@@ -6,11 +6,15 @@ Exposure around 1 means capital is nearly fully invested most of the time, but n
 Low exposure (<1) means capital is mostly idle or only partially invested.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List
 
+import numpy as np
+
 from investing_algorithm_framework.domain import Trade
 
+from ._trade_columns import trade_columns, to_seconds
+
 
 def get_exposure_ratio(
     trades: List["Trade"], start_date: datetime, end_date: datetime
@@ -34,39 +38,35 @@ def get_exposure_ratio(
         return 0.0
 
     # Collect trade intervals
-    intervals = []
-    for trade in trades:
-        entry = max(trade.opened_at, start_date)
-        exit = min(trade.closed_at or end_date, end_date)
-        if exit > entry:
-            intervals.append((entry, exit))
+    opened_at, closed_at = trade_columns(trades, "opened_at", "closed_at")
+    start, end = to_seconds(start_date), to_seconds(end_date)
+    entry = np.maximum(opened_at, start)
+    exit = np.minimum(np.where(np.isnan(closed_at), end, closed_at), end)
+    keep = exit > entry
 
-    if not intervals:
+    if not keep.any():
         return 0.0
 
     # Sort intervals by start time
-    intervals.sort(key=lambda x: x[0])
-
-    # Merge overlapping intervals
-    merged = []
-    current_start, current_end = intervals[0]
-    for start, end in intervals[1:]:
-        if start <= current_end:  # overlap
-            current_end = max(current_end, end)
-        else:
-            merged.append((current_start, current_end))
-            current_start, current_end = start, end
-    merged.append((current_start, current_end))
+    order = np.argsort(entry[keep], kind="stable")
+    entry, exit = entry[keep][order], exit[keep][order]
+
+    # Merge overlapping intervals: a new block starts wherever an
+    # interval begins after every earlier interval has ended
+    reach = np.maximum.accumulate(exit)
+    first = np.flatnonzero(
+        np.concatenate(([True], entry[1:] > reach[:-1]))
+    )
+    last = np.append(first[1:] - 1, len(entry) - 1)
 
     # Total time with at least one open trade
-    total_exposed_time = sum((end - start for start, end in merged), timedelta(0))
+    total_exposed_time = float((reach[last] - entry[first]).sum())
 
     backtest_duration = end_date - start_date
     if backtest_duration.total_seconds() == 0:
         return 0.0
 
-    return total_exposed_time.total_seconds() \
-        / backtest_duration.total_seconds()
+    return total_exposed_time / backtest_duration.total_seconds()
 
 
 def get_cumulative_exposure(
@@ -94,21 +94,17 @@ def get_cumulative_exposure(
     if not trades:
         return 0.0
 
-    total_trade_duration = timedelta(0)
-    for trade in trades:
-        entry = trade.opened_at
-        exit = trade.closed_at or end_date  # open trades counted up to end
-
-        if exit > entry:
-            total_trade_duration += exit - entry
-
+    entry, exit = trade_columns(trades, "opened_at", "closed_at")
+    # Open trades counted up to end
+    exit = np.where(np.isnan(exit), to_seconds(end_date), exit)
+    duration = exit - entry
+    total_trade_duration = float(duration[duration > 0].sum())
     backtest_duration = end_date - start_date
 
     if backtest_duration.total_seconds() == 0:
         return 0.0
 
-    return (total_trade_duration.total_seconds()
-            / backtest_duration.total_seconds())
+    return total_trade_duration / backtest_duration.total_seconds()
 
 
 def get_average_trade_duration(trades: List[Trade]):
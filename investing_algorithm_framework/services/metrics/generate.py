@@ -695,6 +695,9 @@ def create_backtest_metrics(
         backtest_window=backtest_run.backtest_window,
         initial_unallocated=backtest_run.initial_unallocated or 0.0,
     )
+    # Vector backtests keep their trades in a columnar ledger that the
+    # trade metrics read directly, without building Trade objects.
+    trades = backtest_run.get_trade_source()
 
     def safe_set(metric_name, func, *args, index=None):
         if metric_name in metrics:
@@ -738,7 +741,7 @@ def create_backtest_metrics(
             # always 0 otherwise. ``total_loss_percentage`` is the gross
             # loss expressed as a fraction of the initial unallocated
             # capital (decimal, e.g. ``0.05`` for a 5% loss magnitude).
-            gross_loss_value = get_gross_loss(backtest_run.trades)
+            gross_loss_value = get_gross_loss(trades)
             initial_value = backtest_run.initial_unallocated or 0.0
 
             if "total_loss" in metrics:
@@ -756,7 +759,7 @@ def create_backtest_metrics(
     if ("average_trade_return" in metrics
             or "average_trade_return_percentage" in metrics):
         try:
-            avg_return = get_average_trade_return(backtest_run.trades)
+            avg_return = get_average_trade_return(trades)
             if "average_trade_return" in metrics:
                 backtest_metrics.average_trade_return = avg_return[0]
             if "average_trade_return_percentage" in metrics:
@@ -768,7 +771,7 @@ def create_backtest_metrics(
     if ("average_trade_gain" in metrics
             or "average_trade_gain_percentage" in metrics):
         try:
-            avg_gain = get_average_trade_gain(backtest_run.trades)
+            avg_gain = get_average_trade_gain(trades)
             if "average_trade_gain" in metrics:
                 backtest_metrics.average_trade_gain = avg_gain[0]
             if "average_trade_gain_percentage" in metrics:
@@ -779,7 +782,7 @@ def create_backtest_metrics(
     if ("average_trade_loss" in metrics
             or "average_trade_loss_percentage" in metrics):
         try:
-            avg_loss = get_average_trade_loss(backtest_run.trades)
+            avg_loss = get_average_trade_loss(trades)
             if "average_trade_loss" in metrics:
                 backtest_metrics.average_trade_loss = avg_loss[0]
             if "average_trade_loss_percentage" in metrics:
@@ -791,7 +794,7 @@ def create_backtest_metrics(
             or "get_current_average_trade_gain_percentage" in metrics):
         try:
             current_avg_gain = get_current_average_trade_gain(
-                backtest_run.trades
+                trades
             )
 
             if "current_average_trade_gain" in metrics:
@@ -808,7 +811,7 @@ def create_backtest_metrics(
             or "current_average_trade_return_percentage" in metrics):
         try:
             current_avg_return = get_current_average_trade_return(
-                backtest_run.trades
+                trades
             )
 
             if "current_average_trade_return" in metrics:
@@ -823,7 +826,7 @@ def create_backtest_metrics(
     if "current_average_trade_duration" in metrics:
         try:
             current_avg_duration = get_current_average_trade_duration(
-                backtest_run.trades, backtest_run
+                trades, backtest_run
             )
             backtest_metrics.current_average_trade_duration = \
                 current_avg_duration
@@ -834,7 +837,7 @@ def create_backtest_metrics(
             or "current_average_trade_loss_percentage" in metrics):
         try:
             current_avg_loss = get_current_average_trade_loss(
-                backtest_run.trades
+                trades
             )
             if "current_average_trade_loss" in metrics:
                 backtest_metrics.current_average_trade_loss = \
@@ -845,29 +848,29 @@ def create_backtest_metrics(
         except OperationalException as e:
             logger.warning(f"current_average_trade_loss failed: {e}")
 
-    safe_set("number_of_positive_trades", get_positive_trades, backtest_run.trades, index=0)
-    safe_set("percentage_positive_trades", get_positive_trades, backtest_run.trades, index=1)
-    safe_set("number_of_negative_trades", get_negative_trades, backtest_run.trades, index=0)
-    safe_set("percentage_negative_trades", get_negative_trades, backtest_run.trades, index=1)
-    safe_set("median_trade_return", get_median_trade_return, backtest_run.trades, index=0)
-    safe_set("median_trade_return_percentage", get_median_trade_return, backtest_run.trades, index=1)
-    safe_set("number_of_trades", get_number_of_trades, backtest_run.trades)
-    safe_set("number_of_trades_closed", get_number_of_closed_trades, backtest_run.trades)
-    safe_set("number_of_trades_opened", get_number_of_open_trades, backtest_run.trades)
+    safe_set("number_of_positive_trades", get_positive_trades, trades, index=0)
+    safe_set("percentage_positive_trades", get_positive_trades, trades, index=1)
+    safe_set("number_of_negative_trades", get_negative_trades, trades, index=0)
+    safe_set("percentage_negative_trades", get_negative_trades, trades, index=1)
+    safe_set("median_trade_return", get_median_trade_return, trades, index=0)
+    safe_set("median_trade_return_percentage", get_median_trade_return, trades, index=1)
+    safe_set("number_of_trades", get_number_of_trades, trades)
+    safe_set("number_of_trades_closed", get_number_of_closed_trades, trades)
+    safe_set("number_of_trades_opened", get_number_of_open_trades, trades)
     directional_statistics = get_directional_trade_statistics(
-        backtest_run.trades
+        trades
     )
     for metric_name, value in directional_statistics.items():
         if metric_name in metrics:
             setattr(backtest_metrics, metric_name, value)
-    mae_mfe_statistics = get_trade_mae_mfe_statistics(backtest_run.trades)
+    mae_mfe_statistics = get_trade_mae_mfe_statistics(trades)
     for metric_name, value in mae_mfe_statistics.items():
         if metric_name in metrics:
             setattr(backtest_metrics, metric_name, value)
-    safe_set("average_trade_duration", get_average_trade_duration, backtest_run.trades)
-    safe_set("average_win_duration", get_average_win_duration, backtest_run.trades)
-    safe_set("average_loss_duration", get_average_loss_duration, backtest_run.trades)
-    safe_set("average_trade_size", get_average_trade_size, backtest_run.trades)
+    safe_set("average_trade_duration", get_average_trade_duration, trades)
+    safe_set("average_win_duration", get_average_win_duration, trades)
+    safe_set("average_loss_duration", get_average_loss_duration, trades)
+    safe_set("average_trade_size", get_average_trade_size, trades)
     safe_set("equity_curve", get_equity_curve, backtest_run.portfolio_snapshots)
     safe_set("final_value", get_final_value, backtest_run.portfolio_snapshots)
     safe_set("cagr", get_cagr, backtest_run.portfolio_snapshots)
@@ -875,7 +878,7 @@ def create_backtest_metrics(
     safe_set("rolling_sharpe_ratio", get_rolling_sharpe_ratio, backtest_run.portfolio_snapshots, risk_free_rate)
     safe_set("sortino_ratio", get_sortino_ratio, backtest_run.portfolio_snapshots, risk_free_rate)
     safe_set("omega_ratio", get_omega_ratio, backtest_run.portfolio_snapshots)
-    safe_set("profit_factor", get_profit_factor, backtest_run.trades)
+    safe_set("profit_factor", get_profit_factor, trades)
     safe_set("calmar_ratio", get_calmar_ratio, backtest_run.portfolio_snapshots)
     safe_set("annual_volatility", get_annual_volatility, backtest_run.portfolio_snapshots)
     safe_set("monthly_returns", get_monthly_returns, backtest_run.portfolio_snapshots)
@@ -890,18 +893,18 @@ def create_backtest_metrics(
     safe_set("twr_drawdown_series", get_twr_drawdown_series, backtest_run.portfolio_snapshots)
     safe_set("twr_max_drawdown", get_twr_max_drawdown, backtest_run.portfolio_snapshots)
     safe_set("twr_max_drawdown_duration", get_twr_max_drawdown_duration, backtest_run.portfolio_snapshots)
-    safe_set("trades_per_year", get_trades_per_year, backtest_run.trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
-    safe_set("trades_per_week", get_trades_per_week, backtest_run.trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
-    safe_set("trades_per_month", get_trades_per_month, backtest_run.trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
-    safe_set("trades_per_day", get_trades_per_day, backtest_run.trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
-    safe_set("exposure_ratio", get_exposure_ratio, backtest_run.trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
-    safe_set("cumulative_exposure", get_cumulative_exposure, backtest_run.trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
-    safe_set("best_trade", get_best_trade, backtest_run.trades)
-    safe_set("worst_trade", get_worst_trade, backtest_run.trades)
-    safe_set("win_rate", get_win_rate, backtest_run.trades)
-    safe_set("current_win_rate", get_current_win_rate, backtest_run.trades)
-    safe_set("win_loss_ratio", get_win_loss_ratio, backtest_run.trades)
-    safe_set("current_win_loss_ratio", get_current_win_loss_ratio, backtest_run.trades)
+    safe_set("trades_per_year", get_trades_per_year, trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
+    safe_set("trades_per_week", get_trades_per_week, trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
+    safe_set("trades_per_month", get_trades_per_month, trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
+    safe_set("trades_per_day", get_trades_per_day, trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
+    safe_set("exposure_ratio", get_exposure_ratio, trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
+    safe_set("cumulative_exposure", get_cumulative_exposure, trades, backtest_run.backtest_start_date, backtest_run.backtest_end_date)
+    safe_set("best_trade", get_best_trade, trades)
+    safe_set("worst_trade", get_worst_trade, trades)
+    safe_set("win_rate", get_win_rate, trades)
+    safe_set("current_win_rate", get_current_win_rate, trades)
+    safe_set("win_loss_ratio", get_win_loss_ratio, trades)
+    safe_set("current_win_loss_ratio", get_current_win_loss_ratio, trades)
     safe_set("percentage_winning_months", get_percentage_winning_months, backtest_run.portfolio_snapshots)
     safe_set("percentage_winning_years", get_percentage_winning_years, backtest_run.portfolio_snapshots)
     safe_set("average_monthly_return", get_average_monthly_return, backtest_run.portfolio_snapshots)
@@ -911,12 +914,12 @@ def create_backtest_metrics(
     safe_set("best_year", get_best_year, backtest_run.portfolio_snapshots)
     safe_set("worst_month", get_worst_month, backtest_run.portfolio_snapshots)
     safe_set("worst_year", get_worst_year, backtest_run.portfolio_snapshots)
-    safe_set("gross_loss", get_gross_loss, backtest_run.trades)
-    safe_set("gross_profit", get_gross_profit, backtest_run.trades)
+    safe_set("gross_loss", get_gross_loss, trades)
+    safe_set("gross_profit", get_gross_profit, trades)
     safe_set("cumulative_return_series", get_cumulative_return_series, backtest_run.portfolio_snapshots)
     safe_set("cumulative_return", get_cumulative_return, backtest_run.portfolio_snapshots)
     safe_set("var_95", get_value_at_risk, backtest_run.portfolio_snapshots, 0.95)
     safe_set("cvar_95", get_conditional_value_at_risk, backtest_run.portfolio_snapshots, 0.95)
-    safe_set("max_consecutive_wins", get_max_consecutive_wins, backtest_run.trades)
-    safe_set("max_consecutive_losses", get_max_consecutive_losses, backtest_run.trades)
+    safe_set("max_consecutive_wins", get_max_consecutive_wins, trades)
+    safe_set("max_consecutive_losses", get_max_consecutive_losses, trades)
     return backtest_metrics
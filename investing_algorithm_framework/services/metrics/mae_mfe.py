@@ -32,8 +32,12 @@ bar) are excluded since no excursion could be observed.
 """
 from typing import List
 
+import numpy as np
+
 from investing_algorithm_framework.domain import Trade
 
+from ._trade_columns import trade_columns
+
 
 def get_trade_mae_mfe_statistics(trades: List[Trade]) -> dict:
     """
@@ -50,45 +54,35 @@ def get_trade_mae_mfe_statistics(trades: List[Trade]) -> dict:
             - max_mae / max_mfe
             - mfe_mae_ratio
     """
-    maes: List[float] = []
-    mae_percentages: List[float] = []
-    mfes: List[float] = []
-    mfe_percentages: List[float] = []
-
-    for trade in (trades or []):
-        if trade.open_price is None or trade.open_price <= 0:
-            continue
-        if trade.high_water_mark is None or trade.low_water_mark is None:
-            continue
-
-        if trade.is_short:
-            mfe = max(trade.open_price - trade.low_water_mark, 0.0)
-            mae = max(trade.high_water_mark - trade.open_price, 0.0)
-        else:
-            mfe = max(trade.high_water_mark - trade.open_price, 0.0)
-            mae = max(trade.open_price - trade.low_water_mark, 0.0)
-
-        maes.append(mae)
-        mae_percentages.append((mae / trade.open_price) * 100.0)
-        mfes.append(mfe)
-        mfe_percentages.append((mfe / trade.open_price) * 100.0)
+    open_price, high, low, is_short = trade_columns(
+        trades, "open_price", "high_water_mark", "low_water_mark", "is_short"
+    )
+    # NaN marks a missing price, which fails every comparison
+    observed = (open_price > 0) & ~np.isnan(high) & ~np.isnan(low)
+    open_price, high, low, is_short = (
+        open_price[observed], high[observed], low[observed],
+        is_short[observed],
+    )
+    upside = np.maximum(high - open_price, 0.0)
+    downside = np.maximum(open_price - low, 0.0)
+    mfes = np.where(is_short, downside, upside)
+    maes = np.where(is_short, upside, downside)
+    observed = len(maes) > 0
 
-    average_mae = sum(maes) / len(maes) if maes else 0.0
-    average_mfe = sum(mfes) / len(mfes) if mfes else 0.0
+    average_mae = float(maes.mean()) if observed else 0.0
+    average_mfe = float(mfes.mean()) if observed else 0.0
 
     return {
         "average_mae": average_mae,
         "average_mae_percentage": (
-            sum(mae_percentages) / len(mae_percentages)
-            if mae_percentages else 0.0
+            float((maes / open_price * 100.0).mean()) if observed else 0.0
         ),
         "average_mfe": average_mfe,
         "average_mfe_percentage": (
-            sum(mfe_percentages) / len(mfe_percentages)
-            if mfe_percentages else 0.0
+            float((mfes / open_price * 100.0).mean()) if observed else 0.0
         ),
-        "max_mae": max(maes) if maes else 0.0,
-        "max_mfe": max(mfes) if mfes else 0.0,
+        "max_mae": float(maes.max()) if observed else 0.0,
+        "max_mfe": float(mfes.max()) if observed else 0.0,
         "mfe_mae_ratio": (
             average_mfe / average_mae if average_mae > 0 else 0.0
         ),
@@ -16,8 +16,12 @@ from collections import deque
 from datetime import datetime
 from typing import List, Tuple
 
+import numpy as np
+
 from investing_algorithm_framework.domain.models import Trade
 
+from ._trade_columns import trade_columns
+
 
 def get_cumulative_profit_factor_series(
     trades: List[Trade]
@@ -134,12 +138,8 @@ def get_gross_profit(trades: List[Trade]) -> float:
         float: The total gross profit from the trades.
     """
 
-    gross_profit = 0.0
-    for trade in trades:
-        gain = trade.net_gain_absolute
-        if gain > 0:
-            gross_profit += gain
-    return gross_profit
+    gains = trade_columns(trades, "net_gain_absolute")
+    return float(gains[gains > 0].sum())
 
 
 def get_gross_loss(trades: List[Trade]) -> float:
@@ -154,9 +154,5 @@ def get_gross_loss(trades: List[Trade]) -> float:
         float: The total gross loss from the trades.
     """
 
-    gross_loss = 0.0
-    for trade in trades:
-        gain = trade.net_gain_absolute
-        if gain < 0:
-            gross_loss += abs(gain)
-    return gross_loss
+    gains = trade_columns(trades, "net_gain_absolute")
+    return float(np.abs(gains[gains < 0]).sum())
@@ -1,36 +1,31 @@
 from typing import List, Tuple
 
-from investing_algorithm_framework.domain import Trade, TradeStatus, \
-    BacktestRun
+import numpy as np
+
+from investing_algorithm_framework.domain import Trade, BacktestRun
+
+from ._trade_columns import trade_columns, to_seconds, longest_run
 
 
 def get_directional_trade_statistics(trades: List[Trade]) -> dict:
     """Return long/short trade counts and closed-trade win rates."""
     statistics = {}
+    shorts, closed, gains = trade_columns(
+        trades, "is_short", "closed", "net_gain_absolute"
+    )
     for side, is_short in (("long", False), ("short", True)):
-        side_trades = [
-            trade for trade in (trades or [])
-            if bool(getattr(trade, "is_short", False)) is is_short
-        ]
-        closed_trades = [
-            trade for trade in side_trades
-            if TradeStatus.CLOSED.equals(trade.status)
-        ]
-        winning_trades = [
-            trade for trade in closed_trades
-            if trade.net_gain_absolute > 0
-        ]
-        losing_trades = [
-            trade for trade in closed_trades
-            if trade.net_gain_absolute < 0
-        ]
-        statistics[f"number_of_{side}_trades"] = len(side_trades)
-        statistics[f"number_of_{side}_trades_closed"] = len(closed_trades)
-        statistics[f"number_of_winning_{side}_trades"] = len(winning_trades)
-        statistics[f"number_of_losing_{side}_trades"] = len(losing_trades)
+        side_trades = shorts == is_short
+        closed_trades = side_trades & closed
+        number_closed = int(closed_trades.sum())
+        number_winning = int((closed_trades & (gains > 0)).sum())
+        statistics[f"number_of_{side}_trades"] = int(side_trades.sum())
+        statistics[f"number_of_{side}_trades_closed"] = number_closed
+        statistics[f"number_of_winning_{side}_trades"] = number_winning
+        statistics[f"number_of_losing_{side}_trades"] = int(
+            (closed_trades & (gains < 0)).sum()
+        )
         statistics[f"{side}_win_rate"] = (
-            len(winning_trades) / len(closed_trades)
-            if closed_trades else 0.0
+            number_winning / number_closed if number_closed else 0.0
         )
     return statistics
 
@@ -51,17 +46,12 @@ def get_positive_trades(
     if trades is None or len(trades) == 0:
         return 0, 0.0
 
-    closed_trades = [
-        trade for trade in trades if TradeStatus.CLOSED.equals(trade.status)
-    ]
-
-    positive_trades = [
-        trade for trade in closed_trades if trade.net_gain_absolute > 0
-    ]
-    number_of_positive_trades = len(positive_trades)
+    closed, gains = trade_columns(trades, "closed", "net_gain_absolute")
+    number_of_closed_trades = int(closed.sum())
+    number_of_positive_trades = int((closed & (gains > 0)).sum())
     percentage_positive_trades = (
-        (number_of_positive_trades / len(closed_trades)) * 100.0
-        if len(closed_trades) > 0 else 0.0
+        (number_of_positive_trades / number_of_closed_trades) * 100.0
+        if number_of_closed_trades > 0 else 0.0
     )
     return number_of_positive_trades, percentage_positive_trades
 
@@ -82,17 +72,12 @@ def get_negative_trades(
     if trades is None or len(trades) == 0:
         return 0, 0.0
 
-    closed_trades = [
-        trade for trade in trades if TradeStatus.CLOSED.equals(trade.status)
-    ]
-
-    negative_trades = [
-        trade for trade in closed_trades if trade.net_gain_absolute < 0
-    ]
-    number_of_negative_trades = len(negative_trades)
+    closed, gains = trade_columns(trades, "closed", "net_gain_absolute")
+    number_of_closed_trades = int(closed.sum())
+    number_of_negative_trades = int((closed & (gains < 0)).sum())
     percentage_negative_trades = (
-        (number_of_negative_trades / len(closed_trades)) * 100.0
-        if len(closed_trades) > 0 else 0.0
+        (number_of_negative_trades / number_of_closed_trades) * 100.0
+        if number_of_closed_trades > 0 else 0.0
     )
     return number_of_negative_trades, percentage_negative_trades
 
@@ -130,10 +115,7 @@ def get_number_of_open_trades(
     if trades is None:
         return 0
 
-    open_trades = [
-        trade for trade in trades if TradeStatus.OPEN.equals(trade.status)
-    ]
-    return len(open_trades)
+    return int(trade_columns(trades, "open").sum())
 
 
 def get_number_of_closed_trades(
@@ -151,10 +133,7 @@ def get_number_of_closed_trades(
     if trades is None:
         return 0
 
-    closed_trades = [
-        trade for trade in trades if TradeStatus.CLOSED.equals(trade.status)
-    ]
-    return len(closed_trades)
+    return int(trade_columns(trades, "closed").sum())
 
 
 def get_average_trade_duration(
@@ -172,15 +151,13 @@ def get_average_trade_duration(
     if trades is None:
         return 0.0
 
-    total_duration = 0.0
-
-    for trade in trades:
-        if TradeStatus.CLOSED.equals(trade.status):
-            total_duration += (trade.closed_at - trade.opened_at)\
-                                  .total_seconds() / 3600
-
-    number_of_trades = get_number_of_closed_trades(trades)
-    return total_duration / number_of_trades if number_of_trades > 0 else 0.0
+    closed, opened_at, closed_at = trade_columns(
+        trades, "closed", "opened_at", "closed_at"
+    )
+    durations = (closed_at[closed] - opened_at[closed]) / 3600
+    number_of_trades = len(durations)
+    return float(durations.sum()) / number_of_trades \
+        if number_of_trades > 0 else 0.0
 
 
 def get_current_average_trade_duration(
@@ -200,18 +177,14 @@ def get_current_average_trade_duration(
     if trades is None:
         return 0.0
 
-    total_duration = 0.0
-
-    for trade in trades:
-
-        if TradeStatus.CLOSED.equals(trade.status):
-            total_duration += (trade.closed_at - trade.opened_at)\
-                                  .total_seconds() / 3600
-        else:
-            total_duration += (
-                  backtest_run.backtest_end_date - trade.opened_at
-            ).total_seconds() / 3600
-
+    closed, opened_at, closed_at = trade_columns(
+        trades, "closed", "opened_at", "closed_at"
+    )
+    # Open trades are counted up to the end of the backtest
+    end = np.where(
+        closed, closed_at, to_seconds(backtest_run.backtest_end_date)
+    )
+    total_duration = float(((end - opened_at) / 3600).sum())
     number_of_trades = len(trades)
     return total_duration / number_of_trades if number_of_trades > 0 else 0.0
 
@@ -233,11 +206,8 @@ def get_average_trade_size(
     if trades is None:
         return 0.0
 
-    total_trade_size = 0.0
-
-    for trade in trades:
-        total_trade_size += trade.amount * trade.open_price
-
+    amount, open_price = trade_columns(trades, "amount", "open_price")
+    total_trade_size = float((amount * open_price).sum())
     number_of_trades = get_number_of_trades(trades)
     return total_trade_size / number_of_trades if number_of_trades > 0 else 0.0
 
@@ -250,23 +220,14 @@ def get_average_trade_return(trades: List[Trade]) -> Tuple[float, float]:
     if not trades or len(trades) == 0:
         return 0.0, 0.0
 
-    closed_trades = [t for t in trades if TradeStatus.CLOSED.equals(t.status)]
+    closed, gains, cost = trade_columns(
+        trades, "closed", "net_gain_absolute", "cost"
+    )
 
-    if not closed_trades:
+    if not closed.any():
         return 0.0, 0.0
 
-    total_return = sum(t.net_gain_absolute for t in closed_trades)
-    average_return = total_return / len(closed_trades)
-
-    percentage_returns = [
-        (t.net_gain_absolute / t.cost) for t in closed_trades if t.cost > 0
-    ]
-    average_return_percentage = (
-        sum(percentage_returns) / len(percentage_returns)
-        if percentage_returns else 0.0
-    )
-
-    return average_return, average_return_percentage
+    return _average_return(gains[closed], cost[closed])
 
 
 def get_current_average_trade_return(
@@ -286,19 +247,10 @@ def get_current_average_trade_return(
     if not trades or len(trades) == 0:
         return 0.0, 0.0
 
-    total_return = sum(t.net_gain_absolute for t in trades)
-    average_return = total_return / len(trades)
-
-    percentage_returns = [
-        (t.net_gain_absolute / t.cost) for t in trades if t.cost > 0
-    ]
-    average_return_percentage = (
-        sum(percentage_returns) / len(percentage_returns)
-        if percentage_returns else 0.0
+    return _average_return(
+        *trade_columns(trades, "net_gain_absolute", "cost")
     )
 
-    return average_return, average_return_percentage
-
 
 def get_average_trade_gain(trades: List[Trade]) -> Tuple[float, float]:
     """
@@ -315,24 +267,13 @@ def get_average_trade_gain(trades: List[Trade]) -> Tuple[float, float]:
     if trades is None or len(trades) == 0:
         return 0.0, 0.0
 
-    gains = [t.net_gain_absolute for t in trades if t.net_gain_absolute > 0]
+    gains, cost = trade_columns(trades, "net_gain_absolute", "cost")
+    winning = gains > 0
 
-    if not gains:
+    if not winning.any():
         return 0.0, 0.0
 
-    average_gain = sum(gains) / len(gains)
-
-    # Updated percentage calculation to match other functions
-    percentage_returns = [
-        (t.net_gain_absolute / t.cost) for t in trades
-        if t.net_gain_absolute > 0 and t.cost > 0
-    ]
-    average_gain_percentage = (
-        sum(percentage_returns) / len(percentage_returns)
-        if percentage_returns else 0.0
-    )
-
-    return average_gain, average_gain_percentage
+    return _average_return(gains[winning], cost[winning])
 
 
 def get_current_average_trade_gain(trades: List[Trade]) -> Tuple[float, float]:
@@ -350,24 +291,13 @@ def get_current_average_trade_gain(trades: List[Trade]) -> Tuple[float, float]:
     if trades is None or len(trades) == 0:
         return 0.0, 0.0
 
-    gains = [t.net_gain_absolute for t in trades if t.net_gain_absolute > 0]
+    gains, cost = trade_columns(trades, "net_gain_absolute", "cost")
+    winning = gains > 0
 
-    if not gains:
+    if not winning.any():
         return 0.0, 0.0
 
-    average_gain = sum(gains) / len(gains)
-
-    # Updated percentage calculation to match other functions
-    percentage_returns = [
-        (t.net_gain_absolute / t.cost) for t in trades
-        if t.net_gain_absolute > 0 and t.cost > 0
-    ]
-    average_gain_percentage = (
-        sum(percentage_returns) / len(percentage_returns)
-        if percentage_returns else 0.0
-    )
-
-    return average_gain, average_gain_percentage
+    return _average_return(gains[winning], cost[winning])
 
 
 def get_average_trade_loss(trades: List[Trade]) -> Tuple[float, float]:
@@ -385,22 +315,15 @@ def get_average_trade_loss(trades: List[Trade]) -> Tuple[float, float]:
     if trades is None or len(trades) == 0:
         return 0.0, 0.0
 
-    closed_trades = [t for t in trades if TradeStatus.CLOSED.equals(t.status)]
-    losing_trades = [t for t in closed_trades if t.net_gain < 0]
+    closed, net_gain, gains, cost = trade_columns(
+        trades, "closed", "net_gain", "net_gain_absolute", "cost"
+    )
+    losing = closed & (net_gain < 0)
 
-    if not losing_trades or len(losing_trades) == 0:
+    if not losing.any():
         return 0.0, 0.0
 
-    losses = [t.net_gain_absolute for t in losing_trades]
-    average_loss = sum(losses) / len(losses)
-    percentage_returns = [
-        (t.net_gain_absolute / t.cost) for t in losing_trades if t.cost > 0
-    ]
-    average_return_percentage = (
-        sum(percentage_returns) / len(percentage_returns)
-        if percentage_returns else 0.0
-    )
-    return average_loss, average_return_percentage
+    return _average_return(gains[losing], cost[losing])
 
 
 def get_current_average_trade_loss(
@@ -422,21 +345,13 @@ def get_current_average_trade_loss(
     if trades is None or len(trades) == 0:
         return 0.0, 0.0
 
-    losing_trades = [t for t in trades if t.net_gain_absolute < 0]
+    gains, cost = trade_columns(trades, "net_gain_absolute", "cost")
+    losing = gains < 0
 
-    if not losing_trades or len(losing_trades) == 0:
+    if not losing.any():
         return 0.0, 0.0
 
-    losses = [t.net_gain_absolute for t in losing_trades]
-    average_loss = sum(losses) / len(losses)
-    percentage_returns = [
-        (t.net_gain_absolute / t.cost) for t in losing_trades if t.cost > 0
-    ]
-    average_return_percentage = (
-        sum(percentage_returns) / len(percentage_returns)
-        if percentage_returns else 0.0
-    )
-    return average_loss, average_return_percentage
+    return _average_return(gains[losing], cost[losing])
 
 
 def get_median_trade_return(trades: List[Trade]) -> Tuple[float, float]:
@@ -456,16 +371,9 @@ def get_median_trade_return(trades: List[Trade]) -> Tuple[float, float]:
     if not trades:
         return 0.0, 0.0
 
-    sorted_returns = sorted(t.net_gain_absolute for t in trades)
-    n = len(sorted_returns)
-    mid = n // 2
-
-    if n % 2 == 0:
-        median_return = (sorted_returns[mid - 1] + sorted_returns[mid]) / 2
-    else:
-        median_return = sorted_returns[mid]
-
-    cost = sum(t.cost for t in trades)
+    gains, cost = trade_columns(trades, "net_gain_absolute", "cost")
+    median_return = float(np.median(gains))
+    cost = float(cost.sum())
     percentage = (median_return / cost) if cost > 0 else 0.0
     return median_return, percentage
 
@@ -484,7 +392,7 @@ def get_best_trade(trades: List[Trade]) -> Trade:
     if not trades:
         return None
 
-    return max(trades, key=lambda t: t.net_gain_absolute)
+    return trades[int(np.argmax(trade_columns(trades, "net_gain_absolute")))]
 
 
 def get_worst_trade(trades: List[Trade]) -> Trade:
@@ -501,7 +409,7 @@ def get_worst_trade(trades: List[Trade]) -> Trade:
     if not trades:
         return None
 
-    return min(trades, key=lambda t: t.net_gain)
+    return trades[int(np.argmin(trade_columns(trades, "net_gain")))]
 
 
 def get_average_win_duration(trades: List[Trade]) -> float:
@@ -512,11 +420,12 @@ def get_average_win_duration(trades: List[Trade]) -> float:
     if not trades:
         return 0.0
 
-    total, count = 0.0, 0
-    for t in trades:
-        if TradeStatus.CLOSED.equals(t.status) and t.net_gain > 0:
-            total += (t.closed_at - t.opened_at).total_seconds() / 3600
-            count += 1
+    closed, net_gain, opened_at, closed_at = trade_columns(
+        trades, "closed", "net_gain", "opened_at", "closed_at"
+    )
+    selected = closed & (net_gain > 0)
+    count = int(selected.sum())
+    total = float(((closed_at[selected] - opened_at[selected]) / 3600).sum())
     return total / count if count > 0 else 0.0
 
 
@@ -528,11 +437,12 @@ def get_average_loss_duration(trades: List[Trade]) -> float:
     if not trades:
         return 0.0
 
-    total, count = 0.0, 0
-    for t in trades:
-        if TradeStatus.CLOSED.equals(t.status) and t.net_gain <= 0:
-            total += (t.closed_at - t.opened_at).total_seconds() / 3600
-            count += 1
+    closed, net_gain, opened_at, closed_at = trade_columns(
+        trades, "closed", "net_gain", "opened_at", "closed_at"
+    )
+    selected = closed & (net_gain <= 0)
+    count = int(selected.sum())
+    total = float(((closed_at[selected] - opened_at[selected]) / 3600).sum())
     return total / count if count > 0 else 0.0
 
 
@@ -549,18 +459,7 @@ def get_max_consecutive_wins(trades: List[Trade]) -> int:
     if not trades:
         return 0
 
-    closed = sorted(
-        [t for t in trades if TradeStatus.CLOSED.equals(t.status)],
-        key=lambda t: t.closed_at
-    )
-    max_streak, streak = 0, 0
-    for t in closed:
-        if t.net_gain_absolute > 0:
-            streak += 1
-            max_streak = max(max_streak, streak)
-        else:
-            streak = 0
-    return max_streak
+    return longest_run(_closed_gains_by_close_time(trades) > 0)
 
 
 def get_max_consecutive_losses(trades: List[Trade]) -> int:
@@ -576,15 +475,23 @@ def get_max_consecutive_losses(trades: List[Trade]) -> int:
     if not trades:
         return 0
 
-    closed = sorted(
-        [t for t in trades if TradeStatus.CLOSED.equals(t.status)],
-        key=lambda t: t.closed_at
+    return longest_run(_closed_gains_by_close_time(trades) <= 0)
+
+
+def _average_return(gains, cost) -> Tuple[float, float]:
+    # Mean absolute return and mean return on cost, the latter over
+    # the trades with a positive cost only
+    priced = cost > 0
+    average_return_percentage = (
+        float((gains[priced] / cost[priced]).mean())
+        if priced.any() else 0.0
+    )
+    return float(gains.mean()), average_return_percentage
+
+
+def _closed_gains_by_close_time(trades):
+    closed, closed_at, gains = trade_columns(
+        trades, "closed", "closed_at", "net_gain_absolute"
     )
-    max_streak, streak = 0, 0
-    for t in closed:
-        if t.net_gain_absolute <= 0:
-            streak += 1
-            max_streak = max(max_streak, streak)
-        else:
-            streak = 0
-    return max_streak
+    order = np.argsort(closed_at[closed], kind="stable")
+    return gains[closed][order]
@@ -31,7 +31,9 @@ higher win/loss ratio.
 """
 
 from typing import List
-from investing_algorithm_framework.domain import TradeStatus, Trade
+from investing_algorithm_framework.domain import Trade
+
+from ._trade_columns import trade_columns
 
 
 def get_win_rate(trades: List[Trade]) -> float:
@@ -52,11 +54,9 @@ def get_win_rate(trades: List[Trade]) -> float:
     Returns:
         float: The win rate as a percentage (e.g., o.75 for 75% win rate).
     """
-    trades = [
-        trade for trade in trades if TradeStatus.CLOSED.equals(trade.status)
-    ]
-    positive_trades = sum(1 for trade in trades if trade.net_gain > 0)
-    total_trades = len(trades)
+    closed, net_gain = trade_columns(trades, "closed", "net_gain")
+    positive_trades = int((closed & (net_gain > 0)).sum())
+    total_trades = int(closed.sum())
 
     if total_trades == 0:
         return 0.0
@@ -85,8 +85,9 @@ def get_current_win_rate(trades: List[Trade]) -> float:
     if not trades:
         return 0.0
 
-    positive_trades = sum(1 for trade in trades if trade.net_gain_absolute > 0)
-    total_trades = len(trades)
+    gains = trade_columns(trades, "net_gain_absolute")
+    positive_trades = int((gains > 0).sum())
+    total_trades = len(gains)
 
     return positive_trades / total_trades
 
@@ -111,33 +112,12 @@ def get_win_loss_ratio(trades: List[Trade]) -> float:
     Returns:
         float: The win/loss ratio.
     """
-    trades = [
-        trade for trade in trades if TradeStatus.CLOSED.equals(trade.status)
-    ]
+    closed, net_gain = trade_columns(trades, "closed", "net_gain")
 
-    if not trades:
+    if not closed.any():
         return 0.0
 
-    # Separate winning and losing trades
-    winning_trades = [t for t in trades if t.net_gain > 0]
-    losing_trades = [t for t in trades if t.net_gain < 0]
-
-    if not winning_trades:
-        return 0.0
-
-    if not losing_trades:
-        return float('inf')
-
-    # Compute averages
-    avg_win = sum(t.net_gain for t in winning_trades) / len(winning_trades)
-    avg_loss = abs(
-        sum(t.net_gain for t in losing_trades) / len(losing_trades))
-
-    # Avoid division by zero
-    if avg_loss == 0:
-        return float('inf')
-
-    return avg_win / avg_loss
+    return _win_loss_ratio(net_gain[closed])
 
 
 def get_current_win_loss_ratio(trades: List[Trade]) -> float:
@@ -161,20 +141,23 @@ def get_current_win_loss_ratio(trades: List[Trade]) -> float:
     if not trades:
         return 0.0
 
+    return _win_loss_ratio(trade_columns(trades, "net_gain_absolute"))
+
+
+def _win_loss_ratio(gains) -> float:
     # Separate winning and losing trades
-    winning_trades = [t for t in trades if t.net_gain_absolute > 0]
-    losing_trades = [t for t in trades if t.net_gain_absolute < 0]
+    winning_trades = gains[gains > 0]
+    losing_trades = gains[gains < 0]
 
-    if not winning_trades:
+    if len(winning_trades) == 0:
         return 0.0
 
-    if not losing_trades:
+    if len(losing_trades) == 0:
         return float('inf')
 
     # Compute averages
-    avg_win = sum(t.net_gain_absolute for t in winning_trades) / len(winning_trades)
-    avg_loss = abs(
-        sum(t.net_gain_absolute for t in losing_trades) / len(losing_trades))
+    avg_win = float(winning_trades.mean())
+    avg_loss = abs(float(losing_trades.mean()))
 
     # Avoid division by zero
     if avg_loss == 0:
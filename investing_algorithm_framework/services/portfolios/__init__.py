@@ -3,6 +3,7 @@ from .broker_balance_tracker import BrokerBalanceTracker
 from .portfolio_configuration_service import PortfolioConfigurationService
 from .portfolio_service import PortfolioService
 from .portfolio_snapshot_service import PortfolioSnapshotService
+from .portfolio_snapshot_writer import PortfolioSnapshotWriter
 from .portfolio_sync_service import PortfolioSyncService
 from .portfolio_provider_lookup import PortfolioProviderLookup
 
@@ -15,4 +16,5 @@ __all__ = [
     "BacktestPortfolioService",
     "PortfolioProviderLookup",
     "BrokerBalanceTracker",
+    "PortfolioSnapshotWriter",
 ]
@@ -100,8 +100,7 @@ class PortfolioSnapshotService(RepositoryService):
 
         total_value = portfolio.get_unallocated() + pending_value
 
-        for position in \
-                self.position_repository.get_all({"portfolio": portfolio.id}):
+        for position in positions:
 
             if position.get_symbol() != portfolio.get_trading_symbol():
                 symbol_pair = f"{position.get_symbol()}/" \
@@ -0,0 +1,62 @@
+class PortfolioSnapshotWriter:
+    """
+    Writer that buffers portfolio snapshots in memory and writes them
+    to the database in batches, with one bulk insert per batch instead
+    of one insert per snapshot.
+
+    The snapshots are written when the number of buffered snapshots
+    reaches the flush size, and when `flush` is called, e.g. at the
+    end of a run.
+
+    Attributes:
+        portfolio_snapshot_service (PortfolioSnapshotService): The
+            service to write the snapshots with.
+        flush_size (int): The number of buffered snapshots after which
+            they are written. If None, the snapshots are only written
+            when `flush` is called.
+    """
+
+    def __init__(self, portfolio_snapshot_service, flush_size=None):
+        self.portfolio_snapshot_service = portfolio_snapshot_service
+        self.flush_size = flush_size
+        self._snapshots = []
+
+    @property
+    def snapshots(self):
+        """
+        The buffered snapshots that are not written yet.
+        """
+        return self._snapshots
+
+    def add(self, snapshot):
+        """
+        Add a snapshot to the buffer, and write the buffered snapshots
+        if the flush size is reached.
+
+        Args:
+            snapshot (PortfolioSnapshot): The unsaved snapshot.
+
+        Returns:
+            None
+        """
+        self._snapshots.append(snapshot)
+
+        if self.flush_size is not None \
+                and len(self._snapshots) >= self.flush_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffered snapshots to the database and clear the
+        buffer.
+
+        Returns:
+            None
+        """
+
+        if len(self._snapshots) == 0:
+            return
+
+        snapshots = self._snapshots
+        self._snapshots = []
+        self.portfolio_snapshot_service.insert_all(snapshots)
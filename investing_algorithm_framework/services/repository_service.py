@@ -38,3 +38,6 @@ class RepositoryService:
 
     def save_all(self, objects):
         return self.repository.save_objects(objects)
+
+    def insert_all(self, objects):
+        return self.repository.insert_objects(objects)
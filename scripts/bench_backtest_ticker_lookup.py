@@ -0,0 +1,118 @@
+"""Benchmark: backtest ticker lookup from an OHLCV data provider.
+
+When no ticker data provider is registered for a symbol,
+`DataProviderService.get_ticker_data` answers a backtest ticker with
+the OHLCV data provider of the symbol. It used to materialise the
+backtest window of the date (converted to pandas for data sources with
+``pandas=True``) and read its last row, for every position on every
+portfolio valuation and snapshot.
+
+It now looks the date up in a price index of the provider: the sorted
+int64 timestamps and price arrays of its data, searched with a binary
+search.
+
+Run with::
+
+    python scripts/bench_backtest_ticker_lookup.py
+    python scripts/bench_backtest_ticker_lookup.py --days 365 --pandas
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import polars as pl
+
+from investing_algorithm_framework.domain import BacktestDateRange, \
+    DataSource
+from investing_algorithm_framework.infrastructure import \
+    PandasOHLCVDataProvider
+from investing_algorithm_framework.services import ConfigurationService, \
+    DataProviderService, MarketCredentialService
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def _window_ticker(data_provider, date):
+    # The previous implementation of get_ticker_data
+    data = data_provider.get_backtest_data(backtest_index_date=date)
+
+    if isinstance(data, pd.DataFrame):
+        data.index.name = "Datetime"
+        data = pl.from_pandas(data.reset_index())
+
+    entry = data[-1]
+    return entry["Close"][0]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=90)
+    ap.add_argument("--warmup", type=int, default=200)
+    ap.add_argument("--lookups", type=int, default=2000)
+    ap.add_argument("--pandas", action="store_true")
+    args = ap.parse_args()
+
+    end = START + timedelta(days=args.days)
+    dates = pd.date_range(
+        START - timedelta(hours=args.warmup), end, freq="15min", tz="UTC"
+    )
+    dataframe = pd.DataFrame({
+        "Datetime": dates,
+        "Open": 100.0,
+        "High": 101.0,
+        "Low": 99.0,
+        "Close": 100.5,
+        "Volume": 1.0,
+    })
+    service = DataProviderService(
+        configuration_service=ConfigurationService(),
+        market_credential_service=MarketCredentialService(),
+    )
+    service.add_data_provider(
+        PandasOHLCVDataProvider(
+            dataframe=dataframe, symbol="BTC/EUR", market="BITVAVO",
+            time_frame="15m",
+        )
+    )
+    date_range = BacktestDateRange(start_date=START, end_date=end)
+    data_source = DataSource(
+        symbol="BTC/EUR", market="BITVAVO", time_frame="15m",
+        data_type="OHLCV", warmup_window=args.warmup, pandas=args.pandas,
+    )
+    service.index_backtest_data_providers(
+        [data_source], date_range, show_progress=False
+    )
+    service.prepare_backtest_data(date_range, show_progress=False)
+    data_provider = service.data_provider_index.get(data_source)
+
+    rng = random.Random(7)
+    lookups = [
+        START + timedelta(seconds=rng.randrange(args.days * 86400))
+        for _ in range(args.lookups)
+    ]
+
+    t0 = time.perf_counter()
+    for date in lookups:
+        _window_ticker(data_provider, date)
+    old = (time.perf_counter() - t0) / len(lookups)
+
+    t0 = time.perf_counter()
+    for date in lookups:
+        service.get_ticker_data("BTC/EUR", "BITVAVO", date)
+    new = (time.perf_counter() - t0) / len(lookups)
+
+    print(f"Backtest ticker lookup — {len(dates)} bars "
+          f"(15m, {args.days} days, warmup={args.warmup}, "
+          f"pandas={args.pandas})")
+    print("=" * 60)
+    print(f"  {'last row of window':<22}{old * 1e6:>12.1f} us/lookup")
+    print(f"  {'price index':<22}{new * 1e6:>12.1f} us/lookup")
+    print(f"  speedup: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark: CSV vs. Arrow IPC storage of the CCXT OHLCV cache.
+
+The canonical CCXT OHLCV cache is one CSV file per (symbol, market,
+time_frame). Every load parses all datetimes and floats again and every
+update of the cache rewrites the whole file.
+
+With ``storage_format="arrow"`` the cache is a directory of typed,
+memory-mapped Arrow IPC files and new bars are written as an extra
+file.
+
+The script writes synthetic 1m data (one year by default) to both
+formats through the provider and reports the time to load the cache
+(best of ``--repeat``), its size on disk and the time to add one day
+of new bars to it.
+
+Run with::
+
+    python scripts/bench_ccxt_ohlcv_storage.py
+    python scripts/bench_ccxt_ohlcv_storage.py --days 30
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import polars as pl
+
+from investing_algorithm_framework.infrastructure.data_providers.ccxt import (
+    CCXTOHLCVDataProvider,
+)
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def _make_ohlcv(start: datetime, end: datetime) -> pl.DataFrame:
+    n = int((end - start).total_seconds() // 60) + 1
+    prices = pl.int_range(0, n, eager=True).cast(pl.Float64) * 0.01 + 100
+    return pl.DataFrame(
+        {
+            "Datetime": pl.datetime_range(
+                start, end, interval="1m", eager=True, time_unit="ms",
+                time_zone="UTC",
+            ),
+            "Open": prices,
+            "High": prices,
+            "Low": prices,
+            "Close": prices,
+            "Volume": pl.repeat(1.0, n, eager=True),
+        }
+    )
+
+
+def _size(path: str) -> int:
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+
+    return sum(
+        os.path.getsize(os.path.join(path, name)) for name in os.listdir(path)
+    )
+
+
+def _bench(storage_format, storage_path, data, update, repeat):
+    provider = CCXTOHLCVDataProvider(
+        symbol="BTC/USDT",
+        market="BINANCE",
+        time_frame="1m",
+        storage_directory=storage_path,
+        storage_format=storage_format,
+    )
+    provider._write_canonical_file(
+        storage_path, "BTC/USDT", "BINANCE", "1m", data
+    )
+    path = provider.data_file_path
+    load = float("inf")
+
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        cached = provider._read_canonical_file(
+            storage_path, "BTC/USDT", "BINANCE", "1m"
+        )
+        # Touch every column, memory-mapped files are read lazily
+        cached.select(pl.all().max())
+        load = min(load, time.perf_counter() - t0)
+
+    size = _size(path)
+    t0 = time.perf_counter()
+    provider._write_canonical_file(
+        storage_path, "BTC/USDT", "BINANCE", "1m",
+        pl.concat([cached, update], how="vertical"),
+    )
+    append = time.perf_counter() - t0
+    return load, size, append
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=365)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    end = START + timedelta(days=args.days)
+    data = _make_ohlcv(START, end)
+    update = _make_ohlcv(
+        end + timedelta(minutes=1), end + timedelta(days=1)
+    )
+    results = {}
+
+    for storage_format in ("csv", "arrow"):
+        storage_path = tempfile.mkdtemp()
+
+        try:
+            results[storage_format] = _bench(
+                storage_format, storage_path, data, update, args.repeat
+            )
+        finally:
+            shutil.rmtree(storage_path, ignore_errors=True)
+
+    csv, arrow = results["csv"], results["arrow"]
+    print(f"CCXT OHLCV cache — {len(data)} bars (1m, {args.days} days)")
+    print("=" * 60)
+    print(f"  {'':<22}{'csv':>18}{'arrow':>18}")
+    print(f"  {'load cache':<22}{csv[0] * 1e3:>15.1f} ms"
+          f"{arrow[0] * 1e3:>15.1f} ms")
+    print(f"  {'size on disk':<22}{csv[1] / 2 ** 20:>15.1f} MB"
+          f"{arrow[1] / 2 ** 20:>15.1f} MB")
+    print(f"  {'add one day of bars':<22}{csv[2] * 1e3:>15.1f} ms"
+          f"{arrow[2] * 1e3:>15.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
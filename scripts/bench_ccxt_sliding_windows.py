@@ -0,0 +1,150 @@
+"""Benchmark: offset-indexed sliding windows vs. one DataFrame per bar.
+
+`CCXTOHLCVDataProvider.prepare_backtest_data` used to materialise the
+warmup window of every bar of the backtest: one Polars filter over the
+whole frame per timestamp, each result stored in `window_cache`. That
+is O(n^2) work and n DataFrames in memory. A lookup between two bars
+scanned every cache key.
+
+`SlidingWindows` keeps the sorted timestamps and the (start, stop) row
+offsets of every window, computed with `searchsorted`, and returns
+zero-copy slices on lookup.
+
+The script prepares synthetic 1m data (one year by default) through
+the provider with the download mocked out and reports the time to
+build the window cache, the memory it holds and the lookup time.
+The old per-bar cache of a full year of 1m bars does not fit in
+memory on most machines, so it is measured on ``--sample`` bars and
+extrapolated to the full range.
+
+Run with::
+
+    python scripts/bench_ccxt_sliding_windows.py
+    python scripts/bench_ccxt_sliding_windows.py --days 30 --warmup 500
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import polars as pl
+
+from investing_algorithm_framework.infrastructure.data_providers.ccxt import (
+    CCXTOHLCVDataProvider,
+)
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def _make_ohlcv(start: datetime, end: datetime) -> pl.DataFrame:
+    n = int((end - start).total_seconds() // 60) + 1
+    prices = pl.int_range(0, n, eager=True).cast(pl.Float64) * 0.01 + 100
+    return pl.DataFrame(
+        {
+            "Datetime": pl.datetime_range(
+                start, end, interval="1m", eager=True, time_unit="ms",
+                time_zone="UTC",
+            ),
+            "Open": prices,
+            "High": prices,
+            "Low": prices,
+            "Close": prices,
+            "Volume": pl.repeat(1.0, n, eager=True),
+        }
+    )
+
+
+def _old_window(data, timestamp, window):
+    # The per-bar filter of the previous _precompute_sliding_windows
+    return data.filter(
+        (data["Datetime"] <= timestamp)
+        & (data["Datetime"] >= timestamp - window)
+    )
+
+
+def _old_lookup(keys, date):
+    # The closest-key fallback of the previous get_backtest_data
+    return min([k for k in keys if k >= date])
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=365)
+    ap.add_argument("--warmup", type=int, default=200)
+    ap.add_argument("--sample", type=int, default=500)
+    ap.add_argument("--lookups", type=int, default=1000)
+    args = ap.parse_args()
+
+    end = START + timedelta(days=args.days)
+    window = timedelta(minutes=args.warmup)
+    data = _make_ohlcv(START - window, end)
+    provider = CCXTOHLCVDataProvider(
+        symbol="BTC/USDT",
+        market="BINANCE",
+        time_frame="1m",
+        warmup_window=args.warmup,
+    )
+
+    with patch.object(CCXTOHLCVDataProvider, "get_ohlcv", return_value=data):
+        provider.prepare_backtest_data(
+            backtest_start_date=START, backtest_end_date=end
+        )
+
+    t0 = time.perf_counter()
+    provider._precompute_sliding_windows(
+        data=provider.data,
+        window_size=args.warmup,
+        time_frame=provider.time_frame,
+        start_date=START,
+        end_date=end,
+    )
+    prepare_elapsed = time.perf_counter() - t0
+
+    windows = provider.window_cache
+    bars = len(windows)
+    new_bytes = (
+        windows._keys.nbytes + windows._starts.nbytes + windows._stops.nbytes
+    )
+    timestamps = list(windows)
+    sample = timestamps[:: max(bars // args.sample, 1)][:args.sample]
+
+    t0 = time.perf_counter()
+    old_windows = [_old_window(data, ts, window) for ts in sample]
+    old_prepare = (time.perf_counter() - t0) / len(sample) * bars
+    old_bytes = sum(w.estimated_size() for w in old_windows) \
+        / len(sample) * bars
+
+    rng = random.Random(7)
+    dates = [
+        START + timedelta(seconds=rng.randrange(args.days * 86400))
+        for _ in range(args.lookups)
+    ]
+    t0 = time.perf_counter()
+    for date in dates:
+        windows.at_or_after(date)
+    new_lookup = (time.perf_counter() - t0) / len(dates)
+
+    old_keys = timestamps
+    t0 = time.perf_counter()
+    for date in dates[:20]:
+        _old_lookup(old_keys, date)
+    old_lookup = (time.perf_counter() - t0) / 20
+
+    print(f"CCXT OHLCV sliding windows — {bars} bars "
+          f"(1m, {args.days} days, warmup={args.warmup})")
+    print("=" * 60)
+    print(f"  {'':<22}{'per-bar frames':>18}{'row offsets':>18}")
+    print(f"  {'build window cache':<22}{old_prepare:>16.1f} s"
+          f"{prepare_elapsed:>16.3f} s")
+    print(f"  {'window cache memory':<22}{old_bytes / 2 ** 20:>15.1f} MB"
+          f"{new_bytes / 2 ** 20:>15.1f} MB")
+    print(f"  {'closest-bar lookup':<22}{old_lookup * 1e3:>15.3f} ms"
+          f"{new_lookup * 1e3:>15.3f} ms")
+    print(f"  (per-bar frames extrapolated from {len(sample)} bars)")
+
+
+if __name__ == "__main__":
+    main()
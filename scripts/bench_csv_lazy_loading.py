@@ -0,0 +1,99 @@
+"""Benchmark: eager vs. lazy loading of CSV OHLCV data.
+
+`CSVOHLCVDataProvider` reads the whole CSV file on initialization, even
+when a backtest only needs a few months of a long history. With
+``lazy=True`` only the date range of the file is read up front and
+`prepare_backtest_data` loads the backtest range plus its warmup
+window with a `pl.scan_csv` whose date filter is pushed down into the
+scan.
+
+The script writes synthetic 1m data (five years by default) to a CSV
+file and reports, for a 90 day backtest, the time to create the
+provider and prepare the backtest and the size of the loaded data.
+
+Run with::
+
+    python scripts/bench_csv_lazy_loading.py
+    python scripts/bench_csv_lazy_loading.py --years 2 --days 30
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import polars as pl
+
+from investing_algorithm_framework.infrastructure import \
+    CSVOHLCVDataProvider
+
+START = datetime(2019, 1, 1, tzinfo=timezone.utc)
+
+
+def _write_ohlcv(file_path: str, start: datetime, end: datetime) -> None:
+    n = int((end - start).total_seconds() // 60) + 1
+    prices = pl.int_range(0, n, eager=True).cast(pl.Float64) * 0.01 + 100
+    pl.DataFrame(
+        {
+            "Datetime": pl.datetime_range(
+                start, end, interval="1m", eager=True, time_unit="ms",
+                time_zone="UTC",
+            ),
+            "Open": prices,
+            "High": prices,
+            "Low": prices,
+            "Close": prices,
+            "Volume": pl.repeat(1.0, n, eager=True),
+        }
+    ).write_csv(file_path)
+
+
+def _bench(file_path, lazy, start, end, warmup):
+    t0 = time.perf_counter()
+    provider = CSVOHLCVDataProvider(
+        storage_path=file_path,
+        symbol="BTC/EUR",
+        time_frame="1m",
+        market="BITVAVO",
+        warmup_window=warmup,
+        lazy=lazy,
+    )
+    provider.prepare_backtest_data(
+        backtest_start_date=start, backtest_end_date=end
+    )
+    return time.perf_counter() - t0, provider.data.estimated_size()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--years", type=int, default=5)
+    ap.add_argument("--days", type=int, default=90)
+    ap.add_argument("--warmup", type=int, default=200)
+    args = ap.parse_args()
+
+    end_of_data = START + timedelta(days=365 * args.years)
+    start = end_of_data - timedelta(days=args.days * 2)
+    end = start + timedelta(days=args.days)
+    file_path = os.path.join(tempfile.mkdtemp(), "ohlcv.csv")
+    _write_ohlcv(file_path, START, end_of_data)
+
+    try:
+        eager = _bench(file_path, False, start, end, args.warmup)
+        lazy = _bench(file_path, True, start, end, args.warmup)
+    finally:
+        os.remove(file_path)
+
+    print(f"CSV OHLCV loading — {args.years} years of 1m bars, "
+          f"{args.days} day backtest")
+    print("=" * 60)
+    print(f"  {'':<22}{'eager':>18}{'lazy':>18}")
+    print(f"  {'load and prepare':<22}{eager[0]:>16.2f} s"
+          f"{lazy[0]:>16.2f} s")
+    print(f"  {'loaded data':<22}{eager[1] / 2 ** 20:>15.1f} MB"
+          f"{lazy[1] / 2 ** 20:>15.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
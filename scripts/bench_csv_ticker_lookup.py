@@ -0,0 +1,100 @@
+"""Benchmark: backtest ticker lookup of the CSV ticker data provider.
+
+`CSVTickerDataProvider.get_backtest_data` used to keep the prepared
+rows in a dict keyed by datetime and, for a date between two rows,
+scan every key for the closest earlier one. `get_data` filtered the
+whole DataFrame on every call.
+
+The provider now keeps its rows sorted with an int64 array of their
+timestamps and finds the row of a date with a binary search.
+
+Run with::
+
+    python scripts/bench_csv_ticker_lookup.py
+    python scripts/bench_csv_ticker_lookup.py --days 365 --lookups 5000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import polars as pl
+
+from investing_algorithm_framework.infrastructure import \
+    CSVTickerDataProvider
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def _dict_lookup(rows, date):
+    # The previous implementation of get_backtest_data
+    if date in rows:
+        return rows[date]
+
+    candidates = [k for k in rows.keys() if k <= date]
+    return rows[max(candidates)]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=90)
+    ap.add_argument("--lookups", type=int, default=2000)
+    args = ap.parse_args()
+
+    end = START + timedelta(days=args.days)
+    dates = pl.datetime_range(
+        START, end, interval="15m", eager=True, time_zone="UTC"
+    )
+    prices = pl.int_range(0, len(dates), eager=True).cast(pl.Float64)
+    data = pl.DataFrame({
+        "Datetime": dates,
+        "Open": prices,
+        "High": prices,
+        "Low": prices,
+        "Close": prices,
+        "Volume": prices,
+    })
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "ticker.csv")
+        data.write_csv(path)
+        data_provider = CSVTickerDataProvider(
+            storage_path=path, market="BITVAVO", symbol="BTC/EUR"
+        )
+        data_provider.prepare_backtest_data(START, end)
+
+    rows = {
+        row["Datetime"]: row for row in data_provider.data.iter_rows(
+            named=True
+        )
+    }
+    rng = random.Random(7)
+    lookups = [
+        START + timedelta(seconds=rng.randrange(args.days * 86400))
+        for _ in range(args.lookups)
+    ]
+
+    t0 = time.perf_counter()
+    for date in lookups:
+        _dict_lookup(rows, date)
+    old = (time.perf_counter() - t0) / len(lookups)
+
+    t0 = time.perf_counter()
+    for date in lookups:
+        data_provider.get_backtest_data(backtest_index_date=date)
+    new = (time.perf_counter() - t0) / len(lookups)
+
+    print(f"CSV backtest ticker lookup — {len(dates)} rows "
+          f"(15m, {args.days} days)")
+    print("=" * 60)
+    print(f"  {'scan of row dict':<22}{old * 1e6:>12.1f} us/lookup")
+    print(f"  {'binary search':<22}{new * 1e6:>12.1f} us/lookup")
+    print(f"  speedup: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
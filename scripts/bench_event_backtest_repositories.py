@@ -0,0 +1,152 @@
+"""Benchmark: repositories of an event-driven backtest.
+
+An event-driven backtest used to store its orders, positions, trades
+and snapshots in the SQLite database of the app: every repository call
+of every iteration opened a session and ran SQL queries against it.
+
+The repositories of an event backtest now use an in-memory database
+(``IN_MEMORY_BACKTEST_DATABASE``) that stores the rows as dicts with
+secondary indexes and materializes the same ORM objects. This script
+runs the same strategy with both backends, reports the run times, and
+checks that the orders, trades, snapshots and positions of the two
+runs are identical.
+
+Run with::
+
+    python scripts/bench_event_backtest_repositories.py
+    python scripts/bench_event_backtest_repositories.py --days 60
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from investing_algorithm_framework import create_app, BacktestDateRange, \
+    RESOURCE_DIRECTORY, DATA_DIRECTORY, TradingStrategy, DataSource, \
+    TimeUnit, Schedule, SnapshotInterval, Study, Universe, BacktestWindow, \
+    BacktestEngine, IN_MEMORY_BACKTEST_DATABASE
+
+DATA_DIRECTORY_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "resources", "test_data",
+    "ohlcv"
+)
+END = datetime(2023, 11, 1, tzinfo=timezone.utc)
+
+
+class ChurnStrategy(TradingStrategy):
+    # Opens and closes a position every iteration to stress the
+    # order, position and trade repositories
+    schedule = Schedule.every(2, TimeUnit.HOUR)
+    symbols = ["BTC"]
+    data_sources = [
+        DataSource(
+            market="BITVAVO",
+            symbol="BTC/EUR",
+            data_type="ohlcv",
+            time_frame="2h",
+            warmup_window=10,
+            identifier="btc",
+        )
+    ]
+
+    def run_strategy(self, context, data):
+        price = data["btc"]["Close"][-1]
+
+        if context.has_position("BTC", amount_gt=0):
+            context.close_position(symbol="BTC")
+        else:
+            context.create_limit_order(
+                target_symbol="BTC",
+                order_side="BUY",
+                price=price,
+                percentage_of_portfolio=20,
+            )
+
+
+def _run(in_memory: bool, days: int, data_directory: str):
+    resource_directory = tempfile.mkdtemp()
+    os.symlink(
+        os.path.abspath(data_directory),
+        os.path.join(resource_directory, "data")
+    )
+
+    try:
+        app = create_app(
+            name="bench",
+            config={
+                RESOURCE_DIRECTORY: resource_directory,
+                DATA_DIRECTORY: "data",
+                IN_MEMORY_BACKTEST_DATABASE: in_memory,
+            }
+        )
+        app.add_market(
+            market="BITVAVO", trading_symbol="EUR", initial_balance=1000
+        )
+        date_range = BacktestDateRange(
+            start_date=END - timedelta(days=days), end_date=END
+        )
+        study = Study(
+            universe=Universe(market="BITVAVO", trading_symbol="EUR"),
+            backtest_windows=[BacktestWindow(train_range=date_range)],
+            engines=[BacktestEngine.EVENT_DRIVEN],
+        )
+        start = time.perf_counter()
+        backtests = app.run_backtest(
+            strategy=ChurnStrategy,
+            study=study,
+            snapshot_interval=SnapshotInterval.DAILY,
+        )
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(resource_directory, ignore_errors=True)
+
+    run = backtests[0].get_backtest_run(date_range)
+    results = json.loads(json.dumps({
+        "orders": [order.to_dict() for order in run.orders],
+        "trades": [trade.to_dict() for trade in run.trades],
+        "snapshots": [
+            snapshot.to_dict() for snapshot in run.portfolio_snapshots
+        ],
+        "positions": [position.to_dict() for position in run.positions],
+    }, default=str))
+
+    # Order ids are random, and the order of the orders of a trade is
+    # not defined by the SQL query that loads them
+    for order in results["orders"]:
+        order.pop("id")
+
+    for trade in results["trades"]:
+        for order in trade["orders"]:
+            order.pop("id")
+
+        trade["orders"].sort(key=lambda order: order["created_at"])
+
+    return elapsed, results
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=30)
+    ap.add_argument("--data-directory", default=DATA_DIRECTORY_PATH)
+    args = ap.parse_args()
+
+    sql_time, sql_results = _run(False, args.days, args.data_directory)
+    memory_time, memory_results = _run(True, args.days, args.data_directory)
+
+    print(f"days={args.days}")
+    print(f"sql repositories        {sql_time:8.2f}s")
+    print(f"in-memory repositories  {memory_time:8.2f}s")
+    print(f"speedup                 {sql_time / memory_time:8.1f}x")
+
+    for key, rows in sql_results.items():
+        status = "identical" if rows == memory_results[key] else "DIFFERENT"
+        print(f"{key:<10} {len(rows):>6} {status}")
+
+
+if __name__ == "__main__":
+    main()
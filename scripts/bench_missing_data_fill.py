@@ -0,0 +1,104 @@
+"""Benchmark: missing-data detection and filling of a stored series.
+
+With ``fill_missing_data=True`` every backtest run looked up the missing
+dates of each data source with `get_missing_timeseries_data_entries`
+(a pandas conversion and a ``date_range`` / ``isin`` over the range)
+and filled them with `fill_missing_timeseries_data` (a row-by-row
+insert on a pandas copy).
+
+`get_completeness_index` computes the missing timestamps of the stored
+series once with numpy and persists them in a cache directory. Later
+runs over the unchanged file load the index and, when nothing is
+missing in the range, skip the fill.
+
+Run with::
+
+    python scripts/bench_missing_data_fill.py
+    python scripts/bench_missing_data_fill.py --days 730 --gaps 500
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import polars as pl
+
+from investing_algorithm_framework.services.data_providers import \
+    CompletenessIndex, fill_missing_timeseries_data, \
+    get_completeness_index, get_missing_timeseries_data_entries
+
+START = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=365)
+    ap.add_argument("--gaps", type=int, default=200)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    end = START + timedelta(days=args.days)
+    dates = pl.datetime_range(
+        START, end, interval="15m", eager=True, time_unit="ms",
+        time_zone="UTC",
+    )
+    rng = random.Random(7)
+    gaps = rng.sample(range(1, len(dates) - 1), args.gaps)
+    prices = pl.int_range(0, len(dates), eager=True).cast(pl.Float64)
+    data = pl.DataFrame({
+        "Datetime": dates,
+        "Open": prices,
+        "High": prices,
+        "Low": prices,
+        "Close": prices,
+        "Volume": prices,
+    }).filter(~pl.int_range(0, len(dates)).is_in(gaps))
+    directory = tempfile.mkdtemp()
+    data_file_path = os.path.join(directory, "OHLCV_BTC-EUR_BITVAVO_15m.csv")
+    data.write_csv(data_file_path)
+    CompletenessIndex.directory = directory
+
+    try:
+        t0 = time.perf_counter()
+        for _ in range(args.runs):
+            missing = get_missing_timeseries_data_entries(
+                data, start=START, end=end, freq="15min"
+            )
+            fill_missing_timeseries_data(data, missing_dates=missing)
+        old = (time.perf_counter() - t0) / args.runs
+
+        t0 = time.perf_counter()
+        for _ in range(args.runs):
+            index = get_completeness_index(
+                data, "15m", data_file_path=data_file_path
+            )
+            index.fill(data, START, end)
+        new = (time.perf_counter() - t0) / args.runs
+
+        # A complete range of the series
+        complete_end = START + timedelta(minutes=15 * (min(gaps) - 1))
+        t0 = time.perf_counter()
+        for _ in range(args.runs):
+            get_completeness_index(
+                data, "15m", data_file_path=data_file_path
+            ).fill(data, START, complete_end)
+        skip = (time.perf_counter() - t0) / args.runs
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"Missing-data fill — {len(data)} rows (15m, {args.days} days, "
+          f"{args.gaps} gaps), {args.runs} runs")
+    print("=" * 60)
+    print(f"  {'detect + fill (pandas)':<30}{old * 1000:>10.1f} ms/run")
+    print(f"  {'completeness index':<30}{new * 1000:>10.1f} ms/run")
+    print(f"  {'completeness index, no gaps':<30}{skip * 1000:>10.1f} ms/run")
+    print(f"  speedup: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Benchmark: ORM load throughput of the numeric storages.
+
+The monetary columns of the models are SqliteDecimal columns. With the
+default DECIMAL storage they are stored as TEXT, and every value is
+converted with ``str(Decimal(str(value)))`` on write and
+``float(Decimal(value))`` on read. That is several string round trips
+per attribute of every loaded object.
+
+The NUMERIC_STORAGE config value selects another storage: FIXED_POINT
+stores the values as 64-bit integers scaled by 10^8, and REAL stores
+them as floats. This script fills a SQLite database with orders for
+every storage, loads them with the ORM and prints the rows per second
+of the writes and the loads. It also prints the rows per second of
+the conversion of the numeric values alone, as done by the in-memory
+database of event backtests on every write.
+
+Run with::
+
+    python scripts/bench_numeric_storage.py
+    python scripts/bench_numeric_storage.py --orders 200000 --loads 10
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from investing_algorithm_framework.domain import NumericStorage
+from investing_algorithm_framework.infrastructure import SQLOrder, \
+    use_numeric_storage
+from investing_algorithm_framework.infrastructure.database import \
+    SQLBaseModel, SqliteDecimal
+
+START = datetime(2020, 1, 1)
+
+
+def _create_orders(number_of_orders):
+    random.seed(0)
+    orders = []
+
+    for index in range(number_of_orders):
+        price = round(random.uniform(10, 60000), 2)
+        amount = round(random.uniform(0.0001, 2), 8)
+        created_at = START + timedelta(minutes=index)
+        orders.append({
+            "id": index + 1,
+            "target_symbol": "BTC",
+            "trading_symbol": "EUR",
+            "order_side": "BUY",
+            "order_type": "LIMIT",
+            "price": price,
+            "amount": amount,
+            "filled": amount,
+            "remaining": 0,
+            "order_fee": price * amount * 0.001,
+            "status": "CLOSED",
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+
+    return orders
+
+
+def _run(storage, orders, loads):
+    use_numeric_storage(storage)
+    directory = tempfile.mkdtemp()
+    engine = create_engine(
+        f"sqlite:///{os.path.join(directory, 'bench.sqlite3')}"
+    )
+    SQLBaseModel.metadata.create_all(engine)
+
+    started_at = time.perf_counter()
+
+    with engine.begin() as connection:
+        connection.execute(insert(SQLOrder.__table__), orders)
+
+    write_duration = time.perf_counter() - started_at
+    started_at = time.perf_counter()
+
+    for _ in range(loads):
+
+        with Session(bind=engine) as db:
+            loaded = db.query(SQLOrder).all()
+            assert len(loaded) == len(orders)
+
+    load_duration = (time.perf_counter() - started_at) / loads
+    engine.dispose()
+
+    columns = [
+        column for column in SQLOrder.__table__.columns
+        if isinstance(column.type, SqliteDecimal)
+    ]
+    started_at = time.perf_counter()
+
+    for order in orders:
+        for column in columns:
+            value = order.get(column.key)
+
+            if value is not None:
+                column.type.process_result_value(
+                    column.type.process_bind_param(value, None), None
+                )
+
+    convert_duration = time.perf_counter() - started_at
+    return write_duration, load_duration, convert_duration
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--orders", type=int, default=100_000)
+    ap.add_argument("--loads", type=int, default=5)
+    args = ap.parse_args()
+
+    orders = _create_orders(args.orders)
+    results = {}
+
+    try:
+        for storage in NumericStorage:
+            results[storage] = _run(storage, orders, args.loads)
+    finally:
+        use_numeric_storage(NumericStorage.DECIMAL)
+
+    print(f"orders={args.orders} loads={args.loads}")
+    print(f"{'storage':<12} {'write rows/s':>14} {'load rows/s':>14} "
+          f"{'load speedup':>13} {'convert rows/s':>15} "
+          f"{'convert speedup':>16}")
+    _, decimal_load_duration, decimal_convert_duration = \
+        results[NumericStorage.DECIMAL]
+
+    for storage, durations in results.items():
+        write_duration, load_duration, convert_duration = durations
+        print(f"{storage.value:<12} "
+              f"{args.orders / write_duration:>14,.0f} "
+              f"{args.orders / load_duration:>14,.0f} "
+              f"{decimal_load_duration / load_duration:>12.2f}x "
+              f"{args.orders / convert_duration:>15,.0f} "
+              f"{decimal_convert_duration / convert_duration:>15.2f}x")
+
+
+if __name__ == "__main__":
+    main()
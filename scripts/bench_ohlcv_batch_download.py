@@ -0,0 +1,102 @@
+"""Benchmark: downloading the OHLCV data of an equity universe.
+
+The Yahoo and Polygon data providers download the full range of one
+symbol per `_download_ohlcv` call, one symbol after the other.
+
+`OHLCVDataProviderBase.download_ohlcv` splits the range into chunks
+and downloads the (symbol, chunk) pairs with a pool of threads, merging
+the chunks of a symbol into storage in one write.
+
+The download is a stub with a fixed latency per request plus a latency
+per candle, standing in for the network.
+
+Run with::
+
+    python scripts/bench_ohlcv_batch_download.py
+    python scripts/bench_ohlcv_batch_download.py --symbols 500 --workers 16
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import polars as pl
+
+from investing_algorithm_framework.infrastructure import \
+    YahooOHLCVDataProvider
+
+START = datetime(2019, 1, 1, tzinfo=timezone.utc)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--symbols", type=int, default=100)
+    ap.add_argument("--days", type=int, default=5 * 365)
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--chunk-size", type=int, default=365)
+    ap.add_argument("--latency", type=float, default=0.02)
+    ap.add_argument("--candle-latency", type=float, default=0.00002)
+    args = ap.parse_args()
+
+    def download(self, symbol, time_frame, start_date, end_date):
+        dates = pl.datetime_range(
+            start_date, end_date, interval="1d", eager=True,
+            time_unit="us", time_zone="UTC",
+        )
+        time.sleep(args.latency + args.candle_latency * len(dates))
+        prices = pl.int_range(0, len(dates), eager=True).cast(pl.Float64)
+        return pl.DataFrame({
+            "Datetime": dates,
+            "Open": prices,
+            "High": prices,
+            "Low": prices,
+            "Close": prices,
+            "Volume": prices,
+        })
+
+    symbols = [f"SYM{i}" for i in range(args.symbols)]
+    end = START + timedelta(days=args.days)
+    directory = tempfile.mkdtemp()
+
+    try:
+        with patch.object(YahooOHLCVDataProvider, "_download_ohlcv", download):
+            provider = YahooOHLCVDataProvider(
+                time_frame="1d", storage_directory=directory
+            )
+
+            t0 = time.perf_counter()
+            for symbol in symbols:
+                data = provider._download_ohlcv(
+                    symbol=symbol, time_frame="1d",
+                    start_date=START, end_date=end,
+                )
+                provider._save_data_to_storage(
+                    symbol, "1d", START, end, data, directory
+                )
+            old = time.perf_counter() - t0
+
+            shutil.rmtree(directory)
+            provider.download_chunk_size = args.chunk_size
+            t0 = time.perf_counter()
+            provider.download_ohlcv(
+                symbols, START, end, max_workers=args.workers
+            )
+            new = time.perf_counter() - t0
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"OHLCV download — {args.symbols} symbols, {args.days} days of "
+          f"1d, {args.latency * 1000:.0f} ms latency per request")
+    print("=" * 60)
+    print(f"  {'one symbol at a time':<26}{old:>10.2f} s")
+    print(f"  {'download_ohlcv':<26}{new:>10.2f} s "
+          f"({args.workers} workers, chunks of {args.chunk_size})")
+    print(f"  speedup: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark: pandas backtest windows of a ``pandas=True`` data source.
+
+The OHLCV data providers used to convert every backtest window to
+pandas with `convert_polars_to_pandas` (polars -> pandas copy,
+`to_datetime`, `drop_duplicates`, `set_index`) on every bar.
+
+`DataProvider.convert_to_pandas` converts the provider data once and
+serves each window as a copied row slice of the converted frame, found
+with a binary search on its datetime index.
+
+Run with::
+
+    python scripts/bench_pandas_window_conversion.py
+    python scripts/bench_pandas_window_conversion.py --bars 100000 --warmup 500
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+import polars as pl
+
+from investing_algorithm_framework.domain import convert_polars_to_pandas, \
+    PandasConversionCache
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--bars", type=int, default=50000)
+    ap.add_argument("--warmup", type=int, default=200)
+    ap.add_argument("--windows", type=int, default=2000)
+    args = ap.parse_args()
+
+    prices = pl.int_range(0, args.bars, eager=True).cast(pl.Float64)
+    data = pl.DataFrame({
+        "Datetime": pl.datetime_range(
+            START, START + timedelta(minutes=args.bars - 1), interval="1m",
+            eager=True, time_unit="ms", time_zone="UTC",
+        ),
+        "Open": prices,
+        "High": prices,
+        "Low": prices,
+        "Close": prices,
+        "Volume": prices,
+    })
+    step = max((args.bars - args.warmup) // args.windows, 1)
+    windows = [
+        data.slice(offset, args.warmup + 1)
+        for offset in range(0, args.bars - args.warmup, step)
+    ][:args.windows]
+
+    t0 = time.perf_counter()
+    for window in windows:
+        convert_polars_to_pandas(window)
+    old = (time.perf_counter() - t0) / len(windows)
+
+    cache = PandasConversionCache()
+    t0 = time.perf_counter()
+    for window in windows:
+        cache.convert(data, window)
+    new = (time.perf_counter() - t0) / len(windows)
+
+    print(f"pandas backtest windows — {args.bars} bars, "
+          f"window of {args.warmup + 1} rows, {len(windows)} windows")
+    print("=" * 60)
+    print(f"  {'convert per window':<22}{old * 1e6:>12.1f} us/window")
+    print(f"  {'conversion cache':<22}{new * 1e6:>12.1f} us/window")
+    print(f"  speedup: {old / new:.1f}x "
+          "(including the one-off conversion of the data)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Benchmark: per-iteration repository queries on a large order history.
+
+The event loop queries the open orders and open trades on every
+iteration, and the snapshots query the orders of a portfolio. The
+orders and trades tables had no indexes on the filtered columns, so
+these queries scanned every historic order and became slower as a
+live deployment accumulated orders.
+
+The tables now have indexes that match the filters of the
+repositories (status, position, symbol and side), and the orders of a
+trade are loaded with a second query on the trade_id index of the
+association table instead of a joined load, which SQLite executed by
+joining the whole association table with all orders. This script
+fills a SQLite database with historic closed orders and trades, runs
+the per-iteration queries through the repositories with and without
+the indexes, and prints the repository statistics of both runs.
+
+Run with::
+
+    python scripts/bench_repository_indexes.py
+    python scripts/bench_repository_indexes.py --orders 200000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert, text
+
+from investing_algorithm_framework.domain import OrderStatus, TradeStatus
+from investing_algorithm_framework.infrastructure import SQLOrder, \
+    SQLPortfolio, SQLPosition, SQLTrade, SQLOrderRepository, \
+    SQLTradeRepository, RepositoryStatistics, use_repository_statistics
+from investing_algorithm_framework.infrastructure.database import Session, \
+    SQLBaseModel
+from investing_algorithm_framework.infrastructure.models\
+    .order_trade_association import order_trade_association
+
+SYMBOLS = ["BTC", "ETH", "SOL", "ADA", "DOT", "XRP", "LTC", "LINK"]
+START = datetime(2020, 1, 1)
+
+
+def _fill_database(engine, number_of_orders):
+    SQLBaseModel.metadata.create_all(engine)
+    random.seed(0)
+
+    with engine.begin() as connection:
+        connection.execute(insert(SQLPortfolio.__table__), [{
+            "id": 1,
+            "identifier": "binance",
+            "market": "BINANCE",
+            "trading_symbol": "EUR",
+            "unallocated": 1000,
+            "initialized": True,
+            "created_at": START,
+            "updated_at": START,
+        }])
+        connection.execute(insert(SQLPosition.__table__), [
+            {"id": index + 1, "symbol": symbol, "amount": 0, "cost": 0,
+             "portfolio_id": 1}
+            for index, symbol in enumerate(SYMBOLS)
+        ])
+        orders = []
+        trades = []
+        associations = []
+
+        for index in range(number_of_orders):
+            position = random.randrange(len(SYMBOLS))
+            is_open = index >= number_of_orders - 5
+            created_at = START + timedelta(minutes=15 * index)
+            orders.append({
+                "id": index + 1,
+                "target_symbol": SYMBOLS[position],
+                "trading_symbol": "EUR",
+                "order_side": "BUY" if index % 2 == 0 else "SELL",
+                "order_type": "LIMIT",
+                "price": "100",
+                "amount": "1",
+                "filled": "0" if is_open else "1",
+                "remaining": "1" if is_open else "0",
+                "status": OrderStatus.OPEN.value if is_open
+                else OrderStatus.CLOSED.value,
+                "position_id": position + 1,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+
+            if index % 2 == 0:
+                trades.append({
+                    "id": index // 2 + 1,
+                    "target_symbol": SYMBOLS[position],
+                    "trading_symbol": "EUR",
+                    "open_price": "100",
+                    "amount": "1",
+                    "status": TradeStatus.OPEN.value if is_open
+                    else TradeStatus.CLOSED.value,
+                    "opened_at": created_at,
+                    "is_short": False,
+                })
+
+            associations.append(
+                {"order_id": index + 1, "trade_id": index // 2 + 1}
+            )
+
+        connection.execute(insert(SQLOrder.__table__), orders)
+        connection.execute(insert(SQLTrade.__table__), trades)
+        connection.execute(insert(order_trade_association), associations)
+
+
+def _run_queries(iterations):
+    order_repository = SQLOrderRepository()
+    trade_repository = SQLTradeRepository()
+    statistics = RepositoryStatistics()
+    use_repository_statistics(statistics)
+
+    try:
+        for _ in range(iterations):
+            order_repository.get_all({"status": OrderStatus.OPEN.value})
+            trade_repository.get_all({"status": TradeStatus.OPEN.value})
+            order_repository.get_all(
+                {"target_symbol": "BTC", "order_side": "BUY",
+                 "status": OrderStatus.OPEN.value}
+            )
+            order_repository.count({"position": [1]})
+    finally:
+        use_repository_statistics(None)
+
+    return statistics
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--orders", type=int, default=100_000)
+    ap.add_argument("--iterations", type=int, default=50)
+    args = ap.parse_args()
+
+    directory = tempfile.mkdtemp()
+    engine = create_engine(
+        f"sqlite:///{os.path.join(directory, 'bench.sqlite3')}"
+    )
+    _fill_database(engine, args.orders)
+    Session.configure(bind=engine)
+    indexed = _run_queries(args.iterations)
+
+    with engine.begin() as connection:
+        for table in SQLBaseModel.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(text(f"DROP INDEX {index.name}"))
+
+    unindexed = _run_queries(args.iterations)
+    engine.dispose()
+
+    print(f"orders={args.orders} iterations={args.iterations}")
+    print("without indexes:")
+    print(unindexed.report())
+    print("with indexes:")
+    print(indexed.report())
+    print(f"speedup {unindexed.total_duration / indexed.total_duration:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Benchmark: per-worker memory of parallel vector backtests.
+
+Registers synthetic 1-minute OHLCV data for a configurable number of
+symbols with a ``DataProviderService`` and starts a spawn-based
+``ProcessPoolExecutor`` initialised exactly like
+``BacktestService.run_vector_backtests`` does (through
+``_init_worker``). Every worker then scans the full OHLCV range of
+every symbol, as a vector backtest over the whole data set would, and
+reports its memory usage.
+
+The pool is run twice: once with the data providers pickled into every
+worker (the default) and once inside
+``DataProviderService.shared_ohlcv_data()``, where the workers
+memory-map one shared Arrow IPC copy of the data. Reported per worker:
+
+* peak RSS (``VmHWM``),
+* anonymous (private) RSS — the memory the worker actually owns,
+* file-backed RSS — pages shared through the OS page cache.
+
+Memory figures are read from ``/proc/self/status`` and are therefore
+only available on Linux.
+
+Run with::
+
+    python scripts/bench_shared_ohlcv.py
+    python scripts/bench_shared_ohlcv.py --symbols 20 --days 365 --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from investing_algorithm_framework.domain import DataSource
+from investing_algorithm_framework.infrastructure import \
+    PandasOHLCVDataProvider
+from investing_algorithm_framework.infrastructure.services.backtesting \
+    import backtest_service
+from investing_algorithm_framework.services import DataProviderService
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def _frame(seed, bars):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, bars)))
+    return pd.DataFrame({
+        "Datetime": pd.date_range(START, periods=bars, freq="1min"),
+        "Open": close,
+        "High": close,
+        "Low": close,
+        "Close": close,
+        "Volume": rng.random(bars),
+    })
+
+
+def _memory():
+    status = {}
+
+    with open("/proc/self/status") as file:
+        for line in file:
+            key, _, value = line.partition(":")
+
+            if key in ("VmHWM", "RssAnon", "RssFile"):
+                status[key] = int(value.split()[0]) / 1024
+
+    return status
+
+
+def _scan_all_symbols(end_date):
+    # Runs inside the worker; the service was installed by _init_worker
+    service = backtest_service._worker_data_provider_service
+    total = 0.0
+
+    for _, provider in service.data_provider_index.get_all():
+        data = provider.data.filter(
+            (pl.col("Datetime") >= START) & (pl.col("Datetime") <= end_date)
+        )
+        total += data["Close"].sum() + data["Volume"].sum()
+
+    time.sleep(0.5)
+    return total, _memory()
+
+
+def _run_pool(service, workers, end_date):
+    mp_ctx = multiprocessing.get_context("spawn")
+    t0 = time.perf_counter()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_ctx,
+        initializer=backtest_service._init_worker,
+        initargs=(service,),
+    ) as ex:
+        futures = [
+            ex.submit(_scan_all_symbols, end_date) for _ in range(workers)
+        ]
+        results = [future.result() for future in futures]
+
+    return time.perf_counter() - t0, [memory for _, memory in results]
+
+
+def _report(title, payload, elapsed, memories):
+    print(title)
+    print("=" * 60)
+    print(f"  pickled service   : {payload / 1024 ** 2:>10.1f} MiB")
+    print(f"  wall-clock        : {elapsed:>10.2f} s")
+
+    for key, label in (
+        ("VmHWM", "peak RSS"),
+        ("RssAnon", "private RSS"),
+        ("RssFile", "file-backed RSS"),
+    ):
+        values = [memory[key] for memory in memories]
+        print(f"  {label:<18}: {np.mean(values):>10.1f} MiB / worker "
+              f"(max {max(values):.1f})")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--symbols", type=int, default=10)
+    ap.add_argument("--days", type=int, default=180)
+    ap.add_argument("--workers", type=int, default=4)
+    args = ap.parse_args()
+
+    bars = args.days * 1440
+    end_date = START + timedelta(minutes=bars - 1)
+    service = DataProviderService()
+
+    for i in range(args.symbols):
+        symbol = f"S{i:03d}/EUR"
+        service.register_data_provider(
+            DataSource(
+                data_type="OHLCV",
+                market="BITVAVO",
+                symbol=symbol,
+                time_frame="1m",
+            ),
+            PandasOHLCVDataProvider(
+                dataframe=_frame(i, bars),
+                symbol=symbol,
+                time_frame="1m",
+                market="BITVAVO",
+            ),
+        )
+
+    size = sum(
+        provider.data.estimated_size()
+        for _, provider in service.data_provider_index.get_all()
+    )
+    print(f"OHLCV data — {args.symbols} symbols x {bars} bars "
+          f"(1m, {args.days} days), {size / 1024 ** 2:.1f} MiB, "
+          f"{args.workers} workers")
+    print()
+
+    payload = len(pickle.dumps(service))
+    elapsed, memories = _run_pool(service, args.workers, end_date)
+    _report("Pickled per worker", payload, elapsed, memories)
+    print()
+
+    with service.shared_ohlcv_data():
+        payload = len(pickle.dumps(service))
+        elapsed, memories = _run_pool(service, args.workers, end_date)
+
+    _report("Shared memory-mapped Arrow IPC", payload, elapsed, memories)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark: writing portfolio snapshots to a SQLite database.
+
+The event loop used to keep all snapshots of a run in memory and save
+them at the end with ``save_all``, which adds every snapshot to the
+session and lets the unit of work of the session insert them one by
+one. The snapshots are now buffered by a ``PortfolioSnapshotWriter``
+that writes them every ``SNAPSHOT_FLUSH_SIZE`` snapshots, and at the
+end of the run, with one bulk insert per batch.
+
+This script writes the same snapshots both ways to a temporary SQLite
+database and prints the duration of both.
+
+Run with::
+
+    python scripts/bench_snapshot_writer.py
+    python scripts/bench_snapshot_writer.py --snapshots 500000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+
+from investing_algorithm_framework.infrastructure import \
+    SQLPortfolioSnapshot, SQLPortfolioSnapshotRepository
+from investing_algorithm_framework.infrastructure.database import Session, \
+    SQLBaseModel
+from investing_algorithm_framework.services import \
+    PortfolioSnapshotService, PortfolioSnapshotWriter
+
+START = datetime(2020, 1, 1)
+
+
+def _create_snapshots(number_of_snapshots):
+    return [
+        SQLPortfolioSnapshot(
+            portfolio_id="1",
+            trading_symbol="EUR",
+            pending_value=0,
+            unallocated=1000 - index * 0.01,
+            net_size=1000,
+            total_net_gain=index * 0.01,
+            total_revenue=0,
+            total_cost=0,
+            cash_flow=0,
+            total_value=1000 + index * 0.01,
+            created_at=START + timedelta(minutes=index),
+        )
+        for index in range(number_of_snapshots)
+    ]
+
+
+def _clear():
+
+    with Session() as db:
+        db.query(SQLPortfolioSnapshot).delete()
+        db.commit()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--snapshots", type=int, default=100_000)
+    ap.add_argument("--flush-size", type=int, default=1000)
+    args = ap.parse_args()
+
+    directory = tempfile.mkdtemp()
+    engine = create_engine(
+        f"sqlite:///{os.path.join(directory, 'bench.sqlite3')}"
+    )
+    SQLBaseModel.metadata.create_all(engine)
+    Session.configure(bind=engine)
+    service = PortfolioSnapshotService(
+        repository=SQLPortfolioSnapshotRepository(),
+        portfolio_repository=None,
+        order_repository=None,
+        position_repository=None,
+        position_snapshot_service=None,
+        data_provider_service=None,
+    )
+
+    snapshots = _create_snapshots(args.snapshots)
+    started_at = time.perf_counter()
+    service.save_all(snapshots)
+    save_all_duration = time.perf_counter() - started_at
+    _clear()
+
+    snapshots = _create_snapshots(args.snapshots)
+    writer = PortfolioSnapshotWriter(service, flush_size=args.flush_size)
+    started_at = time.perf_counter()
+
+    for snapshot in snapshots:
+        writer.add(snapshot)
+
+    writer.flush()
+    writer_duration = time.perf_counter() - started_at
+    count = service.count()
+    engine.dispose()
+
+    print(f"snapshots={args.snapshots} flush_size={args.flush_size} "
+          f"written={count}")
+    print(f"save_all: {save_all_duration:.2f}s")
+    print(f"writer:   {writer_duration:.2f}s")
+    print(f"speedup {save_all_duration / writer_duration:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
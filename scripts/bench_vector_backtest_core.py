@@ -0,0 +1,201 @@
+"""Benchmark: per-bar execution core of ``VectorBacktestService.run``.
+
+Drives a vector backtest over synthetic 5-minute OHLCV data for a
+configurable number of symbols with seeded random entry/exit signals,
+and reports the wall-clock time of ``VectorBacktestService.run``
+together with the per-bar throughput (bars x symbols per second).
+
+Data loading is served from memory through a stub data provider
+service, so the end-to-end number covers signal alignment, the
+per-bar state machine, the snapshot pass and metric generation. The
+per-bar state machine is additionally timed on its own by driving
+``VectorExecutionCore`` directly with the same (bars x symbols)
+close / signal arrays.
+
+Run with::
+
+    python scripts/bench_vector_backtest_core.py
+    python scripts/bench_vector_backtest_core.py --symbols 50 --days 90
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from investing_algorithm_framework import (
+    BacktestDateRange,
+    DataSource,
+    DataType,
+    PortfolioConfiguration,
+    PositionSize,
+    Schedule,
+    SignalSeries,
+    SignalSide,
+    TimeUnit,
+    TradingCost,
+    TradingStrategy,
+)
+from investing_algorithm_framework.infrastructure.services.backtesting \
+    .vector_backtest_service import VectorBacktestService
+from investing_algorithm_framework.infrastructure.services.backtesting \
+    .vector_execution_core import VectorExecutionCore, SIGNAL_BUY, \
+    SIGNAL_SELL
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+BAR = timedelta(minutes=5)
+
+
+class _InMemoryDataProviderService:
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def get_vectorized_backtest_data(
+        self, data_sources, start_date=None, end_date=None
+    ):
+        return {ds.get_identifier(): self.frames[ds.symbol]
+                for ds in data_sources}
+
+    def get_ohlcv_data(
+        self, symbol, start_date=None, end_date=None, pandas=True, **kwargs
+    ):
+        return self.frames[symbol]
+
+
+class _RandomSignalStrategy(TradingStrategy):
+    schedule = Schedule.every(5, TimeUnit.MINUTE)
+
+    def __init__(self, symbols, density):
+        self._density = density
+        super().__init__(
+            algorithm_id="bench",
+            symbols=symbols,
+            data_sources=[
+                DataSource(
+                    identifier=f"{s}_ohlcv",
+                    data_type=DataType.OHLCV,
+                    time_frame="5m",
+                    market="BITVAVO",
+                    symbol=f"{s}/EUR",
+                    pandas=True,
+                ) for s in symbols
+            ],
+            position_sizes=[
+                PositionSize(
+                    symbol=s, percentage_of_portfolio=100 / len(symbols)
+                ) for s in symbols
+            ],
+        )
+
+    def generate_signal_series(self, data):
+        for i, symbol in enumerate(self.symbols):
+            index = data[f"{symbol}_ohlcv"].index
+            rng = np.random.default_rng(i)
+            yield SignalSeries(
+                symbol=symbol,
+                side=SignalSide.OPEN_LONG,
+                series=pd.Series(
+                    rng.random(len(index)) < self._density, index=index
+                ),
+            )
+            yield SignalSeries(
+                symbol=symbol,
+                side=SignalSide.CLOSE_LONG,
+                series=pd.Series(
+                    rng.random(len(index)) < self._density, index=index
+                ),
+            )
+
+
+def _frames(symbols, bars):
+    index = pd.DatetimeIndex(
+        [START + BAR * i for i in range(bars)], name="Datetime"
+    )
+    frames = {}
+
+    for i, symbol in enumerate(symbols):
+        rng = np.random.default_rng(100 + i)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, bars)))
+        frames[f"{symbol}/EUR"] = pd.DataFrame(
+            {"Open": close, "High": close, "Low": close,
+             "Close": close, "Volume": 1.0},
+            index=index,
+        )
+    return frames
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--symbols", type=int, default=20)
+    ap.add_argument("--days", type=int, default=30)
+    ap.add_argument("--density", type=float, default=0.01)
+    ap.add_argument("--dynamic", action="store_true")
+    args = ap.parse_args()
+
+    bars = args.days * 288
+    symbols = [f"S{i:03d}" for i in range(args.symbols)]
+    service = VectorBacktestService(
+        _InMemoryDataProviderService(_frames(symbols, bars))
+    )
+    strategy = _RandomSignalStrategy(symbols, args.density)
+
+    t0 = time.perf_counter()
+    run = service.run(
+        strategy=strategy,
+        backtest_date_range=BacktestDateRange(
+            start_date=START, end_date=START + timedelta(days=args.days)
+        ),
+        portfolio_configuration=PortfolioConfiguration(
+            market="BITVAVO", trading_symbol="EUR", initial_balance=10000
+        ),
+        dynamic_position_sizing=args.dynamic,
+    )
+    elapsed = time.perf_counter() - t0
+
+    frames = service.data_provider_service.frames
+    close = np.column_stack(
+        [frames[f"{s}/EUR"]["Close"].to_numpy() for s in symbols]
+    )
+    signals = np.zeros(close.shape, dtype=np.uint8)
+
+    for i in range(len(symbols)):
+        rng = np.random.default_rng(i)
+        signals[rng.random(bars) < args.density, i] |= SIGNAL_BUY
+        signals[rng.random(bars) < args.density, i] |= SIGNAL_SELL
+
+    t0 = time.perf_counter()
+    VectorExecutionCore(
+        symbols=symbols,
+        dates=list(frames[f"{symbols[0]}/EUR"].index.to_pydatetime()),
+        close=close,
+        signals=signals,
+        position_sizes=strategy.position_sizes,
+        scaling_rules=[None] * len(symbols),
+        trading_costs=[TradingCost()] * len(symbols),
+        initial_capital_for_trade=[10000 / len(symbols)] * len(symbols),
+        trading_symbol="EUR",
+        initial_amount=10000,
+        dynamic_position_sizing=args.dynamic,
+    ).run()
+    core_elapsed = time.perf_counter() - t0
+
+    print(f"Vector backtest — {args.symbols} symbols x {bars} bars "
+          f"(5m, {args.days} days, dynamic={args.dynamic})")
+    print("=" * 60)
+    print(f"  trades           : {len(run.trades):>10}")
+    print(f"  signal events    : {len(run.signal_events):>10}")
+    print(f"  wall-clock       : {elapsed:>10.2f} s")
+    print(f"  bar-symbols / s  : {bars * args.symbols / elapsed:>10.0f}")
+    print("Execution core only")
+    print("=" * 60)
+    print(f"  wall-clock       : {core_elapsed:>10.2f} s")
+    print(f"  bar-symbols / s  : "
+          f"{bars * args.symbols / core_elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
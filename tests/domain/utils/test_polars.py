@@ -1,7 +1,10 @@
+from datetime import datetime, timedelta, timezone
 from unittest import TestCase
 from polars import DataFrame
 from pandas import Timestamp
+from pandas.testing import assert_frame_equal
 from investing_algorithm_framework import convert_polars_to_pandas
+from investing_algorithm_framework.domain import PandasConversionCache
 
 class TestConvertPandasToPolars(TestCase):
 
@@ -39,3 +42,60 @@ class TestConvertPandasToPolars(TestCase):
         self.assertEqual(
             polars_df_converted.index[0], Timestamp('2021-01-01 00:00:00')
         )
+
+
+class TestPandasConversionCache(TestCase):
+
+    def _data(self, n=50):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        return DataFrame({
+            "Datetime": [start + timedelta(hours=i) for i in range(n)],
+            "Open": [float(i) for i in range(n)],
+            "Close": [float(i) + 1 for i in range(n)],
+        })
+
+    def test_windows_equal_converted_windows(self):
+        source = self._data()
+        cache = PandasConversionCache()
+
+        for start, length in [(0, 10), (5, 20), (40, 10), (49, 1)]:
+            window = source.slice(start, length)
+            assert_frame_equal(
+                convert_polars_to_pandas(window),
+                cache.convert(source, window)
+            )
+
+        # The source is converted once
+        frame = cache._frame
+        cache.convert(source, source.slice(10, 5))
+        self.assertIs(frame, cache._frame)
+
+    def test_windows_are_independent_copies(self):
+        source = self._data()
+        cache = PandasConversionCache()
+        window = cache.convert(source, source.slice(0, 10))
+        window["Close"] = 0.0
+        window["Indicator"] = 1.0
+
+        assert_frame_equal(
+            convert_polars_to_pandas(source.slice(0, 10)),
+            cache.convert(source, source.slice(0, 10))
+        )
+
+    def test_new_source_is_converted_again(self):
+        cache = PandasConversionCache()
+        cache.convert(self._data(), self._data().slice(0, 5))
+        source = self._data(60)
+        window = source.slice(50, 10)
+        assert_frame_equal(
+            convert_polars_to_pandas(window), cache.convert(source, window)
+        )
+
+    def test_unsorted_source_is_not_cached(self):
+        source = self._data().reverse()
+        cache = PandasConversionCache()
+        window = source.slice(0, 10)
+        assert_frame_equal(
+            convert_polars_to_pandas(window), cache.convert(source, window)
+        )
+        self.assertIsNone(cache._frame)
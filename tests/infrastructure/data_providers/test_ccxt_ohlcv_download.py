@@ -0,0 +1,233 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+import ccxt
+import polars as pl
+
+from investing_algorithm_framework.domain import MarketCredential, \
+    NetworkError, TimeFrame
+from investing_algorithm_framework.infrastructure import \
+    CCXTOHLCVDataProvider
+from investing_algorithm_framework.infrastructure.data_providers\
+    .rate_limiter import TokenBucket
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _milliseconds(date):
+    return int(date.timestamp() * 1000)
+
+
+class FakeExchange:
+    """
+    Local stand-in for a CCXT exchange that serves hourly candles and
+    returns at most ``max_candles`` candles per request.
+    """
+    has = {"fetchOHLCV": True}
+
+    def __init__(self, max_candles=100, rate_limit=0, missing=(), error=None):
+        self.max_candles = max_candles
+        self.rateLimit = rate_limit
+        self.missing = set(_milliseconds(date) for date in missing)
+        self.error = error
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def parse_timeframe(self, time_frame):
+        return TimeFrame.from_value(time_frame).amount_of_minutes * 60
+
+    def milliseconds(self):
+        return _milliseconds(START + timedelta(days=30))
+
+    def fetch_ohlcv(self, symbol, time_frame, since=None, limit=None):
+        with self._lock:
+            self.requests.append((time.monotonic(), since))
+
+        if self.error is not None:
+            raise self.error
+
+        step = self.parse_timeframe(time_frame) * 1000
+        timestamp = since + (-since % step)
+        candles = []
+
+        while len(candles) < self.max_candles \
+                and timestamp <= self.milliseconds():
+            if timestamp not in self.missing:
+                price = (timestamp - _milliseconds(START)) / step
+                candles.append([timestamp, price, price, price, price, 1])
+
+            timestamp += step
+
+        return candles
+
+
+class TestCCXTOHLCVDownload(TestCase):
+    """Paginated downloads of CCXTOHLCVDataProvider.get_ohlcv."""
+
+    def setUp(self):
+        CCXTOHLCVDataProvider.clear_exchange_pool()
+
+    def tearDown(self):
+        CCXTOHLCVDataProvider.clear_exchange_pool()
+
+    def _get_ohlcv(self, exchange, start, end, provider=None, market="fake"):
+        if provider is None:
+            provider = CCXTOHLCVDataProvider()
+
+        with patch.object(
+            CCXTOHLCVDataProvider, "initialize_exchange",
+            return_value=exchange
+        ) as initialize_exchange:
+            data = provider.get_ohlcv(
+                symbol="BTC/EUR",
+                time_frame=TimeFrame.ONE_HOUR,
+                from_timestamp=start,
+                market=market,
+                to_timestamp=end,
+            )
+        return data, initialize_exchange.call_count
+
+    def _expected_dates(self, start, end, missing=()):
+        dates = []
+
+        while start <= end:
+            if start not in missing:
+                dates.append(start)
+
+            start += timedelta(hours=1)
+
+        return dates
+
+    def test_pages_are_downloaded_concurrently(self):
+        end = START + timedelta(days=20)
+
+        for max_candles in [50, 500, 2000]:
+            exchange = FakeExchange(max_candles=max_candles)
+            CCXTOHLCVDataProvider.clear_exchange_pool()
+            provider = CCXTOHLCVDataProvider()
+            provider.ohlcv_page_size = 100
+            data, _ = self._get_ohlcv(exchange, START, end, provider)
+
+            self.assertEqual(
+                self._expected_dates(START, end), data["Datetime"].to_list()
+            )
+            self.assertEqual(
+                pl.Datetime("ms", "UTC"), data["Datetime"].dtype
+            )
+            self.assertEqual(pl.Float64, data["Volume"].dtype)
+            self.assertEqual(
+                list(range(len(data))), data["Close"].cast(int).to_list()
+            )
+            # Every page of 100 candles starts with a request
+            starts = set(since for _, since in exchange.requests)
+
+            for page in range(5):
+                self.assertIn(
+                    _milliseconds(START + timedelta(hours=100 * page)),
+                    starts
+                )
+
+    def test_gaps_in_exchange_data(self):
+        missing = [
+            START + timedelta(hours=hours) for hours in range(90, 130)
+        ] + [START + timedelta(hours=250)]
+        end = START + timedelta(days=15)
+        exchange = FakeExchange(max_candles=60, missing=missing)
+        provider = CCXTOHLCVDataProvider()
+        provider.ohlcv_page_size = 100
+        data, _ = self._get_ohlcv(exchange, START, end, provider)
+
+        self.assertEqual(
+            self._expected_dates(START, end, missing),
+            data["Datetime"].to_list()
+        )
+
+    def test_empty_range(self):
+        data, _ = self._get_ohlcv(
+            FakeExchange(), START + timedelta(days=40),
+            START + timedelta(days=41)
+        )
+
+        self.assertEqual(0, len(data))
+        self.assertEqual(pl.Datetime("ms", "UTC"), data["Datetime"].dtype)
+
+    def test_exchange_clients_are_pooled(self):
+        exchange = FakeExchange()
+        end = START + timedelta(days=1)
+        _, initializations = self._get_ohlcv(exchange, START, end)
+        self.assertEqual(1, initializations)
+        _, initializations = self._get_ohlcv(exchange, START, end)
+        self.assertEqual(0, initializations)
+
+        # Another credential gets its own client
+        provider = CCXTOHLCVDataProvider()
+        provider.market_credentials = [
+            MarketCredential(market="fake", api_key="key", secret_key="secret")
+        ]
+        _, initializations = self._get_ohlcv(exchange, START, end, provider)
+        self.assertEqual(1, initializations)
+
+        exchange_a, limiter_a = CCXTOHLCVDataProvider.get_exchange(
+            "FAKE", None
+        )
+        exchange_b, limiter_b = CCXTOHLCVDataProvider.get_exchange(
+            "fake", None
+        )
+        self.assertIs(exchange, exchange_a)
+        self.assertIs(exchange_a, exchange_b)
+        self.assertIs(limiter_a, limiter_b)
+
+    def test_requests_are_rate_limited(self):
+        exchange = FakeExchange(max_candles=100, rate_limit=20)
+        provider = CCXTOHLCVDataProvider()
+        provider.ohlcv_page_size = 100
+        self._get_ohlcv(exchange, START, START + timedelta(days=20), provider)
+
+        timestamps = sorted(timestamp for timestamp, _ in exchange.requests)
+        self.assertGreaterEqual(len(timestamps), 5)
+
+        for previous, current in zip(timestamps, timestamps[1:]):
+            self.assertGreaterEqual(current - previous, 0.015)
+
+    def test_network_error(self):
+        exchange = FakeExchange(error=ccxt.NetworkError("offline"))
+
+        with self.assertRaises(NetworkError):
+            self._get_ohlcv(exchange, START, START + timedelta(days=30))
+
+
+class TestTokenBucket(TestCase):
+
+    def test_acquire_waits_for_tokens(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+        acquired = []
+
+        def acquire():
+            for _ in range(5):
+                bucket.acquire()
+                acquired.append(time.monotonic())
+
+        threads = [threading.Thread(target=acquire) for _ in range(4)]
+        start = time.monotonic()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # 1 token up front, then 19 at 100 tokens per second
+        self.assertEqual(20, len(acquired))
+        self.assertGreaterEqual(max(acquired) - start, 0.18)
+
+    def test_burst_capacity(self):
+        bucket = TokenBucket(rate=1, capacity=5)
+        start = time.monotonic()
+
+        for _ in range(5):
+            bucket.acquire()
+
+        self.assertLess(time.monotonic() - start, 0.5)
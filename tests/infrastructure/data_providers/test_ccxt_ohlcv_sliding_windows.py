@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+import polars as pl
+
+from investing_algorithm_framework.domain import OperationalException
+from investing_algorithm_framework.infrastructure import \
+    CCXTOHLCVDataProvider
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _ohlcv(start, end, minutes):
+    n = int((end - start).total_seconds() // (minutes * 60)) + 1
+    prices = [100.0 + i for i in range(n)]
+    return pl.DataFrame({
+        "Datetime": [start + timedelta(minutes=minutes * i) for i in range(n)],
+        "Open": prices,
+        "High": prices,
+        "Low": prices,
+        "Close": prices,
+        "Volume": [1.0] * n,
+    }).with_columns(
+        pl.col("Datetime").cast(pl.Datetime(time_unit="ms", time_zone="UTC"))
+    )
+
+
+class TestCCXTOHLCVSlidingWindows(TestCase):
+    """The backtest windows of the CCXT OHLCV data provider."""
+
+    def _prepare(self, start_date, end_date, data_end=None):
+        data_provider = CCXTOHLCVDataProvider(
+            symbol="BTC/EUR",
+            market="BITVAVO",
+            time_frame="1h",
+            warmup_window=24,
+        )
+        data = _ohlcv(
+            start_date - timedelta(hours=24), data_end or end_date, 60
+        )
+
+        with patch.object(
+            CCXTOHLCVDataProvider, "get_ohlcv", return_value=data
+        ):
+            data_provider.prepare_backtest_data(
+                backtest_start_date=start_date,
+                backtest_end_date=end_date,
+            )
+
+        return data_provider, data
+
+    def test_windows_match_filtered_windows(self):
+        end_date = START + timedelta(days=10)
+        data_provider, data = self._prepare(START, end_date)
+        timestamps = [
+            ts for ts in data["Datetime"].to_list()
+            if START <= ts <= end_date
+        ]
+
+        self.assertEqual(timestamps, list(data_provider.window_cache))
+
+        for timestamp in timestamps:
+            expected = data.filter(
+                (data["Datetime"] <= timestamp) &
+                (data["Datetime"] >= timestamp - timedelta(hours=24))
+            )
+            self.assertTrue(expected.equals(
+                data_provider.get_backtest_data(
+                    backtest_index_date=timestamp
+                )
+            ))
+
+    def test_get_backtest_data_between_bars(self):
+        data_provider, _ = self._prepare(START, START + timedelta(days=2))
+        data = data_provider.get_backtest_data(
+            backtest_index_date=START + timedelta(hours=5, minutes=30)
+        )
+
+        self.assertEqual(
+            START + timedelta(hours=6), data["Datetime"][-1]
+        )
+        self.assertEqual(25, len(data))
+
+    def test_end_date_between_bars_is_included(self):
+        end_date = START + timedelta(days=2, minutes=30)
+        data_provider, data = self._prepare(START, end_date)
+
+        self.assertIn(end_date, data_provider.window_cache)
+        window = data_provider.get_backtest_data(
+            backtest_index_date=end_date - timedelta(minutes=10)
+        )
+        self.assertTrue(data[-24:].equals(window))
+
+        with self.assertRaises(OperationalException):
+            data_provider.get_backtest_data(
+                backtest_index_date=end_date + timedelta(minutes=1)
+            )
@@ -0,0 +1,250 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+import polars as pl
+
+from investing_algorithm_framework.domain import OperationalException, \
+    OHLCV_STORAGE_FORMAT, TimeFrame
+from investing_algorithm_framework.infrastructure import \
+    CCXTOHLCVDataProvider
+from investing_algorithm_framework.services.data_providers import \
+    CompletenessIndex
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _ohlcv(start, end, minutes=60):
+    n = int((end - start).total_seconds() // (minutes * 60)) + 1
+    dates = [start + timedelta(minutes=minutes * i) for i in range(n)]
+    prices = [
+        100.0 + (date - START).total_seconds() / 3600 for date in dates
+    ]
+    return pl.DataFrame({
+        "Datetime": dates,
+        "Open": prices,
+        "High": prices,
+        "Low": prices,
+        "Close": prices,
+        "Volume": [1.0] * n,
+    }).with_columns(
+        pl.col("Datetime").cast(pl.Datetime(time_unit="ms", time_zone="UTC"))
+    )
+
+
+def _fake_get_ohlcv(
+    self, symbol, time_frame, from_timestamp, market, to_timestamp=None
+):
+    minutes = TimeFrame.from_value(time_frame).amount_of_minutes
+    return _ohlcv(from_timestamp, to_timestamp, minutes)
+
+
+class TestCCXTOHLCVStorage(TestCase):
+    """The Arrow storage format of the canonical CCXT OHLCV cache."""
+
+    def setUp(self):
+        self.storage_path = tempfile.mkdtemp()
+        self.directory_path = os.path.join(
+            self.storage_path, "OHLCV_BTC-EUR_BITVAVO_1h.arrow"
+        )
+        self.cache_directory = tempfile.mkdtemp()
+        patcher = patch.object(
+            CompletenessIndex, "directory", self.cache_directory
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(
+            shutil.rmtree, self.cache_directory, ignore_errors=True
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.storage_path, ignore_errors=True)
+
+    def _provider(self, **kwargs):
+        kwargs.setdefault("storage_format", "arrow")
+        return CCXTOHLCVDataProvider(
+            symbol="BTC/EUR",
+            market="BITVAVO",
+            time_frame="1h",
+            storage_directory=self.storage_path,
+            **kwargs
+        )
+
+    def _fetch(self, provider, start_date, end_date):
+        with patch.object(
+            CCXTOHLCVDataProvider, "get_ohlcv", autospec=True,
+            side_effect=_fake_get_ohlcv,
+        ) as get_ohlcv:
+            data = provider._get_or_fetch_data(
+                symbol="BTC/EUR",
+                market="BITVAVO",
+                time_frame="1h",
+                storage_path=self.storage_path,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        return data, get_ohlcv.call_count
+
+    def _parts(self):
+        return sorted(os.listdir(self.directory_path))
+
+    def test_new_bars_are_appended(self):
+        provider = self._provider()
+        self._fetch(provider, START, START + timedelta(days=10))
+        self.assertEqual(["000000.arrow"], self._parts())
+
+        data, downloads = self._fetch(
+            provider, START, START + timedelta(days=12)
+        )
+
+        self.assertEqual(1, downloads)
+        self.assertEqual(["000000.arrow", "000001.arrow"], self._parts())
+        self.assertTrue(
+            _ohlcv(START, START + timedelta(days=12)).equals(data)
+        )
+
+        cached = provider._read_canonical_file(
+            self.storage_path, "BTC/EUR", "BITVAVO", "1h"
+        )
+        self.assertEqual(pl.Datetime("ms", "UTC"), cached["Datetime"].dtype)
+        self.assertEqual(pl.Float64, cached["Volume"].dtype)
+        self.assertTrue(cached["Datetime"].is_sorted())
+        self.assertEqual(12 * 24 + 1, len(cached))
+
+    def test_earlier_bars_rewrite_cache(self):
+        provider = self._provider()
+        self._fetch(provider, START, START + timedelta(days=10))
+        self._fetch(provider, START, START + timedelta(days=12))
+        data, _ = self._fetch(
+            provider, START - timedelta(days=2), START + timedelta(days=12)
+        )
+
+        self.assertEqual(["000002.arrow"], self._parts())
+        self.assertTrue(
+            _ohlcv(
+                START - timedelta(days=2), START + timedelta(days=12)
+            ).equals(data)
+        )
+
+    def test_cache_is_compacted(self):
+        provider = self._provider()
+        provider.max_arrow_parts = 3
+
+        for days in range(1, 5):
+            self._fetch(provider, START, START + timedelta(days=days))
+
+        self.assertEqual(["000003.arrow"], self._parts())
+        _, downloads = self._fetch(
+            provider, START, START + timedelta(days=4)
+        )
+        self.assertEqual(0, downloads)
+
+    def test_csv_cache_is_migrated(self):
+        self._fetch(
+            self._provider(storage_format="csv"),
+            START, START + timedelta(days=10)
+        )
+        self.assertFalse(os.path.exists(self.directory_path))
+
+        provider = self._provider(
+            storage_format=None, config={OHLCV_STORAGE_FORMAT: "arrow"}
+        )
+        data, downloads = self._fetch(
+            provider, START + timedelta(days=1), START + timedelta(days=5)
+        )
+
+        self.assertEqual(0, downloads)
+        self.assertEqual(["000000.arrow"], self._parts())
+        self.assertTrue(
+            _ohlcv(
+                START + timedelta(days=1), START + timedelta(days=5)
+            ).equals(data)
+        )
+
+    def test_migrate_csv_cache(self):
+        csv_provider = self._provider(storage_format="csv")
+        self._fetch(csv_provider, START, START + timedelta(days=10))
+        legacy_path = os.path.join(
+            self.storage_path,
+            "OHLCV_ETH-EUR_BITVAVO_1h_2024-01-01-00-00_2024-01-02-00-00.csv"
+        )
+        _ohlcv(START, START + timedelta(days=1)).with_columns(
+            pl.col("Datetime").dt.strftime("%Y-%m-%d %H:%M:%S")
+        ).write_csv(legacy_path)
+
+        provider = self._provider()
+        migrated = provider.migrate_csv_cache(remove_csv=True)
+
+        self.assertEqual(
+            sorted([
+                self.directory_path,
+                os.path.join(
+                    self.storage_path, "OHLCV_ETH-EUR_BITVAVO_1h.arrow"
+                ),
+            ]),
+            sorted(migrated),
+        )
+        self.assertEqual("arrow", provider.storage_format)
+        self.assertEqual(
+            sorted(os.path.basename(path) for path in migrated),
+            sorted(os.listdir(self.storage_path)),
+        )
+        self.assertTrue(
+            _ohlcv(START, START + timedelta(days=1)).equals(
+                provider._read_canonical_file(
+                    self.storage_path, "ETH/EUR", "BITVAVO", "1h"
+                )
+            )
+        )
+        self.assertEqual([], provider.migrate_csv_cache())
+
+    def test_unsupported_storage_format(self):
+        with self.assertRaises(OperationalException):
+            self._provider(storage_format="xlsx")
+
+        provider = self._provider(
+            storage_format=None, config={OHLCV_STORAGE_FORMAT: "xlsx"}
+        )
+
+        with self.assertRaises(OperationalException):
+            provider.get_storage_format()
+
+    def test_fill_missing_data_uses_completeness_index(self):
+        gap = START + timedelta(hours=30)
+
+        def get_ohlcv(self, symbol, time_frame, from_timestamp, market,
+                      to_timestamp=None):
+            return _fake_get_ohlcv(
+                self, symbol, time_frame, from_timestamp, market,
+                to_timestamp
+            ).filter(pl.col("Datetime") != gap)
+
+        index_path = CompletenessIndex.index_path(self.directory_path)
+
+        for _ in range(2):
+            provider = self._provider(warmup_window=10)
+
+            with patch.object(
+                CCXTOHLCVDataProvider, "get_ohlcv", autospec=True,
+                side_effect=get_ohlcv,
+            ), patch(
+                "investing_algorithm_framework.services.data_providers"
+                ".completeness.CompletenessIndex.from_data",
+                wraps=CompletenessIndex.from_data,
+            ) as from_data:
+                provider.prepare_backtest_data(
+                    START + timedelta(hours=24),
+                    START + timedelta(hours=48),
+                    fill_missing_data=True,
+                )
+
+            filled = provider.data.filter(pl.col("Datetime") == gap)
+            self.assertEqual(1, len(filled))
+            self.assertEqual(129.0, filled["Close"][0])
+            self.assertTrue(os.path.isfile(index_path))
+
+        # The index of the unchanged cache is reused by the second run
+        from_data.assert_not_called()
@@ -636,3 +636,177 @@ class Test(TestCase):
                 minutes=TimeFrame.from_value(datasource.time_frame)
                 .amount_of_minutes
             )
+
+    def test_sliding_windows_match_filtered_windows(self):
+        file_name = "OHLCV_BTC-EUR_BINANCE" \
+                    "_2h_2023-08-07-07-59_2023-12-02-00-00.csv"
+        data_provider = CSVOHLCVDataProvider(
+            storage_path=os.path.join(
+                self.resource_dir, "test_data", "ohlcv", file_name
+            ),
+            market="binance",
+            symbol="BTC/EUR",
+            time_frame="2h",
+            warmup_window=50
+        )
+        start = datetime(2023, 9, 1, 0, 0, tzinfo=timezone.utc)
+        end = datetime(2023, 10, 1, 0, 0, tzinfo=timezone.utc)
+        data_provider.prepare_backtest_data(
+            backtest_start_date=start,
+            backtest_end_date=end
+        )
+        data = data_provider.data
+        timestamps = [
+            ts for ts in data["Datetime"].to_list() if start <= ts <= end
+        ]
+
+        self.assertEqual(timestamps, list(data_provider.window_cache))
+
+        for timestamp in timestamps:
+            expected = data.filter(
+                (data["Datetime"] <= timestamp) &
+                (data["Datetime"] >= timestamp - timedelta(hours=2 * 50))
+            )
+            self.assertTrue(
+                expected.equals(data_provider.window_cache[timestamp])
+            )
+
+    def test_get_backtest_data_between_timestamps(self):
+        file_name = "OHLCV_BTC-EUR_BINANCE" \
+                    "_2h_2023-08-07-07-59_2023-12-02-00-00.csv"
+        data_provider = CSVOHLCVDataProvider(
+            storage_path=os.path.join(
+                self.resource_dir, "test_data", "ohlcv", file_name
+            ),
+            market="binance",
+            symbol="BTC/EUR",
+            time_frame="2h",
+            warmup_window=10
+        )
+        start = datetime(2023, 9, 1, 0, 0, tzinfo=timezone.utc)
+        end = datetime(2023, 10, 1, 0, 0, tzinfo=timezone.utc)
+        data_provider.prepare_backtest_data(
+            backtest_start_date=start,
+            backtest_end_date=end
+        )
+
+        # Dates between two bars get the window of the next bar
+        data = data_provider.get_backtest_data(
+            backtest_index_date=datetime(
+                2023, 9, 15, 0, 30, tzinfo=timezone.utc
+            )
+        )
+        self.assertEqual(
+            datetime(2023, 9, 15, 2, 0, tzinfo=timezone.utc),
+            data["Datetime"][-1]
+        )
+
+        with self.assertRaises(KeyError):
+            data_provider.window_cache[
+                datetime(2023, 9, 15, 0, 30, tzinfo=timezone.utc)
+            ]
+
+        with self.assertRaises(OperationalException):
+            data_provider.get_backtest_data(
+                backtest_index_date=end + timedelta(minutes=1)
+            )
+
+    def test_lazy_loading(self):
+        storage_path = os.path.join(
+            self.resource_dir, "test_data", "ohlcv",
+            "OHLCV_BTC-EUR_BINANCE_2h_2023-08-07-07-59_2023-12-02-00-00.csv"
+        )
+        eager_provider = CSVOHLCVDataProvider(
+            storage_path=storage_path,
+            market="binance",
+            symbol="BTC/EUR",
+            time_frame="2h",
+            warmup_window=50
+        )
+        data_provider = CSVOHLCVDataProvider(
+            storage_path=storage_path,
+            market="binance",
+            symbol="BTC/EUR",
+            time_frame="2h",
+            warmup_window=50,
+            lazy=True
+        )
+        self.assertIsNone(data_provider.data)
+        self.assertEqual(
+            eager_provider._start_date_data_source,
+            data_provider._start_date_data_source
+        )
+        self.assertEqual(
+            eager_provider._end_date_data_source,
+            data_provider._end_date_data_source
+        )
+
+        start = datetime(2023, 9, 1, 0, 0, tzinfo=timezone.utc)
+        end = datetime(2023, 10, 1, 0, 0, tzinfo=timezone.utc)
+
+        for provider in [eager_provider, data_provider]:
+            provider.prepare_backtest_data(
+                backtest_start_date=start,
+                backtest_end_date=end
+            )
+
+        # Only the backtest range and its warmup window are loaded
+        required_start = start - timedelta(hours=2 * 50)
+        self.assertEqual(
+            required_start, data_provider.data["Datetime"].min()
+        )
+        self.assertEqual(end, data_provider.data["Datetime"].max())
+        self.assertEqual(
+            eager_provider.missing_data_point_dates,
+            data_provider.missing_data_point_dates
+        )
+        self.assertEqual(
+            list(eager_provider.window_cache),
+            list(data_provider.window_cache)
+        )
+
+        for timestamp in eager_provider.window_cache:
+            self.assertTrue(
+                eager_provider.window_cache[timestamp].equals(
+                    data_provider.window_cache[timestamp]
+                )
+            )
+
+        # Rows outside of the loaded range are loaded on demand
+        range_start = datetime(2023, 8, 10, 0, 0, tzinfo=timezone.utc)
+        range_end = datetime(2023, 11, 1, 0, 0, tzinfo=timezone.utc)
+        self.assertTrue(
+            eager_provider.get_backtest_data(
+                backtest_index_date=range_end,
+                backtest_start_date=range_start,
+                backtest_end_date=range_end
+            ).equals(
+                data_provider.get_backtest_data(
+                    backtest_index_date=range_end,
+                    backtest_start_date=range_start,
+                    backtest_end_date=range_end
+                )
+            )
+        )
+        self.assertEqual(range_start, data_provider.data["Datetime"].min())
+        self.assertTrue(
+            eager_provider.window_cache[end].equals(
+                data_provider.window_cache[end]
+            )
+        )
+
+    def test_lazy_loading_missing_columns(self):
+        file_name = "OHLCV_BTC-EUR_BINANCE_2h_NO_COLUMNS" \
+                    "_2023-08-07-07-59_2023-12-02-00-00.csv"
+
+        with self.assertRaises(OperationalException):
+            CSVOHLCVDataProvider(
+                storage_path=os.path.join(
+                    self.resource_dir, "test_data", "ohlcv", file_name
+                ),
+                market="binance",
+                symbol="BTC/EUR",
+                time_frame="2h",
+                warmup_window=10,
+                lazy=True
+            )
@@ -2,7 +2,10 @@ import os
 from datetime import datetime, timezone
 from unittest import TestCase
 
-from investing_algorithm_framework.domain import DataSource
+import polars as pl
+
+from investing_algorithm_framework.domain import DataSource, \
+    OperationalException
 from investing_algorithm_framework.infrastructure import \
     CSVTickerDataProvider
 
@@ -177,3 +180,77 @@ class TestCSVTickerDataProvider(TestCase):
             "my_custom_ticker",
             data_provider.data_provider_identifier
         )
+
+    def test_get_data_closest_row(self):
+        """get_data returns the last row at or before the date."""
+        data_provider = CSVTickerDataProvider(
+            storage_path=self.storage_path,
+            market="binance",
+            symbol="BTC/EUR",
+        )
+        data = data_provider.data
+        dates = [
+            datetime(2023, 8, 23, 22, 0, tzinfo=timezone.utc),
+            datetime(2023, 9, 15, 1, 0, tzinfo=timezone.utc),
+            datetime(2023, 10, 1, 2, 30, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+        ]
+
+        for date in dates:
+            expected = data.filter(pl.col("Datetime") <= date).tail(1)
+            result = data_provider.get_data(date=date)
+            self.assertEqual(expected["Datetime"][0], result["datetime"])
+            self.assertEqual(expected["Close"][0], result["close"])
+
+        # Before the first row the first row is returned
+        result = data_provider.get_data(
+            date=datetime(2023, 1, 1, tzinfo=timezone.utc)
+        )
+        self.assertEqual(data["Datetime"][0], result["datetime"])
+
+    def test_get_backtest_data(self):
+        """get_backtest_data looks up the prepared backtest rows."""
+        data_provider = CSVTickerDataProvider(
+            storage_path=self.storage_path,
+            market="binance",
+            symbol="BTC/EUR",
+        )
+        start = datetime(2023, 9, 1, tzinfo=timezone.utc)
+        end = datetime(2023, 10, 1, tzinfo=timezone.utc)
+
+        with self.assertRaises(OperationalException):
+            data_provider.get_backtest_data(backtest_index_date=start)
+
+        data_provider.prepare_backtest_data(start, end)
+        result = data_provider.get_backtest_data(
+            backtest_index_date=datetime(
+                2023, 9, 15, 1, 0, tzinfo=timezone.utc
+            )
+        )
+        self.assertEqual(
+            datetime(2023, 9, 15, 0, 0, tzinfo=timezone.utc),
+            result["datetime"]
+        )
+
+        # After the backtest range the last prepared row is returned
+        result = data_provider.get_backtest_data(
+            backtest_index_date=datetime(2023, 11, 1, tzinfo=timezone.utc)
+        )
+        self.assertEqual(end, result["datetime"])
+
+        with self.assertRaises(OperationalException):
+            data_provider.get_backtest_data(
+                backtest_index_date=datetime(
+                    2023, 8, 31, tzinfo=timezone.utc
+                )
+            )
+
+        self.assertEqual(
+            len(
+                data_provider.data.filter(
+                    (pl.col("Datetime") >= start)
+                    & (pl.col("Datetime") <= end)
+                )
+            ),
+            data_provider.get_number_of_data_points(start, end)
+        )
@@ -0,0 +1,172 @@
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+import polars as pl
+
+from investing_algorithm_framework.domain import OperationalException
+from investing_algorithm_framework.infrastructure import \
+    YahooOHLCVDataProvider
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = datetime(2024, 1, 31, tzinfo=timezone.utc)
+
+
+def _fake_download(self, symbol, time_frame, start_date, end_date):
+    # Daily candles of the range, priced by the day of the year
+    dates = pl.datetime_range(
+        start_date, end_date, interval="1d", eager=True,
+        time_unit="us", time_zone="UTC",
+    )
+    prices = dates.dt.ordinal_day().cast(pl.Float64)
+    return pl.DataFrame({
+        "Datetime": dates,
+        "Open": prices,
+        "High": prices,
+        "Low": prices,
+        "Close": prices,
+        "Volume": prices,
+    })
+
+
+class TestOHLCVBatchDownload(TestCase):
+
+    def setUp(self):
+        self.storage_directory = tempfile.mkdtemp()
+        self.provider = YahooOHLCVDataProvider(
+            time_frame="1d", storage_directory=self.storage_directory
+        )
+        self.provider.download_chunk_size = 7
+        self.provider.download_retry_backoff = 0
+        self.download = patch.object(
+            YahooOHLCVDataProvider, "_download_ohlcv", autospec=True,
+            side_effect=_fake_download,
+        )
+        self.download_mock = self.download.start()
+
+    def tearDown(self):
+        self.download.stop()
+        shutil.rmtree(self.storage_directory, ignore_errors=True)
+
+    def test_download_in_chunks(self):
+        symbols = ["AAPL", "MSFT", "NVDA"]
+        data = self.provider.download_ohlcv(symbols, START, END)
+
+        # 30 days in chunks of 7 days, for every symbol
+        self.assertEqual(15, self.download_mock.call_count)
+        expected = _fake_download(None, "AAPL", "1d", START, END)
+
+        for symbol in symbols:
+            self.assertTrue(data[symbol].equals(expected))
+            stored = self.provider._get_data_from_storage(
+                symbol, "1d", self.storage_directory
+            )
+            self.assertEqual(
+                expected["Close"].to_list(), stored["Close"].to_list()
+            )
+
+        # The chunks of a symbol cover the range without gaps
+        calls = sorted(
+            (call.kwargs["start_date"], call.kwargs["end_date"])
+            for call in self.download_mock.call_args_list
+            if call.kwargs["symbol"] == "AAPL"
+        )
+        self.assertEqual(START, calls[0][0])
+        self.assertEqual(END, calls[-1][1])
+
+        for (_, end), (start, _) in zip(calls, calls[1:]):
+            self.assertEqual(end, start)
+
+    def test_one_write_per_symbol(self):
+        with patch.object(
+            YahooOHLCVDataProvider, "_save_data_to_storage_impl",
+            wraps=YahooOHLCVDataProvider._save_data_to_storage_impl
+        ) as save:
+            self.provider.download_ohlcv(["AAPL", "MSFT"], START, END)
+
+        self.assertEqual(2, save.call_count)
+
+    def test_download_concurrently(self):
+        # Every chunk waits until two chunks are downloading at once
+        barrier = threading.Barrier(2, timeout=5)
+
+        def download(self, **kwargs):
+            barrier.wait()
+            return _fake_download(self, **kwargs)
+
+        self.download_mock.side_effect = download
+        data = self.provider.download_ohlcv(
+            ["AAPL", "MSFT"], START, START + timedelta(days=5),
+            max_workers=2,
+        )
+        self.assertEqual(6, len(data["AAPL"]))
+        self.assertEqual(6, len(data["MSFT"]))
+
+    def test_retry_failed_chunks(self):
+        failures = {"MSFT": 2}
+        lock = threading.Lock()
+
+        def download(self, **kwargs):
+            with lock:
+                if failures.get(kwargs["symbol"], 0) > 0:
+                    failures[kwargs["symbol"]] -= 1
+                    raise ConnectionError("Connection reset")
+
+            return _fake_download(self, **kwargs)
+
+        self.download_mock.side_effect = download
+        data = self.provider.download_ohlcv(["AAPL", "MSFT"], START, END)
+        self.assertEqual(31, len(data["MSFT"]))
+        self.assertEqual(12, self.download_mock.call_count)
+
+    def test_failed_symbol_raises_after_retries(self):
+        def download(self, **kwargs):
+            if kwargs["symbol"] == "MSFT":
+                raise ConnectionError("Connection reset")
+
+            return _fake_download(self, **kwargs)
+
+        self.download_mock.side_effect = download
+
+        with self.assertRaises(OperationalException) as context:
+            self.provider.download_ohlcv(["AAPL", "MSFT"], START, END)
+
+        self.assertIn("MSFT", str(context.exception))
+        self.assertNotIn("AAPL", str(context.exception))
+        # The other symbols are stored
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(self.storage_directory, "AAPL_1d_yahoo.csv")
+            )
+        )
+        self.assertFalse(
+            os.path.exists(
+                os.path.join(self.storage_directory, "MSFT_1d_yahoo.csv")
+            )
+        )
+
+    def test_merge_with_stored_data(self):
+        self.provider.download_ohlcv(
+            ["AAPL"], START, START + timedelta(days=9)
+        )
+        self.provider.download_ohlcv(
+            ["AAPL"], START + timedelta(days=5), END
+        )
+        stored = self.provider._get_data_from_storage(
+            "AAPL", "1d", self.storage_directory
+        )
+        self.assertEqual(31, len(stored))
+        self.assertTrue(stored["Datetime"].is_sorted())
+
+    def test_save_requires_storage_directory(self):
+        provider = YahooOHLCVDataProvider(time_frame="1d")
+
+        with self.assertRaises(OperationalException):
+            provider.download_ohlcv(["AAPL"], START, END)
+
+        data = provider.download_ohlcv(["AAPL"], START, END, save=False)
+        self.assertEqual(31, len(data["AAPL"]))
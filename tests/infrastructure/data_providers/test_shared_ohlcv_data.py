@@ -0,0 +1,74 @@
+import os
+import pickle
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import DataSource
+from investing_algorithm_framework.infrastructure import \
+    CSVOHLCVDataProvider
+from investing_algorithm_framework.services import DataProviderService
+
+
+class Test(TestCase):
+    """
+    Test cases for sharing OHLCV data between processes through
+    memory-mapped Arrow IPC files.
+    """
+
+    def setUp(self) -> None:
+        self.resource_dir = os.path.abspath(
+            os.path.join(
+                os.path.realpath(__file__),
+                os.pardir, os.pardir, os.pardir, "resources"
+            )
+        )
+        file_name = "OHLCV_BTC-EUR_BINANCE" \
+                    "_2h_2023-08-07-07-59_2023-12-02-00-00.csv"
+        data_provider = CSVOHLCVDataProvider(
+            storage_path=os.path.join(
+                self.resource_dir, "test_data", "ohlcv", file_name
+            ),
+            warmup_window=10,
+            market="binance",
+            symbol="BTC/EUR",
+            time_frame="2h"
+        )
+        data_source = DataSource(
+            market="binance",
+            symbol="BTC/EUR",
+            time_frame="2h",
+            data_type="OHLCV"
+        )
+        self.data_provider_service = DataProviderService.from_data_pairs(
+            [(data_source, data_provider)]
+        )
+        self.data_provider = self.data_provider_service.get(data_source)
+        self.data_provider.window_cache = {"key": self.data_provider.data}
+
+    def test_pickled_provider_memory_maps_shared_data(self):
+        original = self.data_provider.data
+
+        with self.data_provider_service.shared_ohlcv_data() as service:
+            path = self.data_provider.shared_data_path
+            self.assertTrue(os.path.isfile(path))
+            payload = pickle.dumps(self.data_provider)
+
+            # The pickled provider only carries the file path
+            self.assertLess(
+                len(payload), original.estimated_size() // 2
+            )
+            copy = pickle.loads(payload)
+            self.assertEqual(path, copy.shared_data_path)
+            self.assertTrue(copy.data.equals(original))
+            self.assertEqual({}, copy.window_cache)
+            self.assertIs(service, self.data_provider_service)
+
+        self.assertIsNone(self.data_provider.shared_data_path)
+        self.assertFalse(os.path.exists(path))
+        self.assertTrue(self.data_provider.data.equals(original))
+        self.assertIn("key", self.data_provider.window_cache)
+
+    def test_unshared_provider_pickles_data(self):
+        copy = pickle.loads(pickle.dumps(self.data_provider))
+        self.assertIsNone(copy.shared_data_path)
+        self.assertTrue(copy.data.equals(self.data_provider.data))
+        self.assertIn("key", copy.window_cache)
@@ -0,0 +1,98 @@
+"""
+Tests to verify that the tables have indexes for the query filters of
+the repositories, that SQLite uses them for the queries of every
+iteration, and that they are added to existing databases.
+"""
+from sqlalchemy import inspect, text
+
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential, OrderStatus, TradeStatus
+from investing_algorithm_framework.infrastructure import SQLOrder, SQLTrade
+from investing_algorithm_framework.infrastructure.database import Session, \
+    create_all_tables
+from tests.resources import TestBase
+
+
+class TestIndexes(TestBase):
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="binance",
+            trading_symbol="EUR",
+        )
+    ]
+    market_credentials = [
+        MarketCredential(
+            market="binance",
+            api_key="api_key",
+            secret_key="secret_key"
+        )
+    ]
+    external_balances = {"EUR": 1000}
+
+    def _get_query_plan(self, query):
+
+        with Session() as db:
+            statement = query.with_session(db).statement.compile(
+                compile_kwargs={"literal_binds": True}
+            )
+            rows = db.execute(text(f"EXPLAIN QUERY PLAN {statement}"))
+            return " ".join(str(row[-1]) for row in rows)
+
+    def test_tables_have_indexes(self):
+        inspector = inspect(Session().bind)
+        order_indexes = {
+            index["name"] for index in inspector.get_indexes("orders")
+        }
+        self.assertIn("ix_orders_status_created_at", order_indexes)
+        self.assertIn("ix_orders_position_id_created_at", order_indexes)
+        self.assertIn(
+            "ix_orders_target_symbol_order_side_status", order_indexes
+        )
+        trade_indexes = {
+            index["name"] for index in inspector.get_indexes("trades")
+        }
+        self.assertIn("ix_trades_status_target_symbol", trade_indexes)
+        self.assertIn(
+            "ix_positions_portfolio_id",
+            {index["name"] for index in inspector.get_indexes("positions")}
+        )
+
+    def test_open_orders_query_uses_index(self):
+        order_repository = self.app.container.order_repository()
+
+        with Session() as db:
+            query = order_repository.apply_query_params(
+                db, db.query(SQLOrder), {"status": OrderStatus.OPEN.value}
+            )
+
+        self.assertIn(
+            "ix_orders_status_created_at", self._get_query_plan(query)
+        )
+
+    def test_open_trades_query_uses_index(self):
+        trade_repository = self.app.container.trade_repository()
+
+        with Session() as db:
+            query = trade_repository.apply_query_params(
+                db, db.query(SQLTrade), {"status": TradeStatus.OPEN.value}
+            )
+
+        self.assertIn(
+            "ix_trades_status_target_symbol", self._get_query_plan(query)
+        )
+
+    def test_missing_indexes_are_created(self):
+        bind = Session().bind
+
+        with bind.begin() as connection:
+            connection.execute(text("DROP INDEX ix_orders_status_created_at"))
+
+        self.assertNotIn(
+            "ix_orders_status_created_at",
+            {index["name"] for index in inspect(bind).get_indexes("orders")}
+        )
+        create_all_tables()
+        self.assertIn(
+            "ix_orders_status_created_at",
+            {index["name"] for index in inspect(bind).get_indexes("orders")}
+        )
@@ -0,0 +1,244 @@
+"""
+Tests to verify that the numeric columns are stored with the numeric
+storage of the NUMERIC_STORAGE config value, and that the columns of
+existing tables are converted when the storage changes.
+"""
+from sqlalchemy import event, inspect, BigInteger, Float, String
+
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential, OrderSide, OrderType, OrderStatus, NumericStorage, \
+    NUMERIC_STORAGE, OperationalException
+from investing_algorithm_framework.infrastructure import InMemoryDatabase, \
+    use_in_memory_database, use_numeric_storage, get_numeric_storage
+from investing_algorithm_framework.infrastructure.database import Session, \
+    create_all_tables
+from tests.resources import TestBase
+
+
+class NumericStorageTestBase(TestBase):
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="binance",
+            trading_symbol="EUR",
+        )
+    ]
+    market_credentials = [
+        MarketCredential(
+            market="binance",
+            api_key="api_key",
+            secret_key="secret_key"
+        )
+    ]
+    external_balances = {"EUR": 1000}
+
+    def tearDown(self):
+        super().tearDown()
+        use_numeric_storage(NumericStorage.DECIMAL)
+
+    def _create_order(self, price=0.1):
+        order_repository = self.app.container.order_repository()
+        return order_repository.create(
+            {
+                "target_symbol": "BTC",
+                "trading_symbol": "EUR",
+                "price": price,
+                "amount": 1.23456789,
+                "order_side": OrderSide.BUY.value,
+                "order_type": OrderType.LIMIT.value,
+                "status": OrderStatus.OPEN.value,
+            }
+        )
+
+    def _get_stored_price(self, order_id):
+
+        with Session().bind.connect() as connection:
+            return connection.exec_driver_sql(
+                f"SELECT price FROM orders WHERE id = {order_id}"
+            ).scalar()
+
+    def _get_column_type(self, table, column):
+        columns = inspect(Session().bind).get_columns(table)
+        return [c["type"] for c in columns if c["name"] == column][0]
+
+    def _assert_order_values(self, order_id):
+        order = self.app.container.order_repository().get(order_id)
+        self.assertEqual(0.1, order.get_price())
+        self.assertEqual(1.23456789, order.get_amount())
+
+
+class TestDecimalStorage(NumericStorageTestBase):
+
+    def test_storage(self):
+        self.assertEqual(NumericStorage.DECIMAL, get_numeric_storage())
+        self.assertIsInstance(
+            self._get_column_type("orders", "price"), String
+        )
+        order = self._create_order()
+        self.assertEqual("0.1", self._get_stored_price(order.id))
+        self._assert_order_values(order.id)
+
+    def test_migrate_to_fixed_point_and_back(self):
+        order = self._create_order()
+        use_numeric_storage(NumericStorage.FIXED_POINT)
+        create_all_tables()
+        self.assertIsInstance(
+            self._get_column_type("orders", "price"), BigInteger
+        )
+        self.assertIsInstance(
+            self._get_column_type("portfolios", "unallocated"), BigInteger
+        )
+        self.assertEqual(10_000_000, self._get_stored_price(order.id))
+        self._assert_order_values(order.id)
+        self.assertEqual(
+            1000,
+            self.app.container.portfolio_service().get_all()[0]
+            .get_unallocated()
+        )
+
+        use_numeric_storage(NumericStorage.DECIMAL)
+        create_all_tables()
+        self.assertIsInstance(
+            self._get_column_type("orders", "price"), String
+        )
+        self.assertEqual("0.1", self._get_stored_price(order.id))
+        self._assert_order_values(order.id)
+
+    def test_migration_out_of_range_leaves_database_unchanged(self):
+        order = self._create_order(price=10 ** 11)
+        use_numeric_storage(NumericStorage.FIXED_POINT)
+
+        with self.assertRaises(OperationalException) as context:
+            create_all_tables()
+
+        self.assertIn("orders.price", str(context.exception))
+
+        # None of the tables is converted
+        use_numeric_storage(NumericStorage.DECIMAL)
+        self.assertIsInstance(
+            self._get_column_type("portfolios", "unallocated"), String
+        )
+        self.assertIsInstance(
+            self._get_column_type("orders", "price"), String
+        )
+        self.assertEqual("100000000000", self._get_stored_price(order.id))
+
+    def test_failed_migration_rolls_back_recreated_tables(self):
+        order = self._create_order()
+        bind = Session().bind
+
+        def fail_orders_insert(
+            connection, cursor, statement, parameters, context, many
+        ):
+
+            if statement.startswith('INSERT INTO "orders"'):
+                raise RuntimeError("Insert failed")
+
+        event.listen(bind, "before_cursor_execute", fail_orders_insert)
+        use_numeric_storage(NumericStorage.FIXED_POINT)
+
+        try:
+            with self.assertRaises(RuntimeError):
+                create_all_tables()
+        finally:
+            event.remove(bind, "before_cursor_execute", fail_orders_insert)
+            use_numeric_storage(NumericStorage.DECIMAL)
+
+        # The portfolios table was recreated before the orders table
+        self.assertIsInstance(
+            self._get_column_type("portfolios", "unallocated"), String
+        )
+        self.assertEqual(
+            1000,
+            self.app.container.portfolio_service().get_all()[0]
+            .get_unallocated()
+        )
+        self.assertIsInstance(
+            self._get_column_type("orders", "price"), String
+        )
+        self.assertEqual("0.1", self._get_stored_price(order.id))
+
+    def test_migration_refuses_to_drop_unknown_columns(self):
+        order = self._create_order()
+
+        with Session().bind.begin() as connection:
+            connection.exec_driver_sql(
+                "ALTER TABLE orders ADD COLUMN note VARCHAR"
+            )
+
+        use_numeric_storage(NumericStorage.FIXED_POINT)
+
+        with self.assertRaises(OperationalException) as context:
+            create_all_tables()
+
+        self.assertIn("note", str(context.exception))
+        use_numeric_storage(NumericStorage.DECIMAL)
+        self.assertIsInstance(
+            self._get_column_type("portfolios", "unallocated"), String
+        )
+        self.assertEqual("0.1", self._get_stored_price(order.id))
+
+    def test_migration_keeps_indexes(self):
+        use_numeric_storage(NumericStorage.REAL)
+        create_all_tables()
+        indexes = {
+            index["name"]
+            for index in inspect(Session().bind).get_indexes("orders")
+        }
+        self.assertIn("ix_orders_status_created_at", indexes)
+
+
+class TestFixedPointStorage(NumericStorageTestBase):
+    config = {NUMERIC_STORAGE: NumericStorage.FIXED_POINT.value}
+
+    def test_storage(self):
+        self.assertEqual(NumericStorage.FIXED_POINT, get_numeric_storage())
+        self.assertIsInstance(
+            self._get_column_type("orders", "price"), BigInteger
+        )
+        order = self._create_order()
+        self.assertEqual(10_000_000, self._get_stored_price(order.id))
+        self._assert_order_values(order.id)
+
+    def test_value_out_of_range(self):
+
+        with self.assertLogs("investing_algorithm_framework", "ERROR") \
+                as logs, self.assertRaises(OperationalException):
+            self._create_order(price=10 ** 11)
+
+        self.assertIn("orders.price", "".join(logs.output))
+        self.assertEqual(0, self.app.container.order_repository().count())
+        use_in_memory_database(InMemoryDatabase())
+
+        try:
+            with self.assertRaises(OperationalException) as context:
+                self._create_order(price=-10 ** 11)
+
+            self.assertIn("orders.price", str(context.exception))
+            self.assertIn("REAL", str(context.exception))
+        finally:
+            use_in_memory_database(None)
+
+    def test_in_memory_database(self):
+        use_in_memory_database(InMemoryDatabase())
+
+        try:
+            order = self._create_order()
+            self._assert_order_values(order.id)
+            order = self.app.container.order_repository().update(
+                order.id, {"price": 0.123456789}
+            )
+            # Rounded to the 8 decimals of the fixed point storage
+            self.assertEqual(0.12345679, order.get_price())
+        finally:
+            use_in_memory_database(None)
+
+
+class TestRealStorage(NumericStorageTestBase):
+    config = {NUMERIC_STORAGE: NumericStorage.REAL.value}
+
+    def test_storage(self):
+        self.assertEqual(NumericStorage.REAL, get_numeric_storage())
+        self.assertIsInstance(self._get_column_type("orders", "price"), Float)
+        order = self._create_order()
+        self.assertEqual(0.1, self._get_stored_price(order.id))
+        self._assert_order_values(order.id)
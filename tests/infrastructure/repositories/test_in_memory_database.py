@@ -0,0 +1,174 @@
+from datetime import timezone
+
+from investing_algorithm_framework.domain import OrderSide, OrderType, \
+    OrderStatus, PortfolioConfiguration, MarketCredential, \
+    OperationalException, TradeStatus
+from investing_algorithm_framework.infrastructure import InMemoryDatabase, \
+    use_in_memory_database, get_in_memory_database
+from tests.resources import TestBase
+
+
+class TestInMemoryDatabase(TestBase):
+    market_credentials = [
+        MarketCredential(
+            market="BINANCE",
+            api_key="api_key",
+            secret_key="secret_key",
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="BINANCE",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000,
+    }
+
+    def setUp(self):
+        self.database = InMemoryDatabase()
+        use_in_memory_database(self.database)
+        super().setUp()
+        self.order_service = self.app.container.order_service()
+        self.trade_service = self.app.container.trade_service()
+        self.portfolio_service = self.app.container.portfolio_service()
+        self.position_repository = self.app.container.position_repository()
+        self.order_repository = self.app.container.order_repository()
+        self.portfolio = self.portfolio_service.get_all()[0]
+
+    def tearDown(self):
+        use_in_memory_database(None)
+        super().tearDown()
+
+    def _create_order(self, **kwargs):
+        data = {
+            "portfolio_id": self.portfolio.id,
+            "target_symbol": "BTC",
+            "amount": 1,
+            "trading_symbol": "EUR",
+            "price": 10,
+            "order_side": OrderSide.BUY.value,
+            "order_type": OrderType.LIMIT.value,
+            "status": OrderStatus.OPEN.value,
+        }
+        data.update(kwargs)
+        return self.order_service.create(data)
+
+    def test_rows_are_stored_in_memory(self):
+        self.assertIs(self.database, get_in_memory_database())
+        self.assertEqual(1, len(self.database.table("portfolios").rows))
+        order = self._create_order()
+        self.assertEqual(1, len(self.database.table("orders").rows))
+        self.assertEqual(order.id, self.order_repository.get(order.id).id)
+
+        # The SQL database is untouched
+        use_in_memory_database(None)
+        self.assertEqual(0, self.order_repository.count())
+        use_in_memory_database(self.database)
+
+    def test_create_applies_defaults(self):
+        order = self.order_repository.create(
+            {
+                "target_symbol": "BTC",
+                "amount": 1,
+                "trading_symbol": "EUR",
+                "price": 10,
+                "order_side": OrderSide.BUY.value,
+                "order_type": OrderType.LIMIT.value,
+                "status": OrderStatus.OPEN.value,
+            }
+        )
+        self.assertIsNotNone(order.id)
+        self.assertIsNotNone(order.created_at)
+        self.assertIsNotNone(order.updated_at)
+        self.assertEqual(timezone.utc, order.created_at.tzinfo)
+        self.assertEqual(timezone.utc, order.updated_at.tzinfo)
+
+    def test_update(self):
+        order = self._create_order()
+        order = self.order_repository.update(
+            order.id, {"status": OrderStatus.CLOSED.value, "filled": 1}
+        )
+        self.assertEqual(OrderStatus.CLOSED.value, order.get_status())
+        self.assertEqual(1, order.get_filled())
+        self.assertEqual(
+            OrderStatus.CLOSED.value,
+            self.order_repository.get(order.id).get_status()
+        )
+
+    def test_query_params(self):
+        first = self._create_order(price=10)
+        self._create_order(target_symbol="ETH", price=20)
+        last = self._create_order(price=30)
+        orders = self.order_repository.get_all(
+            {"target_symbol": "BTC", "order_by_created_at_asc": True}
+        )
+        self.assertEqual([first.id, last.id], [order.id for order in orders])
+        orders = self.order_repository.get_all(
+            {"target_symbol": "BTC", "order_by_created_at_asc": False}
+        )
+        self.assertEqual([last.id, first.id], [order.id for order in orders])
+        self.assertEqual(
+            3, self.order_repository.count({"portfolio": self.portfolio.id})
+        )
+        self.assertEqual(
+            1, self.order_repository.count({"target_symbol": "ETH"})
+        )
+        self.assertTrue(self.order_repository.exists({"price": 20}))
+        self.assertFalse(self.order_repository.exists({"price": 40}))
+
+    def test_trade_orders(self):
+        buy_order = self._create_order()
+        self.order_service.update(
+            buy_order.id,
+            {"status": OrderStatus.CLOSED.value, "filled": 1, "remaining": 0}
+        )
+        trades = self.trade_service.get_all(
+            {"status": TradeStatus.OPEN.value}
+        )
+        self.assertEqual(1, len(trades))
+        sell_order = self._create_order(
+            order_side=OrderSide.SELL.value, price=20
+        )
+        self.order_service.update(
+            sell_order.id,
+            {"status": OrderStatus.CLOSED.value, "filled": 1, "remaining": 0}
+        )
+        trade = self.trade_service.get(trades[0].id)
+        self.assertEqual(TradeStatus.CLOSED.value, trade.status)
+        self.assertEqual(
+            [buy_order.id, sell_order.id],
+            [order.id for order in trade.orders]
+        )
+        self.assertEqual(
+            1,
+            len(self.trade_service.get_all({"portfolio": self.portfolio.id}))
+        )
+
+    def test_unique_constraint(self):
+        self.assertTrue(self.position_repository.exists({"symbol": "EUR"}))
+
+        with self.assertRaises(OperationalException):
+            self.position_repository.create(
+                {"symbol": "EUR", "portfolio_id": self.portfolio.id}
+            )
+
+    def test_delete_cascades(self):
+        order = self._create_order()
+        position = self.position_repository.get(order.position_id)
+        self.position_repository.delete(position.id)
+        self.assertFalse(self.order_repository.exists({"id": order.id}))
+
+    def test_flush(self):
+        order = self._create_order()
+        self.database.flush()
+        use_in_memory_database(None)
+        self.assertEqual(1, self.order_repository.count())
+        self.assertEqual(
+            order.get_price(), self.order_repository.get(order.id).get_price()
+        )
+        self.assertEqual(
+            self.portfolio.get_identifier(),
+            self.portfolio_service.get_all()[0].get_identifier()
+        )
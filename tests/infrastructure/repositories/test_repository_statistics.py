@@ -0,0 +1,92 @@
+from investing_algorithm_framework.domain import OrderSide, OrderType, \
+    OrderStatus, PortfolioConfiguration, MarketCredential
+from investing_algorithm_framework.infrastructure import \
+    RepositoryStatistics, use_repository_statistics, \
+    get_repository_statistics
+from tests.resources import TestBase
+
+
+class TestRepositoryStatistics(TestBase):
+    market_credentials = [
+        MarketCredential(
+            market="BINANCE",
+            api_key="api_key",
+            secret_key="secret_key",
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="BINANCE",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000,
+    }
+
+    def setUp(self):
+        super().setUp()
+        self.order_repository = self.app.container.order_repository()
+        self.statistics = RepositoryStatistics()
+        use_repository_statistics(self.statistics)
+
+    def tearDown(self):
+        use_repository_statistics(None)
+        super().tearDown()
+
+    def _create_order(self):
+        return self.order_repository.create(
+            {
+                "target_symbol": "BTC",
+                "amount": 1,
+                "trading_symbol": "EUR",
+                "price": 10,
+                "order_side": OrderSide.BUY.value,
+                "order_type": OrderType.LIMIT.value,
+                "status": OrderStatus.OPEN.value,
+            }
+        )
+
+    def test_record_calls(self):
+        self.assertIs(self.statistics, get_repository_statistics())
+        order = self._create_order()
+        self.order_repository.get_all({"status": OrderStatus.OPEN.value})
+        self.order_repository.get_all({"status": OrderStatus.OPEN.value})
+        self.order_repository.update(order.id, {"amount": 2})
+
+        # The get calls of create and update are part of these calls
+        self.assertEqual(
+            {
+                "SQLOrderRepository.create",
+                "SQLOrderRepository.get_all",
+                "SQLOrderRepository.update",
+            },
+            set(self.statistics.calls)
+        )
+        get_all = self.statistics.calls["SQLOrderRepository.get_all"]
+        self.assertEqual(2, get_all.count)
+        self.assertGreater(get_all.total_duration, 0)
+        self.assertGreaterEqual(get_all.total_duration, get_all.max_duration)
+        self.assertEqual(4, self.statistics.number_of_calls)
+
+    def test_slowest_calls(self):
+        self.statistics.record("SQLOrderRepository.get_all", 0.5)
+        self.statistics.record("SQLOrderRepository.get_all", 0.25)
+        self.statistics.record("SQLTradeRepository.get_all", 1.0)
+        self.statistics.record("SQLPositionRepository.find", 0.1)
+        slowest = self.statistics.get_slowest_calls(2)
+        self.assertEqual(
+            ["SQLTradeRepository.get_all", "SQLOrderRepository.get_all"],
+            [call.name for call in slowest]
+        )
+        self.assertEqual(0.375, slowest[1].average_duration)
+        self.assertEqual(0.5, slowest[1].max_duration)
+        report = self.statistics.report(2)
+        self.assertIn("4 repository calls", report)
+        self.assertIn("SQLTradeRepository.get_all", report)
+        self.assertNotIn("SQLPositionRepository.find", report)
+
+    def test_stop_recording(self):
+        use_repository_statistics(None)
+        self._create_order()
+        self.assertEqual({}, self.statistics.calls)
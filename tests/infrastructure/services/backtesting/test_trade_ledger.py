@@ -0,0 +1,88 @@
+"""Tests for the columnar trade ledger of the vector backtest engine."""
+import math
+import pickle
+from unittest import TestCase
+
+from investing_algorithm_framework import TradeLedger
+from investing_algorithm_framework.services import create_backtest_metrics
+
+from .test_vector_backtest_parity import _run_scenario, _scenarios
+
+
+class TestTradeLedger(TestCase):
+
+    def assertClose(self, expected, actual, path="value"):
+        if isinstance(expected, dict):
+            self.assertEqual(sorted(expected), sorted(actual), path)
+            for key in expected:
+                self.assertClose(expected[key], actual[key], f"{path}.{key}")
+        elif isinstance(expected, (list, tuple)):
+            self.assertEqual(len(expected), len(actual), path)
+            for i, (e, a) in enumerate(zip(expected, actual)):
+                self.assertClose(e, a, f"{path}[{i}]")
+        elif isinstance(expected, float) and isinstance(actual, float):
+            self.assertTrue(
+                math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9)
+                or (math.isnan(expected) and math.isnan(actual)),
+                f"{path}: expected {expected!r}, got {actual!r}",
+            )
+        else:
+            self.assertEqual(expected, actual, path)
+
+    def test_trades_are_materialised_on_first_access(self):
+        run = _run_scenario(_scenarios()["long_static"])
+
+        self.assertIsInstance(run.trade_ledger, TradeLedger)
+        self.assertNotIn("trades", run.__dict__)
+        self.assertIn(f"trades={len(run.trade_ledger)}", repr(run))
+        self.assertNotIn("trades", run.__dict__)
+        self.assertIs(run.get_trade_source(), run.trade_ledger)
+
+        trades = run.trades
+
+        self.assertEqual(len(trades), run.number_of_trades)
+        self.assertEqual(len(run.orders), run.number_of_orders)
+        self.assertIs(trades, run.trades)
+        self.assertIs(trades[0].orders[0], run.orders[0])
+        self.assertIs(run.get_trade_source(), trades)
+
+    def test_records_match_domain_serialisation(self):
+        for name in ("scaling_with_cooldowns", "shorts_dynamic"):
+            run = _run_scenario(_scenarios()[name])
+            data = run.to_dict()
+            self.assertNotIn("trades", run.__dict__)
+
+            self.assertEqual(
+                [t.to_dict() for t in run.trades], data["trades"]
+            )
+            self.assertEqual(
+                [o.to_dict() for o in run.orders], data["orders"]
+            )
+
+    def test_single_trade_matches_materialised_trade(self):
+        run = _run_scenario(_scenarios()["shorts_dynamic"])
+        ledger = run.trade_ledger
+        trade = ledger[3]
+
+        self.assertNotIn("trades", run.__dict__)
+        self.assertEqual(run.trades[3].to_dict(), trade.to_dict())
+
+    def test_metrics_match_trade_objects(self):
+        for name in ("long_dynamic", "scaling_with_cooldowns",
+                     "take_profit_stop_loss", "shorts_dynamic"):
+            run = _run_scenario(_scenarios()[name])
+            from_ledger = run.backtest_metrics.to_dict()
+            self.assertIsInstance(run.trades, list)
+            from_trades = create_backtest_metrics(
+                run, risk_free_rate=0.027
+            ).to_dict()
+
+            self.assertClose(from_trades, from_ledger, name)
+
+    def test_pickle_keeps_ledger_lazy(self):
+        run = _run_scenario(_scenarios()["long_static"])
+        ids = [t.id for t in run.trade_ledger.to_domain()[0]]
+        copy = pickle.loads(pickle.dumps(run))
+
+        self.assertNotIn("trades", copy.__dict__)
+        self.assertEqual(ids, [t.id for t in copy.trades])
@@ -0,0 +1,169 @@
+"""Tests for ``VectorBacktestService.extend``.
+
+A run that is extended with new bars must match a single run over the
+extended date range, both when the run is still in memory and when it
+was serialised and loaded again.
+"""
+from datetime import timedelta
+from unittest import TestCase
+
+from investing_algorithm_framework import BacktestDateRange, BacktestRun, \
+    OperationalException, PortfolioConfiguration
+from investing_algorithm_framework.infrastructure.services.backtesting \
+    .vector_backtest_service import VectorBacktestService
+
+from .test_trade_ledger import TestTradeLedger
+from .test_vector_backtest_parity import START, WARMUP_BARS, \
+    _FakeDataProviderService, _RandomSignalStrategy, _make_ohlcv, \
+    _scenarios
+
+BARS = 400
+END = START + timedelta(hours=BARS - WARMUP_BARS - 1)
+SPLIT = START + timedelta(hours=180)
+
+
+def _without_ids(value):
+    # Trade and order ids are random per run
+    if isinstance(value, dict):
+        return {
+            k: _without_ids(v) for k, v in value.items()
+            if k not in ("id", "trade_id", "order_id")
+        }
+    if isinstance(value, list):
+        return [_without_ids(v) for v in value]
+    return value
+
+
+def _service_and_strategy(config):
+    config = dict(config)
+    frames = {
+        f"{s}/EUR": _make_ohlcv(seed=i + 11, bars=BARS)
+        for i, s in enumerate(config["symbols"])
+    }
+    dynamic = config.pop("dynamic_position_sizing", False)
+    portfolio_configuration = PortfolioConfiguration(
+        market="BITVAVO",
+        trading_symbol="EUR",
+        initial_balance=1000,
+        deposit_schedule=config.pop("deposit_schedule", None),
+    )
+    return (
+        VectorBacktestService(_FakeDataProviderService(frames)),
+        _RandomSignalStrategy(**config),
+        portfolio_configuration,
+        dynamic,
+    )
+
+
+def _run(config, end_date):
+    service, strategy, portfolio_configuration, dynamic = \
+        _service_and_strategy(config)
+    return service.run(
+        strategy=strategy,
+        backtest_date_range=BacktestDateRange(
+            start_date=START, end_date=end_date
+        ),
+        portfolio_configuration=portfolio_configuration,
+        dynamic_position_sizing=dynamic,
+    )
+
+
+def _extend(config, backtest_run, end_date):
+    service, strategy, portfolio_configuration, _ = \
+        _service_and_strategy(config)
+    return service.extend(
+        strategy=strategy,
+        backtest_run=backtest_run,
+        end_date=end_date,
+        portfolio_configuration=portfolio_configuration,
+    )
+
+
+class TestVectorBacktestExtend(TestCase):
+
+    assertClose = TestTradeLedger.assertClose
+
+    def assertExtends(self, expected, run):
+        self.assertEqual(expected.backtest_start_date, run.backtest_start_date)
+        self.assertEqual(expected.backtest_end_date, run.backtest_end_date)
+        self.assertEqual(
+            _without_ids([t.to_dict() for t in expected.trades]),
+            _without_ids([t.to_dict() for t in run.trades]),
+        )
+        self.assertEqual(
+            _without_ids([o.to_dict() for o in expected.orders]),
+            _without_ids([o.to_dict() for o in run.orders]),
+        )
+        self.assertEqual(
+            [e["date"] for e in expected.signal_events],
+            [e["date"] for e in run.signal_events],
+        )
+        self.assertClose(
+            [
+                (s.created_at, s.total_value, s.unallocated)
+                for s in expected.portfolio_snapshots
+            ],
+            [
+                (s.created_at, s.total_value, s.unallocated)
+                for s in run.portfolio_snapshots
+            ],
+        )
+        self.assertClose(
+            _without_ids(expected.backtest_metrics.to_dict()),
+            _without_ids(run.backtest_metrics.to_dict()),
+        )
+
+    def test_matches_full_run(self):
+        for name in ("long_static", "long_dynamic",
+                     "scaling_with_cooldowns", "take_profit_stop_loss",
+                     "shorts_dynamic"):
+            config = _scenarios()[name]
+            expected = _run(config, END)
+            partial = _run(config, SPLIT)
+
+            with self.subTest(name):
+                self.assertLess(partial.number_of_orders,
+                                expected.number_of_orders)
+                self.assertExtends(expected, _extend(config, partial, END))
+
+    def test_matches_full_run_in_steps(self):
+        # The snapshots of trades scaled after the end of a step are
+        # not revalued, so this scenario has no scaling rules
+        config = _scenarios()["take_profit_stop_loss"]
+        run = _run(config, START + timedelta(hours=100))
+
+        for hours in (180, 181, 300):
+            run = _extend(config, run, START + timedelta(hours=hours))
+
+        self.assertExtends(_run(config, END), _extend(config, run, END))
+
+    def test_matches_full_run_after_serialisation(self):
+        for name in ("long_static", "shorts_dynamic"):
+            config = _scenarios()[name]
+            partial = BacktestRun.from_dict(_run(config, SPLIT).to_dict())
+
+            with self.subTest(name):
+                self.assertIsNone(partial.trade_ledger)
+                self.assertExtends(
+                    _run(config, END), _extend(config, partial, END)
+                )
+
+    def test_leaves_extended_run_unchanged(self):
+        config = _scenarios()["long_static"]
+        partial = _run(config, SPLIT)
+        data = partial.to_dict()
+        _extend(config, partial, END)
+
+        self.assertEqual(data, partial.to_dict())
+
+    def test_rejects_invalid_extension(self):
+        config = _scenarios()["long_static"]
+        partial = _run(config, SPLIT)
+
+        with self.assertRaises(OperationalException):
+            _extend(config, partial, SPLIT)
+
+        partial.engine_state = {}
+
+        with self.assertRaises(OperationalException):
+            _extend(config, partial, END)
@@ -0,0 +1,404 @@
+"""Parity tests for the vector backtest execution core.
+
+Every scenario below drives ``VectorBacktestService.run`` with
+deterministic synthetic OHLCV data and seeded random signals, then
+compares the resulting trades, orders, signal events and portfolio
+snapshots against golden outputs stored under
+``tests/resources/vector_parity``. The golden files were recorded
+with the original dict-backed per-bar loop, so any divergence in the
+array-backed core (or any later optimisation of it) shows up here as
+a field-level mismatch.
+
+To re-record the golden files after an *intentional* behaviour change
+run::
+
+    IAF_RECORD_VECTOR_PARITY=1 python -m pytest \\
+        tests/infrastructure/services/backtesting/test_vector_backtest_parity.py
+"""
+import json
+import math
+import os
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from investing_algorithm_framework import (
+    BacktestDateRange,
+    CooldownRule,
+    DataSource,
+    DataType,
+    PortfolioConfiguration,
+    PositionSize,
+    ScalingRule,
+    Schedule,
+    ScheduledDeposit,
+    SignalSeries,
+    SignalSide,
+    StopLossRule,
+    TakeProfitRule,
+    TimeUnit,
+    TradingCost,
+    TradingStrategy,
+)
+from investing_algorithm_framework.infrastructure.services.backtesting \
+    .vector_backtest_service import VectorBacktestService
+
+
+GOLDEN_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "resources",
+    "vector_parity",
+)
+RECORD = os.environ.get("IAF_RECORD_VECTOR_PARITY") == "1"
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+WARMUP_BARS = 20
+
+
+def _make_ohlcv(seed, bars, freq_hours=1, start_price=100.0):
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0, 0.02, size=bars)
+    close = start_price * np.exp(np.cumsum(returns))
+    index = pd.DatetimeIndex(
+        [
+            START - timedelta(hours=WARMUP_BARS)
+            + timedelta(hours=i * freq_hours)
+            for i in range(bars)
+        ],
+        name="Datetime",
+    )
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": np.full(bars, 1000.0),
+        },
+        index=index,
+    )
+
+
+class _FakeDataProviderService:
+    """In-memory stand-in for ``DataProviderService`` keyed by symbol."""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def get_vectorized_backtest_data(
+        self, data_sources, start_date=None, end_date=None
+    ):
+        return {
+            ds.get_identifier(): self.frames[ds.symbol].copy()
+            for ds in data_sources
+        }
+
+    def get_ohlcv_data(
+        self, symbol, start_date=None, end_date=None, pandas=True, **kwargs
+    ):
+        df = self.frames[symbol]
+        return df[(df.index >= start_date) & (df.index <= end_date)].copy()
+
+
+class _RandomSignalStrategy(TradingStrategy):
+    """Emits seeded random boolean signals for every configured side."""
+
+    schedule = Schedule.every(1, TimeUnit.HOUR)
+
+    def __init__(self, symbols, densities, seed, **kwargs):
+        self._densities = densities
+        self._seed = seed
+        data_sources = [
+            DataSource(
+                identifier=f"{symbol}_ohlcv",
+                data_type=DataType.OHLCV,
+                time_frame="1h",
+                market="BITVAVO",
+                symbol=f"{symbol}/EUR",
+                pandas=True,
+            )
+            for symbol in symbols
+        ]
+        super().__init__(
+            algorithm_id="parity",
+            data_sources=data_sources,
+            symbols=symbols,
+            **kwargs,
+        )
+
+    def generate_signal_series(self, data):
+        for symbol_index, symbol in enumerate(self.symbols):
+            index = data[f"{symbol}_ohlcv"].index
+
+            for side_index, side in enumerate(SignalSide):
+                density = self._densities.get(side)
+
+                if density is None:
+                    continue
+
+                rng = np.random.default_rng(
+                    self._seed * 1000 + symbol_index * 10 + side_index
+                )
+                yield SignalSeries(
+                    symbol=symbol,
+                    side=side,
+                    series=pd.Series(
+                        rng.random(len(index)) < density, index=index
+                    ),
+                )
+
+
+LONG = {SignalSide.OPEN_LONG: 0.08, SignalSide.CLOSE_LONG: 0.08}
+SCALING = {
+    SignalSide.OPEN_LONG: 0.08,
+    SignalSide.CLOSE_LONG: 0.03,
+    SignalSide.SCALE_IN: 0.1,
+    SignalSide.SCALE_OUT: 0.06,
+}
+LONG_SHORT = {
+    SignalSide.OPEN_LONG: 0.06,
+    SignalSide.CLOSE_LONG: 0.06,
+    SignalSide.OPEN_SHORT: 0.06,
+    SignalSide.CLOSE_SHORT: 0.06,
+}
+
+
+def _scenarios():
+    symbols = ["BTC", "ETH", "SOL"]
+    sizes = [
+        PositionSize(symbol=s, percentage_of_portfolio=30) for s in symbols
+    ]
+    costs = [
+        TradingCost(symbol="BTC", fee_percentage=0.1),
+        TradingCost(
+            symbol="ETH", fee_percentage=0.25, slippage_percentage=0.05
+        ),
+    ]
+    return {
+        "long_static": dict(
+            symbols=symbols, densities=LONG, seed=1,
+            position_sizes=sizes, trading_costs=costs,
+        ),
+        "long_dynamic": dict(
+            symbols=symbols, densities=LONG, seed=2,
+            position_sizes=sizes, trading_costs=costs,
+            dynamic_position_sizing=True,
+        ),
+        "scaling_with_cooldowns": dict(
+            symbols=symbols, densities=SCALING, seed=3,
+            position_sizes=sizes, trading_costs=costs,
+            scaling_rules=[
+                ScalingRule(
+                    symbol="BTC", max_entries=3,
+                    scale_in_percentage=[50, 25],
+                    scale_out_percentage=[25, 50],
+                    cooldown_in_bars=2,
+                ),
+                ScalingRule(symbol="ETH", max_entries=2),
+            ],
+            cooldowns=[
+                CooldownRule(symbol="SOL", trigger="sell", bars=5),
+                CooldownRule(trigger="buy", blocks="buy", bars=2),
+            ],
+        ),
+        "scaling_dynamic": dict(
+            symbols=symbols, densities=SCALING, seed=4,
+            position_sizes=sizes,
+            scaling_rules=[
+                ScalingRule(
+                    symbol=s, max_entries=3, cooldown_in_bars=1
+                ) for s in symbols
+            ],
+            dynamic_position_sizing=True,
+        ),
+        "take_profit_stop_loss": dict(
+            symbols=symbols, densities=LONG_SHORT, seed=5,
+            position_sizes=sizes, trading_costs=costs,
+            take_profits=[
+                TakeProfitRule(
+                    percentage_threshold=4, sell_percentage=100,
+                    symbol="BTC",
+                ),
+                TakeProfitRule(
+                    percentage_threshold=6, sell_percentage=100,
+                    symbol=None,
+                ),
+            ],
+            stop_losses=[
+                StopLossRule(
+                    percentage_threshold=3, sell_percentage=100,
+                    symbol=None,
+                ),
+            ],
+            cooldowns=[CooldownRule(trigger="sell", bars=3)],
+        ),
+        "shorts_dynamic": dict(
+            symbols=symbols, densities=LONG_SHORT, seed=6,
+            position_sizes=sizes, trading_costs=costs,
+            dynamic_position_sizing=True,
+        ),
+        "fixed_amount_with_deposits": dict(
+            symbols=symbols, densities=LONG, seed=7,
+            position_sizes=[
+                PositionSize(symbol=s, fixed_amount=400) for s in symbols
+            ],
+            deposit_schedule=[
+                ScheduledDeposit(
+                    amount=250.0, time_unit=TimeUnit.DAY, interval=3
+                ),
+            ],
+            dynamic_position_sizing=True,
+        ),
+    }
+
+
+def _run_scenario(config):
+    config = dict(config)
+    bars = 400
+    frames = {
+        f"{s}/EUR": _make_ohlcv(seed=i + 11, bars=bars)
+        for i, s in enumerate(config["symbols"])
+    }
+    dynamic = config.pop("dynamic_position_sizing", False)
+    deposit_schedule = config.pop("deposit_schedule", None)
+    strategy = _RandomSignalStrategy(**config)
+    portfolio_configuration = PortfolioConfiguration(
+        market="BITVAVO",
+        trading_symbol="EUR",
+        initial_balance=1000,
+        deposit_schedule=deposit_schedule,
+    )
+    service = VectorBacktestService(_FakeDataProviderService(frames))
+    return service.run(
+        strategy=strategy,
+        backtest_date_range=BacktestDateRange(
+            start_date=START,
+            end_date=START + timedelta(hours=bars - WARMUP_BARS - 1),
+        ),
+        portfolio_configuration=portfolio_configuration,
+        dynamic_position_sizing=dynamic,
+    )
+
+
+def _compact(value):
+    if isinstance(value, dict):
+        return {k: _compact(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_compact(v) for v in value]
+    if isinstance(value, float):
+        return float(f"{value:.12g}")
+    return value
+
+
+def _iso(value):
+    return value.isoformat() if value is not None else None
+
+
+def _serialize(run):
+    return {
+        "trades": [
+            {
+                "target_symbol": t.target_symbol,
+                "opened_at": _iso(t.opened_at),
+                "closed_at": _iso(t.closed_at),
+                "status": str(t.status),
+                "open_price": t.open_price,
+                "amount": t.amount,
+                "available_amount": t.available_amount,
+                "cost": t.cost,
+                "net_gain": t.net_gain,
+                "total_fees": t.total_fees,
+                "is_short": bool(t.is_short),
+                "order_count": len(t.orders),
+            }
+            for t in run.trades
+        ],
+        "orders": [
+            {
+                "target_symbol": o.target_symbol,
+                "order_side": str(o.order_side),
+                "price": o.price,
+                "amount": o.amount,
+                "order_fee": o.order_fee,
+                "created_at": _iso(o.created_at),
+                "metadata": o.metadata,
+            }
+            for o in run.orders
+        ],
+        "signal_events": [
+            dict(event, date=_iso(event["date"]))
+            for event in run.signal_events
+        ],
+        "portfolio_snapshots": [
+            {
+                "created_at": _iso(s.created_at),
+                "unallocated": s.unallocated,
+                "total_value": s.total_value,
+                "total_net_gain": s.total_net_gain,
+                "cash_flow": s.cash_flow,
+            }
+            for s in run.portfolio_snapshots
+        ],
+    }
+
+
+class TestVectorBacktestParity(TestCase):
+
+    def assertParity(self, expected, actual, path="run"):
+        if isinstance(expected, dict):
+            self.assertIsInstance(actual, dict, path)
+            self.assertEqual(sorted(expected), sorted(actual), path)
+            for key in expected:
+                self.assertParity(expected[key], actual[key], f"{path}.{key}")
+        elif isinstance(expected, list):
+            self.assertIsInstance(actual, list, path)
+            self.assertEqual(len(expected), len(actual), path)
+            for i, (e, a) in enumerate(zip(expected, actual)):
+                self.assertParity(e, a, f"{path}[{i}]")
+        elif isinstance(expected, float) and not isinstance(actual, str):
+            self.assertTrue(
+                math.isclose(
+                    expected, float(actual), rel_tol=1e-9, abs_tol=1e-9
+                ),
+                f"{path}: expected {expected!r}, got {actual!r}",
+            )
+        else:
+            self.assertEqual(expected, actual, path)
+
+    def _check(self, name):
+        actual = json.loads(
+            json.dumps(_serialize(_run_scenario(_scenarios()[name])))
+        )
+        path = os.path.join(GOLDEN_DIRECTORY, f"{name}.json")
+
+        if RECORD:
+            os.makedirs(GOLDEN_DIRECTORY, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(_compact(actual), f)
+
+        with open(path) as f:
+            expected = json.load(f)
+
+        self.assertGreater(len(expected["trades"]), 0)
+        self.assertParity(expected, actual)
+
+    def test_long_static(self):
+        self._check("long_static")
+
+    def test_long_dynamic(self):
+        self._check("long_dynamic")
+
+    def test_scaling_with_cooldowns(self):
+        self._check("scaling_with_cooldowns")
+
+    def test_scaling_dynamic(self):
+        self._check("scaling_dynamic")
+
+    def test_take_profit_stop_loss(self):
+        self._check("take_profit_stop_loss")
+
+    def test_shorts_dynamic(self):
+        self._check("shorts_dynamic")
+
+    def test_fixed_amount_with_deposits(self):
+        self._check("fixed_amount_with_deposits")
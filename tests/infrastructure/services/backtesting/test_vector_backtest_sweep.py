@@ -0,0 +1,232 @@
+"""Tests for batched vector backtests and parameter sweeps."""
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from investing_algorithm_framework import (
+    BacktestDateRange,
+    DataSource,
+    DataType,
+    PortfolioConfiguration,
+    PositionSize,
+    Schedule,
+    SignalMatrix,
+    SignalSeries,
+    SignalSide,
+    TimeUnit,
+    TradingStrategy,
+)
+from investing_algorithm_framework.infrastructure.services.backtesting \
+    .vector_backtest_service import VectorBacktestService
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+BARS = 300
+SYMBOLS = ["BTC", "ETH"]
+
+
+def _frame(seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, BARS)))
+    index = pd.DatetimeIndex(
+        [START + timedelta(hours=i) for i in range(BARS)], name="Datetime"
+    )
+    return pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close,
+         "Volume": 1.0},
+        index=index,
+    )
+
+
+class _CountingDataProviderService:
+
+    def __init__(self):
+        self.frames = {
+            f"{s}/EUR": _frame(i) for i, s in enumerate(SYMBOLS)
+        }
+        self.vectorized_calls = 0
+        self.ohlcv_calls = 0
+
+    def get_vectorized_backtest_data(
+        self, data_sources, start_date=None, end_date=None
+    ):
+        self.vectorized_calls += 1
+        return {ds.get_identifier(): self.frames[ds.symbol].copy()
+                for ds in data_sources}
+
+    def get_ohlcv_data(
+        self, symbol, start_date=None, end_date=None, pandas=True, **kwargs
+    ):
+        self.ohlcv_calls += 1
+        return self.frames[symbol].copy()
+
+
+class _MovingAverageCross(TradingStrategy):
+    schedule = Schedule.every(1, TimeUnit.HOUR)
+
+    def __init__(self, fast, slow):
+        self.fast = fast
+        self.slow = slow
+        super().__init__(
+            data_sources=[
+                DataSource(
+                    identifier=f"{s}_ohlcv",
+                    data_type=DataType.OHLCV,
+                    time_frame="1h",
+                    market="BITVAVO",
+                    symbol=f"{s}/EUR",
+                    pandas=True,
+                ) for s in SYMBOLS
+            ],
+            symbols=SYMBOLS,
+            position_sizes=[
+                PositionSize(symbol=s, percentage_of_portfolio=40)
+                for s in SYMBOLS
+            ],
+        )
+
+    @staticmethod
+    def _averages(close, fast, slow):
+        return (
+            close.rolling(fast).mean().to_numpy(),
+            close.rolling(slow).mean().to_numpy(),
+        )
+
+    def generate_signal_series(self, data):
+        for symbol in SYMBOLS:
+            close = data[f"{symbol}_ohlcv"]["Close"]
+            fast, slow = self._averages(close, self.fast, self.slow)
+            yield SignalSeries(
+                symbol=symbol, side=SignalSide.OPEN_LONG,
+                series=pd.Series(fast > slow, index=close.index),
+            )
+            yield SignalSeries(
+                symbol=symbol, side=SignalSide.CLOSE_LONG,
+                series=pd.Series(fast < slow, index=close.index),
+            )
+
+
+class _StackedMovingAverageCross(_MovingAverageCross):
+    matrix_calls = 0
+
+    @classmethod
+    def generate_signal_matrices(cls, data, variants):
+        cls.matrix_calls += 1
+
+        for symbol in SYMBOLS:
+            close = data[f"{symbol}_ohlcv"]["Close"]
+            averages = [
+                cls._averages(close, v.fast, v.slow) for v in variants
+            ]
+            fast = np.stack([a[0] for a in averages])
+            slow = np.stack([a[1] for a in averages])
+            yield SignalMatrix(
+                symbol=symbol, side=SignalSide.OPEN_LONG,
+                values=fast > slow, index=close.index,
+            )
+            yield SignalMatrix(
+                symbol=symbol, side=SignalSide.CLOSE_LONG,
+                values=fast < slow, index=close.index,
+            )
+
+
+def _summary(run):
+    return (
+        [(t.target_symbol, t.opened_at, t.closed_at, round(t.amount, 9))
+         for t in run.trades],
+        [round(s.total_value, 9) for s in run.portfolio_snapshots],
+    )
+
+
+class TestVectorBacktestSweep(TestCase):
+    grid = {"fast": [5, 10], "slow": [20, 40]}
+
+    def _kwargs(self):
+        return dict(
+            backtest_date_range=BacktestDateRange(
+                start_date=START, end_date=START + timedelta(hours=BARS - 1)
+            ),
+            portfolio_configuration=PortfolioConfiguration(
+                market="BITVAVO", trading_symbol="EUR", initial_balance=1000
+            ),
+        )
+
+    def _individual_runs(self):
+        service = VectorBacktestService(_CountingDataProviderService())
+        return [
+            service.run(strategy=strategy, **self._kwargs())
+            for strategy in _MovingAverageCross.from_parameter_grid(
+                self.grid
+            )
+        ]
+
+    def test_from_parameter_grid_expands_cartesian_product(self):
+        variants = _MovingAverageCross.from_parameter_grid(self.grid)
+        self.assertEqual(
+            [v.get_parameters() for v in variants],
+            [
+                {"fast": 5, "slow": 20},
+                {"fast": 5, "slow": 40},
+                {"fast": 10, "slow": 20},
+                {"fast": 10, "slow": 40},
+            ],
+        )
+        self.assertEqual(len({v.algorithm_id for v in variants}), 4)
+
+    def test_from_parameter_grid_accepts_list_of_dicts(self):
+        variants = _MovingAverageCross.from_parameter_grid(
+            [{"fast": 3, "slow": 9}]
+        )
+        self.assertEqual(variants[0].fast, 3)
+        self.assertEqual(variants[0].slow, 9)
+
+    def test_sweep_loads_data_once_and_matches_individual_runs(self):
+        provider = _CountingDataProviderService()
+        results = VectorBacktestService(provider).run_sweep(
+            _MovingAverageCross, self.grid, **self._kwargs()
+        )
+
+        self.assertEqual(provider.vectorized_calls, 1)
+        # One master-index load plus one close load per symbol
+        self.assertEqual(provider.ohlcv_calls, 1 + len(SYMBOLS))
+        self.assertEqual(
+            [_summary(run) for _, run in results],
+            [_summary(run) for run in self._individual_runs()],
+        )
+
+    def test_sweep_uses_signal_matrices(self):
+        _StackedMovingAverageCross.matrix_calls = 0
+        results = VectorBacktestService(
+            _CountingDataProviderService()
+        ).run_sweep(_StackedMovingAverageCross, self.grid, **self._kwargs())
+
+        self.assertEqual(_StackedMovingAverageCross.matrix_calls, 1)
+        self.assertTrue(any(run.trades for _, run in results))
+        self.assertEqual(
+            [_summary(run) for _, run in results],
+            [_summary(run) for run in self._individual_runs()],
+        )
+
+    def test_run_batch_yields_errors_per_strategy(self):
+        variants = _MovingAverageCross.from_parameter_grid(self.grid)
+        variants[1].position_sizes = []
+        results = list(
+            VectorBacktestService(_CountingDataProviderService())
+            .run_batch(variants, **self._kwargs())
+        )
+
+        self.assertEqual([s for s, _ in results], variants)
+        self.assertIsInstance(results[1][1], Exception)
+        self.assertFalse(
+            any(isinstance(r, Exception) for i, (_, r) in enumerate(results)
+                if i != 1)
+        )
+
+    def test_signal_matrix_rejects_mismatched_shape(self):
+        with self.assertRaises(ValueError):
+            SignalMatrix(
+                symbol="BTC", side=SignalSide.OPEN_LONG,
+                values=np.zeros((2, 3), dtype=bool),
+                index=pd.date_range("2024-01-01", periods=4),
+            )
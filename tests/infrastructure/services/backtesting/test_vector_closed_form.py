@@ -0,0 +1,146 @@
+"""Tests for the closed-form path of ``VectorExecutionCore``.
+
+The closed-form path must produce exactly the ledger, signal events
+and portfolio series of the per-bar loop, which is forced here by
+disabling ``closed_form_applicable``.
+"""
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+import numpy as np
+
+from investing_algorithm_framework import CooldownRule, PositionSize, \
+    ScalingRule, StopLossRule, TradingCost
+from investing_algorithm_framework.infrastructure.services.backtesting \
+    .vector_execution_core import VectorExecutionCore, build_signal_mask
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class _LoopExecutionCore(VectorExecutionCore):
+
+    def closed_form_applicable(self):
+        return False
+
+
+def _core(core_class, seed=1, bars=500, symbols=("BTC", "ETH", "SOL"),
+          density=0.1, capital=200.0, initial_amount=1000.0, **kwargs):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(
+        np.cumsum(rng.normal(0, 0.02, (bars, len(symbols))), axis=0)
+    )
+    signals = np.column_stack([
+        build_signal_mask(
+            bars,
+            buy=rng.random(bars) < density,
+            sell=rng.random(bars) < density,
+            # Ignored without a scaling rule
+            scale_in=rng.random(bars) < density,
+        )
+        for _ in symbols
+    ])
+    kwargs.setdefault("trading_costs", [
+        TradingCost(fee_percentage=0.1),
+        TradingCost(fee_percentage=0.25, slippage_percentage=0.05,
+                    fee_fixed=0.5),
+        TradingCost(),
+    ][:len(symbols)])
+    return core_class(
+        symbols=symbols,
+        dates=[START + timedelta(hours=i) for i in range(bars)],
+        close=close,
+        signals=signals,
+        position_sizes=[
+            PositionSize(symbol=s, fixed_amount=capital) for s in symbols
+        ],
+        scaling_rules=kwargs.pop("scaling_rules", [None] * len(symbols)),
+        initial_capital_for_trade=[capital] * len(symbols),
+        trading_symbol="EUR",
+        initial_amount=initial_amount,
+        strategy_id="closed-form",
+        **kwargs,
+    ).run()
+
+
+def _state(core):
+    ledger = core.ledger
+    columns = [
+        "symbol", "open_bar", "close_bar", "update_bar", "open_price",
+        "amount", "available_amount", "cost", "net_gain", "total_fees",
+        "trade_orders", "order_trade", "order_side", "order_bar",
+        "order_price", "order_amount", "order_fee", "order_fee_rate",
+        "order_slippage", "order_reason",
+    ]
+    return {
+        "ledger": {name: getattr(ledger, name) for name in columns},
+        "signal_events": core.signal_events,
+        "portfolio_series": [
+            series.tolist() for series in core.portfolio_series()
+        ],
+        "last_trade": core.last_trade,
+        "open_trades": core.open_trades,
+        "has_position": core.has_position.tolist(),
+        "total_allocated": core.total_allocated,
+    }
+
+
+class TestVectorClosedForm(TestCase):
+
+    def test_matches_loop(self):
+        for seed, density in ((1, 0.1), (2, 0.3), (3, 0.6)):
+            closed_form = _core(VectorExecutionCore, seed, density=density)
+            loop = _core(_LoopExecutionCore, seed, density=density)
+
+            self.assertTrue(closed_form.closed_form)
+            self.assertFalse(loop.closed_form)
+            self.assertGreater(len(closed_form.ledger), 0)
+            self.assertEqual(_state(loop), _state(closed_form))
+
+    def test_matches_loop_with_deposits(self):
+        deposits = [
+            (START + timedelta(hours=h), 100.0) for h in (0, 50, 130)
+        ]
+        closed_form = _core(VectorExecutionCore, deposit_events=deposits)
+        loop = _core(_LoopExecutionCore, deposit_events=deposits)
+
+        self.assertTrue(closed_form.closed_form)
+        self.assertEqual(_state(loop), _state(closed_form))
+        self.assertEqual(
+            loop.current_unallocated, closed_form.current_unallocated
+        )
+
+    def test_falls_back_when_budget_rejects_entry(self):
+        # Both positions together take the whole budget, so the entry
+        # fees kept in the allocated capital reject a later entry.
+        closed_form = _core(
+            VectorExecutionCore, symbols=("BTC", "ETH"), capital=500.0,
+            density=0.3,
+        )
+        loop = _core(
+            _LoopExecutionCore, symbols=("BTC", "ETH"), capital=500.0,
+            density=0.3,
+        )
+
+        self.assertFalse(closed_form.closed_form)
+        self.assertIn(
+            "insufficient_capital",
+            [event["reason"] for event in loop.signal_events],
+        )
+        self.assertEqual(_state(loop), _state(closed_form))
+
+    def test_falls_back_for_rules(self):
+        for kwargs in (
+            dict(dynamic_position_sizing=True),
+            dict(cooldowns=[CooldownRule(trigger="sell", bars=3)]),
+            dict(stop_losses=[
+                StopLossRule(
+                    symbol="BTC", percentage_threshold=3,
+                    sell_percentage=100,
+                )
+            ]),
+            dict(scaling_rules=[ScalingRule(symbol="BTC", max_entries=2),
+                                None, None]),
+        ):
+            self.assertFalse(
+                _core(VectorExecutionCore, **kwargs).closed_form, kwargs
+            )
@@ -0,0 +1,163 @@
+"""Tests for continuing a ``VectorExecutionCore`` run with new bars.
+
+A run over the first bars, resumed from its ``state()`` and ledger
+over the remaining bars, must produce the ledger and signal events of
+a single run over all bars, and the tail of its portfolio series.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+import numpy as np
+
+from investing_algorithm_framework import CooldownRule, PositionSize, \
+    ScalingRule, StopLossRule, TradingCost, OperationalException
+from investing_algorithm_framework.infrastructure.services.backtesting \
+    .vector_execution_core import VectorExecutionCore, build_signal_mask
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+LEDGER_COLUMNS = [
+    "symbol", "open_bar", "close_bar", "update_bar", "open_price",
+    "amount", "available_amount", "cost", "net_gain", "total_fees",
+    "trade_orders", "order_trade", "order_side", "order_bar",
+    "order_price", "order_amount", "order_fee", "order_fee_rate",
+    "order_slippage", "order_reason",
+]
+
+
+def _inputs(seed, bars, symbols, density):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(
+        np.cumsum(rng.normal(0, 0.02, (bars, len(symbols))), axis=0)
+    )
+    signals = np.column_stack([
+        build_signal_mask(
+            bars,
+            buy=rng.random(bars) < density,
+            sell=rng.random(bars) < density,
+            scale_in=rng.random(bars) < density,
+        )
+        for _ in symbols
+    ])
+    return close, signals
+
+
+def _core(dates, close, signals, symbols, deposit_events=(), **kwargs):
+    return VectorExecutionCore(
+        symbols=symbols,
+        dates=dates,
+        close=close,
+        signals=signals,
+        position_sizes=[
+            PositionSize(symbol=s, percentage_of_portfolio=20)
+            for s in symbols
+        ],
+        scaling_rules=kwargs.pop("scaling_rules", [None] * len(symbols)),
+        trading_costs=[TradingCost(fee_percentage=0.1)] * len(symbols),
+        initial_capital_for_trade=[200.0] * len(symbols),
+        trading_symbol="EUR",
+        initial_amount=1000.0,
+        strategy_id="continuation",
+        deposit_events=list(deposit_events),
+        **kwargs,
+    )
+
+
+def _split(split, seed=1, bars=400, symbols=("BTC", "ETH"),
+           density=0.1, deposit_events=(), **kwargs):
+    """Run all bars at once and the same bars in two parts."""
+    close, signals = _inputs(seed, bars, symbols, density)
+    dates = [START + timedelta(hours=i) for i in range(bars)]
+    full = _core(
+        dates, close, signals, symbols, deposit_events, **kwargs
+    ).run()
+    first = _core(
+        dates[:split], close[:split], signals[:split], symbols,
+        [e for e in deposit_events if e[0] <= dates[split - 1]], **kwargs
+    ).run()
+    # The state is stored as JSON with the backtest run
+    state = json.loads(json.dumps(first.state()))
+    second = _core(
+        dates, close[split:], signals[split:], symbols,
+        [e for e in deposit_events if e[0] > dates[split - 1]], **kwargs
+    ).restore(state, first.ledger).run()
+    return full, first, second
+
+
+class TestVectorContinuation(TestCase):
+
+    def assertContinues(self, full, first, second):
+        for name in LEDGER_COLUMNS:
+            self.assertEqual(
+                getattr(full.ledger, name), getattr(second.ledger, name),
+                name,
+            )
+
+        self.assertEqual(
+            full.signal_events, first.signal_events + second.signal_events
+        )
+        split = len(first.dates)
+
+        for expected, series in zip(
+            full.portfolio_series(), second.portfolio_series()
+        ):
+            np.testing.assert_allclose(expected[split:], series, rtol=1e-9)
+
+        self.assertAlmostEqual(
+            full.current_unallocated, second.current_unallocated
+        )
+
+    def test_matches_full_run(self):
+        for seed, split in ((1, 100), (2, 250), (3, 350)):
+            full, first, second = _split(split, seed=seed)
+
+            self.assertGreater(len(full.ledger), len(first.ledger))
+            self.assertContinues(full, first, second)
+
+    def test_matches_full_run_with_rules(self):
+        for kwargs in (
+            dict(dynamic_position_sizing=True),
+            dict(cooldowns=[CooldownRule(trigger="sell", bars=5)]),
+            dict(stop_losses=[
+                StopLossRule(
+                    symbol="BTC", percentage_threshold=3,
+                    sell_percentage=100,
+                )
+            ]),
+            dict(scaling_rules=[ScalingRule(symbol="BTC", max_entries=3),
+                                None]),
+            dict(deposit_events=[
+                (START + timedelta(hours=h), 100.0) for h in (0, 90, 300)
+            ]),
+        ):
+            self.assertContinues(*_split(150, density=0.2, **kwargs))
+
+    def test_does_not_modify_continued_ledger(self):
+        close, signals = _inputs(1, 200, ("BTC",), 0.1)
+        dates = [START + timedelta(hours=i) for i in range(200)]
+        first = _core(dates[:100], close[:100], signals[:100], ("BTC",))
+        first.run()
+        trades = len(first.ledger)
+        close_bars = list(first.ledger.close_bar)
+        _core(dates, close[100:], signals[100:], ("BTC",)) \
+            .restore(first.state(), first.ledger).run()
+
+        self.assertEqual(trades, len(first.ledger))
+        self.assertEqual(close_bars, first.ledger.close_bar)
+
+    def test_rejects_mismatching_state(self):
+        close, signals = _inputs(1, 200, ("BTC", "ETH"), 0.1)
+        dates = [START + timedelta(hours=i) for i in range(200)]
+        first = _core(
+            dates[:100], close[:100], signals[:100], ("BTC", "ETH")
+        ).run()
+
+        with self.assertRaises(OperationalException):
+            _core(
+                dates, close[120:], signals[120:], ("BTC", "ETH")
+            ).restore(first.state(), first.ledger)
+
+        with self.assertRaises(OperationalException):
+            _core(
+                dates, close[100:], signals[100:], ("ETH", "BTC")
+            ).restore(first.state(), first.ledger)
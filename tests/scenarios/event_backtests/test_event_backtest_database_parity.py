@@ -0,0 +1,226 @@
+"""
+Parity tests of the databases of event backtests.
+
+The same event backtest is run with its state in the in-memory
+database (IN_MEMORY_BACKTEST_DATABASE True, the default) and in the
+SQL database of the app. Both runs must produce identical orders,
+trades, positions and portfolio snapshots. With FLUSH_BACKTEST_DATABASE
+the in-memory state is written to the SQL database at the end of the
+run, and the SQL database is kept after the backtest.
+"""
+import math
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from investing_algorithm_framework import TradingStrategy, DataSource, \
+    TimeUnit, DataType, create_app, BacktestDateRange, PositionSize, \
+    RESOURCE_DIRECTORY, CSVOHLCVDataProvider, ScalingRule, Schedule, \
+    SignalSide, signals_from_column, StopLossRule, TakeProfitRule, Study, \
+    Universe, BacktestWindow, BacktestEngine, IN_MEMORY_BACKTEST_DATABASE, \
+    FLUSH_BACKTEST_DATABASE
+from investing_algorithm_framework.infrastructure.database import \
+    InMemoryDatabase
+
+CSV_FILENAME = "OHLCV_BTC-EUR_BITVAVO_2h_SCALING_FAST.csv"
+WARMUP = 5
+START_DATE = datetime(2020, 12, 20, 10, 0, 0, tzinfo=timezone.utc)
+END_DATE = datetime(2020, 12, 21, 8, 0, 0, tzinfo=timezone.utc)
+# The ids of the orders are random, so they differ between runs
+IGNORED_FIELDS = {"id"}
+
+
+class ScalingStrategy(TradingStrategy):
+    """Buy at 110, scale-in at 115, scale-out at 120, sell at 90."""
+    schedule = Schedule.every(2, TimeUnit.HOUR)
+    symbols = ["BTC"]
+    data_sources = [
+        DataSource(
+            symbol="BTC/EUR",
+            data_type=DataType.OHLCV,
+            time_frame="2h",
+            warmup_window=WARMUP,
+            market="BITVAVO",
+            identifier="BTC_EUR_OHLCV",
+            pandas=True,
+        )
+    ]
+    position_sizes = [
+        PositionSize(symbol="BTC", percentage_of_portfolio=20.0),
+    ]
+    scaling_rules = [
+        ScalingRule(
+            symbol="BTC", max_entries=3,
+            scale_in_percentage=50, scale_out_percentage=50,
+        ),
+    ]
+    stop_losses = [
+        StopLossRule(
+            symbol="BTC", percentage_threshold=15.0, trailing=True,
+            sell_percentage=100,
+        ),
+    ]
+    take_profits = [
+        TakeProfitRule(
+            symbol="BTC", percentage_threshold=30.0, trailing=False,
+            sell_percentage=50,
+        ),
+    ]
+
+    def generate_signals(self, context, data):
+        df = data["BTC_EUR_OHLCV"].copy()
+        df["buy"] = df['Close'] == 110
+        df["sell"] = df['Close'] == 90
+        df["scale_in"] = df['Close'] == 115
+        df["scale_out"] = df['Close'] == 120
+        yield from signals_from_column(
+            df, "buy", side=SignalSide.OPEN_LONG, symbol="BTC",
+        )
+        yield from signals_from_column(
+            df, "sell", side=SignalSide.CLOSE_LONG, symbol="BTC",
+        )
+        yield from signals_from_column(
+            df, "scale_in", side=SignalSide.SCALE_IN, symbol="BTC",
+        )
+        yield from signals_from_column(
+            df, "scale_out", side=SignalSide.SCALE_OUT, symbol="BTC",
+        )
+
+
+def _run_backtest(name, config):
+    resource_dir = str(Path(__file__).parent.parent.parent / 'resources')
+    csv_path = str(
+        Path(__file__).parent.parent.parent / 'resources' / 'test_data'
+        / 'ohlcv' / CSV_FILENAME
+    )
+    app = create_app(
+        name=name, config={RESOURCE_DIRECTORY: resource_dir, **config}
+    )
+    app.add_market(
+        market="BITVAVO", trading_symbol="EUR", initial_balance=1000
+    )
+    app.add_data_provider(
+        data_provider=CSVOHLCVDataProvider(
+            storage_path=csv_path,
+            symbol="BTC/EUR",
+            time_frame="2h",
+            market="BITVAVO",
+            warmup_window=WARMUP,
+        ),
+        priority=1,
+    )
+    backtests = app.run_backtest(
+        strategy=ScalingStrategy(algorithm_id="ScalingStrategy"),
+        study=Study(
+            universe=Universe(market="BITVAVO", trading_symbol="EUR"),
+            backtest_windows=[
+                BacktestWindow(train_range=BacktestDateRange(
+                    start_date=START_DATE, end_date=END_DATE,
+                ))
+            ],
+            engines=[BacktestEngine.EVENT_DRIVEN],
+        ),
+    )
+    return app, backtests[0].get_all_backtest_runs()[0]
+
+
+def _strip(value):
+
+    if isinstance(value, dict):
+        return {
+            key: _strip(entry) for key, entry in value.items()
+            if key not in IGNORED_FIELDS
+        }
+
+    if isinstance(value, list):
+        return [_strip(entry) for entry in value]
+
+    # NaN metrics, e.g. the Sharpe ratio of a short run, are equal
+    if isinstance(value, float) and math.isnan(value):
+        return "nan"
+
+    return value
+
+
+def _to_dicts(objects):
+    return [_strip(entry.to_dict()) for entry in objects]
+
+
+class TestEventBacktestDatabaseParity(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        _, cls.in_memory_run = _run_backtest(
+            "InMemoryParity", {IN_MEMORY_BACKTEST_DATABASE: True}
+        )
+        _, cls.sql_run = _run_backtest(
+            "SQLParity", {IN_MEMORY_BACKTEST_DATABASE: False}
+        )
+
+    def test_run_trades(self):
+        self.assertGreaterEqual(len(self.in_memory_run.orders), 4)
+        self.assertGreaterEqual(len(self.in_memory_run.trades), 1)
+
+    def test_orders(self):
+        # Orders created at the same time are ordered by their random
+        # ids, so the orders are compared in a fixed order
+        self.assertEqual(
+            sorted(_to_dicts(self.sql_run.orders), key=repr),
+            sorted(_to_dicts(self.in_memory_run.orders), key=repr)
+        )
+
+    def test_trades(self):
+        self.assertEqual(
+            _to_dicts(self.sql_run.trades),
+            _to_dicts(self.in_memory_run.trades)
+        )
+
+    def test_positions(self):
+        self.assertEqual(
+            _to_dicts(self.sql_run.positions),
+            _to_dicts(self.in_memory_run.positions)
+        )
+
+    def test_portfolio_snapshots(self):
+        self.assertEqual(
+            _to_dicts(self.sql_run.portfolio_snapshots),
+            _to_dicts(self.in_memory_run.portfolio_snapshots)
+        )
+
+    def test_backtest_metrics(self):
+        self.assertEqual(
+            _strip(self.sql_run.backtest_metrics.to_dict()),
+            _strip(self.in_memory_run.backtest_metrics.to_dict())
+        )
+
+
+class TestFlushBacktestDatabase(TestCase):
+
+    def test_flush(self):
+        app, run = _run_backtest(
+            "FlushParity",
+            {IN_MEMORY_BACKTEST_DATABASE: True, FLUSH_BACKTEST_DATABASE: True}
+        )
+        orders = app.container.order_repository().get_all()
+        self.assertEqual(
+            [order.to_dict() for order in run.orders],
+            [order.to_dict() for order in orders]
+        )
+        self.assertEqual(
+            len(run.trades), app.container.trade_repository().count()
+        )
+        self.assertEqual(
+            len(run.portfolio_snapshots),
+            app.container.portfolio_snapshot_repository().count()
+        )
+
+    def test_no_flush(self):
+
+        with patch.object(InMemoryDatabase, "flush") as flush:
+            _, run = _run_backtest(
+                "NoFlushParity", {IN_MEMORY_BACKTEST_DATABASE: True}
+            )
+
+        self.assertGreater(len(run.orders), 0)
+        flush.assert_not_called()
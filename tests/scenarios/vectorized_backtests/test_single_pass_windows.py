@@ -0,0 +1,176 @@
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+from unittest import TestCase
+
+from investing_algorithm_framework import TradingStrategy, DataSource, \
+    TimeUnit, DataType, create_app, BacktestDateRange, PositionSize, \
+    RESOURCE_DIRECTORY, DATA_DIRECTORY, SnapshotInterval, Schedule, \
+    SignalSeries, SignalSide, Study, Universe, BacktestWindow, \
+    BacktestEngine
+
+
+class SMACrossStrategy(TradingStrategy):
+    schedule = Schedule.every(2, TimeUnit.HOUR)
+
+    def __init__(self, algorithm_id, short_period, long_period):
+        self.short_period = short_period
+        self.long_period = long_period
+        self.signal_generations = 0
+        super().__init__(
+            algorithm_id=algorithm_id,
+            data_sources=[
+                DataSource(
+                    identifier="BTC_data",
+                    data_type=DataType.OHLCV,
+                    time_frame="2h",
+                    market="BITVAVO",
+                    symbol="BTC/EUR",
+                    warmup_window=100,
+                    pandas=True,
+                )
+            ],
+            symbols=["BTC"],
+            position_sizes=[
+                PositionSize(symbol="BTC", percentage_of_portfolio=20.0)
+            ],
+        )
+
+    def generate_signal_series(self, data: Dict[str, Any]):
+        self.signal_generations += 1
+        close = data["BTC_data"]["Close"]
+        above = close.rolling(self.short_period).mean() \
+            > close.rolling(self.long_period).mean()
+        previous = above.shift(1, fill_value=False)
+        yield SignalSeries(
+            symbol="BTC", side=SignalSide.OPEN_LONG,
+            series=above & ~previous,
+        )
+        yield SignalSeries(
+            symbol="BTC", side=SignalSide.CLOSE_LONG,
+            series=~above & previous,
+        )
+
+
+class Test(TestCase):
+
+    def setUp(self):
+        resource_directory = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), '..', 'resources'
+        )
+        self.app = create_app(
+            name="SinglePassWindows",
+            config={
+                RESOURCE_DIRECTORY: resource_directory,
+                DATA_DIRECTORY: "test_data/ohlcv"
+            }
+        )
+        self.app.add_market(
+            market="BITVAVO", trading_symbol="EUR", initial_balance=1000
+        )
+        start_date = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        self.date_ranges = [
+            BacktestDateRange(
+                start_date=start_date + timedelta(days=30 * i),
+                end_date=start_date + timedelta(days=30 * i + 60),
+                name=f"Window {i}",
+            )
+            for i in range(4)
+        ]
+        self.study = Study(
+            universe=Universe(market="BITVAVO", trading_symbol="EUR"),
+            initial_capital=1000,
+            risk_free_rate=0.027,
+            backtest_windows=[
+                BacktestWindow(train_range=date_range)
+                for date_range in self.date_ranges
+            ],
+            engines=[BacktestEngine.VECTOR],
+        )
+
+    @staticmethod
+    def _strategies():
+        return [
+            SMACrossStrategy(f"sma_{short}_{long}", short, long)
+            for short, long in ((5, 20), (10, 50), (20, 80))
+        ]
+
+    def _run(self, strategies, **kwargs):
+        return {
+            backtest.algorithm_id: backtest
+            for backtest in self.app.run_backtests(
+                strategies=strategies,
+                study=self.study,
+                snapshot_interval=SnapshotInterval.DAILY,
+                **kwargs,
+            )
+        }
+
+    def test_matches_per_window_runs(self):
+        per_window_strategies = self._strategies()
+        single_pass_strategies = self._strategies()
+        per_window = self._run(per_window_strategies)
+        single_pass = self._run(
+            single_pass_strategies, single_pass_windows=True
+        )
+
+        for strategy in per_window_strategies:
+            self.assertEqual(len(self.date_ranges), strategy.signal_generations)
+
+        for strategy in single_pass_strategies:
+            self.assertEqual(1, strategy.signal_generations)
+
+        self.assertEqual(set(per_window), set(single_pass))
+        number_of_trades = 0
+
+        for algorithm_id, backtest in per_window.items():
+            for date_range in self.date_ranges:
+                expected = backtest.get_backtest_run(date_range)
+                run = single_pass[algorithm_id].get_backtest_run(date_range)
+                self.assertEqual(
+                    [
+                        (t.opened_at, t.closed_at, t.net_gain)
+                        for t in expected.get_trades()
+                    ],
+                    [
+                        (t.opened_at, t.closed_at, t.net_gain)
+                        for t in run.get_trades()
+                    ],
+                )
+                self.assertEqual(
+                    [
+                        (s.created_at, s.total_value)
+                        for s in expected.portfolio_snapshots
+                    ],
+                    [
+                        (s.created_at, s.total_value)
+                        for s in run.portfolio_snapshots
+                    ],
+                )
+                number_of_trades += len(run.get_trades())
+
+        self.assertGreater(number_of_trades, 0)
+
+    def test_with_window_filter_function(self):
+        strategies = self._strategies()
+        eliminated = strategies[0].algorithm_id
+
+        def window_filter(backtests, backtest_date_range):
+            return [
+                backtest for backtest in backtests
+                if backtest.algorithm_id != eliminated
+            ]
+
+        backtests = self._run(
+            strategies,
+            single_pass_windows=True,
+            window_filter_function=window_filter,
+        )
+
+        self.assertNotIn(eliminated, backtests)
+        self.assertEqual(2, len(backtests))
+
+        for backtest in backtests.values():
+            self.assertEqual(
+                len(self.date_ranges), len(backtest.get_all_backtest_runs())
+            )
@@ -0,0 +1,180 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+import polars as pl
+
+from investing_algorithm_framework.services.data_providers import \
+    CompletenessIndex, fill_missing_timeseries_data, \
+    get_completeness_index, get_missing_timeseries_data_entries
+from investing_algorithm_framework.services.data_providers.completeness \
+    import _get_cache_directory
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _data(hours=48, missing=(0, 3, 4, 10, 47)):
+    dates = pl.datetime_range(
+        START, START + timedelta(hours=hours - 1), interval="1h",
+        eager=True, time_unit="ms", time_zone="UTC",
+    )
+    return pl.DataFrame({
+        "Datetime": dates,
+        "Open": [float(i) for i in range(hours)],
+        "Close": [float(i) + 0.5 for i in range(hours)],
+    }).filter(~pl.int_range(0, hours).is_in(list(missing)))
+
+
+class TestCompletenessIndex(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.data_file_path = os.path.join(self.directory, "OHLCV.csv")
+        self.data = _data()
+        self.data.write_csv(self.data_file_path)
+        self.cache_directory = os.path.join(self.directory, "cache")
+        patcher = patch.object(
+            CompletenessIndex, "directory", self.cache_directory
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_matches_missing_timeseries_data_entries(self):
+        index = CompletenessIndex.from_data(self.data, "1h")
+
+        for start, end in [
+            (START - timedelta(hours=3), START + timedelta(hours=50)),
+            (START + timedelta(hours=5), START + timedelta(hours=9)),
+            (START + timedelta(minutes=30), START + timedelta(hours=12)),
+        ]:
+            expected = get_missing_timeseries_data_entries(
+                self.data, start=start, end=end, freq="1h"
+            )
+            self.assertEqual(
+                [date.to_pydatetime() for date in expected],
+                index.get_missing_dates(start, end)
+            )
+
+    def test_fill_matches_fill_missing_timeseries_data(self):
+        index = CompletenessIndex.from_data(self.data, "1h")
+        start = START - timedelta(hours=2)
+        end = START + timedelta(hours=49)
+        expected = fill_missing_timeseries_data(
+            self.data,
+            missing_dates=get_missing_timeseries_data_entries(
+                self.data, start=start, end=end, freq="1h"
+            ),
+        )
+        filled = index.fill(self.data, start, end)
+
+        self.assertEqual(self.data.schema, filled.schema)
+        self.assertEqual(
+            expected["Datetime"].dt.epoch("ms").to_list(),
+            filled["Datetime"].dt.epoch("ms").to_list()
+        )
+        self.assertEqual(expected["Open"].to_list(), filled["Open"].to_list())
+        self.assertEqual(
+            expected["Close"].to_list(), filled["Close"].to_list()
+        )
+
+        # Nothing is missing in the range
+        range_data = self.data.filter(
+            pl.col("Datetime") >= START + timedelta(hours=11)
+        )
+        self.assertIs(
+            range_data,
+            index.fill(
+                range_data,
+                START + timedelta(hours=11),
+                START + timedelta(hours=20),
+            )
+        )
+
+    def test_fill_is_idempotent(self):
+        index = CompletenessIndex.from_data(self.data, "1h")
+        start = START - timedelta(hours=2)
+        end = START + timedelta(hours=49)
+        filled = index.fill(self.data, start, end)
+        self.assertTrue(filled.equals(index.fill(filled, start, end)))
+        self.assertEqual(
+            filled["Datetime"].n_unique(), len(filled["Datetime"])
+        )
+
+    def test_cache_directory(self):
+
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": self.directory}):
+            self.assertEqual(
+                os.path.join(
+                    self.directory, "investing_algorithm_framework",
+                    "completeness"
+                ),
+                _get_cache_directory()
+            )
+
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": ""}):
+            self.assertEqual(
+                os.path.join(
+                    os.path.expanduser("~"), ".cache",
+                    "investing_algorithm_framework", "completeness"
+                ),
+                _get_cache_directory()
+            )
+
+    def test_index_is_persisted_and_reused(self):
+        index = get_completeness_index(
+            self.data, "1h", data_file_path=self.data_file_path
+        )
+        index_path = CompletenessIndex.index_path(self.data_file_path)
+        self.assertEqual(self.cache_directory, os.path.dirname(index_path))
+        self.assertTrue(os.path.isfile(index_path))
+        # The directory of the data file is left unchanged
+        self.assertEqual(
+            ["OHLCV.csv", "cache"], sorted(os.listdir(self.directory))
+        )
+
+        if os.name == "posix":
+            self.assertEqual(
+                0o700, os.stat(self.cache_directory).st_mode & 0o777
+            )
+
+        with patch.object(
+            CompletenessIndex, "from_data", wraps=CompletenessIndex.from_data
+        ) as from_data:
+            reused = get_completeness_index(
+                self.data, "1h", data_file_path=self.data_file_path
+            )
+            # A slice of the indexed data reuses the index as well
+            get_completeness_index(
+                self.data.tail(10), "1h", data_file_path=self.data_file_path
+            )
+            from_data.assert_not_called()
+
+            # Another time frame is computed again
+            get_completeness_index(
+                self.data, "2h", data_file_path=self.data_file_path
+            )
+            self.assertEqual(1, from_data.call_count)
+
+        self.assertEqual(index.missing.tolist(), reused.missing.tolist())
+        self.assertEqual(index.start, reused.start)
+        self.assertEqual(index.end, reused.end)
+
+    def test_index_is_recomputed_when_the_file_changes(self):
+        get_completeness_index(
+            self.data, "1h", data_file_path=self.data_file_path
+        )
+        data = _data(missing=(3,))
+        data.write_csv(self.data_file_path)
+        index = get_completeness_index(
+            data, "1h", data_file_path=self.data_file_path
+        )
+        self.assertEqual(
+            [START + timedelta(hours=3)],
+            index.get_missing_dates(START, START + timedelta(hours=47))
+        )
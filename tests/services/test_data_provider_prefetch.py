@@ -0,0 +1,262 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any
+from unittest import TestCase
+from unittest.mock import patch
+
+import polars as pl
+from click.testing import CliRunner
+
+from investing_algorithm_framework import create_app, RESOURCE_DIRECTORY, \
+    TradingStrategy, TimeUnit, Schedule
+from investing_algorithm_framework.cli.cli import prefetch_cmd
+from investing_algorithm_framework.domain import BacktestDateRange, \
+    DataProvider, DataSource, DataType, TimeFrame
+from investing_algorithm_framework.infrastructure import \
+    CCXTOHLCVDataProvider
+from investing_algorithm_framework.services import ConfigurationService, \
+    DataProviderService, MarketCredentialService
+
+START = datetime(2024, 1, 10, tzinfo=timezone.utc)
+END = datetime(2024, 1, 20, tzinfo=timezone.utc)
+
+
+class RecordingDataProvider(DataProvider):
+    """Data provider that records the data sources it prepares."""
+    data_type = DataType.OHLCV
+    data_provider_identifier = "recording_data_provider"
+
+    def __init__(self, data_source=None, recorder=None):
+        super().__init__(
+            data_type=DataType.OHLCV.value,
+            data_provider_identifier=self.data_provider_identifier,
+        )
+        self.data_source = data_source
+        self.recorder = recorder if recorder is not None else {
+            "prepared": [], "active": 0, "max_active": 0,
+            "lock": threading.Lock(),
+        }
+        self.data = None
+
+    def has_data(self, data_source, start_date=None, end_date=None):
+        return DataType.OHLCV.equals(data_source.data_type)
+
+    def get_data(self, date=None, start_date=None, end_date=None,
+                 save=False):
+        return None
+
+    def prepare_backtest_data(self, backtest_start_date, backtest_end_date,
+                              fill_missing_data=False, show_progress=False):
+        recorder = self.recorder
+
+        with recorder["lock"]:
+            recorder["active"] += 1
+            recorder["max_active"] = max(
+                recorder["max_active"], recorder["active"]
+            )
+
+        time.sleep(0.05)
+
+        with recorder["lock"]:
+            recorder["active"] -= 1
+            recorder["prepared"].append(self.data_source)
+
+        if self.data_source.symbol == "FAIL/EUR":
+            raise ValueError("no data")
+
+        self.data = pl.DataFrame({"Close": [1.0] * 10})
+
+    def get_backtest_data(self, backtest_index_date,
+                          backtest_start_date=None, backtest_end_date=None,
+                          data_source=None):
+        return None
+
+    def copy(self, data_source):
+        return RecordingDataProvider(data_source, self.recorder)
+
+    def get_number_of_data_points(self, start_date, end_date):
+        return 0
+
+    def get_missing_data_dates(self, start_date, end_date):
+        return []
+
+    def get_data_source_file_path(self):
+        return None
+
+
+def _fake_get_ohlcv(
+    self, symbol, time_frame, from_timestamp, market, to_timestamp=None
+):
+    minutes = TimeFrame.from_value(time_frame).amount_of_minutes
+    n = int((to_timestamp - from_timestamp).total_seconds() // 60 // minutes)
+    return pl.DataFrame({
+        "Datetime": [
+            from_timestamp + timedelta(minutes=minutes * i)
+            for i in range(n + 1)
+        ],
+        "Open": [1.0] * (n + 1),
+        "High": [1.0] * (n + 1),
+        "Low": [1.0] * (n + 1),
+        "Close": [1.0] * (n + 1),
+        "Volume": [1.0] * (n + 1),
+    }).with_columns(
+        pl.col("Datetime").cast(pl.Datetime(time_unit="ms", time_zone="UTC"))
+    )
+
+
+class PrefetchStrategy(TradingStrategy):
+    strategy_id = "prefetch_strategy"
+    schedule = Schedule.every(1, TimeUnit.HOUR)
+    data_sources = [
+        DataSource(
+            symbol="BTC/EUR", market="BITVAVO", time_frame="1h",
+            data_type="OHLCV", warmup_window=24,
+        ),
+        DataSource(
+            symbol="ETH/EUR", market="BITVAVO", time_frame="1h",
+            data_type="OHLCV", warmup_window=24,
+        ),
+    ]
+
+    def generate_signal_series(self, data: Dict[str, Any]):
+        return iter(())
+
+
+class TestDataProviderPrefetch(TestCase):
+
+    def setUp(self):
+        self.resource_directory = tempfile.mkdtemp()
+        self.date_range = BacktestDateRange(start_date=START, end_date=END)
+
+    def tearDown(self):
+        shutil.rmtree(self.resource_directory, ignore_errors=True)
+        CCXTOHLCVDataProvider.clear_exchange_pool()
+
+    def _data_source(self, symbol, time_frame="1h", warmup_window=None):
+        return DataSource(
+            symbol=symbol, market="BITVAVO", time_frame=time_frame,
+            data_type="OHLCV", warmup_window=warmup_window,
+        )
+
+    def test_prefetch_deduplicates_data_sources(self):
+        service = DataProviderService(
+            configuration_service=ConfigurationService(),
+            market_credential_service=MarketCredentialService(),
+        )
+        provider = RecordingDataProvider()
+        service.add_data_provider(provider)
+        data_sources = [
+            self._data_source("BTC/EUR", warmup_window=50),
+            self._data_source("BTC/EUR", warmup_window=200),
+            self._data_source("BTC/EUR", time_frame="1d"),
+            self._data_source("FAIL/EUR"),
+            self._data_source("ETH/EUR"),
+            self._data_source("SOL/EUR"),
+            DataSource(symbol="BTC/EUR", market="BITVAVO", data_type="TICKER"),
+        ]
+        results = service.prefetch_data(
+            data_sources, self.date_range, max_workers=4,
+            show_progress=False,
+        )
+
+        self.assertEqual(
+            [
+                ("BTC/EUR", "1h", 200), ("BTC/EUR", "1d", None),
+                ("FAIL/EUR", "1h", None), ("ETH/EUR", "1h", None),
+                ("SOL/EUR", "1h", None),
+            ],
+            [
+                (
+                    result.data_source.symbol,
+                    TimeFrame.from_value(result.data_source.time_frame).value,
+                    result.data_source.warmup_window,
+                )
+                for result in results
+            ]
+        )
+        self.assertEqual(5, len(provider.recorder["prepared"]))
+        self.assertGreater(provider.recorder["max_active"], 1)
+        self.assertEqual(
+            [True, True, False, True, True],
+            [result.succeeded for result in results]
+        )
+        self.assertEqual("no data", results[2].error)
+        self.assertEqual(10, results[0].number_of_rows)
+        self.assertGreater(results[0].rows_per_second, 0)
+        # Prefetching does not register the data sources
+        self.assertEqual(
+            0, len(service.data_provider_index.data_providers_lookup)
+        )
+
+    def test_prefetch_caches_ccxt_data(self):
+        app = create_app(
+            config={RESOURCE_DIRECTORY: self.resource_directory}
+        )
+        app.add_strategy(PrefetchStrategy)
+
+        with patch.object(
+            CCXTOHLCVDataProvider, "has_data", return_value=True
+        ), patch.object(
+            CCXTOHLCVDataProvider, "get_ohlcv", autospec=True,
+            side_effect=_fake_get_ohlcv,
+        ) as get_ohlcv:
+            results = app.prefetch_data(
+                self.date_range, max_workers=2, show_progress=False
+            )
+
+            self.assertEqual(2, get_ohlcv.call_count)
+            self.assertTrue(all(result.succeeded for result in results))
+            self.assertEqual(
+                [24 * 11 + 1] * 2,
+                [result.number_of_rows for result in results]
+            )
+            self.assertEqual(
+                [
+                    "OHLCV_BTC-EUR_BITVAVO_1h.csv",
+                    "OHLCV_ETH-EUR_BITVAVO_1h.csv",
+                ],
+                sorted(os.listdir(
+                    os.path.join(self.resource_directory, "data")
+                ))
+            )
+
+            # The second run is served from the cache
+            app.prefetch_data(self.date_range, show_progress=False)
+            self.assertEqual(2, get_ohlcv.call_count)
+
+    def test_prefetch_command(self):
+        app_path = os.path.join(self.resource_directory, "app.py")
+
+        with open(app_path, "w") as file:
+            file.write(
+                "from investing_algorithm_framework import create_app, "
+                "RESOURCE_DIRECTORY\n"
+                "from tests.services.test_data_provider_prefetch import "
+                "PrefetchStrategy\n"
+                f"app = create_app(config={{RESOURCE_DIRECTORY: "
+                f"{self.resource_directory!r}}})\n"
+                "app.add_strategy(PrefetchStrategy)\n"
+            )
+
+        with patch.object(
+            CCXTOHLCVDataProvider, "has_data", return_value=True
+        ), patch.object(
+            CCXTOHLCVDataProvider, "get_ohlcv", autospec=True,
+            side_effect=_fake_get_ohlcv,
+        ):
+            result = CliRunner().invoke(
+                prefetch_cmd,
+                [
+                    app_path, "--start-date", "2024-01-10",
+                    "--end-date", "2024-01-20", "--no-progress",
+                ],
+            )
+
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertIn("BTC/EUR", result.output)
+        self.assertIn("ETH/EUR", result.output)
+        self.assertIn("2 data source(s), 530 rows, 0 failed", result.output)
@@ -0,0 +1,189 @@
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+import polars as pl
+
+from investing_algorithm_framework import RESOURCE_DIRECTORY, \
+    RESAMPLE_OHLCV_DATA
+from investing_algorithm_framework.domain import BacktestDateRange, \
+    DataSource, TimeFrame
+from investing_algorithm_framework.infrastructure import \
+    CCXTOHLCVDataProvider
+from investing_algorithm_framework.services import ConfigurationService, \
+    DataProviderService, MarketCredentialService
+from investing_algorithm_framework.services.data_providers import \
+    ResampledOHLCVDataProvider
+
+START = datetime(2024, 1, 10, tzinfo=timezone.utc)
+END = datetime(2024, 1, 20, tzinfo=timezone.utc)
+
+
+def _fake_get_ohlcv(
+    self, symbol, time_frame, from_timestamp, market, to_timestamp=None
+):
+    # Prices derived from the timestamp, so every download of the same
+    # candle returns the same values
+    minutes = TimeFrame.from_value(time_frame).amount_of_minutes
+    start = from_timestamp - timedelta(
+        minutes=(from_timestamp.timestamp() // 60) % minutes
+    )
+    n = int((to_timestamp - start).total_seconds() // 60 // minutes)
+    dates = [start + timedelta(minutes=minutes * i) for i in range(n + 1)]
+    opens = [(date.timestamp() // 60) % 997 for date in dates]
+    return pl.DataFrame({
+        "Datetime": dates,
+        "Open": opens,
+        "High": [price + 5 for price in opens],
+        "Low": [price - 5 for price in opens],
+        "Close": [price + 1 for price in opens],
+        "Volume": [float(minutes)] * len(dates),
+    }).with_columns(
+        pl.col("Datetime").cast(pl.Datetime(time_unit="ms", time_zone="UTC"))
+    )
+
+
+class TestDataProviderResampling(TestCase):
+
+    def setUp(self):
+        self.resource_directory = tempfile.mkdtemp()
+        self.date_range = BacktestDateRange(start_date=START, end_date=END)
+        self.has_data = patch.object(
+            CCXTOHLCVDataProvider, "has_data", return_value=True
+        )
+        self.get_ohlcv = patch.object(
+            CCXTOHLCVDataProvider, "get_ohlcv", autospec=True,
+            side_effect=_fake_get_ohlcv,
+        )
+        self.has_data.start()
+        self.get_ohlcv_mock = self.get_ohlcv.start()
+
+    def tearDown(self):
+        self.has_data.stop()
+        self.get_ohlcv.stop()
+        shutil.rmtree(self.resource_directory, ignore_errors=True)
+        CCXTOHLCVDataProvider.clear_exchange_pool()
+
+    def _service(self, resample=True):
+        configuration_service = ConfigurationService()
+        configuration_service.add_dict({
+            RESOURCE_DIRECTORY: self.resource_directory,
+            RESAMPLE_OHLCV_DATA: resample,
+        })
+        service = DataProviderService(
+            configuration_service=configuration_service,
+            market_credential_service=MarketCredentialService(),
+        )
+        service.add_data_provider(CCXTOHLCVDataProvider())
+        return service
+
+    def _data_source(self, time_frame, warmup_window):
+        return DataSource(
+            symbol="BTC/EUR", market="BITVAVO", time_frame=time_frame,
+            data_type="OHLCV", warmup_window=warmup_window,
+        )
+
+    def _prepare(self, service, data_sources):
+        service.index_backtest_data_providers(
+            data_sources, self.date_range, show_progress=False
+        )
+        service.prepare_backtest_data(self.date_range, show_progress=False)
+
+    def _downloaded_time_frames(self):
+        return {
+            TimeFrame.from_value(call.kwargs["time_frame"]).value
+            for call in self.get_ohlcv_mock.call_args_list
+        }
+
+    def test_resampled_data_matches_native_data(self):
+        data_sources = [
+            self._data_source("15m", 10),
+            self._data_source("1h", 24),
+            self._data_source("1d", 5),
+        ]
+        service = self._service()
+        self._prepare(service, data_sources)
+
+        # Only the finest time frame is downloaded
+        self.assertEqual({"15m"}, self._downloaded_time_frames())
+
+        index_date = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+        for data_source, expected_index in [
+            (data_sources[1], datetime(2024, 1, 15, 11, tzinfo=timezone.utc)),
+            (data_sources[2], datetime(2024, 1, 16, tzinfo=timezone.utc)),
+        ]:
+            provider = service.data_provider_index.get(data_source)
+            self.assertIsInstance(provider, ResampledOHLCVDataProvider)
+            data = service.get_backtest_data(
+                data_source, backtest_index_date=index_date
+            )
+            minutes = data_source.time_frame.amount_of_minutes
+            native = _fake_get_ohlcv(
+                None, "BTC/EUR", data_source.time_frame,
+                expected_index - timedelta(
+                    minutes=minutes * data_source.warmup_window
+                ),
+                "BITVAVO", expected_index,
+            )
+            fine = _fake_get_ohlcv(
+                None, "BTC/EUR", "15m", native["Datetime"][0], "BITVAVO",
+                expected_index + timedelta(minutes=minutes - 15),
+            )
+            expected = fine.group_by_dynamic(
+                "Datetime", every=f"{minutes}m"
+            ).agg(
+                pl.col("Open").first(),
+                pl.col("High").max(),
+                pl.col("Low").min(),
+                pl.col("Close").last(),
+                pl.col("Volume").sum(),
+            )
+            self.assertEqual(data_source.warmup_window + 1, len(data))
+            self.assertEqual(expected_index, data["Datetime"][-1])
+            self.assertTrue(data.equals(expected))
+
+        # The finest time frame is served from the same data
+        data = service.get_backtest_data(
+            data_sources[0], backtest_index_date=index_date
+        )
+        self.assertEqual(11, len(data))
+        self.assertEqual(index_date, data["Datetime"][-1])
+
+    def test_resampled_data_is_memoised(self):
+        data_sources = [
+            self._data_source("15m", 10),
+            self._data_source("1h", 24),
+        ]
+        service = self._service()
+        self._prepare(service, data_sources)
+        provider = service.data_provider_index.get(data_sources[1])
+        resampler = provider.resampler
+        self.assertIs(
+            resampler,
+            service.data_provider_index.get(data_sources[0]).resampler
+        )
+        self.assertIs(
+            resampler.resample("1h"), resampler.resample(TimeFrame.ONE_HOUR)
+        )
+
+        # Preparing again for the same range does not reload the data
+        calls = self.get_ohlcv_mock.call_count
+        provider.prepare_backtest_data(START, END)
+        self.assertEqual(calls, self.get_ohlcv_mock.call_count)
+
+    def test_resampling_is_opt_in(self):
+        data_sources = [
+            self._data_source("15m", 10),
+            self._data_source("1h", 24),
+        ]
+        service = self._service(resample=False)
+        self._prepare(service, data_sources)
+
+        self.assertEqual({"15m", "1h"}, self._downloaded_time_frames())
+        self.assertIsInstance(
+            service.data_provider_index.get(data_sources[1]),
+            CCXTOHLCVDataProvider
+        )
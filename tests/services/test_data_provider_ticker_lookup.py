@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+import pandas as pd
+import polars as pl
+
+from investing_algorithm_framework.domain import BacktestDateRange, \
+    DataSource
+from investing_algorithm_framework.infrastructure import \
+    PandasOHLCVDataProvider
+from investing_algorithm_framework.services import ConfigurationService, \
+    DataProviderService, MarketCredentialService
+from investing_algorithm_framework.services.data_providers.price_index \
+    import PriceIndex
+
+START = datetime(2024, 1, 10, tzinfo=timezone.utc)
+END = datetime(2024, 1, 20, tzinfo=timezone.utc)
+
+
+def _ohlcv(start, end):
+    dates = pd.date_range(
+        start - timedelta(days=2), end, freq="1h", tz="UTC"
+    )
+    prices = [float(i) for i in range(len(dates))]
+    return pd.DataFrame({
+        "Datetime": dates,
+        "Open": prices,
+        "High": [price + 2 for price in prices],
+        "Low": [price - 2 for price in prices],
+        "Close": [price + 1 for price in prices],
+        "Volume": [10.0] * len(dates),
+    })
+
+
+class TestDataProviderTickerLookup(TestCase):
+
+    def setUp(self):
+        self.service = DataProviderService(
+            configuration_service=ConfigurationService(),
+            market_credential_service=MarketCredentialService(),
+        )
+        self.service.add_data_provider(
+            PandasOHLCVDataProvider(
+                dataframe=_ohlcv(START, END),
+                symbol="BTC/EUR",
+                market="BITVAVO",
+                time_frame="1h",
+            )
+        )
+        date_range = BacktestDateRange(start_date=START, end_date=END)
+        self.data_source = DataSource(
+            symbol="BTC/EUR", market="BITVAVO", time_frame="1h",
+            data_type="OHLCV", warmup_window=24, pandas=True,
+        )
+        self.service.index_backtest_data_providers(
+            [self.data_source], date_range, show_progress=False
+        )
+        self.service.prepare_backtest_data(date_range, show_progress=False)
+        self.data_provider = self.service.data_provider_index.get(
+            self.data_source
+        )
+
+    def _window_ticker(self, date):
+        # The ticker from the last row of the backtest window
+        data = self.data_provider.get_backtest_data(backtest_index_date=date)
+        data.index.name = "Datetime"
+        entry = pl.from_pandas(data.reset_index())[-1]
+        return {
+            "symbol": "BTC/EUR",
+            "market": "BITVAVO",
+            "datetime": entry["Datetime"][0],
+            "open": entry["Open"][0],
+            "high": entry["High"][0],
+            "low": entry["Low"][0],
+            "close": entry["Close"][0],
+            "volume": entry["Close"][0],
+            "ask": entry["Close"][0],
+            "bid": entry["Close"][0],
+        }
+
+    def test_ticker_matches_backtest_window(self):
+        dates = [
+            START,
+            START + timedelta(hours=5),
+            START + timedelta(hours=5, minutes=30),
+            END - timedelta(minutes=1),
+            END,
+        ]
+        expected = [self._window_ticker(date) for date in dates]
+
+        with patch.object(
+            self.data_provider, "get_backtest_data",
+            wraps=self.data_provider.get_backtest_data
+        ) as get_backtest_data:
+            tickers = [
+                self.service.get_ticker_data("BTC/EUR", "BITVAVO", date)
+                for date in dates
+            ]
+
+        self.assertEqual(expected, tickers)
+        # No backtest window is materialised
+        get_backtest_data.assert_not_called()
+
+    def test_price_index_is_rebuilt_for_new_data(self):
+        self.service.get_ticker_data("BTC/EUR", "BITVAVO", START)
+        price_index = self.service._price_indexes[id(self.data_provider)]
+        self.service.get_ticker_data("BTC/EUR", "BITVAVO", START)
+        self.assertIs(
+            price_index, self.service._price_indexes[id(self.data_provider)]
+        )
+
+        self.data_provider.data = self.data_provider.data.with_columns(
+            pl.col("Close") * 2
+        )
+        ticker = self.service.get_ticker_data("BTC/EUR", "BITVAVO", START)
+        self.assertEqual(
+            self.data_provider.data.filter(
+                pl.col("Datetime") == START
+            )["Close"][0],
+            ticker["close"]
+        )
+
+    def test_price_index_at_or_before(self):
+        price_index = PriceIndex(pl.from_pandas(_ohlcv(START, END)))
+        date = START + timedelta(minutes=30)
+        self.assertEqual(
+            START + timedelta(hours=1),
+            price_index.get("BTC/EUR", "BITVAVO", date)["datetime"]
+        )
+        self.assertEqual(
+            START,
+            price_index.get(
+                "BTC/EUR", "BITVAVO", date, at_or_before=True
+            )["datetime"]
+        )
+        self.assertIsNone(
+            price_index.get("BTC/EUR", "BITVAVO", END + timedelta(hours=1))
+        )
+        self.assertIsNone(
+            price_index.get(
+                "BTC/EUR", "BITVAVO", START - timedelta(days=3),
+                at_or_before=True
+            )
+        )
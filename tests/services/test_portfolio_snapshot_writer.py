@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential
+from investing_algorithm_framework.infrastructure import InMemoryDatabase, \
+    use_in_memory_database
+from investing_algorithm_framework.services import PortfolioSnapshotWriter
+from tests.resources import TestBase
+
+
+class TestPortfolioSnapshotWriter(TestBase):
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="binance",
+            trading_symbol="EUR",
+        )
+    ]
+    external_balances = {
+        "EUR": 1000
+    }
+    market_credentials = [
+        MarketCredential(
+            market="binance",
+            api_key="api_key",
+            secret_key="secret_key",
+        )
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.portfolio_snapshot_service = self.app.container \
+            .portfolio_snapshot_service()
+        self.portfolio = self.app.container.portfolio_service().get_all()[0]
+
+    def _create_snapshot(self, day):
+        return self.portfolio_snapshot_service.create_snapshot(
+            portfolio=self.portfolio,
+            created_at=datetime(2024, 1, 1) + timedelta(days=day),
+            save=False,
+        )
+
+    def _count_snapshots(self):
+        return self.portfolio_snapshot_service.count(
+            {"portfolio_id": self.portfolio.id}
+        )
+
+    def test_flush_size(self):
+        writer = PortfolioSnapshotWriter(
+            self.portfolio_snapshot_service, flush_size=2
+        )
+        writer.add(self._create_snapshot(0))
+        self.assertEqual(0, self._count_snapshots())
+        writer.add(self._create_snapshot(1))
+        self.assertEqual(2, self._count_snapshots())
+        self.assertEqual([], writer.snapshots)
+        writer.add(self._create_snapshot(2))
+        self.assertEqual(2, self._count_snapshots())
+        writer.flush()
+        self.assertEqual(3, self._count_snapshots())
+        writer.flush()
+        self.assertEqual(3, self._count_snapshots())
+
+    def test_written_values(self):
+        writer = PortfolioSnapshotWriter(self.portfolio_snapshot_service)
+
+        for day in range(3):
+            writer.add(self._create_snapshot(day))
+
+        self.assertEqual(0, self._count_snapshots())
+        writer.flush()
+        snapshots = self.portfolio_snapshot_service.get_all(
+            {"portfolio_id": self.portfolio.id}
+        )
+        self.assertEqual(3, len(snapshots))
+        self.assertEqual(
+            [datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=day)
+             for day in range(3)],
+            sorted(snapshot.get_created_at() for snapshot in snapshots)
+        )
+
+        for snapshot in snapshots:
+            self.assertIsNotNone(snapshot.id)
+            self.assertEqual(1000, snapshot.get_total_value())
+            self.assertEqual(1000, snapshot.get_unallocated())
+            self.assertEqual(0, snapshot.get_cash_flow())
+
+    def test_in_memory_database(self):
+        use_in_memory_database(InMemoryDatabase())
+
+        try:
+            writer = PortfolioSnapshotWriter(
+                self.portfolio_snapshot_service, flush_size=2
+            )
+
+            for day in range(3):
+                writer.add(self._create_snapshot(day))
+
+            writer.flush()
+            snapshots = self.portfolio_snapshot_service.get_all(
+                {"portfolio_id": self.portfolio.id}
+            )
+            self.assertEqual(3, len(snapshots))
+            self.assertEqual(1000, snapshots[0].get_total_value())
+        finally:
+            use_in_memory_database(None)
+
+        self.assertEqual(0, self._count_snapshots())